@@ -0,0 +1,110 @@
+"""거래소 시세 지표 계산 성능 벤치마크.
+
+아이템마다 ``MarketItemStats.stats`` 를 순회하며 이동 평균, VWAP, 변동성, z-score를 계산하는
+반복문 구현과, :func:`pyloa.analytics.to_arrays` 로 한 번에 배열로 바꾼 뒤 배열 연산으로
+계산하는 구현을 비교합니다. 배열 변환 시간도 따로 표시합니다.
+
+사용법:
+    python benchmarks/bench_analytics.py [아이템 수]
+"""
+
+import datetime
+import math
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pyloa.analytics import to_arrays  # noqa: E402
+from pyloa.models.market import MarketItemStats, MarketStatsInfo  # noqa: E402
+
+DAYS = 30
+WINDOW = 7
+
+
+def make_entries(count: int):
+    rng = random.Random(0)
+    start = datetime.date(2024, 1, 1)
+    entries = {}
+    for item_id in range(count):
+        price = rng.uniform(10, 10000)
+        stats = []
+        for day in range(DAYS):
+            price *= math.exp(rng.gauss(0, 0.05))
+            date = (start + datetime.timedelta(days=day)).isoformat()
+            stats.append(MarketStatsInfo(date, round(price, 1), rng.randint(0, 5000)))
+        stats.reverse()  # API는 최신 날짜부터 반환합니다.
+        entries[item_id] = MarketItemStats(f"아이템{item_id}", 1, stats)
+    return entries
+
+
+def _std(values):
+    mean = sum(values) / len(values)
+    return math.sqrt(sum((v - mean) ** 2 for v in values) / (len(values) - 1))
+
+
+def naive(entries):
+    """아이템마다 파이썬 반복문으로 지표를 계산합니다."""
+    results = {}
+    for key, entry in entries.items():
+        stats = sorted(entry.stats, key=lambda s: s.date)
+        prices = [s.avg_price for s in stats]
+        counts = [s.trade_count for s in stats]
+        volume = sum(counts)
+        vwap = sum(p * c for p, c in zip(prices, counts)) / volume if volume else None
+        sma, vol, z = [], [], []
+        returns = [math.log(b / a) for a, b in zip(prices, prices[1:])]
+        for i in range(len(prices)):
+            if i >= WINDOW - 1:
+                sma.append(sum(prices[i - WINDOW + 1 : i + 1]) / WINDOW)
+            if i >= WINDOW:
+                vol.append(_std(returns[i - WINDOW : i]))
+                history = prices[i - WINDOW : i]
+                std = _std(history)
+                z.append((prices[i] - sum(history) / WINDOW) / std if std else None)
+        results[key] = (sma, vwap, vol, z)
+    return results
+
+
+def vectorized(entries):
+    arrays = to_arrays(entries)
+    return (
+        arrays.moving_average(WINDOW),
+        arrays.vwap(),
+        arrays.volatility(WINDOW),
+        arrays.zscore(WINDOW),
+    )
+
+
+def measure(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    entries = make_entries(count)
+    arrays = to_arrays(entries)
+
+    baseline = measure(lambda: naive(entries), 1)
+    convert = measure(lambda: to_arrays(entries), 3)
+    compute = measure(
+        lambda: (
+            arrays.moving_average(WINDOW),
+            arrays.vwap(),
+            arrays.volatility(WINDOW),
+            arrays.zscore(WINDOW),
+        ),
+        10,
+    )
+    total = measure(lambda: vectorized(entries), 3)
+    print(f"{count} items x {DAYS} days, window {WINDOW}")
+    print(f"  {'naive loop':<22} {baseline * 1e3:9.2f} ms")
+    print(f"  {'to_arrays':<22} {convert * 1e3:9.2f} ms")
+    print(f"  {'indicators (arrays)':<22} {compute * 1e3:9.2f} ms   x{baseline / compute:.1f}")
+    print(f"  {'to_arrays + indicators':<22} {total * 1e3:9.2f} ms   x{baseline / total:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""응답 JSON 디코딩 성능 벤치마크.
+
+기존 경로(``requests.Response.json()``)와 :mod:`pyloa.decoders` 가 지원하는 디코더의
+호출당 디코딩 시간을 Armory 종합 정보와 경매장 검색 응답으로 비교합니다.
+설치되지 않은 디코더는 건너뜁니다.
+
+사용법:
+    python benchmarks/bench_decode.py
+"""
+
+import json
+import os
+import sys
+import timeit
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fixtures import make_armory_total, make_auction  # noqa: E402
+from pyloa.decoders import DECODER_PRIORITY, get_decoder  # noqa: E402
+
+
+def encode(data) -> bytes:
+    """API 서버처럼 한글을 이스케이프하지 않은 UTF-8 JSON으로 직렬화합니다."""
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def make_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers["Content-Type"] = "application/json; charset=utf-8"
+    return response
+
+
+def measure(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def bench(label, body, number):
+    print(f"{label} ({len(body) / 1024:.1f} KiB)")
+    response = make_response(body)
+    baseline = measure(response.json, number)
+    print(f"  {'requests .json()':<18} {baseline * 1e3:8.3f} ms")
+    for name in DECODER_PRIORITY:
+        try:
+            decoder = get_decoder(name)
+        except ImportError:
+            print(f"  {name:<18} (not installed)")
+            continue
+        elapsed = measure(lambda: decoder(body), number)
+        print(f"  {name:<18} {elapsed * 1e3:8.3f} ms   x{baseline / elapsed:.2f}")
+
+
+def main():
+    bench("ArmoryTotal", encode(make_armory_total()), number=500)
+    bench("Auction (500 items)", encode(make_auction(items=500)), number=50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""BaseModel.from_dict 성능 벤치마크.
+
+클래스별 키 매핑 캐시를 사용하는 현재 구현과, 호출마다 ``dataclasses.fields()`` 와
+정규식 변환을 반복하던 이전 구현을 비교합니다. 같은 ``ArmoryTotal`` 응답으로 즉시 변환과
+지연 변환(``lazy=True``)도 비교합니다.
+
+사용법:
+    python benchmarks/bench_from_dict.py
+"""
+
+import dataclasses
+import os
+import sys
+import timeit
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fixtures import make_armory_total, make_auction  # noqa: E402
+from pyloa.models.armory import ArmoryTotal  # noqa: E402
+from pyloa.models.auction import Auction  # noqa: E402
+from pyloa.models.base import BaseModel  # noqa: E402
+
+
+@classmethod
+def legacy_from_dict(cls, data):
+    """키 매핑 캐시를 도입하기 전의 from_dict 구현."""
+    fields = {f.name for f in dataclasses.fields(cls)}
+    kwargs = {}
+    for key, value in data.items():
+        snake_key = key if "_" in key else cls._pascal_to_snake(key)
+        if snake_key in fields:
+            kwargs[snake_key] = value
+    return cls(**kwargs)
+
+
+def measure(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def bench(label, fn, number):
+    with patch.object(BaseModel, "from_dict", legacy_from_dict):
+        legacy = measure(fn, number)
+    current = measure(fn, number)
+    print(
+        f"{label:<22} legacy {legacy * 1e3:8.3f} ms   "
+        f"current {current * 1e3:8.3f} ms   x{legacy / current:.2f}"
+    )
+
+
+def bench_lazy(label, read, number):
+    """같은 응답을 즉시 변환했을 때와 지연 변환했을 때 ``read`` 까지 걸린 시간을 비교합니다."""
+    total = make_armory_total()
+    eager = measure(lambda: read(ArmoryTotal.from_dict(total)), number)
+    lazy = measure(lambda: read(ArmoryTotal.from_dict(total, lazy=True)), number)
+    print(
+        f"{label:<22} eager  {eager * 1e3:8.3f} ms   "
+        f"lazy    {lazy * 1e3:8.3f} ms   x{eager / lazy:.2f}"
+    )
+
+
+def read_all(total):
+    return [getattr(total, name) for name in ArmoryTotal.__dataclass_fields__]
+
+
+def main():
+    auction = make_auction(items=500)
+    total = make_armory_total()
+
+    bench("Auction (500 items)", lambda: Auction.from_dict(auction), number=20)
+    bench("ArmoryTotal", lambda: ArmoryTotal.from_dict(total), number=500)
+    print()
+    bench_lazy("ArmoryTotal (profile)", lambda t: t.armory_profile, number=500)
+    bench_lazy("ArmoryTotal (all)", read_all, number=500)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""모델 메모리 사용량 벤치마크.
+
+파싱한 ``ArmoryTotal`` 을 대량으로 보관할 때의 메모리를 ``__slots__`` 모델과
+일반 dataclass 모델(이전 방식)로 비교합니다. 두 경우를 같은 프로세스에서 섞지 않도록
+각각 별도 프로세스에서 측정합니다.
+
+사용법:
+    python benchmarks/bench_memory.py [개수]
+"""
+
+import dataclasses
+import importlib
+import os
+import subprocess
+import sys
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+
+def measure(count: int, slots: bool) -> int:
+    """ArmoryTotal ``count`` 개를 파싱해 보관하는 데 드는 메모리(바이트)를 반환합니다."""
+    import pyloa.models.armory
+    import pyloa.models.base
+
+    if not slots:
+        # 데코레이터를 일반 dataclass로 바꾼 뒤 모델 모듈을 다시 불러옵니다.
+        pyloa.models.base.dataclass = dataclasses.dataclass
+        importlib.reload(pyloa.models.armory)
+
+    from fixtures import make_armory_total
+
+    ArmoryTotal = pyloa.models.armory.ArmoryTotal
+
+    payloads = [make_armory_total(f"캐릭터{i}") for i in range(count)]
+    ArmoryTotal.from_dict(payloads[0])
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    models = [ArmoryTotal.from_dict(p) for p in payloads]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    assert len(models) == count
+    return used
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        print(measure(int(sys.argv[2]), slots=sys.argv[3] == "slots"))
+        return
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    results = {}
+    for mode in ("dict", "slots"):
+        out = subprocess.check_output(
+            [sys.executable, __file__, "--child", str(count), mode]
+        )
+        results[mode] = int(out)
+
+    print(f"ArmoryTotal x {count}")
+    for mode, used in results.items():
+        print(f"  {mode:<6} {used / 1024 / 1024:8.1f} MiB  ({used / count:,.0f} B/개)")
+    print(f"  절감   {1 - results['slots'] / results['dict']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""벤치마크용 합성 API 응답.
+
+실제 API 응답과 같은 키 구조를 가진 큰 페이로드를 만듭니다.
+"""
+
+from typing import Any, Dict
+
+
+def make_stat(i: int) -> Dict[str, Any]:
+    return {"Type": f"스탯{i}", "Value": str(100 + i), "Tooltip": ["<FONT>설명</FONT>"]}
+
+
+def make_armory_total(name: str = "홍길동") -> Dict[str, Any]:
+    """전투 스킬, 장비, 카드, 보석 등을 모두 포함한 Armory 종합 정보를 만듭니다."""
+    return {
+        "ArmoryProfile": {
+            "CharacterImage": "https://img",
+            "ExpeditionLevel": 250,
+            "TownLevel": 70,
+            "TownName": "영지",
+            "Title": "칭호",
+            "GuildMemberGrade": "길드원",
+            "GuildName": "길드",
+            "UsingSkillPoint": 420,
+            "TotalSkillPoint": 420,
+            "Stats": [make_stat(i) for i in range(8)],
+            "Tendencies": [
+                {"Type": f"성향{i}", "Point": 500, "MaxPoint": 1000} for i in range(4)
+            ],
+            "CombatPower": "2000.00",
+            "ServerName": "아만",
+            "CharacterName": name,
+            "CharacterLevel": 70,
+            "CharacterClassName": "버서커",
+            "ItemAvgLevel": "1,680.00",
+        },
+        "ArmoryEquipment": [
+            {
+                "Type": f"장비{i}",
+                "Name": f"+25 장비 {i}",
+                "Icon": "https://icon",
+                "Grade": "고대",
+                "Tooltip": '{"Element_000": {"type": "NameTagBox"}}' * 20,
+            }
+            for i in range(12)
+        ],
+        "ArmoryAvatars": [
+            {
+                "Type": f"아바타{i}",
+                "Name": f"아바타 {i}",
+                "Icon": "https://icon",
+                "Grade": "전설",
+                "IsSet": False,
+                "IsInner": i % 2 == 0,
+                "Tooltip": "{}",
+            }
+            for i in range(10)
+        ],
+        "ArmorySkills": [
+            {
+                "Name": f"스킬{i}",
+                "Icon": "https://icon",
+                "Level": 10,
+                "Type": "일반",
+                "SkillType": 0,
+                "Tooltip": "{}",
+                "Tripods": [
+                    {
+                        "Tier": t // 3,
+                        "Slot": t % 3,
+                        "Name": f"트라이포드{t}",
+                        "Icon": "https://icon",
+                        "IsSelected": t % 3 == 0,
+                        "Tooltip": "설명",
+                    }
+                    for t in range(9)
+                ],
+                "Rune": {
+                    "Name": "질풍",
+                    "Icon": "https://icon",
+                    "Grade": "전설",
+                    "Tooltip": "{}",
+                },
+            }
+            for i in range(30)
+        ],
+        "ArmoryEngraving": {
+            "Engravings": [],
+            "Effects": [],
+            "ArkPassiveEffects": [
+                {
+                    "AbilityStoneLevel": None,
+                    "Grade": "유물",
+                    "Level": 4,
+                    "Name": f"각인{i}",
+                    "Description": "설명",
+                }
+                for i in range(5)
+            ],
+        },
+        "ArmoryCard": {
+            "Cards": [
+                {
+                    "Slot": i,
+                    "Name": f"카드{i}",
+                    "Icon": "https://icon",
+                    "AwakeCount": 5,
+                    "AwakeTotal": 5,
+                    "Grade": "전설",
+                    "Tooltip": "{}",
+                }
+                for i in range(6)
+            ],
+            "Effects": [
+                {
+                    "Index": 0,
+                    "CardSlots": [0, 1, 2, 3, 4, 5],
+                    "Items": [
+                        {"Name": f"세트{i}", "Description": "설명"} for i in range(6)
+                    ],
+                }
+            ],
+        },
+        "ArmoryGem": {
+            "Gems": [
+                {
+                    "Slot": i,
+                    "Name": f"10레벨 겁화의 보석 {i}",
+                    "Icon": "https://icon",
+                    "Level": 10,
+                    "Grade": "고대",
+                    "Tooltip": "{}",
+                }
+                for i in range(11)
+            ],
+            "Effects": {
+                "Description": "",
+                "Skills": [
+                    {
+                        "GemSlot": i,
+                        "Name": f"스킬{i}",
+                        "Description": ["피해 44.00% 증가"],
+                        "Option": "",
+                        "Icon": "https://icon",
+                        "Tooltip": "{}",
+                    }
+                    for i in range(11)
+                ],
+            },
+        },
+        "ColosseumInfo": None,
+        "Collectibles": [],
+        "ArkPassive": None,
+        "ArkGrid": None,
+    }
+
+
+def make_auction(items: int = 10) -> Dict[str, Any]:
+    """옵션이 달린 아이템 ``items`` 개를 가진 경매장 검색 결과를 만듭니다."""
+    return {
+        "PageNo": 1,
+        "PageSize": items,
+        "TotalCount": items * 100,
+        "Items": [
+            {
+                "Name": f"고대 목걸이 {i}",
+                "Grade": "고대",
+                "Tier": 4,
+                "Level": None,
+                "Icon": "https://icon",
+                "GradeQuality": 90,
+                "AuctionInfo": {
+                    "StartPrice": 10000 + i,
+                    "BuyPrice": 20000 + i,
+                    "BidPrice": None,
+                    "EndDate": "2026-10-18T12:00:00",
+                    "BidCount": 0,
+                    "BidStartPrice": 10000 + i,
+                    "IsCompetitive": False,
+                    "TradeAllowCount": 2,
+                    "UpgradeLevel": None,
+                },
+                "Options": [
+                    {
+                        "Type": "STAT",
+                        "OptionName": f"옵션{o}",
+                        "OptionNameTripod": "",
+                        "Value": 1.5 + o,
+                        "IsPenalty": False,
+                        "ClassName": None,
+                        "IsValuePercentage": o % 2 == 0,
+                    }
+                    for o in range(6)
+                ],
+            }
+            for i in range(items)
+        ],
+    }
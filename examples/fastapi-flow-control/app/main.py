@@ -12,7 +12,7 @@ from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
-from pyloa import LostArkAPI, RateLimitError, APIError
+from pyloa import AsyncLostArkAPI, RateLimitError, APIError, SQLiteCache
 
 
 # Redis URL (docker-compose에서 주입)
@@ -21,6 +21,9 @@ REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 # SlowAPI Limiter 설정 (Redis 기반)
 limiter = Limiter(key_func=get_remote_address, storage_uri=REDIS_URL)
 
+# 모든 워커가 공유하는 응답 캐시 (설정된 경우)
+CACHE_PATH = os.getenv("PYLOA_CACHE_PATH")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -29,9 +32,11 @@ async def lifespan(app: FastAPI):
     api_key = os.getenv("LOSTARK_API_KEY")
     if not api_key:
         raise ValueError("LOSTARK_API_KEY 환경 변수가 설정되지 않았습니다.")
-    app.state.loa_api = LostArkAPI(api_key=api_key)
+    cache = SQLiteCache(CACHE_PATH) if CACHE_PATH else None
+    app.state.loa_api = AsyncLostArkAPI(api_key=api_key, cache=cache)
     yield
     # 종료 시 정리
+    await app.state.loa_api.aclose()
 
 
 app = FastAPI(
@@ -59,9 +64,9 @@ async def get_events(request: Request):
     SlowAPI가 분당 100회 요청으로 제한합니다.
     멀티 프로세스 환경에서도 Redis를 통해 전역적으로 제한이 적용됩니다.
     """
-    api: LostArkAPI = request.app.state.loa_api
+    api: AsyncLostArkAPI = request.app.state.loa_api
     try:
-        events = api.news.get_events()
+        events = await api.news.get_events()
         return [
             {
                 "title": event.title,
@@ -82,9 +87,9 @@ async def get_events(request: Request):
 @limiter.limit("100/minute")
 async def get_character(request: Request, character_name: str):
     """캐릭터 기본 정보 조회."""
-    api: LostArkAPI = request.app.state.loa_api
+    api: AsyncLostArkAPI = request.app.state.loa_api
     try:
-        siblings = api.characters.get_siblings(character_name)
+        siblings = await api.characters.get_siblings(character_name)
         return [
             {
                 "server_name": char.server_name,
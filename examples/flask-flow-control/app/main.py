@@ -9,7 +9,7 @@ from flask import Flask, jsonify
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 
-from pyloa import LostArkAPI, RateLimitError, APIError
+from pyloa import LostArkAPI, RateLimitError, APIError, SQLiteCache
 
 
 # Flask 앱 초기화
@@ -26,10 +26,14 @@ limiter = Limiter(
     default_limits=["100 per minute"],  # 기본 제한: 분당 100회
 )
 
+# 모든 워커가 공유하는 응답 캐시 (설정된 경우)
+CACHE_PATH = os.getenv("PYLOA_CACHE_PATH")
+
 # API 클라이언트 초기화
 api_key = os.getenv("LOSTARK_API_KEY")
 if api_key:
-    loa_api = LostArkAPI(api_key=api_key)
+    cache = SQLiteCache(CACHE_PATH) if CACHE_PATH else None
+    loa_api = LostArkAPI(api_key=api_key, cache=cache)
 else:
     loa_api = None
 
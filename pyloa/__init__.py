@@ -4,11 +4,50 @@ pyLoa: 로스트아크 API를 위한 Python 래퍼 라이브러리.
 이 패키지는 로스트아크 공식 API와 상호작용하기 위한 직관적인 인터페이스를 제공합니다.
 """
 
+from .bulk import BulkResult, BulkStats
+from .cache import (
+    ArmoryCache,
+    CacheBackend,
+    MemoryCache,
+    NegativeCache,
+    RosterIndex,
+    SQLiteCache,
+)
+from .conditional import ConditionalCache
+from .crawler import AsyncRosterCrawler, CrawlStats, RosterCrawler
+from .endpoints.armories import FetchStats
 from .client import LostArkAPI
+from .async_client import AsyncLostArkAPI
+from .history import PriceHistoryStore, PriceSeries
 from .exceptions import PyLoaException, APIError, RateLimitError, AuthenticationError
+from .rate_limiter import KeyPool, RateLimiter
+from .retry import RetryPolicy, RetryStats
+from .singleflight import AsyncSingleFlight, SingleFlight
 
 __all__ = [
     "LostArkAPI",
+    "AsyncLostArkAPI",
+    "RateLimiter",
+    "KeyPool",
+    "RetryPolicy",
+    "RetryStats",
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "BulkResult",
+    "BulkStats",
+    "FetchStats",
+    "CacheBackend",
+    "MemoryCache",
+    "SQLiteCache",
+    "RosterIndex",
+    "ArmoryCache",
+    "NegativeCache",
+    "ConditionalCache",
+    "RosterCrawler",
+    "AsyncRosterCrawler",
+    "CrawlStats",
+    "PriceHistoryStore",
+    "PriceSeries",
     "PyLoaException",
     "APIError",
     "RateLimitError",
@@ -0,0 +1,299 @@
+"""거래소 시세 지표 계산.
+
+여러 아이템의 ``MarketItemStats.stats`` 를 날짜 축을 맞춘 2차원 NumPy 배열(아이템 × 날짜)로
+한 번에 변환한 뒤, 이동 평균, 거래량 가중 평균가(VWAP), 변동성, z-score를 아이템별 반복문
+없이 배열 연산으로 계산합니다. 5000개 아이템 × 30일 기준으로 객체를 하나씩 순회하는 반복문보다
+지표 계산은 약 20배, 배열 변환을 포함해도 약 5배 빠릅니다 (``python benchmarks/bench_analytics.py``).
+변환한 배열로 여러 지표를 계산할수록 차이가 커집니다.
+
+선택 의존성인 ``numpy`` 가 필요합니다 (``pip install py-lostark[analytics]``).
+
+이동 창(window) 지표는 창 안에 시세가 없는 날이 하나라도 있거나 창을 채울 만큼 날짜가 쌓이지
+않은 위치에서 NaN입니다.
+"""
+
+from typing import Any, Iterable, List, Mapping, NamedTuple, Optional, Union
+
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError as e:  # pragma: no cover - numpy가 없으면 모듈을 사용할 수 없음
+    raise ImportError(
+        "pyloa.analytics requires numpy. "
+        "Install it with `pip install py-lostark[analytics]`."
+    ) from e
+
+from pyloa.models.market import MarketItemStats
+
+Entries = Union[
+    Mapping[Any, Union[MarketItemStats, dict]], Iterable[Union[MarketItemStats, dict]]
+]
+
+
+def _check_window(window: int) -> None:
+    if window < 1:
+        raise ValueError("window must be at least 1")
+
+
+def _windows(values: "np.ndarray", window: int) -> "np.ndarray":
+    """마지막 축을 따라 크기 ``window`` 의 창을 복사 없이 만듭니다 (아이템, 위치, 창)."""
+    return sliding_window_view(values, window, axis=-1)
+
+
+def _pad(values: "np.ndarray", width: int) -> "np.ndarray":
+    """앞쪽을 NaN으로 채워 날짜 축 길이를 ``width`` 로 맞춥니다."""
+    out = np.full(values.shape[:-1] + (width,), np.nan)
+    out[..., width - values.shape[-1] :] = values
+    return out
+
+
+def moving_average(prices: "np.ndarray", window: int) -> "np.ndarray":
+    """단순 이동 평균.
+
+    Args:
+        prices: (아이템, 날짜) 평균가 배열. 시세가 없는 날은 NaN
+        window: 창 크기 (일)
+
+    Returns:
+        np.ndarray: ``prices`` 와 같은 모양의 배열. 각 날짜까지 ``window`` 일의 평균
+
+    Raises:
+        ValueError: window가 1보다 작은 경우
+    """
+    _check_window(window)
+    width = prices.shape[-1]
+    if window > width:
+        return np.full(prices.shape, np.nan)
+    return _pad(_windows(prices, window).mean(axis=-1), width)
+
+
+def vwap(
+    prices: "np.ndarray", counts: "np.ndarray", window: Optional[int] = None
+) -> "np.ndarray":
+    """거래량 가중 평균가 (VWAP).
+
+    Args:
+        prices: (아이템, 날짜) 평균가 배열. 시세가 없는 날은 NaN
+        counts: (아이템, 날짜) 거래량 배열. 시세가 없는 날은 0
+        window: 창 크기 (일). None이면 전체 기간의 VWAP를 아이템마다 하나씩 계산합니다.
+
+    Returns:
+        np.ndarray: window가 None이면 (아이템,) 배열, 아니면 ``prices`` 와 같은 모양의 배열.
+            거래량이 없으면 NaN
+
+    Raises:
+        ValueError: window가 1보다 작은 경우
+    """
+    traded = np.where(np.isnan(prices), 0.0, prices * counts)
+    volume = counts.astype(np.float64)
+    if window is None:
+        totals, volumes = traded.sum(axis=-1), volume.sum(axis=-1)
+    else:
+        _check_window(window)
+        width = prices.shape[-1]
+        if window > width:
+            return np.full(prices.shape, np.nan)
+        totals = _pad(_windows(traded, window).sum(axis=-1), width)
+        volumes = _pad(_windows(volume, window).sum(axis=-1), width)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(volumes > 0, totals / volumes, np.nan)
+
+
+def log_returns(prices: "np.ndarray") -> "np.ndarray":
+    """전일 대비 로그 수익률. 첫 날과 전날 시세가 없는 날은 NaN입니다."""
+    out = np.full(prices.shape, np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out[..., 1:] = np.log(prices[..., 1:] / prices[..., :-1])
+    return out
+
+
+def volatility(prices: "np.ndarray", window: int) -> "np.ndarray":
+    """이동 변동성: 최근 ``window`` 일 로그 수익률의 표본 표준편차.
+
+    Args:
+        prices: (아이템, 날짜) 평균가 배열. 시세가 없는 날은 NaN
+        window: 창 크기 (일). 2 이상이어야 합니다.
+
+    Returns:
+        np.ndarray: ``prices`` 와 같은 모양의 배열
+
+    Raises:
+        ValueError: window가 2보다 작은 경우
+    """
+    if window < 2:
+        raise ValueError("window must be at least 2")
+    returns = log_returns(prices)
+    width = prices.shape[-1]
+    if window > width:
+        return np.full(prices.shape, np.nan)
+    return _pad(_windows(returns, window).std(axis=-1, ddof=1), width)
+
+
+def zscore(prices: "np.ndarray", window: int) -> "np.ndarray":
+    """직전 ``window`` 일 대비 z-score.
+
+    각 날짜의 가격을 그 전 ``window`` 일(당일 제외)의 평균과 표본 표준편차로 표준화합니다.
+    당일 가격이 기준에 섞이지 않으므로 급등락이 스스로를 희석하지 않습니다. 표준편차가
+    0이면(가격 변동이 없으면) NaN입니다.
+
+    Args:
+        prices: (아이템, 날짜) 평균가 배열. 시세가 없는 날은 NaN
+        window: 기준 창 크기 (일). 2 이상이어야 합니다.
+
+    Returns:
+        np.ndarray: ``prices`` 와 같은 모양의 배열
+
+    Raises:
+        ValueError: window가 2보다 작은 경우
+    """
+    if window < 2:
+        raise ValueError("window must be at least 2")
+    width = prices.shape[-1]
+    out = np.full(prices.shape, np.nan)
+    if window >= width:
+        return out
+    history = _windows(prices[..., :-1], window)
+    mean = history.mean(axis=-1)
+    std = history.std(axis=-1, ddof=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scores = (prices[..., window:] - mean) / std
+    out[..., window:] = np.where(std > 0, scores, np.nan)
+    return out
+
+
+class Alert(NamedTuple):
+    """z-score 경보 하나.
+
+    Attributes:
+        key: 아이템 키
+        date: 날짜
+        price: 당일 평균가
+        zscore: 당일 z-score
+    """
+
+    key: Any
+    date: "np.datetime64"
+    price: float
+    zscore: float
+
+
+class MarketArrays(NamedTuple):
+    """여러 아이템의 시세를 날짜 축을 맞춰 담은 배열.
+
+    Attributes:
+        keys: 행별 아이템 키
+        dates: 날짜 축 (``datetime64[D]``, 오름차순)
+        prices: (아이템, 날짜) 평균가. 시세가 없는 날은 NaN
+        counts: (아이템, 날짜) 거래량. 시세가 없는 날은 0
+    """
+
+    keys: List[Any]
+    dates: "np.ndarray"
+    prices: "np.ndarray"
+    counts: "np.ndarray"
+
+    def row(self, key: Any) -> int:
+        """아이템 키의 행 번호를 반환합니다.
+
+        Raises:
+            KeyError: 키가 없는 경우
+        """
+        try:
+            return self.keys.index(key)
+        except ValueError:
+            raise KeyError(key) from None
+
+    def moving_average(self, window: int) -> "np.ndarray":
+        """:func:`moving_average` 참고."""
+        return moving_average(self.prices, window)
+
+    def vwap(self, window: Optional[int] = None) -> "np.ndarray":
+        """:func:`vwap` 참고."""
+        return vwap(self.prices, self.counts, window)
+
+    def volatility(self, window: int) -> "np.ndarray":
+        """:func:`volatility` 참고."""
+        return volatility(self.prices, window)
+
+    def zscore(self, window: int) -> "np.ndarray":
+        """:func:`zscore` 참고."""
+        return zscore(self.prices, window)
+
+    def alerts(
+        self, window: int = 7, threshold: float = 3.0, latest: bool = False
+    ) -> List[Alert]:
+        """z-score 절댓값이 ``threshold`` 이상인 (아이템, 날짜) 목록을 반환합니다.
+
+        Args:
+            window: 기준 창 크기 (일). :func:`zscore` 참고
+            threshold: 경보 기준 z-score 절댓값
+            latest: True이면 마지막 날짜의 경보만 반환합니다.
+
+        Returns:
+            List[Alert]: 아이템 순, 날짜 순으로 정렬된 경보
+        """
+        scores = self.zscore(window)
+        if latest:
+            scores = scores[:, -1:]
+        offset = self.prices.shape[1] - scores.shape[1]
+        with np.errstate(invalid="ignore"):
+            rows, cols = np.nonzero(np.abs(scores) >= threshold)
+        return [
+            Alert(
+                self.keys[row],
+                self.dates[col + offset],
+                float(self.prices[row, col + offset]),
+                float(scores[row, col]),
+            )
+            for row, col in zip(rows.tolist(), cols.tolist())
+        ]
+
+
+def to_arrays(entries: Entries) -> MarketArrays:
+    """``MarketItemStats`` 묶음을 :class:`MarketArrays` 로 변환합니다.
+
+    모든 아이템의 날짜를 합친 날짜 축을 만들고, 아이템에 시세가 없는 날은 평균가 NaN,
+    거래량 0으로 채웁니다. 배열은 C 연속(contiguous) 배열입니다.
+
+    Args:
+        entries: ``{아이템 키: MarketItemStats}`` 매핑 또는 ``MarketItemStats`` 의 목록.
+            목록이면 ``(아이템 이름, 거래 가능 횟수)`` 를 키로 사용합니다. ``get_item`` 은
+            같은 아이템을 거래 가능 횟수별로 따로 반환하므로 이름만으로는 구분할 수 없습니다.
+            raw 모드의 JSON(dict)도 받을 수 있습니다.
+
+    Returns:
+        MarketArrays: 변환한 배열
+
+    Raises:
+        ValueError: 목록에 같은 키의 아이템이 두 번 이상 있는 경우
+    """
+    if isinstance(entries, Mapping):
+        keys = list(entries.keys())
+        values = list(entries.values())
+    else:
+        values = list(entries)
+        keys = []
+    values = [
+        MarketItemStats.from_dict(v) if isinstance(v, dict) else v for v in values
+    ]
+    if not keys:
+        keys = [(v.name, v.trade_remain_count) for v in values]
+        if len(set(keys)) != len(keys):
+            duplicates = sorted({key for key in keys if keys.count(key) > 1}, key=str)
+            raise ValueError(f"Duplicate item keys: {duplicates}")
+
+    stats = [entry.stats for entry in values]
+    rows = np.repeat(np.arange(len(stats), dtype=np.intp), [len(s) for s in stats])
+    flat = [stat for row in stats for stat in row]
+    days = [stat.date[:10] for stat in flat]
+    # ISO 날짜 문자열은 사전순이 날짜순이므로, 고유 날짜만 정렬해 열 번호를 매깁니다.
+    axis = sorted(set(days))
+    column = {day: i for i, day in enumerate(axis)}
+    cols = np.fromiter((column[day] for day in days), dtype=np.intp, count=len(days))
+    dates = np.array(axis, dtype="datetime64[D]")
+    shape = (len(values), len(dates))
+    price_array = np.full(shape, np.nan)
+    count_array = np.zeros(shape, dtype=np.int64)
+    price_array[rows, cols] = [stat.avg_price for stat in flat]
+    count_array[rows, cols] = [stat.trade_count for stat in flat]
+    return MarketArrays(keys, dates, price_array, count_array)
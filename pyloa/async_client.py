@@ -0,0 +1,103 @@
+"""AsyncLostArkAPI 비동기 클라이언트.
+
+asyncio 이벤트 루프를 막지 않고 API를 호출하기 위한 클라이언트입니다.
+HTTP 전송에는 선택 의존성인 ``httpx`` 를 사용합니다 (``pip install py-lostark[async]``).
+"""
+
+from typing import Dict
+
+from pyloa.client import _ClientBase
+from pyloa.singleflight import AsyncSingleFlight
+
+
+class AsyncLostArkAPI(_ClientBase):
+    """로스트아크 API를 위한 asyncio 클라이언트.
+
+    ``LostArkAPI`` 와 같은 엔드포인트 구성을 제공하며, 모든 엔드포인트 메서드는
+    코루틴입니다. 응답은 동기 클라이언트와 동일한 모델로 변환되고, 생성자 옵션도 같습니다
+    (:class:`~pyloa.client._ClientBase` 참고). ``session`` 에는 ``httpx.AsyncClient`` 를
+    줄 수 있습니다.
+
+    Example:
+        >>> async with AsyncLostArkAPI(api_key="...") as api:
+        ...     events = await api.news.get_events()
+    """
+
+    _single_flight_class = AsyncSingleFlight
+
+    def _make_session(self, session, headers: Dict[str, str]):
+        if session is None:
+            try:
+                import httpx
+            except ImportError as e:
+                raise ImportError(
+                    "AsyncLostArkAPI requires httpx. "
+                    "Install it with `pip install py-lostark[async]`."
+                ) from e
+            return httpx.AsyncClient(headers=headers)
+        session.headers.update(headers)
+        return session
+
+    async def aclose(self) -> None:
+        """내부 HTTP 세션을 닫습니다."""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncLostArkAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    @property
+    def news(self):
+        """News 엔드포인트에 접근합니다."""
+        if not hasattr(self, "_news"):
+            from pyloa.endpoints.news import AsyncNewsEndpoint
+
+            self._news = AsyncNewsEndpoint(self)
+        return self._news
+
+    @property
+    def characters(self):
+        """Characters 엔드포인트에 접근합니다."""
+        if not hasattr(self, "_characters"):
+            from pyloa.endpoints.characters import AsyncCharactersEndpoint
+
+            self._characters = AsyncCharactersEndpoint(self)
+        return self._characters
+
+    @property
+    def markets(self):
+        """Markets 엔드포인트에 접근합니다."""
+        if not hasattr(self, "_markets"):
+            from pyloa.endpoints.markets import AsyncMarketsEndpoint
+
+            self._markets = AsyncMarketsEndpoint(self)
+        return self._markets
+
+    @property
+    def auctions(self):
+        """Auctions 엔드포인트에 접근합니다."""
+        if not hasattr(self, "_auctions"):
+            from pyloa.endpoints.auctions import AsyncAuctionsEndpoint
+
+            self._auctions = AsyncAuctionsEndpoint(self)
+        return self._auctions
+
+    @property
+    def game_contents(self):
+        """Game Contents 엔드포인트에 접근합니다."""
+        if not hasattr(self, "_game_contents"):
+            from pyloa.endpoints.game_contents import AsyncGameContentsEndpoint
+
+            self._game_contents = AsyncGameContentsEndpoint(self)
+        return self._game_contents
+
+    @property
+    def armories(self):
+        """Armories 엔드포인트에 접근합니다."""
+        if not hasattr(self, "_armories"):
+            from pyloa.endpoints.armories import AsyncArmoriesEndpoint
+
+            self._armories = AsyncArmoriesEndpoint(self)
+        return self._armories
@@ -0,0 +1,235 @@
+"""여러 요청을 동시에 처리하는 대량 조회 도우미.
+
+워커 풀로 요청을 동시에 보내되, 실제 전송 속도는 클라이언트의 속도 제한기(또는 키 풀)가
+결정합니다. 결과는 끝나는 순서대로 하나씩 돌려주며, 항목별 오류는 배치를 중단하지 않고
+결과에 담아 전달합니다.
+"""
+
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    TypeVar,
+)
+
+K = TypeVar("K")
+
+# 워커 수 대비 미리 제출해 두는 작업 수. 입력이 매우 커도 메모리에 모두 올리지 않습니다.
+_QUEUE_FACTOR = 2
+
+
+class BulkResult(NamedTuple):
+    """대량 조회의 항목 하나에 대한 결과.
+
+    Attributes:
+        key: 입력 항목 (예: 캐릭터 이름)
+        value: 조회 결과. 실패했으면 None
+        error: 발생한 예외. 성공했으면 None
+    """
+
+    key: Any
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """성공 여부."""
+        return self.error is None
+
+
+class BulkStats:
+    """대량 조회 진행 통계.
+
+    Attributes:
+        submitted: 제출한 항목 수
+        succeeded: 성공한 항목 수
+        failed: 실패한 항목 수
+        started_at: 시작 시각 (``time.monotonic`` 기준). 시작 전이면 None
+        finished_at: 종료 시각. 진행 중이면 None
+    """
+
+    def __init__(self):
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def completed(self) -> int:
+        """완료한 항목 수."""
+        return self.succeeded + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        """경과 시간 (초)."""
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """초당 완료한 항목 수."""
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def _record(self, result: BulkResult) -> BulkResult:
+        if result.ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        return result
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkStats(submitted={self.submitted}, succeeded={self.succeeded}, "
+            f"failed={self.failed}, elapsed={self.elapsed:.1f}s, "
+            f"throughput={self.throughput:.2f}/s)"
+        )
+
+
+class BulkIterator(Generic[K]):
+    """스레드 풀로 항목을 조회하고 끝나는 순서대로 :class:`BulkResult` 를 돌려주는 반복자.
+
+    반복을 중간에 멈추면 :meth:`close` 로 아직 시작하지 않은 작업을 취소합니다.
+
+    Attributes:
+        stats: 진행 통계
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[K], Any],
+        items: Iterable[K],
+        max_workers: int = 8,
+        stats: Optional[BulkStats] = None,
+    ):
+        """반복자를 초기화합니다.
+
+        Args:
+            fn: 항목 하나를 조회하는 함수
+            items: 조회할 항목
+            max_workers: 동시에 실행할 최대 작업 수
+            stats: 진행 통계를 기록할 객체. None이면 새 :class:`BulkStats` 를 만듭니다.
+
+        Raises:
+            ValueError: max_workers가 1보다 작은 경우
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.stats = stats if stats is not None else BulkStats()
+        self._results = self._run(fn, iter(items), max_workers)
+
+    def __iter__(self) -> "BulkIterator[K]":
+        return self
+
+    def __next__(self) -> BulkResult:
+        return next(self._results)
+
+    def close(self) -> None:
+        """남은 작업을 취소하고 워커를 정리합니다."""
+        self._results.close()
+
+    def _run(self, fn, items: Iterator[K], max_workers: int) -> Iterator[BulkResult]:
+        self.stats.started_at = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = {}
+        try:
+            while True:
+                for key in items:
+                    pending[executor.submit(fn, key)] = key
+                    self.stats.submitted += 1
+                    if len(pending) >= max_workers * _QUEUE_FACTOR:
+                        break
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = pending.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        yield self.stats._record(BulkResult(key, error=error))
+                    else:
+                        yield self.stats._record(BulkResult(key, future.result()))
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self.stats.finished_at = time.monotonic()
+
+
+class AsyncBulkIterator(Generic[K]):
+    """:class:`BulkIterator` 의 asyncio 버전. ``async for`` 로 사용합니다.
+
+    Attributes:
+        stats: 진행 통계
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[K], Awaitable[Any]],
+        items: Iterable[K],
+        max_workers: int = 8,
+        stats: Optional[BulkStats] = None,
+    ):
+        """반복자를 초기화합니다.
+
+        Args:
+            fn: 항목 하나를 조회하는 코루틴 함수
+            items: 조회할 항목
+            max_workers: 동시에 실행할 최대 작업 수
+            stats: 진행 통계를 기록할 객체. :class:`BulkIterator` 참고
+
+        Raises:
+            ValueError: max_workers가 1보다 작은 경우
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.stats = stats if stats is not None else BulkStats()
+        self._results = self._run(fn, iter(items), max_workers)
+
+    def __aiter__(self) -> "AsyncBulkIterator[K]":
+        return self
+
+    async def __anext__(self) -> BulkResult:
+        return await self._results.__anext__()
+
+    async def aclose(self) -> None:
+        """남은 작업을 취소합니다."""
+        await self._results.aclose()
+
+    async def _run(self, fn, items: Iterator[K], max_workers: int):
+        self.stats.started_at = time.monotonic()
+        pending = {}
+        try:
+            while True:
+                for key in items:
+                    pending[asyncio.ensure_future(fn(key))] = key
+                    self.stats.submitted += 1
+                    if len(pending) >= max_workers:
+                        break
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    key = pending.pop(task)
+                    error = task.exception()
+                    if error is not None:
+                        yield self.stats._record(BulkResult(key, error=error))
+                    else:
+                        yield self.stats._record(BulkResult(key, task.result()))
+        finally:
+            for task in pending:
+                task.cancel()
+            self.stats.finished_at = time.monotonic()
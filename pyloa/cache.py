@@ -0,0 +1,700 @@
+"""API 응답 캐시.
+
+같은 요청(메서드 + 경로 + 쿼리 파라미터 + JSON 본문)에 대한 응답을 TTL 동안 재사용하여
+속도 제한 예산을 아낍니다. 캐시에는 모델로 변환하기 전의 JSON 데이터를 저장합니다.
+"""
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from pyloa.models.armory import ARMORY_FILTERS
+
+# 캐시에 값이 없음을 나타내는 표식. JSON null(None)도 캐시할 수 있도록 None과 구분합니다.
+MISSING = object()
+
+# 자주 바뀌지 않는 엔드포인트의 기본 TTL (초). 경로 접두사로 매칭합니다.
+DEFAULT_TTLS: Dict[str, float] = {
+    "/news/notices": 300.0,
+    "/news/events": 600.0,
+    "/gamecontents/calendar": 3600.0,
+    "/markets/options": 86400.0,
+    "/auctions/options": 86400.0,
+}
+
+
+def make_cache_key(
+    method: str,
+    path: str,
+    params: Optional[Mapping] = None,
+    json_body: Any = None,
+) -> str:
+    """요청을 식별하는 캐시 키를 생성합니다.
+
+    쿼리 파라미터와 JSON 본문은 키 순서와 무관하게 같은 키가 되도록 정규화합니다.
+
+    Args:
+        method: HTTP 메서드
+        path: base_url을 제외한 전체 경로 (예: "/markets/items")
+        params: 쿼리 파라미터
+        json_body: JSON 요청 본문
+
+    Returns:
+        str: 캐시 키
+    """
+    canonical = json.dumps(
+        [dict(params or {}), json_body],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return f"{method.upper()} {path} {canonical}"
+
+
+class CacheStats:
+    """캐시 적중 통계."""
+
+    def __init__(self, hits: int = 0, misses: int = 0, evictions: int = 0):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+
+    @property
+    def hit_rate(self) -> float:
+        """적중률 (0.0 ~ 1.0)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, hit_rate={self.hit_rate:.2f})"
+        )
+
+
+class CacheBackend:
+    """응답 캐시 백엔드의 기본 클래스.
+
+    하위 클래스는 :meth:`_get`, :meth:`_set`, :meth:`delete`, :meth:`clear` 를 구현합니다.
+    TTL 결정과 적중 통계는 이 클래스가 담당합니다.
+    """
+
+    def __init__(
+        self, default_ttl: float = 60.0, ttls: Optional[Mapping[str, float]] = None
+    ):
+        """캐시를 초기화합니다.
+
+        Args:
+            default_ttl: ``ttls`` 에 없는 경로의 TTL (초). 0이면 캐시하지 않습니다.
+            ttls: 경로 접두사별 TTL (초). :data:`DEFAULT_TTLS` 를 덮어씁니다.
+        """
+        self.default_ttl = default_ttl
+        self.ttls: Dict[str, float] = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    def ttl_for(self, path: str) -> float:
+        """경로에 적용할 TTL을 반환합니다. 가장 긴 접두사가 우선합니다."""
+        best = None
+        for prefix in self.ttls:
+            if path.startswith(prefix) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        return self.ttls[best] if best is not None else self.default_ttl
+
+    def get(self, key: str) -> Any:
+        """캐시된 값을 반환합니다. 없거나 만료되었으면 :data:`MISSING` 을 반환합니다."""
+        value = self._get(key)
+        with self._stats_lock:
+            if value is MISSING:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """값을 TTL(초) 동안 저장합니다."""
+        if ttl > 0:
+            self._set(key, value, ttl)
+
+    def _record_eviction(self, count: int = 1) -> None:
+        with self._stats_lock:
+            self.stats.evictions += count
+
+    def _get(self, key: str) -> Any:
+        raise NotImplementedError
+
+    def _set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """키를 삭제합니다."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """모든 항목을 삭제합니다."""
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """프로세스 메모리에 저장하는 TTL + LRU 캐시.
+
+    항목 수가 ``maxsize`` 를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    캐시된 JSON 객체는 호출자 간에 공유되므로 수정하지 않아야 합니다.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        default_ttl: float = 60.0,
+        ttls: Optional[Mapping[str, float]] = None,
+    ):
+        """메모리 캐시를 초기화합니다.
+
+        Args:
+            maxsize: 최대 항목 수
+            default_ttl: ``ttls`` 에 없는 경로의 TTL (초)
+            ttls: 경로 접두사별 TTL (초)
+
+        Raises:
+            ValueError: maxsize가 1보다 작은 경우
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        super().__init__(default_ttl=default_ttl, ttls=ttls)
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: Any, ttl: float) -> None:
+        evicted = 0
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self._record_eviction(evicted)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class SQLiteCache(CacheBackend):
+    """SQLite 파일에 저장하는 영구 응답 캐시.
+
+    같은 호스트의 여러 워커 프로세스(gunicorn, uvicorn 등)가 하나의 파일을 공유하므로
+    한 워커가 받은 응답을 다른 워커도 재사용하며, 프로세스를 재시작해도 캐시가 유지됩니다.
+
+    - WAL 모드로 열어 읽기와 쓰기가 서로를 막지 않습니다.
+    - 값은 JSON으로 직렬화한 뒤 zlib으로 압축해 저장합니다.
+    - 만료 시각은 프로세스 간에 비교할 수 있도록 벽시계(``time.time``) 기준입니다.
+    - 쓰기 ``EVICT_INTERVAL`` 회마다 만료된 항목을 지우고, 항목 수가 ``maxsize`` 를
+      넘으면 만료 시각이 가장 이른 항목부터 제거합니다.
+
+    연결은 스레드/프로세스마다 따로 열기 때문에 fork 이후에도 안전하게 사용할 수 있습니다.
+    """
+
+    EVICT_INTERVAL = 100
+
+    def __init__(
+        self,
+        path: str,
+        maxsize: int = 100_000,
+        default_ttl: float = 60.0,
+        ttls: Optional[Mapping[str, float]] = None,
+        compress_level: int = 6,
+        timeout: float = 30.0,
+    ):
+        """SQLite 캐시를 초기화합니다.
+
+        Args:
+            path: SQLite 데이터베이스 파일 경로
+            maxsize: 최대 항목 수
+            default_ttl: ``ttls`` 에 없는 경로의 TTL (초)
+            ttls: 경로 접두사별 TTL (초)
+            compress_level: zlib 압축 수준 (0-9)
+            timeout: 다른 프로세스가 쓰기 잠금을 가진 경우 기다릴 최대 시간 (초)
+
+        Raises:
+            ValueError: maxsize가 1보다 작은 경우
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        super().__init__(default_ttl=default_ttl, ttls=ttls)
+        self.path = path
+        self.maxsize = maxsize
+        self.compress_level = compress_level
+        self.timeout = timeout
+        self._local = threading.local()
+        self._writes = 0
+        # 스키마를 미리 만들어 두어 잘못된 경로를 초기화 시점에 발견합니다.
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        """현재 스레드/프로세스의 연결을 반환합니다. 없으면 새로 엽니다."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, payload BLOB NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)"
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def __len__(self) -> int:
+        row = self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()
+        return row[0]
+
+    def _get(self, key: str) -> Any:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT expires_at, payload FROM responses WHERE key = ?", (key,)
+            )
+            .fetchone()
+        )
+        if row is None:
+            return MISSING
+        expires_at, payload = row
+        if time.time() >= expires_at:
+            self.delete(key)
+            return MISSING
+        return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+    def _set(self, key: str, value: Any, ttl: float) -> None:
+        payload = zlib.compress(
+            json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode(
+                "utf-8"
+            ),
+            self.compress_level,
+        )
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, expires_at, payload) "
+            "VALUES (?, ?, ?)",
+            (key, time.time() + ttl, payload),
+        )
+        self._writes += 1
+        if self._writes % self.EVICT_INTERVAL == 0:
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """만료된 항목과 maxsize를 넘는 항목을 제거합니다."""
+        conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        overflow = len(self) - self.maxsize
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY expires_at LIMIT ?)",
+                (overflow,),
+            )
+            self._record_eviction(overflow)
+
+    def delete(self, key: str) -> None:
+        self._connection().execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """현재 스레드의 연결을 닫습니다."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class RosterIndex:
+    """원정대 목록 캐시.
+
+    ``get_siblings`` 응답은 원정대의 모든 캐릭터가 같은 목록이므로, 응답 하나를 원정대 항목
+    하나로 저장하고 목록에 있는 모든 캐릭터 이름(과 요청한 이름)이 그 항목을 가리키게 합니다.
+    한 캐릭터로 조회한 뒤에는 같은 원정대의 다른 캐릭터를 요청 없이 조회할 수 있습니다.
+
+    원정대 수가 ``maxsize`` 를 넘으면 가장 오래 사용하지 않은 원정대부터 제거합니다.
+    캐시된 JSON 목록은 호출자 간에 공유되므로 수정하지 않아야 합니다.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 600.0):
+        """원정대 캐시를 초기화합니다.
+
+        Args:
+            maxsize: 최대 원정대 수
+            ttl: 원정대 항목의 유효 시간 (초). 캐릭터 목록과 아이템 레벨이 바뀌므로
+                너무 길게 잡지 않는 것이 좋습니다.
+
+        Raises:
+            ValueError: maxsize가 1보다 작거나 ttl이 0 이하인 경우
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        # 원정대 ID -> (만료 시각, 이름 목록, JSON 목록)
+        self._rosters: "OrderedDict[int, Tuple[float, Tuple[str, ...], Any]]" = (
+            OrderedDict()
+        )
+        self._names: Dict[str, int] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """저장된 원정대 수."""
+        return len(self._rosters)
+
+    def get(self, name: str) -> Any:
+        """캐릭터가 속한 원정대의 JSON 목록을 반환합니다. 없거나 만료되었으면 MISSING."""
+        with self._lock:
+            roster_id = self._names.get(name)
+            entry = self._rosters.get(roster_id) if roster_id is not None else None
+            if entry is not None and time.monotonic() >= entry[0]:
+                self._drop(roster_id)
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return MISSING
+            self._rosters.move_to_end(roster_id)
+            self.stats.hits += 1
+            return entry[2]
+
+    def set(self, name: str, data: Any) -> None:
+        """``name`` 으로 조회한 원정대 JSON 목록을 저장합니다.
+
+        목록의 캐릭터가 이전에 다른 원정대 항목에 속해 있었다면(캐릭터 생성/삭제 등으로
+        원정대가 바뀐 경우) 그 항목은 제거합니다. 빈 목록은 저장하지 않습니다.
+        """
+        if not isinstance(data, list) or not data:
+            return
+        names = {name}
+        for member in data:
+            if isinstance(member, dict) and member.get("CharacterName"):
+                names.add(member["CharacterName"])
+        evicted = 0
+        with self._lock:
+            for stale in {self._names[n] for n in names if n in self._names}:
+                self._drop(stale)
+            roster_id = self._next_id
+            self._next_id += 1
+            members = tuple(sorted(names))
+            self._rosters[roster_id] = (time.monotonic() + self.ttl, members, data)
+            for member in members:
+                self._names[member] = roster_id
+            while len(self._rosters) > self.maxsize:
+                self._drop(next(iter(self._rosters)))
+                evicted += 1
+            self.stats.evictions += evicted
+
+    def _drop(self, roster_id: int) -> None:
+        """원정대 항목과 이름 매핑을 제거합니다. 잠금을 가진 상태에서 호출합니다."""
+        _, members, _ = self._rosters.pop(roster_id)
+        for member in members:
+            if self._names.get(member) == roster_id:
+                del self._names[member]
+
+    def delete(self, name: str) -> None:
+        """캐릭터가 속한 원정대 항목을 제거합니다."""
+        with self._lock:
+            roster_id = self._names.get(name)
+            if roster_id is not None:
+                self._drop(roster_id)
+
+    def clear(self) -> None:
+        """모든 항목을 삭제합니다."""
+        with self._lock:
+            self._rosters.clear()
+            self._names.clear()
+
+
+class ArmoryCache:
+    """캐릭터별 Armory 섹션 캐시.
+
+    ``get_total_info`` 의 각 섹션과 섹션별 조회(``get_gems`` 등)는 같은 데이터를 서로 다른
+    URL로 받습니다. 이 캐시는 섹션 단위(필터 이름, 예: "gems")로 JSON을 저장하므로, 종합
+    정보를 조회한 직후의 ``get_gems`` 는 요청 없이 응답하고, 필터를 준 ``get_total_info`` 는
+    없거나 만료된 섹션만 요청합니다.
+
+    캐릭터 수가 ``maxsize`` 를 넘으면 가장 오래 사용하지 않은 캐릭터부터 제거합니다.
+    캐시된 JSON은 호출자 간에 공유되므로 수정하지 않아야 합니다.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        ttls: Optional[Mapping[str, float]] = None,
+    ):
+        """섹션 캐시를 초기화합니다.
+
+        Args:
+            maxsize: 최대 캐릭터 수
+            ttl: ``ttls`` 에 없는 섹션의 유효 시간 (초)
+            ttls: 필터 이름별 유효 시간 (초). 예: ``{"profiles": 60, "collectibles": 3600}``
+
+        Raises:
+            ValueError: maxsize가 1보다 작거나 ttls에 알 수 없는 필터 이름이 있는 경우
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        unknown = set(ttls or ()) - set(ARMORY_FILTERS)
+        if unknown:
+            raise ValueError(f"Unknown armory sections: {sorted(unknown)}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls: Dict[str, float] = dict(ttls or {})
+        self.stats = CacheStats()
+        # 캐릭터 이름 -> {필터 이름: (만료 시각, JSON)}
+        self._data: "OrderedDict[str, Dict[str, Tuple[float, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """저장된 캐릭터 수."""
+        return len(self._data)
+
+    def ttl_for(self, section: str) -> float:
+        """섹션(필터 이름)에 적용할 유효 시간을 반환합니다."""
+        return self.ttls.get(section, self.ttl)
+
+    def get(self, name: str, sections: Iterable[str]) -> Dict[str, Any]:
+        """캐릭터의 섹션 중 유효한 것만 ``{필터 이름: JSON}`` 으로 반환합니다."""
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            entries = self._data.get(name)
+            if entries is not None:
+                self._data.move_to_end(name)
+            for section in sections:
+                entry = entries.get(section) if entries is not None else None
+                if entry is not None and now < entry[0]:
+                    found[section] = entry[1]
+                    self.stats.hits += 1
+                else:
+                    self.stats.misses += 1
+        return found
+
+    def set(self, name: str, sections: Mapping[str, Any]) -> None:
+        """캐릭터의 섹션들을 ``{필터 이름: JSON}`` 으로 저장합니다."""
+        now = time.monotonic()
+        evicted = 0
+        with self._lock:
+            entries = self._data.setdefault(name, {})
+            self._data.move_to_end(name)
+            for section, value in sections.items():
+                ttl = self.ttl_for(section)
+                if ttl > 0:
+                    entries[section] = (now + ttl, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                evicted += 1
+            self.stats.evictions += evicted
+
+    def delete(self, name: str) -> None:
+        """캐릭터의 모든 섹션을 삭제합니다."""
+        with self._lock:
+            self._data.pop(name, None)
+
+    def clear(self) -> None:
+        """모든 항목을 삭제합니다."""
+        with self._lock:
+            self._data.clear()
+
+
+class _BloomFilter:
+    """고정 크기 Bloom 필터. 이름 길이와 관계없이 ``capacity`` 에 비례한 메모리만 사용합니다."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.size = max(8, bits)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, name: str):
+        # 128비트 해시 하나를 둘로 나눠 이중 해싱으로 k개의 위치를 만듭니다.
+        digest = hashlib.blake2b(name.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, name: str) -> None:
+        for position in self._positions(name):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, name: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(name)
+        )
+
+
+class NegativeCache:
+    """없는 캐릭터 이름 캐시.
+
+    삭제되었거나 철자가 틀린 캐릭터는 Armory 조회가 null을 반환하는데, 사용자가 같은 이름을
+    반복해서 조회하면 매번 속도 제한 예산을 소모합니다. 이 캐시는 그런 이름을 짧은 TTL 동안
+    기억해 요청 없이 빈 결과를 돌려주게 합니다. 새로 만든 캐릭터가 너무 오래 가려지지 않도록
+    TTL은 짧게 잡는 것이 좋습니다.
+
+    기본 모드는 이름을 그대로 저장하고 ``maxsize`` 를 넘으면 가장 오래된 이름부터 제거합니다.
+    ``bloom=True`` 이면 이름 대신 Bloom 필터 두 세대를 번갈아 사용해 매우 많은 이름도 고정된
+    메모리로 기억합니다. 새 이름은 현재 세대에 넣고, ``ttl / 2`` 마다(또는 현재 세대가
+    ``maxsize`` 개로 차면) 이전 세대를 버리고 새 세대를 시작하므로 이름은 최대 ``ttl`` 동안
+    유지됩니다. 이 모드는 약 ``error_rate`` 확률로 있는 캐릭터를 없다고 잘못 판단할 수 있고,
+    이름 하나만 지울 수 없습니다.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        maxsize: int = 10000,
+        bloom: bool = False,
+        error_rate: float = 0.001,
+    ):
+        """없는 이름 캐시를 초기화합니다.
+
+        Args:
+            ttl: 이름을 기억하는 시간 (초)
+            maxsize: 기억할 최대 이름 수. Bloom 모드에서는 세대 하나의 용량입니다.
+            bloom: True이면 Bloom 필터로 저장합니다.
+            error_rate: Bloom 모드의 세대별 오탐률 목표 (0 초과 1 미만)
+
+        Raises:
+            ValueError: ttl이 0 이하이거나 maxsize가 1보다 작거나 error_rate가 범위를
+                벗어난 경우
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.bloom = bloom
+        self.error_rate = error_rate
+        self.stats = CacheStats()
+        # 이름 -> 만료 시각 (기본 모드)
+        self._names: "OrderedDict[str, float]" = OrderedDict()
+        # 현재/이전 세대와 현재 세대 시작 시각 (Bloom 모드)
+        self._current: Optional[_BloomFilter] = None
+        self._previous: Optional[_BloomFilter] = None
+        self._started = 0.0
+        self._lock = threading.Lock()
+        self.clear()
+
+    def __len__(self) -> int:
+        """기억하는 이름 수. Bloom 모드에서는 두 세대에 넣은 횟수의 합(근사치)입니다."""
+        if self.bloom:
+            return self._current.count + self._previous.count
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        """이름이 없는 캐릭터로 기억되어 있는지 확인합니다."""
+        now = time.monotonic()
+        with self._lock:
+            if self.bloom:
+                self._rotate(now)
+                found = name in self._current or name in self._previous
+            else:
+                expires = self._names.get(name)
+                found = expires is not None and now < expires
+                if expires is not None and not found:
+                    del self._names[name]
+            if found:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+            return found
+
+    def add(self, name: str) -> None:
+        """없는 캐릭터 이름을 기억합니다."""
+        now = time.monotonic()
+        with self._lock:
+            if self.bloom:
+                self._rotate(now)
+                if self._current.count >= self.maxsize:
+                    self._shift(now)
+                self._current.add(name)
+                return
+            self._names[name] = now + self.ttl
+            self._names.move_to_end(name)
+            while len(self._names) > self.maxsize:
+                self._names.popitem(last=False)
+                self.stats.evictions += 1
+
+    def _rotate(self, now: float) -> None:
+        """Bloom 모드에서 세대 시간이 지났으면 세대를 넘깁니다. 잠금을 가진 상태에서 호출합니다."""
+        elapsed = now - self._started
+        if elapsed >= self.ttl:
+            # 두 세대가 모두 만료되었습니다.
+            self._shift(now)
+            self._shift(now)
+        elif elapsed >= self.ttl / 2:
+            self._shift(now)
+
+    def _shift(self, now: float) -> None:
+        if self._previous.count:
+            self.stats.evictions += self._previous.count
+        self._previous = self._current
+        self._current = _BloomFilter(self.maxsize, self.error_rate)
+        self._started = now
+
+    def delete(self, name: str) -> None:
+        """이름을 잊습니다. Bloom 모드에서는 이름 하나만 지울 수 없으므로 모두 비웁니다."""
+        with self._lock:
+            if not self.bloom:
+                self._names.pop(name, None)
+                return
+        self.clear()
+
+    def clear(self) -> None:
+        """모든 이름을 삭제합니다."""
+        with self._lock:
+            self._names.clear()
+            if self.bloom:
+                self._current = _BloomFilter(self.maxsize, self.error_rate)
+                self._previous = _BloomFilter(self.maxsize, self.error_rate)
+                self._started = time.monotonic()
@@ -1,31 +1,145 @@
 """LostArkAPI 클라이언트."""
 
-import requests
-
+from typing import Dict, List, Optional, Sequence, Union
 
-class LostArkAPI:
-    """로스트아크 API를 위한 메인 클라이언트."""
+import requests
 
-    def __init__(self, api_key: str):
+from pyloa.cache import ArmoryCache, CacheBackend, NegativeCache, RosterIndex
+from pyloa.conditional import ConditionalCache
+from pyloa.decoders import Decoder, get_decoder
+from pyloa.rate_limiter import KeyPool, RateLimiter
+from pyloa.retry import RetryPolicy
+from pyloa.singleflight import SingleFlight
+
+# ``raw`` 에 허용하는 값: 모델 변환(False), JSON 그대로(True), 응답 본문 바이트("bytes")
+RAW_MODES = (False, True, "bytes")
+
+
+class _ClientBase:
+    """동기/비동기 클라이언트가 공유하는 설정과 초기화.
+
+    하위 클래스는 :meth:`_make_session` 으로 HTTP 세션을 만들고, ``_single_flight_class`` 로
+    요청 합치기 구현을 지정합니다. 클라이언트 옵션은 이 클래스에만 추가합니다.
+    """
+
+    _single_flight_class: type = SingleFlight
+
+    def __init__(
+        self,
+        api_key: Union[str, Sequence[str]],
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[CacheBackend] = None,
+        coalesce: bool = True,
+        conditional: Optional[ConditionalCache] = None,
+        raw: Union[bool, str] = False,
+        json_decoder: Union[str, Decoder, None] = None,
+        session=None,
+        roster_index: Optional[RosterIndex] = None,
+        armory_cache: Optional[ArmoryCache] = None,
+        negative_cache: Optional[NegativeCache] = None,
+    ):
         """API 클라이언트를 초기화합니다.
 
         Args:
-            api_key: 인증을 위한 JWT 토큰
+            api_key: 인증을 위한 JWT 토큰. 여러 키의 리스트를 주면 키 풀을 구성하여
+                요청마다 남은 한도가 가장 많은 키로 분산합니다.
+            rate_limiter: 요청 속도 제한기. None이면 대기하지 않는 "fail_fast" 모드의 기본
+                제한기를 사용해, 남은 요청이 없으면 요청을 보내지 않고 바로
+                ``RateLimitError`` 를 발생시킵니다. 한도에 맞춰 기다리려면
+                ``RateLimiter(mode="block")`` 이나 ``RateLimiter(mode="wait", max_wait=...)``
+                를 주세요. 키 풀을 사용할 때는 이 제한기의 mode/max_wait 설정만 반영됩니다.
+            retry_policy: 429/5xx 재시도 정책 (예: ``RetryPolicy()``). None이면 재시도하지
+                않고 429 응답은 바로 ``RateLimitError`` 로 알립니다.
+            cache: 응답 캐시 백엔드 (예: ``MemoryCache()``). None이면 캐시하지 않습니다.
+            coalesce: True면 동시에 들어온 동일한 멱등 요청을 하나의 API 호출로 합칩니다.
+            conditional: ETag/Last-Modified 검증자 저장소 (예: ``ConditionalCache()``).
+                주어지면 GET 요청을 조건부로 보내고 304 응답에는 이전 결과를 재사용합니다.
+            raw: True면 모든 엔드포인트가 모델 대신 JSON 디코딩 결과를 그대로 반환합니다.
+                "bytes"면 JSON을 해석하지 않은 응답 본문(bytes)을 반환합니다.
+            json_decoder: 응답 JSON 디코더. 이름("orjson", "msgspec", "ujson", "json")이나
+                bytes를 받는 함수를 지정합니다. None이면 설치된 가장 빠른 라이브러리를 사용합니다.
+            session: 사용할 HTTP 세션 (동기: ``requests.Session``, 비동기:
+                ``httpx.AsyncClient``). None이면 새로 생성합니다.
+            roster_index: 원정대 캐시 (예: ``RosterIndex()``). 주어지면 ``get_siblings`` 응답을
+                원정대의 모든 캐릭터 이름으로 찾을 수 있게 저장합니다.
+            armory_cache: Armory 섹션 캐시 (예: ``ArmoryCache()``). 주어지면 종합 정보와
+                섹션별 조회가 섹션 단위로 캐시를 공유합니다.
+            negative_cache: 없는 캐릭터 캐시 (예: ``NegativeCache(ttl=60)``). 주어지면 null을
+                반환한 캐릭터 이름을 기억해 TTL 동안 Armory/원정대 조회를 요청 없이 비웁니다.
+
+        Raises:
+            ValueError: 빈 키 리스트가 주어졌거나 raw 또는 json_decoder 값이 올바르지 않은 경우
+            ImportError: json_decoder로 지정한 라이브러리가 설치되지 않았거나, 비동기
+                클라이언트에 session이 주어지지 않았고 httpx가 설치되지 않은 경우
         """
-        self._api_key = api_key
+        api_keys = [api_key] if isinstance(api_key, str) else list(api_key)
+        if not api_keys:
+            raise ValueError("At least one API key is required")
+        if raw not in RAW_MODES:
+            raise ValueError(f"raw must be one of {RAW_MODES}, got {raw!r}")
+
+        self._api_key = api_keys[0]
         self.base_url = "https://developer-lostark.game.onstove.com"
 
+        # 키가 하나면 단일 제한기를, 여러 개면 키별 제한기를 가진 키 풀을 사용합니다.
+        if rate_limiter is None:
+            # 웹 요청 처리기 등에서 조용히 오래 멈추지 않도록 기본값은 대기하지 않습니다.
+            rate_limiter = RateLimiter(mode=RateLimiter.MODE_FAIL_FAST)
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.key_pool: Optional[KeyPool] = None
+        if len(api_keys) > 1:
+            self.key_pool = KeyPool(
+                api_keys, mode=rate_limiter.mode, max_wait=rate_limiter.max_wait
+            )
+            self.rate_limiter = None
+
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.conditional = conditional
+        self.raw = raw
+        self.json_decoder: Decoder = get_decoder(json_decoder)
+        self.roster_index = roster_index
+        self.armory_cache = armory_cache
+        self.negative_cache = negative_cache
+        self.single_flight = self._single_flight_class() if coalesce else None
+
         # 세션 및 헤더 생성
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"authorization": f"bearer {api_key}", "accept": "application/json"}
-        )
+        headers = {
+            "authorization": f"bearer {self._api_key}",
+            "accept": "application/json",
+        }
+        self.session = self._make_session(session, headers)
+
+    def _make_session(self, session, headers: Dict[str, str]):
+        """HTTP 세션을 만들거나 주어진 세션에 헤더를 설정해 반환합니다."""
+        raise NotImplementedError  # pragma: no cover - 하위 클래스가 구현
 
     @property
     def api_key(self) -> str:
         """API 키를 반환합니다 (읽기 전용)."""
         return self._api_key
 
+    @property
+    def api_keys(self) -> List[str]:
+        """등록된 모든 API 키를 반환합니다 (읽기 전용)."""
+        if self.key_pool is not None:
+            return self.key_pool.keys
+        return [self._api_key]
+
+
+class LostArkAPI(_ClientBase):
+    """로스트아크 API를 위한 메인 클라이언트.
+
+    옵션은 :class:`_ClientBase` 의 생성자를 참고하세요.
+    """
+
+    def _make_session(self, session, headers: Dict[str, str]) -> requests.Session:
+        if session is None:
+            session = requests.Session()
+        session.headers.update(headers)
+        return session
+
     @property
     def news(self):
         """News 엔드포인트에 접근합니다."""
@@ -0,0 +1,153 @@
+"""조건부 GET (ETag / Last-Modified) 지원.
+
+응답의 ``ETag`` 와 ``Last-Modified`` 헤더를 URL별로 기억했다가 다음 요청에
+``If-None-Match`` / ``If-Modified-Since`` 로 보냅니다. 서버가 304 Not Modified로
+응답하면 본문을 다시 받지 않고 저장해 둔 JSON과 이미 변환한 모델을 그대로 반환합니다.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from pyloa.cache import MISSING
+from pyloa.rate_limiter import get_header
+
+
+class ConditionalStats:
+    """조건부 요청 통계.
+
+    Attributes:
+        conditional_requests: 검증자 헤더를 붙여 보낸 요청 수
+        not_modified: 304 Not Modified 응답 수
+        updates: 새 검증자와 본문을 저장한 횟수
+        model_reuses: 모델 변환을 건너뛰고 이전 모델을 재사용한 횟수
+    """
+
+    def __init__(self):
+        self.conditional_requests = 0
+        self.not_modified = 0
+        self.updates = 0
+        self.model_reuses = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"ConditionalStats(conditional_requests={self.conditional_requests}, "
+            f"not_modified={self.not_modified}, updates={self.updates}, "
+            f"model_reuses={self.model_reuses})"
+        )
+
+
+class _Entry:
+    """URL 하나에 대해 저장한 검증자와 본문."""
+
+    __slots__ = ("etag", "last_modified", "data", "models")
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], data: Any):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.data = data
+        self.models: Dict[Any, Any] = {}
+
+
+class ConditionalCache:
+    """URL별 검증자(ETag/Last-Modified)와 마지막 응답을 보관하는 저장소.
+
+    304 응답에서 재사용한 JSON과 모델은 이전 호출자와 공유되므로 수정하지 않아야 합니다.
+    항목 수가 ``maxsize`` 를 넘으면 가장 오래 사용하지 않은 URL부터 제거합니다.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """저장소를 초기화합니다.
+
+        Args:
+            maxsize: 기억할 최대 URL 수
+
+        Raises:
+            ValueError: maxsize가 1보다 작은 경우
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.stats = ConditionalStats()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        # 반환한 JSON 객체(id) -> 항목. 304로 돌려준 데이터의 모델을 찾는 데 사용합니다.
+        self._by_data: Dict[int, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def request_headers(self, key: str) -> Dict[str, str]:
+        """키에 대해 보낼 조건부 요청 헤더를 반환합니다. 저장된 검증자가 없으면 빈 dict입니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return {}
+            self._entries.move_to_end(key)
+            self.stats.conditional_requests += 1
+        headers = {}
+        if entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def not_modified(self, key: str) -> Any:
+        """304 응답을 기록하고 저장된 JSON을 반환합니다. 없으면 :data:`MISSING` 입니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            self.stats.not_modified += 1
+            return entry.data
+
+    def update(self, key: str, headers: Optional[Mapping], data: Any) -> None:
+        """응답에 검증자가 있으면 본문과 함께 저장합니다. 없으면 기존 항목을 지웁니다."""
+        etag = get_header(headers, "ETag")
+        last_modified = get_header(headers, "Last-Modified")
+        with self._lock:
+            self._discard(key)
+            if etag is None and last_modified is None:
+                return
+            entry = _Entry(etag, last_modified, data)
+            self._entries[key] = entry
+            self._by_data[id(data)] = entry
+            self.stats.updates += 1
+            while len(self._entries) > self.maxsize:
+                self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: str) -> None:
+        """잠금을 보유한 상태에서 항목을 제거합니다."""
+        entry = self._entries.pop(key, None)
+        if entry is not None and self._by_data.get(id(entry.data)) is entry:
+            del self._by_data[id(entry.data)]
+
+    def model(self, data: Any, name: Any, build: Callable[[Any], Any]) -> Any:
+        """저장된 JSON에서 만든 모델을 재사용하고, 없으면 ``build(data)`` 로 만들어 기억합니다.
+
+        Args:
+            data: ``_request`` 가 반환한 JSON 객체
+            name: 같은 JSON에서 만드는 모델을 구분하는 이름
+            build: 모델을 만드는 함수
+
+        Returns:
+            Any: 변환된 모델
+        """
+        with self._lock:
+            entry = self._by_data.get(id(data))
+            if entry is None or entry.data is not data:
+                entry = None
+            elif name in entry.models:
+                self.stats.model_reuses += 1
+                return entry.models[name]
+        model = build(data)
+        if entry is not None:
+            with self._lock:
+                entry.models[name] = model
+        return model
+
+    def clear(self) -> None:
+        """모든 항목을 삭제합니다."""
+        with self._lock:
+            self._entries.clear()
+            self._by_data.clear()
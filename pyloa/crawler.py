@@ -0,0 +1,425 @@
+"""원정대 단위 캐릭터 크롤러.
+
+``get_siblings`` 는 원정대의 모든 캐릭터가 같은 목록을 반환하므로, 캐릭터마다 호출하면 같은
+원정대를 여러 번 조회하게 됩니다. :class:`RosterCrawler` 는 이미 조회한 원정대에 속한 이름은
+다시 조회하지 않고 원정대 단위로 너비 우선 탐색하며, 발견한 캐릭터의 Armory 정보를 제한된
+동시성으로 조회합니다.
+
+진행 상태(대기 중인 원정대/캐릭터, 방문한 이름)는 체크포인트 파일(JSON)에 주기적으로
+저장되므로, 작업이 중간에 종료되어도 같은 체크포인트로 다시 만들면 멈춘 곳부터 이어서
+진행합니다. 결과는 호출자가 다음 결과를 요청해야 전달된 것으로 기록하므로, 종료 시점에
+진행 중이던 요청과 마지막으로 돌려준 결과는 재개할 때 다시 조회합니다 (최소 한 번 전달).
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from pyloa.bulk import BulkResult, BulkStats
+
+# 체크포인트를 저장하는 주기 (완료한 요청 수)
+DEFAULT_CHECKPOINT_EVERY = 100
+
+_VERSION = 2
+_ROSTER = "roster"
+_CHARACTER = "character"
+
+Task = Tuple[str, str]
+
+
+class CrawlStats(BulkStats):
+    """크롤링 진행 통계.
+
+    ``submitted`` 는 Armory 조회 대기열에 넣은 캐릭터 수, ``succeeded``/``failed`` 와
+    ``throughput`` 은 돌려준 결과 기준입니다 (``failed`` 에는 원정대 조회 실패도 포함).
+    모두 이번 실행에서 처리한 양만 셉니다.
+
+    Attributes:
+        rosters: 조회한 원정대 수
+        skipped: 이미 조회한 원정대에 속해 ``get_siblings`` 호출을 건너뛴 이름 수
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.rosters = 0
+        self.skipped = 0
+
+    @property
+    def requests(self) -> int:
+        """완료한 API 요청 수 (원정대 + 캐릭터)."""
+        return self.rosters + self.completed
+
+    @property
+    def request_rate(self) -> float:
+        """초당 완료한 API 요청 수."""
+        elapsed = self.elapsed
+        return self.requests / elapsed if elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"CrawlStats(rosters={self.rosters}, skipped={self.skipped}, "
+            f"succeeded={self.succeeded}, failed={self.failed}, "
+            f"elapsed={self.elapsed:.1f}s, throughput={self.throughput:.2f}/s, "
+            f"request_rate={self.request_rate:.2f}/s)"
+        )
+
+
+class _CrawlState:
+    """크롤링 대기열과 방문 기록. 동기/비동기 크롤러가 공유합니다."""
+
+    def __init__(self, path: Optional[str], stats: CrawlStats, retry_failed: bool):
+        self.path = path
+        self.stats = stats
+        self.rosters: "deque[str]" = deque()
+        self.characters: "deque[str]" = deque()
+        # 원정대 조회 대기열에 넣었거나 조회한 원정대에 속한 이름
+        self.seen = set()
+        # 조회한 원정대에 속한 이름
+        self.covered = set()
+        # Armory 조회 대기열에 넣었거나 조회를 마친 이름
+        self.claimed = set()
+        self.failed: List[Task] = []
+        # 조회 중이거나, 결과를 돌려줬지만 호출자가 아직 다음 결과를 요청하지 않은 요청
+        self.inflight: Dict[Task, None] = {}
+        if path is not None and os.path.exists(path):
+            self._load(path)
+        if retry_failed:
+            for kind, name in self.failed:
+                queue = self.rosters if kind == _ROSTER else self.characters
+                queue.append(name)
+            self.failed.clear()
+
+    def _load(self, path: str) -> None:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != _VERSION:
+            raise ValueError(f"Unsupported crawl checkpoint: {path}")
+        self.rosters.extend(data["rosters"])
+        self.characters.extend(data["characters"])
+        self.seen.update(data["seen"])
+        self.covered.update(data["covered"])
+        self.claimed.update(data["claimed"])
+        self.failed.extend((kind, name) for kind, name in data["failed"])
+
+    def save(self) -> None:
+        """진행 상태를 체크포인트 파일에 원자적으로 저장합니다."""
+        if self.path is None:
+            return
+        # 진행 중이거나 전달을 확인하지 못한 요청은 다시 조회하도록 대기열 앞에 둡니다.
+        inflight = list(self.inflight)
+        data = {
+            "version": _VERSION,
+            "rosters": [n for k, n in inflight if k == _ROSTER] + list(self.rosters),
+            "characters": [n for k, n in inflight if k == _CHARACTER]
+            + list(self.characters),
+            "seen": sorted(self.seen),
+            "covered": sorted(self.covered),
+            "claimed": sorted(self.claimed),
+            "failed": [list(task) for task in self.failed],
+        }
+        tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    def add_roster(self, name: str) -> None:
+        """이름을 원정대 조회 대기열에 넣습니다. 이미 본 이름이면 건너뜁니다."""
+        if name in self.seen:
+            self.stats.skipped += 1
+            return
+        self.seen.add(name)
+        self.rosters.append(name)
+
+    def next_task(self) -> Optional[Task]:
+        """다음 요청을 꺼냅니다. 캐릭터 조회를 원정대 조회보다 먼저 처리합니다.
+
+        대기하는 동안 다른 원정대 조회로 확인된 이름은 건너뜁니다.
+        """
+        if self.characters:
+            task = (_CHARACTER, self.characters.popleft())
+        else:
+            while self.rosters and self.rosters[0] in self.covered:
+                self.rosters.popleft()
+                self.stats.skipped += 1
+            if not self.rosters:
+                return None
+            task = (_ROSTER, self.rosters.popleft())
+        self.inflight[task] = None
+        return task
+
+    def complete(
+        self, task: Task, value: Any, error: Optional[BaseException]
+    ) -> Optional[BulkResult]:
+        """요청 결과를 반영하고, 호출자에게 돌려줄 결과가 있으면 반환합니다.
+
+        돌려줄 결과가 있는 요청은 :meth:`delivered` 를 호출할 때까지 진행 중으로 남습니다.
+        """
+        kind, name = task
+        if error is not None:
+            return BulkResult(name, error=error)
+        if kind == _ROSTER:
+            del self.inflight[task]
+            self.stats.rosters += 1
+            for member in value or ():
+                if isinstance(member, dict):  # raw 모드
+                    member_name = member["CharacterName"]
+                else:
+                    member_name = member.character_name
+                self.seen.add(member_name)
+                self.covered.add(member_name)
+                if member_name not in self.claimed:
+                    self.claimed.add(member_name)
+                    self.characters.append(member_name)
+                    self.stats.submitted += 1
+            return None
+        armory, discovered = value
+        for new_name in discovered:
+            self.add_roster(new_name)
+        return BulkResult(name, armory)
+
+    def delivered(self, task: Task, result: BulkResult) -> None:
+        """호출자가 결과를 받아 다음 결과를 요청했음을 기록합니다."""
+        del self.inflight[task]
+        if not result.ok:
+            self.failed.append(task)
+
+
+class RosterCrawler:
+    """원정대를 너비 우선으로 탐색하며 캐릭터의 Armory 정보를 조회하는 반복자.
+
+    ``seeds`` 의 원정대부터 조회하고, 원정대의 각 캐릭터마다 ``fetch`` 를 호출한 결과를
+    ``BulkResult(key=이름, value=결과, error)`` 로 끝나는 순서대로 돌려줍니다. ``expand`` 가
+    캐릭터 결과에서 새 이름을 찾아 주면 그 이름의 원정대도 이어서 탐색합니다. 원정대 조회가
+    실패하면 그 이름을 key로 하는 실패 결과를 돌려줍니다.
+
+    반복을 중간에 멈추면 :meth:`close` 로 남은 요청을 취소하고 체크포인트를 저장합니다.
+
+    체크포인트는 결과를 돌려준 뒤 호출자가 다음 결과를 요청했을 때만 그 결과를 완료로
+    기록합니다. 따라서 결과를 처리하는 도중 종료되어도 결과를 잃지 않는 대신, 재개하면
+    마지막으로 돌려준 결과를 다시 돌려줄 수 있습니다 (최소 한 번 전달). 실패한 이름은
+    체크포인트에 남으며, ``retry_failed=True`` 로 재개하면 다시 조회합니다.
+
+    Attributes:
+        stats: 진행 통계
+
+    Example:
+        >>> crawler = api.characters.crawl(["홍길동"], checkpoint="crawl.json")
+        >>> for result in crawler:
+        ...     if result.ok:
+        ...         save(result.key, result.value)
+        >>> print(crawler.stats)
+    """
+
+    def __init__(
+        self,
+        siblings: Callable[[str], Any],
+        fetch: Callable[[str], Any],
+        seeds: Iterable[str] = (),
+        checkpoint: Optional[str] = None,
+        expand: Optional[Callable[[str, Any], Iterable[str]]] = None,
+        max_workers: int = 8,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+        retry_failed: bool = False,
+    ):
+        """크롤러를 초기화합니다.
+
+        Args:
+            siblings: 이름을 받아 원정대 캐릭터 목록을 반환하는 함수
+                (예: ``api.characters.get_siblings``)
+            fetch: 이름을 받아 캐릭터 정보를 반환하는 함수
+                (예: ``api.armories.get_total_info``)
+            seeds: 탐색을 시작할 캐릭터 이름. 체크포인트에서 재개할 때 이미 본 이름은
+                무시합니다.
+            checkpoint: 진행 상태를 저장할 파일 경로. 파일이 있으면 이어서 진행합니다.
+                None이면 저장하지 않습니다.
+            expand: ``(이름, fetch 결과)`` 를 받아 새로 탐색할 캐릭터 이름들을 반환하는 함수
+            max_workers: 동시에 보낼 최대 요청 수
+            checkpoint_every: 체크포인트를 저장할 주기 (완료한 요청 수)
+            retry_failed: 체크포인트에서 재개할 때 실패했던 이름을 다시 조회할지 여부
+
+        Raises:
+            ValueError: max_workers나 checkpoint_every가 1보다 작거나, 체크포인트 형식이
+                맞지 않는 경우
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+        self.stats = CrawlStats()
+        self._state = _CrawlState(checkpoint, self.stats, retry_failed)
+        for seed in seeds:
+            self._state.add_roster(seed)
+        self._siblings = siblings
+        self._fetch = fetch
+        self._expand = expand
+        self._max_workers = max_workers
+        self._checkpoint_every = checkpoint_every
+        self._results = self._run()
+
+    def __iter__(self) -> "RosterCrawler":
+        return self
+
+    def __next__(self) -> BulkResult:
+        return next(self._results)
+
+    def close(self) -> None:
+        """남은 요청을 취소하고 체크포인트를 저장합니다."""
+        self._results.close()
+
+    @property
+    def failed(self) -> List[str]:
+        """조회에 실패한 이름 (체크포인트에서 이어받은 것 포함)."""
+        return [name for _, name in self._state.failed]
+
+    def _call(self, task: Task) -> Any:
+        kind, name = task
+        if kind == _ROSTER:
+            return self._siblings(name)
+        value = self._fetch(name)
+        discovered = list(self._expand(name, value)) if self._expand else []
+        return value, discovered
+
+    def _run(self) -> Iterator[BulkResult]:
+        state = self._state
+        self.stats.started_at = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        pending = {}
+        completed = 0
+        try:
+            while True:
+                while len(pending) < self._max_workers:
+                    task = state.next_task()
+                    if task is None:
+                        break
+                    pending[executor.submit(self._call, task)] = task
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = pending.pop(future)
+                    error = future.exception()
+                    value = None if error is not None else future.result()
+                    result = state.complete(task, value, error)
+                    if result is not None:
+                        yield self.stats._record(result)
+                        state.delivered(task, result)
+                    completed += 1
+                    if completed % self._checkpoint_every == 0:
+                        state.save()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            state.save()
+            self.stats.finished_at = time.monotonic()
+
+
+class AsyncRosterCrawler:
+    """:class:`RosterCrawler` 의 asyncio 버전. ``async for`` 로 사용합니다.
+
+    ``siblings``, ``fetch`` 는 코루틴 함수이며 ``expand`` 는 일반 함수입니다. 반복을
+    중간에 멈출 때는 :meth:`aclose` 를 호출해야 체크포인트가 바로 저장됩니다.
+
+    Attributes:
+        stats: 진행 통계
+    """
+
+    def __init__(
+        self,
+        siblings: Callable[[str], Awaitable[Any]],
+        fetch: Callable[[str], Awaitable[Any]],
+        seeds: Iterable[str] = (),
+        checkpoint: Optional[str] = None,
+        expand: Optional[Callable[[str, Any], Iterable[str]]] = None,
+        max_workers: int = 8,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+        retry_failed: bool = False,
+    ):
+        """크롤러를 초기화합니다. 인자는 :class:`RosterCrawler` 와 같습니다."""
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+        self.stats = CrawlStats()
+        self._state = _CrawlState(checkpoint, self.stats, retry_failed)
+        for seed in seeds:
+            self._state.add_roster(seed)
+        self._siblings = siblings
+        self._fetch = fetch
+        self._expand = expand
+        self._max_workers = max_workers
+        self._checkpoint_every = checkpoint_every
+        self._results = self._run()
+
+    def __aiter__(self) -> "AsyncRosterCrawler":
+        return self
+
+    async def __anext__(self) -> BulkResult:
+        return await self._results.__anext__()
+
+    async def aclose(self) -> None:
+        """남은 요청을 취소하고 체크포인트를 저장합니다."""
+        await self._results.aclose()
+
+    @property
+    def failed(self) -> List[str]:
+        """조회에 실패한 이름 (체크포인트에서 이어받은 것 포함)."""
+        return [name for _, name in self._state.failed]
+
+    async def _call(self, task: Task) -> Any:
+        kind, name = task
+        if kind == _ROSTER:
+            return await self._siblings(name)
+        value = await self._fetch(name)
+        discovered = list(self._expand(name, value)) if self._expand else []
+        return value, discovered
+
+    async def _run(self) -> AsyncIterator[BulkResult]:
+        state = self._state
+        self.stats.started_at = time.monotonic()
+        pending = {}
+        completed = 0
+        try:
+            while True:
+                while len(pending) < self._max_workers:
+                    task = state.next_task()
+                    if task is None:
+                        break
+                    pending[asyncio.ensure_future(self._call(task))] = task
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    task = pending.pop(future)
+                    error = future.exception()
+                    value = None if error is not None else future.result()
+                    result = state.complete(task, value, error)
+                    if result is not None:
+                        yield self.stats._record(result)
+                        state.delivered(task, result)
+                    completed += 1
+                    if completed % self._checkpoint_every == 0:
+                        state.save()
+        finally:
+            for future in pending:
+                future.cancel()
+            state.save()
+            self.stats.finished_at = time.monotonic()
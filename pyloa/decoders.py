@@ -0,0 +1,61 @@
+"""응답 본문 JSON 디코더.
+
+설치된 고속 JSON 라이브러리(orjson, msgspec, ujson)를 자동으로 찾아 사용하고, 없으면
+표준 라이브러리 ``json`` 으로 돌아갑니다. 전투 스킬/장비 툴팁 문자열이 포함된 Armory 응답처럼
+큰 본문에서 디코딩 시간을 줄입니다 (``pip install py-lostark[fast]``).
+"""
+
+import json
+from typing import Any, Callable, Union
+
+# 디코더는 응답 본문(bytes)을 받아 JSON 값을 반환합니다.
+Decoder = Callable[[bytes], Any]
+
+# 자동 선택 시 시도하는 순서
+DECODER_PRIORITY = ("orjson", "msgspec", "ujson", "json")
+
+
+def _load(name: str) -> Decoder:
+    """이름에 해당하는 디코더를 반환합니다. 라이브러리가 없으면 ImportError가 발생합니다."""
+    if name == "orjson":
+        import orjson
+
+        return orjson.loads
+    if name == "msgspec":
+        import msgspec
+
+        return msgspec.json.Decoder().decode
+    if name == "ujson":
+        import ujson
+
+        return ujson.loads
+    if name == "json":
+        return json.loads
+    raise ValueError(f"Unknown JSON decoder: {name!r}")
+
+
+def get_decoder(decoder: Union[str, Decoder, None] = None) -> Decoder:
+    """사용할 JSON 디코더를 반환합니다.
+
+    Args:
+        decoder: 디코더 이름("orjson", "msgspec", "ujson", "json") 또는 bytes를 받는 함수.
+            None이면 :data:`DECODER_PRIORITY` 순서로 설치된 첫 번째 라이브러리를 사용합니다.
+
+    Returns:
+        Decoder: bytes를 받아 JSON 값을 반환하는 함수
+
+    Raises:
+        ValueError: 알 수 없는 디코더 이름인 경우
+        ImportError: 지정한 라이브러리가 설치되지 않은 경우
+    """
+    if callable(decoder):
+        return decoder
+    if decoder is not None:
+        return _load(decoder)
+    for name in DECODER_PRIORITY[:-1]:
+        try:
+            return _load(name)
+        except ImportError:
+            continue
+    return json.loads
+
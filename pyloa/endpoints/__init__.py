@@ -4,13 +4,13 @@ pyLoa API 엔드포인트.
 각 API 카테고리별 엔드포인트 클래스들을 제공합니다.
 """
 
-from .base import BaseEndpoint
-from .news import NewsEndpoint
-from .characters import CharactersEndpoint
-from .armories import ArmoriesEndpoint
-from .auctions import AuctionsEndpoint
-from .markets import MarketsEndpoint
-from .game_contents import GameContentsEndpoint
+from .base import BaseEndpoint, AsyncBaseEndpoint
+from .news import NewsEndpoint, AsyncNewsEndpoint
+from .characters import CharactersEndpoint, AsyncCharactersEndpoint
+from .armories import ArmoriesEndpoint, AsyncArmoriesEndpoint
+from .auctions import AuctionsEndpoint, AsyncAuctionsEndpoint
+from .markets import MarketsEndpoint, AsyncMarketsEndpoint
+from .game_contents import GameContentsEndpoint, AsyncGameContentsEndpoint
 
 __all__ = [
     "BaseEndpoint",
@@ -20,4 +20,11 @@ __all__ = [
     "AuctionsEndpoint",
     "MarketsEndpoint",
     "GameContentsEndpoint",
+    "AsyncBaseEndpoint",
+    "AsyncNewsEndpoint",
+    "AsyncCharactersEndpoint",
+    "AsyncArmoriesEndpoint",
+    "AsyncAuctionsEndpoint",
+    "AsyncMarketsEndpoint",
+    "AsyncGameContentsEndpoint",
 ]
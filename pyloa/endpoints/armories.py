@@ -1,8 +1,12 @@
 """Armories 관련 엔드포인트."""
 
-from typing import List, Optional, Dict, Any
-from pyloa.endpoints.base import BaseEndpoint
+import threading
+from typing import Iterable, List, Optional, Dict, Any, Tuple
+from pyloa.bulk import AsyncBulkIterator, BulkIterator, BulkStats
+from pyloa.cache import MISSING
+from pyloa.endpoints.base import BaseEndpoint, AsyncBaseEndpoint
 from pyloa.models.armory import (
+    ARMORY_FILTERS,
     ArmoryProfile,
     ArmoryEquipment,
     ArmoryAvatar,
@@ -16,7 +20,177 @@ from pyloa.models.armory import (
 )
 
 
-class ArmoriesEndpoint(BaseEndpoint):
+class FetchStats(BulkStats):
+    """Armory 섹션 조회 계획(:meth:`ArmoriesEndpoint.fetch`) 통계.
+
+    섹션마다 섹션별 조회를 한 번씩 보내는 경우와 비교해 아낀 요청 수를 셉니다. 여러
+    스레드에서 함께 기록할 수 있습니다.
+
+    Attributes:
+        sections: 요청받은 섹션 수 (섹션별로 조회했다면 보냈을 요청 수)
+        requests: 실제로 보낸 API 요청 수
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.sections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    @property
+    def saved(self) -> int:
+        """아낀 API 요청 수."""
+        return self.sections - self.requests
+
+    def record_plan(self, sections: int, requests: int) -> None:
+        """캐릭터 하나의 조회 계획을 기록합니다.
+
+        Args:
+            sections: 요청받은 섹션 수
+            requests: 실제로 보낸 API 요청 수
+        """
+        with self._lock:
+            self.sections += sections
+            self.requests += requests
+
+    def __repr__(self) -> str:
+        return (
+            f"FetchStats(succeeded={self.succeeded}, failed={self.failed}, "
+            f"sections={self.sections}, requests={self.requests}, "
+            f"saved={self.saved}, elapsed={self.elapsed:.1f}s)"
+        )
+
+
+class _ArmorySections:
+    """동기/비동기 Armories 엔드포인트가 공유하는 섹션 캐시 보조 메서드."""
+
+    def _armory_cache(self):
+        """클라이언트의 섹션 캐시를 반환합니다. 없거나 응답 바이트를 반환하는 모드이면 None."""
+        if self._raw() == "bytes":
+            return None
+        return getattr(self.client, "armory_cache", None)
+
+    def _plan_sections(
+        self, character_name: str, filters: Optional[List[str]]
+    ) -> Tuple[Optional[Dict[str, str]], Optional[Dict[str, Any]], List[str]]:
+        """종합 정보 조회에 필요한 요청 파라미터와 캐시된 섹션을 계산합니다.
+
+        Returns:
+            Tuple: (요청 파라미터, 캐시된 ``{필터 이름: JSON}``, 요청할 섹션 목록).
+            모든 섹션이 캐시되어 있으면 요청 파라미터가 None이고, 섹션 캐시를 사용하지
+            않으면 캐시된 섹션이 None입니다.
+        """
+        cache = self._armory_cache()
+        if cache is None or (filters and not set(filters) <= set(ARMORY_FILTERS)):
+            return _filter_params(filters), None, []
+        wanted = list(dict.fromkeys(filters or ARMORY_FILTERS))
+        cached, missing = self._plan_fetch(character_name, wanted)
+        if not missing:
+            return None, cached, missing
+        if len(missing) == len(ARMORY_FILTERS):
+            # 전체 조회는 필터 없이 요청합니다 (응답 캐시와 같은 키를 사용).
+            return {}, cached, missing
+        return _filter_params(missing), cached, missing
+
+    def _cached_section(self, character_name: str, section: str) -> Any:
+        """섹션 캐시에서 섹션 JSON을 찾습니다. 없으면 MISSING을 반환합니다."""
+        cache = self._armory_cache()
+        if cache is None:
+            return MISSING
+        return cache.get(character_name, [section]).get(section, MISSING)
+
+    def _store_section(self, character_name: str, section: str, data: Any) -> None:
+        """섹션별 조회 결과를 섹션 캐시에 저장합니다.
+
+        없는 캐릭터도 null을 반환하므로 빈 응답은 저장하지 않습니다.
+        """
+        cache = self._armory_cache()
+        if cache is not None and data is not None:
+            cache.set(character_name, {section: data})
+
+    def _plan_fetch(
+        self, character_name: str, sections: List[str]
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """섹션 캐시에서 찾은 섹션과 요청해야 하는 섹션을 나눕니다.
+
+        Returns:
+            Tuple: (캐시된 ``{필터 이름: JSON}``, 요청할 섹션 목록)
+        """
+        cache = self._armory_cache()
+        cached = cache.get(character_name, sections) if cache is not None else {}
+        return cached, [section for section in sections if section not in cached]
+
+    def _fetch_request(
+        self, character_name: str, missing: List[str]
+    ) -> Tuple[str, Optional[Dict[str, str]]]:
+        """남은 섹션을 한 번에 받을 요청의 (경로, 파라미터)를 정합니다.
+
+        섹션이 하나면 섹션별 조회를 사용해 ``get_gems`` 같은 섹션 메서드와 응답 캐시를
+        공유하고, 여러 개면 종합 정보 조회에 필터를 붙입니다. 응답 바이트를 반환하는
+        모드에서는 섹션을 합칠 수 없으므로 항상 종합 정보 조회를 사용합니다.
+        """
+        if len(missing) == 1 and self._raw() != "bytes":
+            return f"/{character_name}/{missing[0]}", None
+        if len(missing) == len(ARMORY_FILTERS):
+            return f"/{character_name}", {}
+        return f"/{character_name}", _filter_params(missing)
+
+    def _merge_sections(
+        self,
+        character_name: str,
+        cached: Optional[Dict[str, Any]],
+        missing: List[str],
+        data: Any,
+        single: bool = False,
+    ) -> Any:
+        """받은 섹션을 캐시에 저장하고 캐시된 섹션과 합친 종합 정보 JSON을 반환합니다.
+
+        Args:
+            character_name: 캐릭터 이름
+            cached: 캐시된 ``{필터 이름: JSON}``. None이면 섹션 캐시를 사용하지 않으므로
+                응답을 그대로 반환합니다.
+            missing: 이번 요청으로 받은 섹션 목록
+            data: 응답 JSON
+            single: 섹션별 조회로 받은 섹션 하나의 JSON이면 True
+        """
+        if cached is None:
+            return data
+        fresh = {}
+        if single:
+            fresh = {missing[0]: data}
+            self._store_section(character_name, missing[0], data)
+        elif missing:
+            if not isinstance(data, dict):
+                # 없는 캐릭터의 빈 응답이나 응답 바이트는 그대로 반환합니다.
+                return data
+            fresh = {s: data.get(ARMORY_FILTERS[s]) for s in missing}
+            cache = self._armory_cache()
+            if cache is not None:
+                cache.set(character_name, fresh)
+        merged = {ARMORY_FILTERS[s]: value for s, value in cached.items()}
+        merged.update((ARMORY_FILTERS[s], value) for s, value in fresh.items())
+        return merged
+
+
+def _check_sections(sections: Optional[Iterable[str]]) -> List[str]:
+    """조회할 섹션 목록을 검사하고 중복을 제거합니다. None이면 전체 섹션입니다."""
+    if sections is None:
+        return list(ARMORY_FILTERS)
+    wanted = list(dict.fromkeys(sections))
+    unknown = [section for section in wanted if section not in ARMORY_FILTERS]
+    if unknown:
+        raise ValueError(f"unknown armory sections: {', '.join(unknown)}")
+    if not wanted:
+        raise ValueError("sections must not be empty")
+    return wanted
+
+
+def _filter_params(filters: Optional[List[str]]) -> Dict[str, str]:
+    # 로스트아크 API는 필터를 쉼표로 구분된 문자열로 받습니다.
+    return {"filters": ",".join(filters)} if filters else {}
+
+
+class ArmoriesEndpoint(_ArmorySections, BaseEndpoint):
     """캐릭터 정보(Armories) endpoint."""
 
     def __init__(self, client):
@@ -28,83 +202,68 @@ class ArmoriesEndpoint(BaseEndpoint):
         super().__init__(client)
         self.base_path = "/armories/characters"
 
-    def get_profile(self, character_name: str) -> ArmoryProfile:
+    def get_profile(self, character_name: str) -> Optional[ArmoryProfile]:
         """캐릭터 프로필 조회."""
-        data = self._request("GET", f"/{character_name}/profiles")
-        return ArmoryProfile.from_dict(data)
+        data = self._section(character_name, "profiles")
+        return self._optional_model(data, ArmoryProfile)
 
     def get_equipment(self, character_name: str) -> List[ArmoryEquipment]:
         """장비 정보 조회."""
-        data = self._request("GET", f"/{character_name}/equipment")
-        return [ArmoryEquipment.from_dict(item) for item in data]
+        data = self._section(character_name, "equipment")
+        return self._models(data, ArmoryEquipment)
 
     def get_avatars(self, character_name: str) -> List[ArmoryAvatar]:
         """아바타 정보 조회."""
-        data = self._request("GET", f"/{character_name}/avatars")
-        if not data:
-            return []
-        return [ArmoryAvatar.from_dict(item) for item in data]
+        data = self._section(character_name, "avatars")
+        return self._models(data, ArmoryAvatar)
 
     def get_combat_skills(self, character_name: str) -> List[ArmorySkill]:
         """전투 스킬 정보 조회."""
-        data = self._request("GET", f"/{character_name}/combat-skills")
-        if not data:
-            return []
-        return [ArmorySkill.from_dict(item) for item in data]
+        data = self._section(character_name, "combat-skills")
+        return self._models(data, ArmorySkill)
 
     def get_engravings(self, character_name: str) -> Optional[ArmoryEngraving]:
         """각인 정보 조회."""
-        data = self._request("GET", f"/{character_name}/engravings")
-        if not data:
-            return None
-        return ArmoryEngraving.from_dict(data)
+        data = self._section(character_name, "engravings")
+        return self._optional_model(data, ArmoryEngraving)
 
     def get_cards(self, character_name: str) -> Optional[ArmoryCard]:
         """카드 정보 조회."""
-        data = self._request("GET", f"/{character_name}/cards")
-        if not data:
-            return None
-        return ArmoryCard.from_dict(data)
+        data = self._section(character_name, "cards")
+        return self._optional_model(data, ArmoryCard)
 
     def get_gems(self, character_name: str) -> Optional[ArmoryGem]:
         """보석 정보 조회."""
-        data = self._request("GET", f"/{character_name}/gems")
-        if not data:
-            return None
-        return ArmoryGem.from_dict(data)
+        data = self._section(character_name, "gems")
+        return self._optional_model(data, ArmoryGem)
 
     def get_colosseums(self, character_name: str) -> Optional[ColosseumInfo]:
         """투기장 정보 조회."""
-        data = self._request("GET", f"/{character_name}/colosseums")
-        if not data:
-            return None
-        return ColosseumInfo.from_dict(data)
+        data = self._section(character_name, "colosseums")
+        return self._optional_model(data, ColosseumInfo)
 
     def get_collectibles(self, character_name: str) -> List[Collectible]:
         """수집품 정보 조회."""
-        data = self._request("GET", f"/{character_name}/collectibles")
-        if not data:
-            return []
-        return [Collectible.from_dict(item) for item in data]
+        data = self._section(character_name, "collectibles")
+        return self._models(data, Collectible)
 
     def get_ark_passive(self, character_name: str) -> Optional[ArkPassive]:
         """아크 패시브 정보 조회."""
-        data = self._request("GET", f"/{character_name}/arkpassive")
-        if not data:
-            return None
-        return ArkPassive.from_dict(data)
+        data = self._section(character_name, "arkpassive")
+        return self._optional_model(data, ArkPassive)
 
     def get_ark_grid(self, character_name: str) -> Optional["ArkGrid"]:
         """아크 그리드 정보 조회."""
         from pyloa.models.armory import ArkGrid
 
-        data = self._request("GET", f"/{character_name}/arkgrid")
-        if not data:
-            return None
-        return ArkGrid.from_dict(data)
+        data = self._section(character_name, "arkgrid")
+        return self._optional_model(data, ArkGrid)
 
     def get_total_info(
-        self, character_name: str, filters: Optional[List[str]] = None
+        self,
+        character_name: str,
+        filters: Optional[List[str]] = None,
+        lazy: bool = False,
     ) -> Optional["ArmoryTotal"]:
         """Armory 종합 정보 조회.
 
@@ -112,15 +271,328 @@ class ArmoriesEndpoint(BaseEndpoint):
             character_name: 조회할 캐릭터 이름
             filters: 조회할 항목 리스트 (예: ['profiles', 'equipment'])
                      None이면 전체 조회
+            lazy: True면 각 섹션을 처음 접근할 때 모델로 변환합니다.
+                  일부 섹션만 읽는 경우 변환 비용을 줄일 수 있습니다.
+
+        클라이언트에 섹션 캐시(``armory_cache``)가 있으면 캐시에 없거나 만료된 섹션만
+        필터로 요청하고 나머지는 캐시에서 채웁니다. 모든 섹션이 캐시되어 있으면 요청하지
+        않습니다.
+        없는 캐릭터 캐시(``negative_cache``)에 있는 이름은 요청하지 않고 None을 반환하며,
+        응답이 null이면 이름을 그 캐시에 기록합니다.
+        """
+        from pyloa.models.armory import ArmoryTotal
+
+        if self._known_missing(character_name):
+            return None
+        params, cached, missing = self._plan_sections(character_name, filters)
+        data = None
+        if params is not None:
+            data = self._request("GET", f"/{character_name}", params=params)
+            self._remember_missing(character_name, data)
+        data = self._merge_sections(character_name, cached, missing, data)
+        return self._optional_model(data, ArmoryTotal, lazy=lazy)
+
+    def _section(self, character_name: str, section: str) -> Any:
+        """섹션 캐시를 거쳐 섹션별 조회(``/{이름}/{섹션}``)를 수행합니다."""
+        if self._known_missing(character_name):
+            return None
+        data = self._cached_section(character_name, section)
+        if data is MISSING:
+            data = self._request("GET", f"/{character_name}/{section}")
+            self._store_section(character_name, section, data)
+            if section == "profiles":
+                self._remember_missing(character_name, data)
+        return data
+
+    def get_total_info_many(
+        self,
+        character_names: Iterable[str],
+        filters: Optional[List[str]] = None,
+        max_workers: int = 8,
+        lazy: bool = False,
+    ) -> BulkIterator[str]:
+        """여러 캐릭터의 Armory 종합 정보를 동시에 조회합니다.
+
+        최대 ``max_workers`` 개의 요청을 동시에 보내며, 전송 속도는 클라이언트의 속도
+        제한기가 조절합니다. 결과는 끝나는 순서대로 돌려주고, 항목별 오류는 배치를
+        중단하지 않고 :class:`~pyloa.bulk.BulkResult` 의 ``error`` 에 담습니다.
+
+        Args:
+            character_names: 조회할 캐릭터 이름
+            filters: 조회할 항목 리스트. :meth:`get_total_info` 참고
+            max_workers: 동시에 보낼 최대 요청 수
+            lazy: True면 섹션을 처음 접근할 때 변환합니다. :meth:`get_total_info` 참고
+
+        Returns:
+            BulkIterator[str]: ``BulkResult(key=이름, value=ArmoryTotal, error)`` 반복자.
+            진행 통계는 ``stats`` 속성으로 확인합니다.
+
+        Example:
+            >>> results = api.armories.get_total_info_many(names)
+            >>> for result in results:
+            ...     if result.ok:
+            ...         save(result.key, result.value)
+            >>> print(results.stats)
+        """
+        return BulkIterator(
+            lambda name: self.get_total_info(name, filters, lazy=lazy),
+            character_names,
+            max_workers=max_workers,
+        )
+
+    def fetch(
+        self,
+        character_name: str,
+        sections: Optional[Iterable[str]] = None,
+        lazy: bool = False,
+        stats: Optional[FetchStats] = None,
+    ) -> Optional["ArmoryTotal"]:
+        """필요한 섹션만 최소한의 요청으로 조회해 ``ArmoryTotal`` 로 합칩니다.
+
+        섹션 캐시(``armory_cache``)에 있는 섹션은 요청하지 않고, 남은 섹션이 하나면
+        섹션별 조회를, 여러 개면 필터를 붙인 종합 정보 조회를 한 번 보냅니다. 따라서
+        캐릭터 하나에 보내는 요청은 많아야 한 번이고, 없는 캐릭터 캐시(``negative_cache``)에
+        있는 이름이면 요청하지 않습니다.
+
+        Args:
+            character_name: 조회할 캐릭터 이름
+            sections: 조회할 섹션 (``ARMORY_FILTERS`` 의 필터 이름, 예: ``{"profiles",
+                "gems"}``). None이면 전체 섹션
+            lazy: True면 각 섹션을 처음 접근할 때 모델로 변환합니다.
+            stats: 보낸 요청 수와 아낀 요청 수를 기록할 :class:`FetchStats`
+
+        Returns:
+            Optional[ArmoryTotal]: 요청한 섹션만 채운 종합 정보. 여러 섹션을 요청했는데
+            캐릭터가 없으면 None입니다. 섹션 하나만 요청하면 섹션별 조회와 마찬가지로
+            없는 캐릭터와 빈 섹션을 구분하지 않고 해당 섹션이 빈 값입니다.
+
+        Raises:
+            ValueError: 알 수 없는 섹션이 있거나 섹션 목록이 비어 있는 경우
+
+        Example:
+            >>> total = api.armories.fetch("홍길동", {"profiles", "gems", "engravings"})
+            >>> total.armory_gem
         """
         from pyloa.models.armory import ArmoryTotal
 
-        params = {}
-        if filters:
-            # 로스트아크 API는 필터를 쉼표로 구분된 문자열로 받습니다.
-            params["filters"] = ",".join(filters)
+        wanted = _check_sections(sections)
+        if self._known_missing(character_name):
+            if stats is not None:
+                stats.record_plan(len(wanted), 0)
+            return None
+        cached, missing = self._plan_fetch(character_name, wanted)
+        data = None
+        single = False
+        if missing:
+            path, params = self._fetch_request(character_name, missing)
+            single = params is None
+            data = self._request("GET", path, params=params)
+            if not single or missing == ["profiles"]:
+                self._remember_missing(character_name, data)
+        if stats is not None:
+            stats.record_plan(len(wanted), 1 if missing else 0)
+        data = self._merge_sections(character_name, cached, missing, data, single)
+        return self._optional_model(data, ArmoryTotal, lazy=lazy)
+
+    def fetch_many(
+        self,
+        character_names: Iterable[str],
+        sections: Optional[Iterable[str]] = None,
+        max_workers: int = 8,
+        lazy: bool = False,
+    ) -> BulkIterator[str]:
+        """여러 캐릭터에 :meth:`fetch` 를 동시에 수행합니다.
+
+        Args:
+            character_names: 조회할 캐릭터 이름
+            sections: 조회할 섹션. :meth:`fetch` 참고
+            max_workers: 동시에 보낼 최대 요청 수
+            lazy: True면 섹션을 처음 접근할 때 변환합니다.
+
+        Returns:
+            BulkIterator[str]: ``BulkResult(key=이름, value=ArmoryTotal, error)`` 반복자.
+            ``stats`` 속성은 아낀 요청 수(``saved``)를 포함한 :class:`FetchStats` 입니다.
+
+        Raises:
+            ValueError: 알 수 없는 섹션이 있거나 섹션 목록이 비어 있는 경우
+
+        Example:
+            >>> results = api.armories.fetch_many(names, {"profiles", "gems"})
+            >>> totals = {r.key: r.value for r in results if r.ok}
+            >>> print(results.stats.saved)
+        """
+        wanted = _check_sections(sections)
+        stats = FetchStats()
+        return BulkIterator(
+            lambda name: self.fetch(name, wanted, lazy=lazy, stats=stats),
+            character_names,
+            max_workers=max_workers,
+            stats=stats,
+        )
+
+
+class AsyncArmoriesEndpoint(_ArmorySections, AsyncBaseEndpoint):
+    """캐릭터 정보(Armories) endpoint (asyncio)."""
+
+    def __init__(self, client):
+        """AsyncArmoriesEndpoint를 초기화합니다.
+
+        Args:
+            client: AsyncLostArkAPI 인스턴스
+        """
+        super().__init__(client)
+        self.base_path = "/armories/characters"
+
+    async def get_profile(self, character_name: str) -> Optional[ArmoryProfile]:
+        """캐릭터 프로필 조회."""
+        data = await self._section(character_name, "profiles")
+        return self._optional_model(data, ArmoryProfile)
+
+    async def get_equipment(self, character_name: str) -> List[ArmoryEquipment]:
+        """장비 정보 조회."""
+        data = await self._section(character_name, "equipment")
+        return self._models(data, ArmoryEquipment)
+
+    async def get_avatars(self, character_name: str) -> List[ArmoryAvatar]:
+        """아바타 정보 조회."""
+        data = await self._section(character_name, "avatars")
+        return self._models(data, ArmoryAvatar)
+
+    async def get_combat_skills(self, character_name: str) -> List[ArmorySkill]:
+        """전투 스킬 정보 조회."""
+        data = await self._section(character_name, "combat-skills")
+        return self._models(data, ArmorySkill)
+
+    async def get_engravings(self, character_name: str) -> Optional[ArmoryEngraving]:
+        """각인 정보 조회."""
+        data = await self._section(character_name, "engravings")
+        return self._optional_model(data, ArmoryEngraving)
 
-        data = self._request("GET", f"/{character_name}", params=params)
-        if not data:
+    async def get_cards(self, character_name: str) -> Optional[ArmoryCard]:
+        """카드 정보 조회."""
+        data = await self._section(character_name, "cards")
+        return self._optional_model(data, ArmoryCard)
+
+    async def get_gems(self, character_name: str) -> Optional[ArmoryGem]:
+        """보석 정보 조회."""
+        data = await self._section(character_name, "gems")
+        return self._optional_model(data, ArmoryGem)
+
+    async def get_colosseums(self, character_name: str) -> Optional[ColosseumInfo]:
+        """투기장 정보 조회."""
+        data = await self._section(character_name, "colosseums")
+        return self._optional_model(data, ColosseumInfo)
+
+    async def get_collectibles(self, character_name: str) -> List[Collectible]:
+        """수집품 정보 조회."""
+        data = await self._section(character_name, "collectibles")
+        return self._models(data, Collectible)
+
+    async def get_ark_passive(self, character_name: str) -> Optional[ArkPassive]:
+        """아크 패시브 정보 조회."""
+        data = await self._section(character_name, "arkpassive")
+        return self._optional_model(data, ArkPassive)
+
+    async def get_ark_grid(self, character_name: str) -> Optional["ArkGrid"]:
+        """아크 그리드 정보 조회."""
+        from pyloa.models.armory import ArkGrid
+
+        data = await self._section(character_name, "arkgrid")
+        return self._optional_model(data, ArkGrid)
+
+    async def get_total_info(
+        self,
+        character_name: str,
+        filters: Optional[List[str]] = None,
+        lazy: bool = False,
+    ) -> Optional["ArmoryTotal"]:
+        """Armory 종합 정보 조회. :meth:`ArmoriesEndpoint.get_total_info` 참고."""
+        from pyloa.models.armory import ArmoryTotal
+
+        if self._known_missing(character_name):
+            return None
+        params, cached, missing = self._plan_sections(character_name, filters)
+        data = None
+        if params is not None:
+            data = await self._request("GET", f"/{character_name}", params=params)
+            self._remember_missing(character_name, data)
+        data = self._merge_sections(character_name, cached, missing, data)
+        return self._optional_model(data, ArmoryTotal, lazy=lazy)
+
+    async def _section(self, character_name: str, section: str) -> Any:
+        """섹션 캐시를 거쳐 섹션별 조회를 수행합니다. :meth:`ArmoriesEndpoint._section` 참고."""
+        if self._known_missing(character_name):
             return None
-        return ArmoryTotal.from_dict(data)
+        data = self._cached_section(character_name, section)
+        if data is MISSING:
+            data = await self._request("GET", f"/{character_name}/{section}")
+            self._store_section(character_name, section, data)
+            if section == "profiles":
+                self._remember_missing(character_name, data)
+        return data
+
+    def get_total_info_many(
+        self,
+        character_names: Iterable[str],
+        filters: Optional[List[str]] = None,
+        max_workers: int = 8,
+        lazy: bool = False,
+    ) -> AsyncBulkIterator[str]:
+        """여러 캐릭터를 동시에 조회합니다. ``async for`` 로 결과를 받습니다.
+
+        :meth:`ArmoriesEndpoint.get_total_info_many` 참고.
+        """
+        return AsyncBulkIterator(
+            lambda name: self.get_total_info(name, filters, lazy=lazy),
+            character_names,
+            max_workers=max_workers,
+        )
+
+    async def fetch(
+        self,
+        character_name: str,
+        sections: Optional[Iterable[str]] = None,
+        lazy: bool = False,
+        stats: Optional[FetchStats] = None,
+    ) -> Optional["ArmoryTotal"]:
+        """필요한 섹션만 최소한의 요청으로 조회합니다. :meth:`ArmoriesEndpoint.fetch` 참고."""
+        from pyloa.models.armory import ArmoryTotal
+
+        wanted = _check_sections(sections)
+        if self._known_missing(character_name):
+            if stats is not None:
+                stats.record_plan(len(wanted), 0)
+            return None
+        cached, missing = self._plan_fetch(character_name, wanted)
+        data = None
+        single = False
+        if missing:
+            path, params = self._fetch_request(character_name, missing)
+            single = params is None
+            data = await self._request("GET", path, params=params)
+            if not single or missing == ["profiles"]:
+                self._remember_missing(character_name, data)
+        if stats is not None:
+            stats.record_plan(len(wanted), 1 if missing else 0)
+        data = self._merge_sections(character_name, cached, missing, data, single)
+        return self._optional_model(data, ArmoryTotal, lazy=lazy)
+
+    def fetch_many(
+        self,
+        character_names: Iterable[str],
+        sections: Optional[Iterable[str]] = None,
+        max_workers: int = 8,
+        lazy: bool = False,
+    ) -> AsyncBulkIterator[str]:
+        """여러 캐릭터에 :meth:`fetch` 를 동시에 수행합니다. ``async for`` 로 결과를 받습니다.
+
+        :meth:`ArmoriesEndpoint.fetch_many` 참고.
+        """
+        wanted = _check_sections(sections)
+        stats = FetchStats()
+        return AsyncBulkIterator(
+            lambda name: self.fetch(name, wanted, lazy=lazy, stats=stats),
+            character_names,
+            max_workers=max_workers,
+            stats=stats,
+        )
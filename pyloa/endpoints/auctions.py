@@ -1,13 +1,19 @@
 """경매장 관련 엔드포인트."""
 
-from typing import Dict, Any
-from pyloa.endpoints.base import BaseEndpoint
-from pyloa.models.auction import Auction
+from typing import Dict, Any, AsyncIterator, Iterator, Optional, Sequence
+from pyloa import pagination, sharding
+from pyloa.endpoints.base import BaseEndpoint, AsyncBaseEndpoint
+from pyloa.models.auction import Auction, AuctionItem
+from pyloa.pagination import DEFAULT_PREFETCH
+from pyloa.sharding import DEFAULT_DIMENSIONS, DEFAULT_MAX_RESULTS
 
 
 class AuctionsEndpoint(BaseEndpoint):
     """경매장 endpoint."""
 
+    # 검색용 POST 요청은 부작용이 없으므로 재시도해도 안전합니다.
+    idempotent_paths = frozenset({"/items"})
+
     def __init__(self, client):
         """AuctionsEndpoint를 초기화합니다.
 
@@ -40,4 +46,153 @@ class AuctionsEndpoint(BaseEndpoint):
         """
 
         data = self._request("POST", "/items", json=kwargs)
-        return Auction.from_dict(data)
+        return self._model(data, Auction)
+
+    def iter_items(
+        self,
+        prefetch: int = DEFAULT_PREFETCH,
+        max_pages: Optional[int] = None,
+        max_items: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[AuctionItem]:
+        """검색 결과의 모든 페이지를 순회하며 경매장 아이템을 하나씩 반환합니다.
+
+        다음 ``prefetch`` 개 페이지를 백그라운드에서 미리 요청하고, 받은 페이지는 바로
+        소비하므로 메모리에는 최대 ``prefetch`` 개 페이지만 남습니다. 반복을 중간에 멈추면
+        시작하지 않은 페이지 요청은 취소합니다.
+
+        Args:
+            prefetch: 동시에 미리 요청해 둘 최대 페이지 수
+            max_pages: 요청할 최대 페이지 수. None이면 마지막 페이지까지 요청합니다.
+            max_items: 반환할 최대 아이템 수. 필요한 페이지까지만 요청합니다.
+            **kwargs: :meth:`get_items` 의 검색 파라미터. PageNo는 시작 페이지입니다.
+
+        Returns:
+            Iterator[AuctionItem]: 경매장 아이템 제너레이터. raw 모드와 bytes 모드에서는
+            JSON(dict) 항목을 반환합니다.
+
+        Raises:
+            ValueError: prefetch, max_pages, max_items가 1보다 작은 경우
+
+        Example:
+            >>> for item in api.auctions.iter_items(
+            ...     CategoryCode=210000, ItemTier=4, max_items=100
+            ... ):
+            ...     print(item.name, item.auction_info.buy_price)
+        """
+        start = kwargs.pop("PageNo", 1)
+        return pagination.iter_items(
+            lambda page_no: self._search_page(**kwargs, PageNo=page_no),
+            start,
+            prefetch,
+            max_pages,
+            max_items,
+        )
+
+    def iter_items_sharded(
+        self,
+        max_results: int = DEFAULT_MAX_RESULTS,
+        max_workers: int = 4,
+        dimensions: Sequence[str] = DEFAULT_DIMENSIONS,
+        prefetch: int = 1,
+        **kwargs,
+    ) -> Iterator[AuctionItem]:
+        """결과가 많은 검색을 여러 쿼리로 나누어 동시에 조회하고 하나의 스트림으로 반환합니다.
+
+        첫 페이지의 ``total_count`` 가 ``max_results`` 를 넘는 쿼리는 ItemTier, ItemGrade,
+        아이템 레벨 구간 순으로 겹치지 않게 나눕니다. 나눈 쿼리들은 최대 ``max_workers`` 개씩
+        동시에 넘기며 받은 페이지의 항목을 바로 반환합니다. 페이지가 밀려 다시 나온 항목은
+        제거합니다 (:func:`pyloa.sharding.iter_sharded_items` 참고). 결과 순서는 보장하지
+        않습니다.
+
+        Args:
+            max_results: 나눈 쿼리 하나의 최대 결과 수
+            max_workers: 동시에 넘길 최대 쿼리 수이자 동시에 보낼 최대 요청 수
+            dimensions: 나누는 기준. :data:`pyloa.sharding.DEFAULT_DIMENSIONS` 참고
+            prefetch: 쿼리 하나에 동시에 미리 요청해 둘 최대 페이지 수
+            **kwargs: :meth:`get_items` 의 검색 파라미터
+
+        Returns:
+            Iterator[AuctionItem]: 경매장 아이템 제너레이터. raw 모드와 bytes 모드에서는
+            JSON(dict) 항목을 반환합니다.
+
+        Raises:
+            ValueError: max_results, max_workers, prefetch가 1보다 작거나, 알 수 없는
+                기준인 경우
+
+        Example:
+            >>> gems = api.auctions.iter_items_sharded(CategoryCode=210000)
+            >>> cheapest = min(gems, key=lambda i: i.auction_info.buy_price or 0)
+        """
+        return sharding.iter_sharded_items(
+            self._search_page, kwargs, max_results, dimensions, max_workers, prefetch
+        )
+
+    def _search_page(self, **kwargs) -> Auction:
+        """순회용 검색 한 페이지. bytes 모드에서는 JSON으로 디코딩합니다."""
+        return self._json_page(self.get_items(**kwargs))
+
+
+class AsyncAuctionsEndpoint(AsyncBaseEndpoint):
+    """경매장 endpoint (asyncio)."""
+
+    # 검색용 POST 요청은 부작용이 없으므로 재시도해도 안전합니다.
+    idempotent_paths = frozenset({"/items"})
+
+    def __init__(self, client):
+        """AsyncAuctionsEndpoint를 초기화합니다.
+
+        Args:
+            client: AsyncLostArkAPI 인스턴스
+        """
+        super().__init__(client)
+        self.base_path = "/auctions"
+
+    async def get_options(self) -> Dict[str, Any]:
+        """경매장 검색 옵션 조회. :meth:`AuctionsEndpoint.get_options` 참고."""
+        return await self._request("GET", "/options")
+
+    async def get_items(self, **kwargs) -> Auction:
+        """경매장 아이템 검색. :meth:`AuctionsEndpoint.get_items` 참고."""
+        data = await self._request("POST", "/items", json=kwargs)
+        return self._model(data, Auction)
+
+    def iter_items(
+        self,
+        prefetch: int = DEFAULT_PREFETCH,
+        max_pages: Optional[int] = None,
+        max_items: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[AuctionItem]:
+        """검색 결과의 모든 경매장 아이템을 ``async for`` 로 반환합니다.
+
+        :meth:`AuctionsEndpoint.iter_items` 참고. 중간에 멈출 때는 ``aclose()`` 를 호출합니다.
+        """
+        start = kwargs.pop("PageNo", 1)
+        return pagination.aiter_items(
+            lambda page_no: self._search_page(**kwargs, PageNo=page_no),
+            start,
+            prefetch,
+            max_pages,
+            max_items,
+        )
+
+    def iter_items_sharded(
+        self,
+        max_results: int = DEFAULT_MAX_RESULTS,
+        max_workers: int = 4,
+        dimensions: Sequence[str] = DEFAULT_DIMENSIONS,
+        prefetch: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[AuctionItem]:
+        """나눈 검색 결과를 ``async for`` 로 반환합니다.
+
+        :meth:`AuctionsEndpoint.iter_items_sharded` 참고.
+        """
+        return sharding.aiter_sharded_items(
+            self._search_page, kwargs, max_results, dimensions, max_workers, prefetch
+        )
+
+    async def _search_page(self, **kwargs) -> Auction:
+        """순회용 검색 한 페이지. bytes 모드에서는 JSON으로 디코딩합니다."""
+        return self._json_page(await self.get_items(**kwargs))
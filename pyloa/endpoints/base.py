@@ -1,14 +1,217 @@
 """모든 API 엔드포인트의 기본 클래스."""
 
-from typing import Dict, TYPE_CHECKING
+import asyncio
+import json
+import time
+from typing import Dict, FrozenSet, List, Optional, TYPE_CHECKING
 from requests import HTTPError
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
 from pyloa.exceptions import APIError, RateLimitError, AuthenticationError
+from pyloa.cache import MISSING, make_cache_key
+from pyloa.retry import RetryAttempt
 
 if TYPE_CHECKING:
     from pyloa.client import LostArkAPI
+    from pyloa.async_client import AsyncLostArkAPI
 
 
-class BaseEndpoint:
+def _raise_api_error(status_code: int, text: str) -> None:
+    """HTTP 상태 코드를 pyLoa 예외로 변환하여 발생시킵니다.
+
+    Args:
+        status_code: HTTP 상태 코드
+        text: 응답 본문
+
+    Raises:
+        AuthenticationError: 401 Unauthorized
+        RateLimitError: 429 Too Many Requests
+        APIError: 기타 HTTP 오류
+    """
+    if status_code == 401:
+        raise AuthenticationError(f"Unauthorized: {text}")
+    elif status_code == 429:
+        raise RateLimitError(f"Rate limit exceeded: {text}")
+    else:
+        raise APIError(f"API error ({status_code}): {text}")
+
+
+def _merge_headers(kwargs: Dict, extra: Dict[str, str]) -> None:
+    """요청 인자의 헤더에 추가 헤더를 합칩니다."""
+    headers = dict(kwargs.get("headers") or {})
+    headers.update(extra)
+    kwargs["headers"] = headers
+
+
+def _set_authorization(kwargs: Dict, api_key: str) -> None:
+    """요청 인자에 키 풀이 고른 API 키의 인증 헤더를 설정합니다."""
+    _merge_headers(kwargs, {"authorization": f"bearer {api_key}"})
+
+
+def _record_limits(key_pool, rate_limiter, api_key: Optional[str], response) -> None:
+    """응답 헤더의 한도 정보를 키 풀 또는 속도 제한기에 반영합니다."""
+    if api_key is not None:
+        key_pool.update(api_key, response.headers, response.status_code)
+    elif rate_limiter is not None:
+        rate_limiter.update(response.headers, response.status_code)
+
+
+def _async_connection_errors() -> tuple:
+    """httpx가 설치되어 있으면 재시도할 전송 오류 타입을 반환합니다."""
+    try:
+        import httpx
+    except ImportError:  # pragma: no cover - httpx 없이는 비동기 클라이언트를 만들 수 없음
+        return ()
+    return (httpx.TransportError,)
+
+
+class _EndpointHelpers:
+    """동기/비동기 엔드포인트가 공유하는 요청 보조 메서드."""
+
+    # GET이 아니어도 재시도해도 안전한(부작용 없는) 경로. 검색용 POST 엔드포인트가 지정합니다.
+    idempotent_paths: FrozenSet[str] = frozenset()
+
+    def _is_idempotent(self, method: str, path: str) -> bool:
+        """부작용이 없어 캐시하거나 합쳐도 되는 요청인지 반환합니다."""
+        return method.upper() == "GET" or path in self.idempotent_paths
+
+    def _request_key(self, method: str, path: str, kwargs: Dict) -> Optional[str]:
+        """캐시와 single-flight에 사용할 요청 키를 반환합니다. 멱등 요청이 아니면 None입니다."""
+        if not self._is_idempotent(method, path):
+            return None
+        return make_cache_key(
+            method, f"{self.base_path}{path}", kwargs.get("params"), kwargs.get("json")
+        )
+
+    def _cache_lookup(self, key: Optional[str], path: str):
+        """요청 키에 적용할 TTL을 계산하고 캐시된 값을 조회합니다.
+
+        Returns:
+            Tuple[float, Any]: (TTL, 캐시된 값 또는 MISSING). 캐시하지 않는 요청이면
+            TTL이 0입니다.
+        """
+        cache = getattr(self.client, "cache", None)
+        # 캐시 백엔드는 JSON 값을 저장하므로 응답 바이트는 캐시하지 않습니다.
+        if cache is None or key is None or self._raw() == "bytes":
+            return 0.0, MISSING
+        ttl = cache.ttl_for(f"{self.base_path}{path}")
+        if ttl <= 0:
+            return 0.0, MISSING
+        return ttl, cache.get(key)
+
+    def _prepare_conditional(self, method: str, url: str, kwargs: Dict):
+        """조건부 GET을 사용하면 저장된 검증자를 요청 헤더에 추가합니다.
+
+        Returns:
+            Tuple[Optional[ConditionalCache], Optional[str]]: (검증자 저장소, 키).
+            조건부 요청을 사용하지 않으면 (None, None)입니다.
+        """
+        store = getattr(self.client, "conditional", None)
+        if store is None or method.upper() != "GET":
+            return None, None
+        key = make_cache_key(method, url, kwargs.get("params"))
+        validators = store.request_headers(key)
+        if validators:
+            _merge_headers(kwargs, validators)
+        return store, key
+
+    def _raw(self):
+        """클라이언트의 raw 설정을 반환합니다 (False, True, "bytes")."""
+        return getattr(self.client, "raw", False)
+
+    def _roster_index(self):
+        """클라이언트의 원정대 캐시를 반환합니다. 없거나 응답 바이트를 반환하는 모드이면 None."""
+        if self._raw() == "bytes":
+            return None
+        return getattr(self.client, "roster_index", None)
+
+    def _known_missing(self, character_name: str) -> bool:
+        """없는 캐릭터 캐시(``negative_cache``)에 이름이 있는지 확인합니다.
+
+        응답 바이트를 반환하는 모드에서는 빈 응답을 구분할 수 없으므로 사용하지 않습니다.
+        """
+        negative = getattr(self.client, "negative_cache", None)
+        if negative is None or self._raw() == "bytes":
+            return False
+        return character_name in negative
+
+    def _remember_missing(self, character_name: str, data) -> None:
+        """캐릭터 전체에 대한 응답이 null이면 없는 캐릭터로 기억합니다."""
+        negative = getattr(self.client, "negative_cache", None)
+        if negative is not None and data is None and self._raw() != "bytes":
+            negative.add(character_name)
+
+    def _decode(self, response):
+        """응답 본문을 디코딩합니다.
+
+        raw 설정이 "bytes"이면 본문을 그대로, 클라이언트에 ``json_decoder`` 가 있으면 그 함수로,
+        없으면 ``response.json()`` 으로 디코딩합니다.
+        """
+        if self._raw() == "bytes":
+            return response.content
+        decoder = getattr(self.client, "json_decoder", None)
+        if decoder is None:
+            return response.json()
+        return decoder(response.content)
+
+    def _json_page(self, data):
+        """bytes 모드의 응답 본문을 클라이언트의 JSON 디코더로 디코딩합니다.
+
+        페이지 순회처럼 응답 내용(``TotalCount`` 등)을 읽어야 하는 기능이 bytes 모드에서도
+        동작하도록, 그런 기능은 raw 모드(True)처럼 JSON을 다룹니다. 다른 모드의 응답은
+        그대로 반환합니다.
+        """
+        if not isinstance(data, (bytes, bytearray)):
+            return data
+        decoder = getattr(self.client, "json_decoder", None)
+        return decoder(data) if decoder is not None else json.loads(data)
+
+    def _model(self, data, model, **options):
+        """JSON을 모델로 변환합니다. 304로 재사용한 JSON이면 이전에 만든 모델을 반환합니다.
+
+        클라이언트가 raw 모드이면 변환하지 않고 그대로 반환합니다.
+        ``options`` 는 ``model.from_dict`` 에 그대로 전달합니다 (예: ``lazy=True``).
+        """
+        if self._raw():
+            return data
+        store = getattr(self.client, "conditional", None)
+        if store is None:
+            return model.from_dict(data, **options)
+        return store.model(
+            data,
+            (model, tuple(sorted(options.items()))),
+            lambda d: model.from_dict(d, **options),
+        )
+
+    def _optional_model(self, data, model, **options):
+        """:meth:`_model` 과 같지만 응답이 비어 있으면 None을 반환합니다."""
+        if not data and not self._raw():
+            return None
+        return self._model(data, model, **options)
+
+    def _models(self, data, model) -> List:
+        """JSON 배열을 모델 리스트로 변환합니다. 배열이 아니면 빈 리스트입니다.
+
+        :meth:`_model` 과 같이 raw 모드와 304 재사용을 지원합니다.
+        """
+        if self._raw():
+            return data
+        if not isinstance(data, list):
+            return []
+        store = getattr(self.client, "conditional", None)
+        if store is None:
+            return [model.from_dict(item) for item in data]
+        models = store.model(
+            data, (list, model), lambda items: [model.from_dict(i) for i in items]
+        )
+        return list(models)
+
+    def _store(self, key: Optional[str], ttl: float, data) -> None:
+        """TTL이 있으면 응답을 캐시에 저장합니다."""
+        if ttl > 0:
+            self.client.cache.set(key, data, ttl)
+
+
+class BaseEndpoint(_EndpointHelpers):
     """모든 API 엔드포인트의 기본 클래스."""
 
     def __init__(self, client: "LostArkAPI"):
@@ -21,7 +224,11 @@ class BaseEndpoint:
         self.base_path = ""  # Subclasses should override
 
     def _request(self, method: str, path: str, **kwargs) -> Dict:
-        """속도 제한 및 오류 처리를 포함하여 HTTP 요청을 수행합니다.
+        """캐시, 속도 제한, 재시도 및 오류 처리를 포함하여 HTTP 요청을 수행합니다.
+
+        클라이언트에 응답 캐시(``cache``)가 있으면 멱등 요청의 응답을 경로별 TTL 동안
+        재사용합니다. single-flight(``single_flight``)가 있으면 동시에 들어온 동일한
+        멱등 요청을 하나의 API 호출로 합칩니다.
 
         Args:
             method: HTTP 메서드 (GET, POST 등)
@@ -33,24 +240,263 @@ class BaseEndpoint:
 
         Raises:
             AuthenticationError: 401 Unauthorized 발생 시
-            RateLimitError: 429 Too Many Requests 발생 시
+            RateLimitError: 429 Too Many Requests 발생 시, 또는 속도 제한기가
+                대기 없이 실패하도록 설정된 경우
+            APIError: 기타 HTTP 오류 발생 시
+        """
+        key = self._request_key(method, path, kwargs)
+        ttl, cached = self._cache_lookup(key, path)
+        if cached is not MISSING:
+            return cached
+
+        single_flight = getattr(self.client, "single_flight", None)
+        if key is None or single_flight is None:
+            return self._fetch_and_store(key, ttl, method, path, kwargs)
+        return single_flight.do(
+            key, self._fetch_and_store, key, ttl, method, path, kwargs
+        )
+
+    def _fetch_and_store(
+        self, key: Optional[str], ttl: float, method: str, path: str, kwargs: Dict
+    ) -> Dict:
+        """요청을 수행하고 응답을 캐시에 저장합니다."""
+        data = self._fetch(method, path, **kwargs)
+        self._store(key, ttl, data)
+        return data
+
+    def _fetch(self, method: str, path: str, **kwargs) -> Dict:
+        """속도 제한, 재시도 및 오류 처리를 포함하여 HTTP 요청을 수행합니다.
+
+        클라이언트에 재시도 정책(``retry_policy``)이 있으면 429/5xx 응답과 연결 오류를
+        정책에 따라 재시도합니다. POST 요청은 ``idempotent_paths`` 에 속한 경우에만
+        재시도합니다. 검증자 저장소(``conditional``)가 있으면 GET 요청을 조건부로 보내고
+        304 응답에는 저장해 둔 JSON을 반환합니다. 본문은 :meth:`_decode` 로 디코딩합니다.
+
+        Args:
+            method: HTTP 메서드 (GET, POST 등)
+            path: 엔드포인트 경로
+            **kwargs: requests 요청을 위한 추가 인자
+
+        Returns:
+            Dict: JSON 응답 딕셔너리
+
+        Raises:
+            AuthenticationError: 401 Unauthorized 발생 시
+            RateLimitError: 429 Too Many Requests 발생 시, 또는 속도 제한기가
+                대기 없이 실패하도록 설정된 경우
             APIError: 기타 HTTP 오류 발생 시
         """
         # 전체 URL 생성
         url = f"{self.client.base_url}{self.base_path}{path}"
+        conditional, conditional_key = self._prepare_conditional(method, url, kwargs)
 
-        # 요청 수행
-        response = self.client.session.request(method, url, **kwargs)
+        retry_policy = getattr(self.client, "retry_policy", None)
+        idempotent = False
+        if retry_policy is not None:
+            retry_policy.stats.record_request()
+            idempotent = retry_policy.is_idempotent(
+                method, path, self.idempotent_paths
+            )
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self._send(method, url, kwargs)
+            except (RequestsConnectionError, Timeout) as e:
+                delay = (
+                    retry_policy.next_delay(attempt, idempotent)
+                    if retry_policy is not None
+                    else None
+                )
+                if delay is None:
+                    raise
+                retry_policy.stats.record_retry(
+                    RetryAttempt(method, url, attempt, None, delay, repr(e))
+                )
+                time.sleep(delay)
+                continue
+
+            if retry_policy is not None:
+                delay = retry_policy.next_delay(
+                    attempt, idempotent, response.status_code, response.headers
+                )
+                if delay is not None:
+                    retry_policy.stats.record_retry(
+                        RetryAttempt(method, url, attempt, response.status_code, delay)
+                    )
+                    time.sleep(delay)
+                    continue
+            break
+
+        if conditional is not None and response.status_code == 304:
+            data = conditional.not_modified(conditional_key)
+            if data is MISSING:
+                _raise_api_error(response.status_code, response.text)
+            return data
 
         # 오류 처리
         try:
             response.raise_for_status()
         except HTTPError:
-            if response.status_code == 401:
-                raise AuthenticationError(f"Unauthorized: {response.text}")
-            elif response.status_code == 429:
-                raise RateLimitError(f"Rate limit exceeded: {response.text}")
-            else:
-                raise APIError(f"API error ({response.status_code}): {response.text}")
-
-        return response.json()
+            _raise_api_error(response.status_code, response.text)
+
+        data = self._decode(response)
+        if conditional is not None:
+            conditional.update(conditional_key, response.headers, data)
+        return data
+
+    def _send(self, method: str, url: str, kwargs: Dict):
+        """키 풀 또는 속도 제한기에서 슬롯을 예약한 뒤 요청을 한 번 전송합니다."""
+        key_pool = getattr(self.client, "key_pool", None)
+        rate_limiter = getattr(self.client, "rate_limiter", None)
+        retry_policy = getattr(self.client, "retry_policy", None)
+        api_key = None
+        if key_pool is not None:
+            api_key = key_pool.acquire()
+            _set_authorization(kwargs, api_key)
+        elif rate_limiter is not None:
+            rate_limiter.acquire()
+
+        if retry_policy is not None:
+            retry_policy.stats.record_attempt()
+        response = self.client.session.request(method, url, **kwargs)
+
+        _record_limits(key_pool, rate_limiter, api_key, response)
+        return response
+
+
+class AsyncBaseEndpoint(_EndpointHelpers):
+    """모든 비동기 API 엔드포인트의 기본 클래스."""
+
+    def __init__(self, client: "AsyncLostArkAPI"):
+        """클라이언트와 함께 엔드포인트를 초기화합니다.
+
+        Args:
+            client: AsyncLostArkAPI 인스턴스
+        """
+        self.client = client
+        self.base_path = ""  # Subclasses should override
+
+    async def _request(self, method: str, path: str, **kwargs) -> Dict:
+        """:meth:`BaseEndpoint._request` 의 비동기 버전.
+
+        Args:
+            method: HTTP 메서드 (GET, POST 등)
+            path: 엔드포인트 경로
+            **kwargs: httpx 요청을 위한 추가 인자
+
+        Returns:
+            Dict: JSON 응답 딕셔너리
+        """
+        key = self._request_key(method, path, kwargs)
+        ttl, cached = self._cache_lookup(key, path)
+        if cached is not MISSING:
+            return cached
+
+        single_flight = getattr(self.client, "single_flight", None)
+        if key is None or single_flight is None:
+            return await self._fetch_and_store(key, ttl, method, path, kwargs)
+        return await single_flight.do(
+            key, self._fetch_and_store, key, ttl, method, path, kwargs
+        )
+
+    async def _fetch_and_store(
+        self, key: Optional[str], ttl: float, method: str, path: str, kwargs: Dict
+    ) -> Dict:
+        """:meth:`BaseEndpoint._fetch_and_store` 의 비동기 버전."""
+        data = await self._fetch(method, path, **kwargs)
+        self._store(key, ttl, data)
+        return data
+
+    async def _fetch(self, method: str, path: str, **kwargs) -> Dict:
+        """:meth:`BaseEndpoint._fetch` 의 비동기 버전.
+
+        Args:
+            method: HTTP 메서드 (GET, POST 등)
+            path: 엔드포인트 경로
+            **kwargs: httpx 요청을 위한 추가 인자
+
+        Returns:
+            Dict: JSON 응답 딕셔너리
+
+        Raises:
+            AuthenticationError: 401 Unauthorized 발생 시
+            RateLimitError: 429 Too Many Requests 발생 시, 또는 속도 제한기가
+                대기 없이 실패하도록 설정된 경우
+            APIError: 기타 HTTP 오류 발생 시
+        """
+        url = f"{self.client.base_url}{self.base_path}{path}"
+        conditional, conditional_key = self._prepare_conditional(method, url, kwargs)
+
+        retry_policy = getattr(self.client, "retry_policy", None)
+        idempotent = False
+        if retry_policy is not None:
+            retry_policy.stats.record_request()
+            idempotent = retry_policy.is_idempotent(
+                method, path, self.idempotent_paths
+            )
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._send(method, url, kwargs)
+            except _async_connection_errors() as e:
+                delay = (
+                    retry_policy.next_delay(attempt, idempotent)
+                    if retry_policy is not None
+                    else None
+                )
+                if delay is None:
+                    raise
+                retry_policy.stats.record_retry(
+                    RetryAttempt(method, url, attempt, None, delay, repr(e))
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            if retry_policy is not None:
+                delay = retry_policy.next_delay(
+                    attempt, idempotent, response.status_code, response.headers
+                )
+                if delay is not None:
+                    retry_policy.stats.record_retry(
+                        RetryAttempt(method, url, attempt, response.status_code, delay)
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+            break
+
+        if conditional is not None and response.status_code == 304:
+            data = conditional.not_modified(conditional_key)
+            if data is MISSING:
+                _raise_api_error(response.status_code, response.text)
+            return data
+
+        if response.status_code >= 400:
+            _raise_api_error(response.status_code, response.text)
+
+        data = self._decode(response)
+        if conditional is not None:
+            conditional.update(conditional_key, response.headers, data)
+        return data
+
+    async def _send(self, method: str, url: str, kwargs: Dict):
+        """:meth:`BaseEndpoint._send` 의 비동기 버전."""
+        key_pool = getattr(self.client, "key_pool", None)
+        rate_limiter = getattr(self.client, "rate_limiter", None)
+        retry_policy = getattr(self.client, "retry_policy", None)
+        api_key = None
+        if key_pool is not None:
+            api_key = await key_pool.acquire_async()
+            _set_authorization(kwargs, api_key)
+        elif rate_limiter is not None:
+            await rate_limiter.acquire_async()
+
+        if retry_policy is not None:
+            retry_policy.stats.record_attempt()
+        response = await self.client.session.request(method, url, **kwargs)
+
+        _record_limits(key_pool, rate_limiter, api_key, response)
+        return response
@@ -1,7 +1,9 @@
 """캐릭터 정보 관련 엔드포인트."""
 
-from typing import List
-from pyloa.endpoints.base import BaseEndpoint
+from typing import Any, Callable, Iterable, List, Optional
+from pyloa.cache import MISSING
+from pyloa.crawler import AsyncRosterCrawler, RosterCrawler, DEFAULT_CHECKPOINT_EVERY
+from pyloa.endpoints.base import BaseEndpoint, AsyncBaseEndpoint
 from pyloa.models.character import CharacterInfo
 
 
@@ -20,12 +22,115 @@ class CharactersEndpoint(BaseEndpoint):
     def get_siblings(self, character_name: str) -> List[CharacterInfo]:
         """계정의 모든 캐릭터 목록 조회.
 
+        클라이언트에 원정대 캐시(``roster_index``)가 있으면 같은 원정대의 다른 캐릭터로
+        이미 조회한 목록을 요청 없이 반환합니다.
+        없는 캐릭터 캐시(``negative_cache``)에 있는 이름이면 요청 없이 빈 목록을 반환합니다.
+
         Args:
             character_name: 조회할 캐릭터 이름
 
         Returns:
             List[CharacterInfo]: 캐릭터 정보 객체 리스트
         """
+        if self._known_missing(character_name):
+            return self._models(None, CharacterInfo)
+        index = self._roster_index()
+        data = MISSING if index is None else index.get(character_name)
+        if data is MISSING:
+            data = self._request("GET", f"/{character_name}/siblings")
+            self._remember_missing(character_name, data)
+            if index is not None:
+                index.set(character_name, data)
+        return self._models(data, CharacterInfo)
+
+    def crawl(
+        self,
+        seeds: Iterable[str],
+        checkpoint: Optional[str] = None,
+        fetch: Optional[Callable[[str], Any]] = None,
+        expand: Optional[Callable[[str, Any], Iterable[str]]] = None,
+        max_workers: int = 8,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+        retry_failed: bool = False,
+    ) -> RosterCrawler:
+        """원정대 단위로 캐릭터를 탐색하며 Armory 정보를 조회합니다.
+
+        같은 원정대는 한 번만 :meth:`get_siblings` 로 조회하고, 진행 상태를 ``checkpoint``
+        파일에 저장해 중단된 작업을 이어서 진행합니다. 자세한 내용은
+        :class:`~pyloa.crawler.RosterCrawler` 참고.
+
+        Args:
+            seeds: 탐색을 시작할 캐릭터 이름
+            checkpoint: 진행 상태를 저장할 파일 경로. None이면 저장하지 않습니다.
+            fetch: 이름을 받아 캐릭터 정보를 반환하는 함수.
+                None이면 ``client.armories.get_total_info`` 를 사용합니다.
+            expand: ``(이름, fetch 결과)`` 를 받아 새로 탐색할 캐릭터 이름들을 반환하는 함수
+            max_workers: 동시에 보낼 최대 요청 수
+            checkpoint_every: 체크포인트를 저장할 주기 (완료한 요청 수)
+            retry_failed: 체크포인트에서 재개할 때 실패했던 이름을 다시 조회할지 여부
+
+        Returns:
+            RosterCrawler: ``BulkResult(key=이름, value=fetch 결과, error)`` 반복자.
+            진행 통계는 ``stats`` 속성으로 확인합니다.
+        """
+        return RosterCrawler(
+            self.get_siblings,
+            fetch or self.client.armories.get_total_info,
+            seeds,
+            checkpoint=checkpoint,
+            expand=expand,
+            max_workers=max_workers,
+            checkpoint_every=checkpoint_every,
+            retry_failed=retry_failed,
+        )
+
+
+class AsyncCharactersEndpoint(AsyncBaseEndpoint):
+    """캐릭터 정보 endpoint (asyncio)."""
+
+    def __init__(self, client):
+        """AsyncCharactersEndpoint를 초기화합니다.
+
+        Args:
+            client: AsyncLostArkAPI 인스턴스
+        """
+        super().__init__(client)
+        self.base_path = "/characters"
+
+    async def get_siblings(self, character_name: str) -> List[CharacterInfo]:
+        """계정의 모든 캐릭터 목록 조회. :meth:`CharactersEndpoint.get_siblings` 참고."""
+        if self._known_missing(character_name):
+            return self._models(None, CharacterInfo)
+        index = self._roster_index()
+        data = MISSING if index is None else index.get(character_name)
+        if data is MISSING:
+            data = await self._request("GET", f"/{character_name}/siblings")
+            self._remember_missing(character_name, data)
+            if index is not None:
+                index.set(character_name, data)
+        return self._models(data, CharacterInfo)
 
-        data = self._request("GET", f"/{character_name}/siblings")
-        return [CharacterInfo.from_dict(item) for item in data]
+    def crawl(
+        self,
+        seeds: Iterable[str],
+        checkpoint: Optional[str] = None,
+        fetch: Optional[Callable[[str], Any]] = None,
+        expand: Optional[Callable[[str, Any], Iterable[str]]] = None,
+        max_workers: int = 8,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+        retry_failed: bool = False,
+    ) -> AsyncRosterCrawler:
+        """원정대 단위로 캐릭터를 탐색합니다. ``async for`` 로 결과를 받습니다.
+
+        ``fetch`` 는 코루틴 함수입니다. :meth:`CharactersEndpoint.crawl` 참고.
+        """
+        return AsyncRosterCrawler(
+            self.get_siblings,
+            fetch or self.client.armories.get_total_info,
+            seeds,
+            checkpoint=checkpoint,
+            expand=expand,
+            max_workers=max_workers,
+            checkpoint_every=checkpoint_every,
+            retry_failed=retry_failed,
+        )
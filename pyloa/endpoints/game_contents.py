@@ -1,7 +1,7 @@
 """게임 콘텐츠 관련 엔드포인트."""
 
 from typing import List
-from pyloa.endpoints.base import BaseEndpoint
+from pyloa.endpoints.base import BaseEndpoint, AsyncBaseEndpoint
 from pyloa.models.game_content import ContentsCalendar
 
 
@@ -25,4 +25,22 @@ class GameContentsEndpoint(BaseEndpoint):
         """
 
         data = self._request("GET", "/calendar")
-        return [ContentsCalendar.from_dict(item) for item in data]
+        return self._models(data, ContentsCalendar)
+
+
+class AsyncGameContentsEndpoint(AsyncBaseEndpoint):
+    """게임 컨텐츠 endpoint (asyncio)."""
+
+    def __init__(self, client):
+        """AsyncGameContentsEndpoint를 초기화합니다.
+
+        Args:
+            client: AsyncLostArkAPI 인스턴스
+        """
+        super().__init__(client)
+        self.base_path = "/gamecontents"
+
+    async def get_calendar(self) -> List[ContentsCalendar]:
+        """주간 캘린더 조회. :meth:`GameContentsEndpoint.get_calendar` 참고."""
+        data = await self._request("GET", "/calendar")
+        return self._models(data, ContentsCalendar)
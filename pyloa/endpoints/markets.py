@@ -1,13 +1,19 @@
 """거래소 관련 엔드포인트."""
 
-from typing import List, Dict, Any
-from pyloa.endpoints.base import BaseEndpoint
+from typing import List, Dict, Any, AsyncIterator, Iterator, Optional
+from pyloa.endpoints.base import BaseEndpoint, AsyncBaseEndpoint
+from pyloa import pagination
+from pyloa.history import PriceHistoryStore
+from pyloa.pagination import DEFAULT_PREFETCH
 from pyloa.models.market import MarketItem, Market, TradeMarket, MarketItemStats
 
 
 class MarketsEndpoint(BaseEndpoint):
     """거래소 endpoint."""
 
+    # 검색용 POST 요청은 부작용이 없으므로 재시도해도 안전합니다.
+    idempotent_paths = frozenset({"/items", "/trades"})
+
     def __init__(self, client):
         """MarketsEndpoint를 초기화합니다.
 
@@ -25,19 +31,24 @@ class MarketsEndpoint(BaseEndpoint):
         """
         return self._request("GET", "/options")
 
-    def get_item(self, item_id: int) -> List[MarketItemStats]:
+    def get_item(
+        self, item_id: int, history: Optional[PriceHistoryStore] = None
+    ) -> List[MarketItemStats]:
         """특정 아이템의 거래소 정보 조회.
 
         Args:
             item_id: 아이템 ID
+            history: 시세 이력 저장소. 주어지면 조회한 최근 시세를 저장소에 누적합니다.
+                bytes 모드에서는 응답 본문을 디코딩해 저장하고, 반환값은 bytes 그대로입니다.
 
         Returns:
             List[MarketItemStats]: 아이템 상세 통계 객체 리스트
         """
         data = self._request("GET", f"/items/{item_id}")
-        if not isinstance(data, list):
-            return []
-        return [MarketItemStats.from_dict(item) for item in data]
+        result = self._models(data, MarketItemStats)
+        if history is not None:
+            history.record(item_id, self._json_page(result))
+        return result
 
     def search_items(self, **kwargs) -> Market:
         """거래소 아이템 검색.
@@ -51,7 +62,50 @@ class MarketsEndpoint(BaseEndpoint):
             Market: 거래소 검색 결과 객체
         """
         data = self._request("POST", "/items", json=kwargs)
-        return Market.from_dict(data)
+        return self._model(data, Market)
+
+    def iter_items(
+        self,
+        prefetch: int = DEFAULT_PREFETCH,
+        max_pages: Optional[int] = None,
+        max_items: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[MarketItem]:
+        """검색 결과의 모든 페이지를 순회하며 아이템을 하나씩 반환합니다.
+
+        첫 페이지의 ``total_count`` 와 ``page_size`` 로 남은 페이지를 계산해 최대
+        ``prefetch`` 개씩 동시에 요청하고, 아이템은 페이지 순서대로 반환합니다.
+        반복을 중간에 멈추면 시작하지 않은 페이지 요청은 취소합니다.
+
+        Args:
+            prefetch: 동시에 미리 요청해 둘 최대 페이지 수
+            max_pages: 요청할 최대 페이지 수. None이면 마지막 페이지까지 요청합니다.
+            max_items: 반환할 최대 아이템 수. 필요한 페이지까지만 요청합니다.
+            **kwargs: :meth:`search_items` 의 검색 파라미터. PageNo는 시작 페이지입니다.
+
+        Returns:
+            Iterator[MarketItem]: 아이템 제너레이터. raw 모드에서는 JSON(dict) 항목을 반환하며,
+            bytes 모드에서도 페이지를 디코딩해 JSON 항목을 반환합니다.
+
+        Raises:
+            ValueError: prefetch, max_pages, max_items가 1보다 작은 경우
+
+        Example:
+            >>> for item in api.markets.iter_items(CategoryCode=50000, ItemName="파괴석"):
+            ...     print(item.name, item.current_min_price)
+        """
+        start = kwargs.pop("PageNo", 1)
+        return pagination.iter_items(
+            lambda page_no: self._search_page(**kwargs, PageNo=page_no),
+            start,
+            prefetch,
+            max_pages,
+            max_items,
+        )
+
+    def _search_page(self, **kwargs) -> Market:
+        """순회용 검색 한 페이지. bytes 모드에서는 JSON으로 디코딩합니다."""
+        return self._json_page(self.search_items(**kwargs))
 
     def get_trades(self, **kwargs) -> TradeMarket:
         """최근 거래 내역 조회.
@@ -66,4 +120,68 @@ class MarketsEndpoint(BaseEndpoint):
         """
 
         data = self._request("POST", "/trades", json=kwargs)
-        return TradeMarket.from_dict(data)
+        return self._model(data, TradeMarket)
+
+
+class AsyncMarketsEndpoint(AsyncBaseEndpoint):
+    """거래소 endpoint (asyncio)."""
+
+    # 검색용 POST 요청은 부작용이 없으므로 재시도해도 안전합니다.
+    idempotent_paths = frozenset({"/items", "/trades"})
+
+    def __init__(self, client):
+        """AsyncMarketsEndpoint를 초기화합니다.
+
+        Args:
+            client: AsyncLostArkAPI 인스턴스
+        """
+        super().__init__(client)
+        self.base_path = "/markets"
+
+    async def get_options(self) -> Dict[str, Any]:
+        """거래소 검색 옵션 조회. :meth:`MarketsEndpoint.get_options` 참고."""
+        return await self._request("GET", "/options")
+
+    async def get_item(
+        self, item_id: int, history: Optional[PriceHistoryStore] = None
+    ) -> List[MarketItemStats]:
+        """특정 아이템의 거래소 정보 조회. :meth:`MarketsEndpoint.get_item` 참고."""
+        data = await self._request("GET", f"/items/{item_id}")
+        result = self._models(data, MarketItemStats)
+        if history is not None:
+            history.record(item_id, self._json_page(result))
+        return result
+
+    async def search_items(self, **kwargs) -> Market:
+        """거래소 아이템 검색. :meth:`MarketsEndpoint.search_items` 참고."""
+        data = await self._request("POST", "/items", json=kwargs)
+        return self._model(data, Market)
+
+    def iter_items(
+        self,
+        prefetch: int = DEFAULT_PREFETCH,
+        max_pages: Optional[int] = None,
+        max_items: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[MarketItem]:
+        """검색 결과의 모든 아이템을 ``async for`` 로 반환합니다.
+
+        :meth:`MarketsEndpoint.iter_items` 참고. 중간에 멈출 때는 ``aclose()`` 를 호출합니다.
+        """
+        start = kwargs.pop("PageNo", 1)
+        return pagination.aiter_items(
+            lambda page_no: self._search_page(**kwargs, PageNo=page_no),
+            start,
+            prefetch,
+            max_pages,
+            max_items,
+        )
+
+    async def _search_page(self, **kwargs) -> Market:
+        """순회용 검색 한 페이지. bytes 모드에서는 JSON으로 디코딩합니다."""
+        return self._json_page(await self.search_items(**kwargs))
+
+    async def get_trades(self, **kwargs) -> TradeMarket:
+        """최근 거래 내역 조회. :meth:`MarketsEndpoint.get_trades` 참고."""
+        data = await self._request("POST", "/trades", json=kwargs)
+        return self._model(data, TradeMarket)
@@ -1,7 +1,7 @@
 """뉴스/공지 관련 엔드포인트."""
 
 from typing import List, Optional
-from pyloa.endpoints.base import BaseEndpoint
+from pyloa.endpoints.base import BaseEndpoint, AsyncBaseEndpoint
 from pyloa.models.news import NoticeList, Event, OpenAPIUserAlarm
 
 
@@ -36,7 +36,7 @@ class NewsEndpoint(BaseEndpoint):
             params["type"] = type
 
         data = self._request("GET", "/notices", params=params)
-        return [NoticeList.from_dict(item) for item in data]
+        return self._models(data, NoticeList)
 
     def get_events(self) -> List[Event]:
         """진행 중인 이벤트 목록 조회.
@@ -45,7 +45,7 @@ class NewsEndpoint(BaseEndpoint):
             List[Event]: 이벤트 정보 객체 리스트
         """
         data = self._request("GET", "/events")
-        return [Event.from_dict(item) for item in data]
+        return self._models(data, Event)
 
     def get_alarms(self) -> OpenAPIUserAlarm:
         """알람 목록 조회.
@@ -55,4 +55,40 @@ class NewsEndpoint(BaseEndpoint):
         """
 
         data = self._request("GET", "/alarms")
-        return OpenAPIUserAlarm.from_dict(data)
+        return self._model(data, OpenAPIUserAlarm)
+
+
+class AsyncNewsEndpoint(AsyncBaseEndpoint):
+    """뉴스/공지 endpoint (asyncio)."""
+
+    def __init__(self, client):
+        """AsyncNewsEndpoint를 초기화합니다.
+
+        Args:
+            client: AsyncLostArkAPI 인스턴스
+        """
+        super().__init__(client)
+        self.base_path = "/news"
+
+    async def get_notices(
+        self, searchText: Optional[str] = None, type: Optional[str] = None
+    ) -> List[NoticeList]:
+        """공지사항 목록 조회. :meth:`NewsEndpoint.get_notices` 참고."""
+        params = {}
+        if searchText is not None:
+            params["searchText"] = searchText
+        if type is not None:
+            params["type"] = type
+
+        data = await self._request("GET", "/notices", params=params)
+        return self._models(data, NoticeList)
+
+    async def get_events(self) -> List[Event]:
+        """진행 중인 이벤트 목록 조회. :meth:`NewsEndpoint.get_events` 참고."""
+        data = await self._request("GET", "/events")
+        return self._models(data, Event)
+
+    async def get_alarms(self) -> OpenAPIUserAlarm:
+        """알람 목록 조회. :meth:`NewsEndpoint.get_alarms` 참고."""
+        data = await self._request("GET", "/alarms")
+        return self._model(data, OpenAPIUserAlarm)
@@ -0,0 +1,258 @@
+"""거래소 시세 이력 저장소.
+
+``MarketsEndpoint.get_item`` 이 돌려주는 최근 시세(``MarketStatsInfo``)는 며칠 분량뿐이므로,
+조회할 때마다 로컬에 누적해 두고 기간 조회와 다운샘플링으로 차트를 그릴 수 있게 합니다.
+
+아이템(과 거래 가능 횟수)마다 파일 하나에 날짜/평균가/거래량 열을 이어 붙인 열 지향 형식으로
+저장합니다. 하루 한 행(20바이트)이라 1년치도 수 KB이므로, 추가할 때마다 파일 전체를 임시
+파일에 쓰고 교체해 중간에 종료되어도 파일이 깨지지 않습니다.
+"""
+
+import datetime
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from pyloa.models.market import MarketItemStats, MarketStatsInfo
+
+_MAGIC = b"PYLOAPH1"
+_HEADER = struct.Struct("<8sI")
+_EPOCH = datetime.date(1970, 1, 1).toordinal()
+
+DateLike = Union[str, datetime.date]
+
+
+def _to_day(value: DateLike) -> int:
+    """날짜("2024-01-08" 또는 date)를 1970-01-01부터의 일 수로 변환합니다."""
+    if isinstance(value, str):
+        value = datetime.date.fromisoformat(value[:10])
+    return value.toordinal() - _EPOCH
+
+
+def _from_day(day: int) -> datetime.date:
+    return datetime.date.fromordinal(day + _EPOCH)
+
+
+def _columns() -> Tuple[array, array, array]:
+    return array("i"), array("d"), array("q")
+
+
+class PriceSeries(NamedTuple):
+    """시세 이력 열 데이터.
+
+    Attributes:
+        days: 1970-01-01부터의 일 수 (오름차순)
+        avg_prices: 일 평균 거래가
+        trade_counts: 일 거래량
+    """
+
+    days: array
+    avg_prices: array
+    trade_counts: array
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    @property
+    def dates(self) -> List[datetime.date]:
+        """각 행의 날짜."""
+        return [_from_day(day) for day in self.days]
+
+    def rows(self) -> List[MarketStatsInfo]:
+        """행을 ``MarketStatsInfo`` 리스트로 반환합니다."""
+        return [
+            MarketStatsInfo(
+                date=_from_day(day).isoformat(), avg_price=price, trade_count=count
+            )
+            for day, price, count in zip(self.days, self.avg_prices, self.trade_counts)
+        ]
+
+    def between(
+        self, start: Optional[DateLike] = None, end: Optional[DateLike] = None
+    ) -> "PriceSeries":
+        """``start`` 이상 ``end`` 이하 날짜의 행만 반환합니다 (이진 탐색)."""
+        lo = 0 if start is None else bisect_left(self.days, _to_day(start))
+        hi = len(self.days) if end is None else bisect_right(self.days, _to_day(end))
+        return PriceSeries(
+            self.days[lo:hi], self.avg_prices[lo:hi], self.trade_counts[lo:hi]
+        )
+
+    def resample(self, days: int) -> "PriceSeries":
+        """``days`` 일 단위 구간으로 묶습니다.
+
+        구간의 날짜는 구간 시작일, 평균가는 거래량 가중 평균(거래가 없으면 단순 평균),
+        거래량은 합계입니다.
+
+        Raises:
+            ValueError: days가 1보다 작은 경우
+        """
+        if days < 1:
+            raise ValueError("days must be at least 1")
+        out = _columns()
+        i, n = 0, len(self.days)
+        while i < n:
+            bucket = self.days[i] // days * days
+            total = weighted = plain = 0.0
+            count = 0
+            while i < n and self.days[i] // days * days == bucket:
+                total += self.trade_counts[i]
+                weighted += self.avg_prices[i] * self.trade_counts[i]
+                plain += self.avg_prices[i]
+                count += 1
+                i += 1
+            out[0].append(bucket)
+            out[1].append(weighted / total if total else plain / count)
+            out[2].append(int(total))
+        return PriceSeries(*out)
+
+
+class PriceHistoryStore:
+    """아이템별 시세 이력을 디렉터리에 저장하는 저장소.
+
+    같은 아이템의 같은 날짜는 한 행만 유지하며, 다시 추가하면 최신 값으로 갱신합니다
+    (당일 시세는 하루 동안 계속 바뀝니다). 한 프로세스 안에서는 스레드 안전하지만,
+    여러 프로세스가 같은 디렉터리에 동시에 쓰는 것은 지원하지 않습니다.
+
+    Example:
+        >>> store = PriceHistoryStore("price-history")
+        >>> api.markets.get_item(66110221, history=store)
+        >>> weekly = store.query(66110221, start="2024-01-01").resample(7)
+    """
+
+    def __init__(self, path: str):
+        """저장소를 초기화합니다.
+
+        Args:
+            path: 이력 파일을 저장할 디렉터리. 없으면 만듭니다.
+        """
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _file(self, item_id: int, trade_remain_count: Optional[int]) -> str:
+        name = str(int(item_id))
+        if trade_remain_count is not None:
+            name += f"_{int(trade_remain_count)}"
+        return os.path.join(self.path, f"{name}.col")
+
+    @staticmethod
+    def _read(path: str) -> PriceSeries:
+        columns = _columns()
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return PriceSeries(*columns)
+        magic, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError(f"Not a price history file: {path}")
+        offset = _HEADER.size
+        for column in columns:
+            size = count * column.itemsize
+            column.frombytes(data[offset : offset + size])
+            offset += size
+            if sys.byteorder != "little":  # pragma: no cover
+                column.byteswap()
+        return PriceSeries(*columns)
+
+    @staticmethod
+    def _write(path: str, series: PriceSeries) -> None:
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(series)))
+            for column in series:
+                if sys.byteorder != "little":  # pragma: no cover
+                    column = array(column.typecode, column)
+                    column.byteswap()
+                column.tofile(f)
+        os.replace(tmp, path)
+
+    def append(
+        self,
+        item_id: int,
+        stats: Iterable[MarketStatsInfo],
+        trade_remain_count: Optional[int] = None,
+    ) -> int:
+        """시세 행을 추가하고 새로 추가된 날짜 수를 반환합니다.
+
+        Args:
+            item_id: 아이템 ID
+            stats: 추가할 시세 행
+            trade_remain_count: 거래 가능 횟수. 같은 아이템의 구분된 시세를 따로 저장합니다.
+
+        Returns:
+            int: 새로 추가된 날짜 수 (기존 날짜의 갱신은 세지 않습니다)
+        """
+        incoming = sorted(
+            (_to_day(s.date), float(s.avg_price), int(s.trade_count)) for s in stats
+        )
+        if not incoming:
+            return 0
+        path = self._file(item_id, trade_remain_count)
+        with self._lock:
+            days, prices, counts = self._read(path)
+            added = 0
+            changed = False
+            for day, price, count in incoming:
+                i = bisect_left(days, day)
+                if i < len(days) and days[i] == day:
+                    if prices[i] != price or counts[i] != count:
+                        prices[i], counts[i] = price, count
+                        changed = True
+                    continue
+                days.insert(i, day)
+                prices.insert(i, price)
+                counts.insert(i, count)
+                added += 1
+            if added or changed:
+                self._write(path, PriceSeries(days, prices, counts))
+        return added
+
+    def record(
+        self, item_id: int, entries: Iterable[Union[MarketItemStats, dict]]
+    ) -> int:
+        """``get_item`` 결과를 추가하고 새로 추가된 날짜 수의 합을 반환합니다.
+
+        raw 모드의 JSON(dict 리스트)도 받을 수 있습니다.
+        """
+        added = 0
+        for entry in entries:
+            if isinstance(entry, dict):
+                entry = MarketItemStats.from_dict(entry)
+            added += self.append(item_id, entry.stats, entry.trade_remain_count)
+        return added
+
+    def query(
+        self,
+        item_id: int,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        trade_remain_count: Optional[int] = None,
+    ) -> PriceSeries:
+        """아이템의 시세 이력을 기간으로 조회합니다.
+
+        Args:
+            item_id: 아이템 ID
+            start: 시작 날짜 (포함). None이면 처음부터
+            end: 끝 날짜 (포함). None이면 끝까지
+            trade_remain_count: 거래 가능 횟수. :meth:`append` 참고
+
+        Returns:
+            PriceSeries: 날짜 오름차순 열 데이터. 이력이 없으면 빈 시리즈
+        """
+        series = self._read(self._file(item_id, trade_remain_count))
+        return series.between(start, end)
+
+    def items(self) -> List[Tuple[int, Optional[int]]]:
+        """저장된 (아이템 ID, 거래 가능 횟수) 목록을 반환합니다."""
+        keys = []
+        for name in sorted(os.listdir(self.path)):
+            if not name.endswith(".col"):
+                continue
+            item_id, _, remain = name[:-4].partition("_")
+            keys.append((int(item_id), int(remain) if remain else None))
+        return keys
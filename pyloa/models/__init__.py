@@ -34,6 +34,7 @@ from .market import (
     TradeMarket,
 )
 from .game_content import ContentsCalendar, LevelRewardItems, RewardItem
+from .tooltip import Tooltip, TooltipElement, parse_tooltip
 
 __all__ = [
     "BaseModel",
@@ -70,4 +71,7 @@ __all__ = [
     "ContentsCalendar",
     "LevelRewardItems",
     "RewardItem",
+    "Tooltip",
+    "TooltipElement",
+    "parse_tooltip",
 ]
@@ -1,8 +1,9 @@
 """Armory 관련 모델."""
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import List, Dict, Any, Optional
-from pyloa.models.base import BaseModel
+from pyloa.models.base import BaseModel, dataclass
+from pyloa.models.tooltip import TooltipMixin
 
 
 @dataclass
@@ -89,7 +90,7 @@ class ArmoryProfile(BaseModel):
 
 
 @dataclass
-class ArmoryEquipment(BaseModel):
+class ArmoryEquipment(TooltipMixin, BaseModel):
     """장비 정보 모델."""
 
     type: str
@@ -100,7 +101,7 @@ class ArmoryEquipment(BaseModel):
 
 
 @dataclass
-class ArmoryAvatar(BaseModel):
+class ArmoryAvatar(TooltipMixin, BaseModel):
     """아바타 모델."""
 
     type: str
@@ -113,7 +114,7 @@ class ArmoryAvatar(BaseModel):
 
 
 @dataclass
-class SkillTripod(BaseModel):
+class SkillTripod(TooltipMixin, BaseModel):
     """스킬 트라이포드 모델."""
 
     tier: int
@@ -125,7 +126,7 @@ class SkillTripod(BaseModel):
 
 
 @dataclass
-class SkillRune(BaseModel):
+class SkillRune(TooltipMixin, BaseModel):
     """스킬 룬 모델."""
 
     name: str
@@ -135,7 +136,7 @@ class SkillRune(BaseModel):
 
 
 @dataclass
-class ArmorySkill(BaseModel):
+class ArmorySkill(TooltipMixin, BaseModel):
     """스킬 모델."""
 
     name: str
@@ -168,7 +169,7 @@ class ArmorySkill(BaseModel):
 
 
 @dataclass
-class Engraving(BaseModel):
+class Engraving(TooltipMixin, BaseModel):
     """각인 슬롯 모델."""
 
     slot: int
@@ -219,7 +220,7 @@ class ArmoryEngraving(BaseModel):
 
 
 @dataclass
-class Card(BaseModel):
+class Card(TooltipMixin, BaseModel):
     """카드 단일 모델."""
 
     slot: int
@@ -274,7 +275,7 @@ class ArmoryCard(BaseModel):
 
 
 @dataclass
-class Gem(BaseModel):
+class Gem(TooltipMixin, BaseModel):
     """보석 단일 모델."""
 
     slot: int
@@ -286,7 +287,7 @@ class Gem(BaseModel):
 
 
 @dataclass
-class GemEffect(BaseModel):
+class GemEffect(TooltipMixin, BaseModel):
     """보석 효과 상세 모델."""
 
     gem_slot: int
@@ -494,7 +495,7 @@ class Collectible(BaseModel):
 
 
 @dataclass
-class ArkPassivePoint(BaseModel):
+class ArkPassivePoint(TooltipMixin, BaseModel):
     """아크 패시브 포인트 모델."""
 
     name: str
@@ -504,7 +505,7 @@ class ArkPassivePoint(BaseModel):
 
 
 @dataclass
-class ArkPassiveEffectSkill(BaseModel):
+class ArkPassiveEffectSkill(TooltipMixin, BaseModel):
     """아크 패시브 효과 스킬 모델."""
 
     name: str
@@ -544,7 +545,7 @@ class ArkPassive(BaseModel):
 
 
 @dataclass
-class ArkGridGem(BaseModel):
+class ArkGridGem(TooltipMixin, BaseModel):
     """아크 그리드 보석 모델."""
 
     index: int
@@ -555,7 +556,7 @@ class ArkGridGem(BaseModel):
 
 
 @dataclass
-class ArkGridEffect(BaseModel):
+class ArkGridEffect(TooltipMixin, BaseModel):
     """아크 그리드 효과 모델."""
 
     name: str
@@ -564,7 +565,7 @@ class ArkGridEffect(BaseModel):
 
 
 @dataclass
-class ArkGridSlot(BaseModel):
+class ArkGridSlot(TooltipMixin, BaseModel):
     """아크 그리드 슬롯 모델."""
 
     index: int
@@ -605,9 +606,57 @@ class ArkGrid(BaseModel):
         )
 
 
+def _one(model):
+    """섹션 JSON을 모델 하나로 변환하는 함수를 만듭니다. 비어 있으면 None입니다."""
+    return lambda data: model.from_dict(data) if data else None
+
+
+def _many(model):
+    """섹션 JSON 배열을 모델 리스트로 변환하는 함수를 만듭니다."""
+    return lambda data: [model.from_dict(item) for item in (data or [])]
+
+
+# ArmoryTotal 필드 이름 -> (API 응답 키, 변환 함수)
+_ARMORY_SECTIONS = {
+    "armory_profile": ("ArmoryProfile", _one(ArmoryProfile)),
+    "armory_equipment": ("ArmoryEquipment", _many(ArmoryEquipment)),
+    "armory_avatars": ("ArmoryAvatars", _many(ArmoryAvatar)),
+    "armory_skills": ("ArmorySkills", _many(ArmorySkill)),
+    "armory_engraving": ("ArmoryEngraving", _one(ArmoryEngraving)),
+    "armory_card": ("ArmoryCard", _one(ArmoryCard)),
+    "armory_gem": ("ArmoryGem", _one(ArmoryGem)),
+    "colosseum_info": ("ColosseumInfo", _one(ColosseumInfo)),
+    "collectibles": ("Collectibles", _many(Collectible)),
+    "ark_passive": ("ArkPassive", _one(ArkPassive)),
+    "ark_grid": ("ArkGrid", _one(ArkGrid)),
+}
+
+# get_total_info 필터 이름 -> API 응답 키. 섹션별 조회 경로는 필터 이름과 같습니다
+# (예: /armories/characters/{name}/gems 의 응답은 종합 정보의 "ArmoryGem" 값과 같습니다).
+ARMORY_FILTERS = {
+    "profiles": "ArmoryProfile",
+    "equipment": "ArmoryEquipment",
+    "avatars": "ArmoryAvatars",
+    "combat-skills": "ArmorySkills",
+    "engravings": "ArmoryEngraving",
+    "cards": "ArmoryCard",
+    "gems": "ArmoryGem",
+    "colosseums": "ColosseumInfo",
+    "collectibles": "Collectibles",
+    "arkpassive": "ArkPassive",
+    "arkgrid": "ArkGrid",
+}
+
+
 @dataclass
 class ArmoryTotal(BaseModel):
-    """Armory 종합 정보 모델."""
+    """Armory 종합 정보 모델.
+
+    ``from_dict(data, lazy=True)`` 로 만들면 각 섹션을 처음 접근할 때 변환합니다.
+    """
+
+    # 지연 모드에서 아직 변환하지 않은 섹션의 원본 JSON (필드 이름 -> JSON)
+    _extra_slots = ("_pending",)
 
     armory_profile: Optional[ArmoryProfile] = None
     armory_equipment: List[ArmoryEquipment] = field(default_factory=list)
@@ -622,61 +671,40 @@ class ArmoryTotal(BaseModel):
     ark_grid: Optional[ArkGrid] = None
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ArmoryTotal":
-        """딕셔너리에서 인스턴스를 생성합니다."""
-        # 각 하위 객체들을 딕셔너리 키 존재 여부에 따라 처리
-        profile_data = data.get("ArmoryProfile")
-        armory_profile = ArmoryProfile.from_dict(profile_data) if profile_data else None
-
-        equipment = [
-            ArmoryEquipment.from_dict(item)
-            for item in (data.get("ArmoryEquipment") or [])
-        ]
-        avatars = [
-            ArmoryAvatar.from_dict(item) for item in (data.get("ArmoryAvatars") or [])
-        ]
-        skills = [
-            ArmorySkill.from_dict(item) for item in (data.get("ArmorySkills") or [])
-        ]
-
-        engraving_data = data.get("ArmoryEngraving")
-        armory_engraving = (
-            ArmoryEngraving.from_dict(engraving_data) if engraving_data else None
-        )
-
-        card_data = data.get("ArmoryCard")
-        armory_card = ArmoryCard.from_dict(card_data) if card_data else None
-
-        gem_data = data.get("ArmoryGem")
-        armory_gem = ArmoryGem.from_dict(gem_data) if gem_data else None
-
-        colosseum_data = data.get("ColosseumInfo")
-        colosseum_info = (
-            ColosseumInfo.from_dict(colosseum_data) if colosseum_data else None
-        )
-
-        collectibles = [
-            Collectible.from_dict(item) for item in (data.get("Collectibles") or [])
-        ]
-
-        ark_passive_data = data.get("ArkPassive")
-        ark_passive = (
-            ArkPassive.from_dict(ark_passive_data) if ark_passive_data else None
-        )
-
-        ark_grid_data = data.get("ArkGrid")
-        ark_grid = ArkGrid.from_dict(ark_grid_data) if ark_grid_data else None
-
-        return cls(
-            armory_profile=armory_profile,
-            armory_equipment=equipment,
-            armory_avatars=avatars,
-            armory_skills=skills,
-            armory_engraving=armory_engraving,
-            armory_card=armory_card,
-            armory_gem=armory_gem,
-            colosseum_info=colosseum_info,
-            collectibles=collectibles,
-            ark_passive=ark_passive,
-            ark_grid=ark_grid,
-        )
+    def from_dict(cls, data: Dict[str, Any], lazy: bool = False) -> "ArmoryTotal":
+        """딕셔너리에서 인스턴스를 생성합니다.
+
+        Args:
+            data: API 응답 딕셔너리
+            lazy: True면 섹션을 바로 변환하지 않고, 처음 접근할 때 변환해 보관합니다.
+                프로필처럼 일부 섹션만 읽는 경우 나머지 섹션의 변환 비용을 아낄 수 있습니다.
+        """
+        if not lazy:
+            return cls(
+                **{
+                    name: build(data.get(key))
+                    for name, (key, build) in _ARMORY_SECTIONS.items()
+                }
+            )
+
+        total = cls.__new__(cls)
+        total._pending = {
+            name: data.get(key) for name, (key, _) in _ARMORY_SECTIONS.items()
+        }
+        return total
+
+    def __getattr__(self, name: str) -> Any:
+        # 슬롯에 값이 없을 때만 호출됩니다. 지연 모드의 섹션이면 지금 변환합니다.
+        try:
+            pending = object.__getattribute__(self, "_pending")
+        except AttributeError:
+            pending = None
+        if not pending or name not in pending:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        value = _ARMORY_SECTIONS[name][1](pending[name])
+        setattr(self, name, value)
+        # 값을 먼저 설정한 뒤 지워서 동시에 접근한 스레드도 값을 얻을 수 있게 합니다.
+        pending.pop(name, None)
+        return value
@@ -1,8 +1,8 @@
 """경매장 관련 모델."""
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import List, Optional, Any, Dict
-from pyloa.models.base import BaseModel
+from pyloa.models.base import BaseModel, dataclass
 
 
 @dataclass
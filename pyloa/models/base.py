@@ -1,16 +1,87 @@
 """API 응답 객체를 위한 기본 모델."""
 
+import dataclasses
 from dataclasses import asdict
-from typing import Dict, TypeVar, Type
+from typing import Dict, FrozenSet, Optional, Tuple, TypeVar, Type
 import re
 
 
 T = TypeVar("T", bound="BaseModel")
 
+# 클래스별 (필드 이름 집합, 입력 키 → 필드 이름) 캐시. from_dict 호출마다
+# dataclasses.fields()와 정규식 변환을 반복하지 않도록 합니다.
+_KEY_MAPS: Dict[type, Tuple[FrozenSet[str], Dict[str, Optional[str]]]] = {}
+
+# 예상하지 못한 키가 계속 들어와도 캐시가 무한히 커지지 않도록 하는 상한
+_MAX_KEYS_PER_CLASS = 256
+
+
+def dataclass(cls=None, **kwargs):
+    """``__slots__`` 를 추가하는 :func:`dataclasses.dataclass`.
+
+    인스턴스마다 ``__dict__`` 를 만들지 않아 파싱한 모델을 대량으로 보관할 때 메모리를
+    크게 줄입니다. Python 3.10의 ``dataclass(slots=True)`` 와 같은 동작을 3.7 이상에서
+    제공합니다. 클래스에 이미 ``__slots__`` 가 있으면 필드 슬롯과 합칩니다.
+
+    필드가 아닌 인스턴스 속성은 ``_extra_slots`` 에 이름을 적으면 슬롯으로 추가합니다.
+    기본값이 있는 필드와 함께 ``__slots__`` 를 직접 쓰면 일반 ``dataclasses.dataclass``
+    로는 클래스를 만들 수 없으므로, 두 데코레이터 모두에서 동작해야 하는 모델은
+    ``_extra_slots`` 를 사용합니다.
+
+    Args:
+        cls: 데코레이트할 클래스
+        **kwargs: :func:`dataclasses.dataclass` 에 전달할 인자
+    """
+
+    def wrap(cls):
+        return _add_slots(dataclasses.dataclass(cls, **kwargs))
+
+    return wrap if cls is None else wrap(cls)
+
+
+def _add_slots(cls):
+    """필드 이름을 ``__slots__`` 로 가진 새 클래스를 만들어 반환합니다."""
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+    extra = tuple(cls.__dict__.get("__slots__", ())) + tuple(
+        cls.__dict__.get("_extra_slots", ())
+    )
+    # 부모 클래스가 이미 가진 슬롯은 다시 만들지 않습니다.
+    inherited = {
+        name
+        for base in cls.__mro__[1:-1]
+        for name in getattr(base, "__slots__", ())
+    }
+    slots = tuple(
+        name
+        for name in dict.fromkeys(field_names + extra)
+        if name not in inherited
+    )
+
+    namespace = dict(cls.__dict__)
+    for name in slots:
+        # 기본값은 dataclass가 __init__에 넣어 두었으므로 클래스 속성은 지웁니다.
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = slots
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+
+    # 인자 없는 super()가 새 클래스를 가리키도록 __class__ 셀을 고칩니다.
+    for value in namespace.values():
+        func = getattr(value, "__func__", value)
+        for cell in getattr(func, "__closure__", None) or ():
+            if cell.cell_contents is cls:
+                cell.cell_contents = new_cls
+    return new_cls
+
 
 class BaseModel:
     """모든 API 응답 모델의 기본 클래스."""
 
+    __slots__ = ()
+
     @classmethod
     def _pascal_to_snake(cls, name: str) -> str:
         """PascalCase를 snake_case로 변환합니다."""
@@ -24,27 +95,42 @@ class BaseModel:
         components = name.split("_")
         return "".join(x.title() for x in components)
 
+    @classmethod
+    def _key_map(cls) -> Tuple[FrozenSet[str], Dict[str, Optional[str]]]:
+        """클래스의 필드 이름 집합과 입력 키 → 필드 이름 매핑을 반환합니다.
+
+        클래스마다 한 번만 계산합니다. 매핑은 처음 보는 키를 만날 때마다 채워지며,
+        필드에 해당하지 않는 키는 None으로 기억합니다.
+        """
+        cached = _KEY_MAPS.get(cls)
+        if cached is None:
+            if not dataclasses.is_dataclass(cls):
+                raise TypeError(f"{cls.__name__} must be a dataclass")
+            fields = frozenset(f.name for f in dataclasses.fields(cls))
+            cached = _KEY_MAPS[cls] = (fields, {})
+        return cached
+
     @classmethod
     def from_dict(cls: Type[T], data: Dict) -> T:
         """딕셔너리에서 모델 인스턴스를 생성합니다.
 
         PascalCase(API 형식)와 snake_case(Python 형식)를 모두 지원합니다.
         """
-        # Get field names from dataclass
-        import dataclasses
-
-        if not dataclasses.is_dataclass(cls):
-            raise TypeError(f"{cls.__name__} must be a dataclass")
-
-        fields = {f.name for f in dataclasses.fields(cls)}
+        fields, key_map = cls._key_map()
         kwargs = {}
 
         for key, value in data.items():
-            # Try snake_case first (direct match)
-            snake_key = key if "_" in key else cls._pascal_to_snake(key)
+            try:
+                name = key_map[key]
+            except KeyError:
+                # Try snake_case first (direct match)
+                snake_key = key if "_" in key else cls._pascal_to_snake(key)
+                name = snake_key if snake_key in fields else None
+                if len(key_map) < _MAX_KEYS_PER_CLASS:
+                    key_map[key] = name
 
-            if snake_key in fields:
-                kwargs[snake_key] = value
+            if name is not None:
+                kwargs[name] = value
 
         return cls(**kwargs)
 
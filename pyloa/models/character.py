@@ -1,7 +1,6 @@
 """캐릭터 관련 모델."""
 
-from dataclasses import dataclass
-from pyloa.models.base import BaseModel
+from pyloa.models.base import BaseModel, dataclass
 
 
 @dataclass
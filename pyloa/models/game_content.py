@@ -1,8 +1,8 @@
 """게임 콘텐츠 모델 (캘린더 등)."""
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import List, Dict, Any, Optional
-from pyloa.models.base import BaseModel
+from pyloa.models.base import BaseModel, dataclass
 
 
 @dataclass
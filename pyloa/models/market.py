@@ -1,8 +1,9 @@
 """거래소 관련 모델."""
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional, List, Dict, Any
-from pyloa.models.base import BaseModel
+from pyloa.models.base import BaseModel, dataclass
+from pyloa.models.tooltip import TooltipMixin
 
 
 @dataclass
@@ -72,7 +73,7 @@ class MarketStatsInfo(BaseModel):
 
 
 @dataclass
-class MarketItemStats(BaseModel):
+class MarketItemStats(TooltipMixin, BaseModel):
     """거래소 아이템 상세 통계 모델."""
 
     name: str
@@ -1,8 +1,8 @@
 """뉴스/공지 관련 모델."""
 
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional, List
-from pyloa.models.base import BaseModel
+from pyloa.models.base import BaseModel, dataclass
 
 
 @dataclass
@@ -0,0 +1,184 @@
+"""툴팁 파싱.
+
+장비, 보석, 카드, 스킬 등의 ``tooltip`` 필드는 HTML 마크업이 섞인 JSON 문자열입니다.
+:func:`parse_tooltip` 은 이를 :class:`Tooltip` 으로 변환하며, 같은 아이템의 툴팁은 여러
+캐릭터에서 반복되므로 툴팁 문자열을 키로 결과를 기억해 두었다가 재사용합니다.
+"""
+
+import html
+import json
+import re
+from dataclasses import field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from pyloa.models.base import dataclass
+
+# 기억해 둘 최대 툴팁 수
+TOOLTIP_CACHE_SIZE = 8192
+
+_TAG = re.compile(r"<[^>]*>")
+_BR = re.compile(r"<br\s*/?>", re.IGNORECASE)
+_REFINEMENT = re.compile(r"^\+(\d+)\s")
+_ITEM_LEVEL = re.compile(r"아이템 레벨\s*([\d,]+)")
+_TIER = re.compile(r"티어\s*(\d+)")
+_LEVEL = re.compile(r"(\d+)")
+
+
+def strip_tags(text: Any) -> str:
+    """HTML 태그를 제거하고 ``<BR>`` 을 줄바꿈으로 바꾼 텍스트를 반환합니다."""
+    if not isinstance(text, str):
+        return ""
+    text = _BR.sub("\n", text)
+    return html.unescape(_TAG.sub("", text)).strip()
+
+
+@dataclass
+class TooltipElement:
+    """툴팁을 구성하는 요소 하나.
+
+    Attributes:
+        type: 요소 종류 (예: "NameTagBox", "ItemTitle", "ItemPartBox")
+        value: 마크업이 남아 있는 원본 값 (문자열 또는 dict)
+    """
+
+    type: str
+    value: Any = None
+
+
+@dataclass
+class Tooltip:
+    """파싱한 툴팁.
+
+    :func:`parse_tooltip` 의 결과는 같은 툴팁을 가진 모델끼리 공유되므로 수정하지 않아야 합니다.
+
+    Attributes:
+        name: 이름 (예: "+25 운명의 업화 머리 장식")
+        item_type: 아이템 종류와 등급 (예: "고대 머리 방어구")
+        item_level: 아이템 레벨
+        tier: 아이템 티어
+        quality: 품질 (0-100). 품질이 없는 아이템이면 None
+        refinement: 재련 단계 (이름의 "+25"). 없으면 None
+        skill_level: 스킬 레벨. 스킬 툴팁이 아니면 None
+        sections: 제목별 본문 줄 (예: {"기본 효과": ["물리 방어력 +5000", ...]})
+        texts: 제목 없는 텍스트 블록
+        elements: 원본 요소 목록
+    """
+
+    name: str = ""
+    item_type: str = ""
+    item_level: Optional[int] = None
+    tier: Optional[int] = None
+    quality: Optional[int] = None
+    refinement: Optional[int] = None
+    skill_level: Optional[int] = None
+    sections: Dict[str, List[str]] = field(default_factory=dict)
+    texts: List[str] = field(default_factory=list)
+    elements: List[TooltipElement] = field(default_factory=list)
+
+
+def _lines(value: Any) -> List[str]:
+    text = strip_tags(value)
+    return [line.strip() for line in text.split("\n") if line.strip()]
+
+
+def _int(pattern, text: str) -> Optional[int]:
+    match = pattern.search(text)
+    return int(match.group(1).replace(",", "")) if match else None
+
+
+def _parse_item_title(tooltip: Tooltip, value: Dict[str, Any]) -> None:
+    tooltip.item_type = strip_tags(value.get("leftStr0"))
+    level_text = strip_tags(value.get("leftStr2"))
+    tooltip.item_level = _int(_ITEM_LEVEL, level_text)
+    tooltip.tier = _int(_TIER, level_text)
+    quality = value.get("qualityValue")
+    if isinstance(quality, int) and quality >= 0:
+        tooltip.quality = quality
+
+
+def _parse_part_box(tooltip: Tooltip, value: Dict[str, Any]) -> None:
+    title = strip_tags(value.get("Element_000"))
+    tooltip.sections.setdefault(title, []).extend(_lines(value.get("Element_001")))
+
+
+def _parse_indent_group(tooltip: Tooltip, value: Dict[str, Any]) -> None:
+    for group in value.values():
+        if not isinstance(group, dict):
+            continue
+        lines = tooltip.sections.setdefault(strip_tags(group.get("topStr")), [])
+        contents = group.get("contentStr")
+        if isinstance(contents, dict):
+            for content in contents.values():
+                if isinstance(content, dict):
+                    lines.extend(_lines(content.get("contentStr")))
+
+
+def _parse_skill_title(tooltip: Tooltip, value: Dict[str, Any]) -> None:
+    if not tooltip.name:
+        tooltip.name = strip_tags(value.get("name"))
+    tooltip.skill_level = _int(_LEVEL, strip_tags(value.get("level")))
+
+
+_PARSERS = {
+    "ItemTitle": _parse_item_title,
+    "ItemPartBox": _parse_part_box,
+    "IndentStringGroup": _parse_indent_group,
+    "CommonSkillTitle": _parse_skill_title,
+}
+
+
+@lru_cache(maxsize=TOOLTIP_CACHE_SIZE)
+def parse_tooltip(raw: Optional[str]) -> Tooltip:
+    """툴팁 문자열을 :class:`Tooltip` 으로 변환합니다.
+
+    같은 문자열에 대해서는 이전에 만든 객체를 반환합니다 (``parse_tooltip.cache_info()``).
+    JSON이 아닌 툴팁은 태그를 제거한 텍스트 하나로 취급합니다.
+
+    Args:
+        raw: 모델의 ``tooltip`` 필드 값
+
+    Returns:
+        Tooltip: 파싱한 툴팁. 빈 툴팁이면 모든 필드가 기본값입니다.
+    """
+    tooltip = Tooltip()
+    if not raw:
+        return tooltip
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        tooltip.texts.extend(_lines(raw))
+        return tooltip
+
+    for element in data.values():
+        if not isinstance(element, dict):
+            continue
+        kind = element.get("type") or ""
+        value = element.get("value")
+        tooltip.elements.append(TooltipElement(kind, value))
+        if kind == "NameTagBox":
+            tooltip.name = strip_tags(value)
+        elif kind in _PARSERS and isinstance(value, dict):
+            _PARSERS[kind](tooltip, value)
+        elif isinstance(value, str):
+            text = strip_tags(value)
+            if text:
+                tooltip.texts.append(text)
+
+    match = _REFINEMENT.match(tooltip.name)
+    if match:
+        tooltip.refinement = int(match.group(1))
+    return tooltip
+
+
+class TooltipMixin:
+    """``tooltip`` 필드를 가진 모델에 :attr:`parsed_tooltip` 을 추가합니다."""
+
+    __slots__ = ()
+
+    @property
+    def parsed_tooltip(self) -> Tooltip:
+        """``tooltip`` 을 파싱한 결과. 처음 접근할 때 파싱하고 이후에는 캐시를 사용합니다."""
+        return parse_tooltip(self.tooltip)
@@ -0,0 +1,219 @@
+"""검색 결과 페이지 자동 순회.
+
+거래소/경매장 검색은 한 번에 한 페이지만 반환합니다. 첫 페이지의 ``total_count`` 와
+``page_size`` 로 전체 페이지 수를 계산한 뒤, 다음 페이지들을 미리 동시에 요청해 두고
+페이지 순서대로 돌려줍니다. 전송 속도는 클라이언트의 속도 제한기가 조절하며, 소비자가
+반복을 멈추면 아직 시작하지 않은 요청은 취소합니다.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+# 기본으로 미리 받아 두는 페이지 수
+DEFAULT_PREFETCH = 4
+
+
+def page_fields(page: Any) -> Tuple[int, int, List[Any]]:
+    """페이지의 (page_size, total_count, items)를 반환합니다. raw 모드의 dict도 지원합니다."""
+    if isinstance(page, dict):
+        return (
+            page.get("PageSize") or 0,
+            page.get("TotalCount") or 0,
+            page.get("Items") or [],
+        )
+    return page.page_size, page.total_count, page.items
+
+
+def _last_page(
+    first: Any, start: int, max_pages: Optional[int], max_items: Optional[int]
+) -> int:
+    """첫 페이지와 상한으로부터 요청할 마지막 페이지 번호를 계산합니다."""
+    page_size, total_count, items = page_fields(first)
+    if not items or page_size <= 0:
+        return start
+    last = -(-total_count // page_size)
+    if max_pages is not None:
+        last = min(last, start + max_pages - 1)
+    if max_items is not None:
+        last = min(last, start + -(-max_items // page_size) - 1)
+    return max(start, last)
+
+
+def _check_limits(
+    prefetch: int, max_pages: Optional[int] = None, max_items: Optional[int] = None
+) -> None:
+    if prefetch < 1:
+        raise ValueError("prefetch must be at least 1")
+    if max_pages is not None and max_pages < 1:
+        raise ValueError("max_pages must be at least 1")
+    if max_items is not None and max_items < 1:
+        raise ValueError("max_items must be at least 1")
+
+
+def iter_pages(
+    fetch: Callable[[int], Any],
+    start: int = 1,
+    prefetch: int = DEFAULT_PREFETCH,
+    max_pages: Optional[int] = None,
+) -> Iterator[Any]:
+    """``start`` 페이지부터 마지막 페이지까지 페이지 순서대로 반환하는 제너레이터.
+
+    Args:
+        fetch: 페이지 번호를 받아 검색 결과 한 페이지를 반환하는 함수
+        start: 시작 페이지 번호
+        prefetch: 동시에 미리 요청해 둘 최대 페이지 수
+        max_pages: 반환할 최대 페이지 수. None이면 마지막 페이지까지 반환합니다.
+
+    Returns:
+        Iterator: 검색 결과 페이지 제너레이터
+
+    Raises:
+        ValueError: prefetch 또는 max_pages가 1보다 작은 경우
+    """
+    _check_limits(prefetch, max_pages)
+    return _pages(fetch, start, prefetch, max_pages, None)
+
+
+def _pages(fetch, start, prefetch, max_pages, max_items) -> Iterator[Any]:
+    first = fetch(start)
+    yield first
+    last = _last_page(first, start, max_pages, max_items)
+    if last <= start:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+    pending: "deque" = deque()
+    next_page = start + 1
+    try:
+        while pending or next_page <= last:
+            while next_page <= last and len(pending) < prefetch:
+                pending.append(executor.submit(fetch, next_page))
+                next_page += 1
+            page = pending.popleft().result()
+            yield page
+            # 순회 도중 결과가 줄어 빈 페이지가 나오면 멈춥니다.
+            if not page_fields(page)[2]:
+                return
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def iter_items(
+    fetch: Callable[[int], Any],
+    start: int = 1,
+    prefetch: int = DEFAULT_PREFETCH,
+    max_pages: Optional[int] = None,
+    max_items: Optional[int] = None,
+) -> Iterator[Any]:
+    """:func:`iter_pages` 의 페이지 항목을 순서대로 반환하는 제너레이터.
+
+    ``max_items`` 를 주면 그 수를 채우는 데 필요한 페이지까지만 요청합니다. 반복을 중간에
+    멈추면 미리 요청해 둔 페이지 중 시작하지 않은 요청을 취소합니다.
+
+    Args:
+        fetch: 페이지 번호를 받아 검색 결과 한 페이지를 반환하는 함수
+        start: 시작 페이지 번호
+        prefetch: 동시에 미리 요청해 둘 최대 페이지 수
+        max_pages: 요청할 최대 페이지 수
+        max_items: 반환할 최대 항목 수
+
+    Returns:
+        Iterator: 항목 제너레이터
+
+    Raises:
+        ValueError: prefetch, max_pages, max_items가 1보다 작은 경우
+    """
+    _check_limits(prefetch, max_pages, max_items)
+    return _items(_pages(fetch, start, prefetch, max_pages, max_items), max_items)
+
+
+def _items(pages, max_items: Optional[int]) -> Iterator[Any]:
+    remaining = max_items
+    try:
+        for page in pages:
+            for item in page_fields(page)[2]:
+                yield item
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining <= 0:
+                        return
+    finally:
+        pages.close()
+
+
+def aiter_pages(
+    fetch: Callable[[int], Awaitable[Any]],
+    start: int = 1,
+    prefetch: int = DEFAULT_PREFETCH,
+    max_pages: Optional[int] = None,
+) -> AsyncIterator[Any]:
+    """:func:`iter_pages` 의 asyncio 버전. ``fetch`` 는 코루틴 함수입니다.
+
+    ``async for`` 를 중간에 멈출 때는 ``aclose()`` 를 호출해야 미리 요청해 둔 페이지가
+    바로 취소됩니다.
+    """
+    _check_limits(prefetch, max_pages)
+    return _apages(fetch, start, prefetch, max_pages, None)
+
+
+async def _apages(fetch, start, prefetch, max_pages, max_items) -> AsyncIterator[Any]:
+    first = await fetch(start)
+    yield first
+    last = _last_page(first, start, max_pages, max_items)
+
+    pending: "deque" = deque()
+    next_page = start + 1
+    try:
+        while pending or next_page <= last:
+            while next_page <= last and len(pending) < prefetch:
+                pending.append(asyncio.ensure_future(fetch(next_page)))
+                next_page += 1
+            page = await pending.popleft()
+            yield page
+            if not page_fields(page)[2]:
+                return
+    finally:
+        for task in pending:
+            if task.done() and not task.cancelled():
+                # 소비하지 않은 페이지의 예외로 경고가 나지 않게 합니다.
+                task.exception()
+            task.cancel()
+
+
+def aiter_items(
+    fetch: Callable[[int], Awaitable[Any]],
+    start: int = 1,
+    prefetch: int = DEFAULT_PREFETCH,
+    max_pages: Optional[int] = None,
+    max_items: Optional[int] = None,
+) -> AsyncIterator[Any]:
+    """:func:`iter_items` 의 asyncio 버전."""
+    _check_limits(prefetch, max_pages, max_items)
+    return _aitems(_apages(fetch, start, prefetch, max_pages, max_items), max_items)
+
+
+async def _aitems(pages, max_items: Optional[int]) -> AsyncIterator[Any]:
+    remaining = max_items
+    try:
+        async for page in pages:
+            for item in page_fields(page)[2]:
+                yield item
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining <= 0:
+                        return
+    finally:
+        await pages.aclose()
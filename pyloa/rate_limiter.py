@@ -0,0 +1,350 @@
+"""응답 헤더 기반 클라이언트 측 속도 제한기."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+from pyloa.exceptions import RateLimitError
+
+
+def get_header(headers: Optional[Mapping], name: str) -> Optional[str]:
+    """대소문자를 구분하지 않고 헤더 값을 조회합니다.
+
+    Args:
+        headers: 응답 헤더 (requests의 CaseInsensitiveDict 또는 일반 dict)
+        name: 조회할 헤더 이름
+
+    Returns:
+        Optional[str]: 헤더 값. 없으면 None
+    """
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is not None:
+        return value
+    lowered = name.lower()
+    for key, value in headers.items():
+        if key.lower() == lowered:
+            return value
+    return None
+
+
+def _to_int(value: Optional[str]) -> Optional[int]:
+    """헤더 문자열을 정수로 변환합니다. 변환할 수 없으면 None을 반환합니다."""
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _check_wait(mode: str, max_wait: float, wait: float, waited: float) -> None:
+    """모드에 따라 대기를 허용할지 결정합니다.
+
+    Raises:
+        RateLimitError: "fail_fast" 모드이거나 "wait" 모드에서 max_wait를 초과하는 경우
+    """
+    if mode == RateLimiter.MODE_FAIL_FAST:
+        raise RateLimitError(
+            f"Rate limit exhausted; resets in {wait:.1f}s (fail_fast mode)"
+        )
+    if mode == RateLimiter.MODE_WAIT and waited + wait > max_wait:
+        raise RateLimitError(
+            f"Rate limit exhausted; resets in {wait:.1f}s "
+            f"which exceeds max_wait={max_wait}s"
+        )
+
+
+class RateLimiter:
+    """X-RateLimit-* 응답 헤더를 읽어 요청 속도를 조절하는 제한기.
+
+    로스트아크 API는 모든 응답에 다음 헤더를 포함합니다.
+
+    - ``X-RateLimit-Limit``: 윈도우당 허용 요청 수 (기본 분당 100회)
+    - ``X-RateLimit-Remaining``: 현재 윈도우의 남은 요청 수
+    - ``X-RateLimit-Reset``: 윈도우가 초기화되는 시각 (Unix epoch 초)
+
+    요청을 보내기 전에 :meth:`acquire` 로 슬롯을 예약하고, 응답을 받은 뒤
+    :meth:`update` 로 서버가 알려준 값을 반영합니다. 서버 헤더를 받기 전과 윈도우가
+    초기화된 직후에는 ``limit`` 만큼 남아 있다고 가정하고 예약마다 차감하므로, 시작
+    직후나 윈도우 경계에서도 한도를 넘겨 요청하지 않습니다. 같은 윈도우 안에서는 서버가
+    알려준 남은 요청 수가 이미 보낸(응답을 기다리는) 요청을 반영하지 못할 수 있으므로 로컬
+    값보다 작을 때만 받아들이고, 새 초기화 시각이 오면 서버 값으로 바꿉니다. 남은 요청이
+    없을 때의 동작은 ``mode`` 로 결정합니다.
+
+    - ``"block"``: 윈도우가 초기화될 때까지 대기합니다.
+    - ``"wait"``: 최대 ``max_wait`` 초까지 대기하고, 그 이상이면 RateLimitError를 발생시킵니다.
+    - ``"fail_fast"``: 대기하지 않고 즉시 RateLimitError를 발생시킵니다.
+    """
+
+    MODE_BLOCK = "block"
+    MODE_WAIT = "wait"
+    MODE_FAIL_FAST = "fail_fast"
+    MODES = (MODE_BLOCK, MODE_WAIT, MODE_FAIL_FAST)
+
+    DEFAULT_LIMIT = 100
+    DEFAULT_WINDOW = 60.0
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        mode: str = MODE_BLOCK,
+        max_wait: float = DEFAULT_WINDOW,
+        window: float = DEFAULT_WINDOW,
+    ):
+        """속도 제한기를 초기화합니다.
+
+        Args:
+            limit: 서버 헤더를 받기 전까지 가정할 윈도우당 요청 수
+            mode: 남은 요청이 없을 때의 동작 ("block", "wait", "fail_fast")
+            max_wait: "wait" 모드에서 허용하는 최대 대기 시간 (초)
+            window: Reset 헤더가 없을 때 가정할 윈도우 길이 (초)
+
+        Raises:
+            ValueError: 알 수 없는 mode가 주어진 경우
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}, got {mode!r}")
+
+        self.limit = limit
+        self.remaining: Optional[int] = None
+        self.reset_time: Optional[datetime] = None
+        # 현재 remaining이 속한 서버 윈도우의 X-RateLimit-Reset 값
+        self._window_reset: Optional[int] = None
+        self.mode = mode
+        self.max_wait = max_wait
+        self.window = window
+        self._lock = threading.Lock()
+
+    def _reset_timestamp(self) -> Optional[float]:
+        """reset_time을 epoch 초로 반환합니다."""
+        if self.reset_time is None:
+            return None
+        return self.reset_time.timestamp()
+
+    def get_wait_duration(self) -> float:
+        """다음 요청을 보내기 전에 기다려야 하는 시간(초)을 반환합니다."""
+        with self._lock:
+            return self._wait_duration(time.time())
+
+    def _wait_duration(self, now: float) -> float:
+        """잠금을 보유한 상태에서 대기 시간을 계산합니다."""
+        reset_at = self._reset_timestamp()
+        if reset_at is not None and now >= reset_at:
+            # 윈도우가 지났으므로 새 윈도우의 한도를 처음부터 셉니다.
+            self.remaining = self.limit
+            self.reset_time = None
+            self._window_reset = None
+            return 0.0
+        if self.remaining is None:
+            self.remaining = self.limit
+        if self.remaining > 0:
+            return 0.0
+        if reset_at is None:
+            # 남은 요청이 없는데 초기화 시각을 모르면 한 윈도우를 기다립니다.
+            self.reset_time = datetime.fromtimestamp(now + self.window, tz=timezone.utc)
+            return self.window
+        return reset_at - now
+
+    def headroom(self) -> int:
+        """현재 윈도우에서 사용할 수 있는 요청 수를 반환합니다.
+
+        서버 헤더를 아직 받지 못했다면 ``limit`` 전체를 사용할 수 있다고 가정합니다.
+        """
+        with self._lock:
+            if self._wait_duration(time.time()) > 0:
+                return 0
+            return self.remaining
+
+    def try_acquire(self) -> float:
+        """대기하지 않고 슬롯 예약을 시도합니다.
+
+        Returns:
+            float: 0이면 예약 성공, 양수면 기다려야 하는 시간(초)
+        """
+        with self._lock:
+            wait = self._wait_duration(time.time())
+            if wait <= 0:
+                # 동시에 요청하는 스레드들이 같은 슬롯을 쓰지 않도록 미리 차감합니다.
+                self.remaining -= 1
+            return wait
+
+    def acquire(self) -> float:
+        """요청 슬롯 하나를 예약합니다. 필요하면 현재 스레드를 대기시킵니다.
+
+        Returns:
+            float: 실제로 대기한 시간 (초)
+
+        Raises:
+            RateLimitError: "fail_fast" 모드이거나 "wait" 모드에서 max_wait를 초과한 경우
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return waited
+            _check_wait(self.mode, self.max_wait, wait, waited)
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self) -> float:
+        """:meth:`acquire` 의 asyncio 버전. 이벤트 루프를 막지 않고 대기합니다."""
+        waited = 0.0
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return waited
+            _check_wait(self.mode, self.max_wait, wait, waited)
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def update(self, headers: Optional[Mapping], status_code: Optional[int] = None):
+        """응답 헤더로 한도 상태를 갱신합니다.
+
+        같은 윈도우의 응답이면 남은 요청 수를 로컬 값과 헤더 값 중 작은 값으로 정하고,
+        이전보다 늦은 초기화 시각(새 윈도우)이 오면 헤더 값을 그대로 사용합니다. 이미 지난
+        윈도우의 늦게 도착한 응답은 무시합니다.
+
+        Args:
+            headers: 응답 헤더
+            status_code: 응답 상태 코드. 429이면 남은 요청을 0으로 간주합니다.
+        """
+        limit = _to_int(get_header(headers, "X-RateLimit-Limit"))
+        remaining = _to_int(get_header(headers, "X-RateLimit-Remaining"))
+        reset = _to_int(get_header(headers, "X-RateLimit-Reset"))
+        retry_after = _to_int(get_header(headers, "Retry-After"))
+
+        with self._lock:
+            if limit is not None:
+                self.limit = limit
+            known = self._window_reset
+            stale = reset is not None and known is not None and reset < known
+            new_window = reset is not None and known is not None and reset > known
+            if remaining is not None and not stale:
+                if self.remaining is None or new_window:
+                    self.remaining = remaining
+                else:
+                    self.remaining = min(self.remaining, remaining)
+            if reset is not None and not stale:
+                self._window_reset = reset
+                self.reset_time = datetime.fromtimestamp(reset, tz=timezone.utc)
+            if status_code == 429:
+                self.remaining = 0
+                if retry_after is not None:
+                    self.reset_time = datetime.fromtimestamp(
+                        time.time() + retry_after, tz=timezone.utc
+                    )
+
+
+class KeyPool:
+    """여러 API 키의 요청 한도를 함께 관리하는 키 풀.
+
+    키마다 별도의 :class:`RateLimiter` 를 두고, 요청할 때마다 남은 요청 수가
+    가장 많은 키를 골라 슬롯을 예약합니다. 등록한 키 수만큼 처리량이 늘어납니다.
+    모든 키가 소진되면 가장 먼저 초기화되는 키를 기준으로 ``mode`` 에 따라 동작합니다.
+    """
+
+    def __init__(
+        self,
+        api_keys: Sequence[str],
+        mode: str = RateLimiter.MODE_BLOCK,
+        max_wait: float = RateLimiter.DEFAULT_WINDOW,
+        limit: int = RateLimiter.DEFAULT_LIMIT,
+    ):
+        """키 풀을 초기화합니다.
+
+        Args:
+            api_keys: 사용할 API 키 목록 (중복은 제거됩니다)
+            mode: 모든 키가 소진되었을 때의 동작 ("block", "wait", "fail_fast")
+            max_wait: "wait" 모드에서 허용하는 최대 대기 시간 (초)
+            limit: 서버 헤더를 받기 전까지 가정할 키당 요청 수
+
+        Raises:
+            ValueError: 키가 없거나 알 수 없는 mode가 주어진 경우
+        """
+        keys = list(dict.fromkeys(api_keys))
+        if not keys:
+            raise ValueError("KeyPool requires at least one API key")
+        if mode not in RateLimiter.MODES:
+            raise ValueError(f"mode must be one of {RateLimiter.MODES}, got {mode!r}")
+
+        self.mode = mode
+        self.max_wait = max_wait
+        self._limiters = {
+            key: RateLimiter(limit=limit, mode=mode, max_wait=max_wait) for key in keys
+        }
+        self._lock = threading.Lock()
+
+    @property
+    def keys(self) -> List[str]:
+        """등록된 API 키 목록을 반환합니다."""
+        return list(self._limiters)
+
+    def __len__(self) -> int:
+        return len(self._limiters)
+
+    def limiter(self, api_key: str) -> RateLimiter:
+        """키에 해당하는 RateLimiter를 반환합니다."""
+        return self._limiters[api_key]
+
+    def try_acquire(self) -> Tuple[Optional[str], float]:
+        """대기하지 않고 가장 여유 있는 키의 슬롯 예약을 시도합니다.
+
+        Returns:
+            Tuple[Optional[str], float]: (예약한 키, 0). 모든 키가 소진되었으면
+            (None, 가장 짧은 대기 시간)
+        """
+        with self._lock:
+            ranked = sorted(
+                self._limiters.items(),
+                key=lambda item: item[1].headroom(),
+                reverse=True,
+            )
+            min_wait = None
+            for key, limiter in ranked:
+                wait = limiter.try_acquire()
+                if wait <= 0:
+                    return key, 0.0
+                min_wait = wait if min_wait is None else min(min_wait, wait)
+            return None, min_wait
+
+    def acquire(self) -> str:
+        """요청에 사용할 키를 골라 슬롯을 예약합니다.
+
+        Returns:
+            str: 예약한 API 키
+
+        Raises:
+            RateLimitError: "fail_fast" 모드이거나 "wait" 모드에서 max_wait를 초과한 경우
+        """
+        waited = 0.0
+        while True:
+            key, wait = self.try_acquire()
+            if key is not None:
+                return key
+            _check_wait(self.mode, self.max_wait, wait, waited)
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self) -> str:
+        """:meth:`acquire` 의 asyncio 버전."""
+        waited = 0.0
+        while True:
+            key, wait = self.try_acquire()
+            if key is not None:
+                return key
+            _check_wait(self.mode, self.max_wait, wait, waited)
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def update(
+        self,
+        api_key: str,
+        headers: Optional[Mapping],
+        status_code: Optional[int] = None,
+    ) -> None:
+        """응답 헤더로 해당 키의 한도 상태를 갱신합니다."""
+        self._limiters[api_key].update(headers, status_code)
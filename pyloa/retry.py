@@ -0,0 +1,198 @@
+"""일시적인 오류(429/5xx)에 대한 재시도 정책."""
+
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Deque, FrozenSet, Iterable, List, Mapping, NamedTuple, Optional
+
+from pyloa.rate_limiter import get_header
+
+
+class RetryAttempt(NamedTuple):
+    """재시도 한 번에 대한 기록."""
+
+    method: str
+    url: str
+    attempt: int
+    status_code: Optional[int]
+    delay: float
+    error: Optional[str] = None
+
+
+class RetryStats:
+    """재시도 통계를 스레드 안전하게 집계합니다.
+
+    Attributes:
+        requests: _request 호출 수
+        attempts: 실제로 전송한 HTTP 요청 수
+        retries: 재시도한 횟수
+        giveups: 재시도 가능한 오류였지만 시도 횟수를 모두 써서 포기한 횟수
+        history: 최근 재시도 기록 (최대 ``history_size`` 개)
+    """
+
+    def __init__(self, history_size: int = 100):
+        self.requests = 0
+        self.attempts = 0
+        self.retries = 0
+        self.giveups = 0
+        self.history: Deque[RetryAttempt] = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """_request 호출 한 번을 기록합니다."""
+        with self._lock:
+            self.requests += 1
+
+    def record_attempt(self) -> None:
+        """HTTP 요청 전송 한 번을 기록합니다."""
+        with self._lock:
+            self.attempts += 1
+
+    def record_retry(self, retry: RetryAttempt) -> None:
+        """재시도 한 번을 기록합니다."""
+        with self._lock:
+            self.retries += 1
+            self.history.append(retry)
+
+    def record_giveup(self) -> None:
+        """재시도 포기 한 번을 기록합니다."""
+        with self._lock:
+            self.giveups += 1
+
+    def snapshot(self) -> List[RetryAttempt]:
+        """최근 재시도 기록의 복사본을 반환합니다."""
+        with self._lock:
+            return list(self.history)
+
+
+class RetryPolicy:
+    """지수 백오프와 지터, Retry-After를 지원하는 재시도 정책.
+
+    재시도 여부는 다음 순서로 결정합니다.
+
+    1. 시도 횟수가 ``max_attempts`` 미만이어야 합니다.
+    2. 요청이 멱등이어야 합니다. GET 등 ``idempotent_methods`` 에 속한 메서드이거나,
+       엔드포인트가 멱등으로 표시한 POST 검색 경로(``idempotent_paths``)여야 합니다.
+    3. 응답 상태 코드가 ``retry_statuses`` 에 속하거나 연결 오류여야 합니다.
+
+    대기 시간은 ``Retry-After`` 헤더가 있으면 그 값을, 없으면
+    ``backoff_factor * 2 ** (attempt - 1)`` (최대 ``max_backoff``) 범위의
+    full jitter 값을 사용합니다.
+    """
+
+    DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    DEFAULT_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        idempotent_methods: Iterable[str] = DEFAULT_IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+        retry_on_connection_error: bool = True,
+    ):
+        """재시도 정책을 초기화합니다.
+
+        Args:
+            max_attempts: 최초 요청을 포함한 최대 시도 횟수 (1이면 재시도하지 않음)
+            backoff_factor: 지수 백오프의 기준 시간 (초)
+            max_backoff: 백오프 대기 시간의 상한 (초)
+            jitter: True면 [0, 백오프] 구간에서 무작위로 대기 시간을 고릅니다
+            retry_statuses: 재시도할 HTTP 상태 코드
+            idempotent_methods: 항상 재시도해도 안전한 HTTP 메서드
+            respect_retry_after: Retry-After 헤더를 따를지 여부
+            max_retry_after: 이보다 긴 Retry-After는 재시도하지 않고 포기합니다 (초)
+            retry_on_connection_error: 연결 오류/타임아웃도 재시도할지 여부
+
+        Raises:
+            ValueError: max_attempts가 1보다 작은 경우
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.idempotent_methods: FrozenSet[str] = frozenset(
+            m.upper() for m in idempotent_methods
+        )
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.retry_on_connection_error = retry_on_connection_error
+        self.stats = RetryStats()
+
+    def is_idempotent(self, method: str, path: str, idempotent_paths=()) -> bool:
+        """요청을 재시도해도 안전한지 반환합니다."""
+        return method.upper() in self.idempotent_methods or path in idempotent_paths
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째 시도가 실패한 뒤 기다릴 백오프 시간(초)을 계산합니다."""
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def next_delay(
+        self,
+        attempt: int,
+        idempotent: bool,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping] = None,
+    ) -> Optional[float]:
+        """재시도까지 기다릴 시간을 반환합니다.
+
+        Args:
+            attempt: 방금 실패한 시도 번호 (1부터 시작)
+            idempotent: 요청이 멱등인지 여부
+            status_code: 응답 상태 코드. 연결 오류면 None
+            headers: 응답 헤더
+
+        Returns:
+            Optional[float]: 대기 시간(초). 재시도하지 않아야 하면 None
+        """
+        if status_code is None:
+            retryable = self.retry_on_connection_error
+        else:
+            retryable = status_code in self.retry_statuses
+        if not retryable or not idempotent:
+            return None
+        if attempt >= self.max_attempts:
+            self.stats.record_giveup()
+            return None
+
+        if self.respect_retry_after:
+            retry_after = _parse_retry_after(get_header(headers, "Retry-After"))
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    self.stats.record_giveup()
+                    return None
+                return retry_after
+        return self.backoff(attempt)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더를 대기 시간(초)으로 변환합니다.
+
+    초 단위 숫자와 HTTP 날짜 형식을 모두 지원합니다. 해석할 수 없으면 None을 반환합니다.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
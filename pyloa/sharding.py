@@ -0,0 +1,401 @@
+"""경매장 검색 샤딩.
+
+넓은 검색(모든 보석, 특정 등급의 모든 장신구 등)은 결과가 너무 많아 한 쿼리의 페이지를
+끝까지 넘기기 어렵습니다. 첫 페이지의 ``total_count`` 를 보고 결과가 ``max_results`` 를
+넘는 쿼리를 ``ItemTier`` → ``ItemGrade`` → 아이템 레벨 구간 순으로 겹치지 않게 나눈 뒤,
+나눈 쿼리(샤드)들을 동시에 넘기며 받은 페이지를 바로 하나의 스트림으로 합칩니다.
+
+``ItemGradeQuality`` 는 최소 품질 조건이라 겹치지 않는 구간으로 나눌 수 없고, 검색 API에는
+가격 범위 조건이 없으므로 두 기준은 샤딩에 사용하지 않습니다.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+from pyloa.pagination import _last_page, page_fields
+
+# 샤딩 기준. 앞에서부터 아직 고정되지 않은 기준으로 나눕니다.
+DEFAULT_DIMENSIONS = ("ItemTier", "ItemGrade", "ItemLevel")
+ITEM_TIERS = (1, 2, 3, 4)
+ITEM_GRADES = ("일반", "고급", "희귀", "영웅", "전설", "유물", "고대", "에스더")
+# 쿼리에 ItemLevelMin/ItemLevelMax가 없을 때 나누는 아이템 레벨 범위
+ITEM_LEVEL_RANGE = (0, 2000)
+# 샤드 하나가 가질 최대 결과 수. 넘으면 더 나눕니다.
+DEFAULT_MAX_RESULTS = 1000
+
+
+class Shard(NamedTuple):
+    """나눈 검색 쿼리 하나.
+
+    Attributes:
+        query: 검색 파라미터
+        total_count: 첫 페이지의 전체 결과 수
+        first_page: 계획 중에 받은 첫 페이지. 조회 시 다시 요청하지 않습니다.
+    """
+
+    query: Dict[str, Any]
+    total_count: int
+    first_page: Any
+
+
+def _check(
+    max_results: int, dimensions: Sequence[str], max_workers: int, prefetch: int = 1
+) -> None:
+    if max_results < 1:
+        raise ValueError("max_results must be at least 1")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    if prefetch < 1:
+        raise ValueError("prefetch must be at least 1")
+    unknown = set(dimensions) - set(DEFAULT_DIMENSIONS)
+    if unknown:
+        raise ValueError(f"Unknown shard dimensions: {sorted(unknown)}")
+
+
+def split_query(
+    query: Dict[str, Any], dimensions: Sequence[str] = DEFAULT_DIMENSIONS
+) -> Optional[List[Dict[str, Any]]]:
+    """쿼리를 겹치지 않는 하위 쿼리들로 나눕니다.
+
+    ``dimensions`` 중 쿼리에서 아직 고정되지 않은 첫 기준으로 나눕니다. 아이템 레벨은
+    ``ItemLevelMin`` ~ ``ItemLevelMax`` 구간을 반으로 나눕니다.
+
+    Args:
+        query: 검색 파라미터
+        dimensions: 사용할 샤딩 기준 ("ItemTier", "ItemGrade", "ItemLevel")
+
+    Returns:
+        Optional[List[Dict]]: 하위 쿼리 리스트. 더 나눌 수 없으면 None
+    """
+    for dimension in dimensions:
+        if dimension == "ItemTier" and not query.get("ItemTier"):
+            return [dict(query, ItemTier=tier) for tier in ITEM_TIERS]
+        if dimension == "ItemGrade" and not query.get("ItemGrade"):
+            return [dict(query, ItemGrade=grade) for grade in ITEM_GRADES]
+        if dimension == "ItemLevel":
+            low = query.get("ItemLevelMin") or ITEM_LEVEL_RANGE[0]
+            high = query.get("ItemLevelMax") or ITEM_LEVEL_RANGE[1]
+            if low < high:
+                mid = (low + high) // 2
+                return [
+                    dict(query, ItemLevelMin=low, ItemLevelMax=mid),
+                    dict(query, ItemLevelMin=mid + 1, ItemLevelMax=high),
+                ]
+    return None
+
+
+def _plan_level(
+    queries: List[Dict[str, Any]],
+    pages: List[Any],
+    max_results: int,
+    dimensions: Sequence[str],
+    shards: List[Shard],
+) -> List[Dict[str, Any]]:
+    """한 단계의 첫 페이지 결과로 샤드를 확정하고 더 나눌 쿼리를 반환합니다."""
+    frontier = []
+    for query, page in zip(queries, pages):
+        total_count = page_fields(page)[1]
+        if total_count <= 0:
+            continue
+        children = None
+        if total_count > max_results:
+            children = split_query(query, dimensions)
+        if children is None:
+            shards.append(Shard(query, total_count, page))
+        else:
+            frontier.extend(children)
+    return frontier
+
+
+def _start(query: Dict[str, Any]) -> Dict[str, Any]:
+    query = dict(query)
+    query.pop("PageNo", None)
+    return query
+
+
+def plan_shards(
+    search: Callable[..., Any],
+    query: Dict[str, Any],
+    max_results: int = DEFAULT_MAX_RESULTS,
+    dimensions: Sequence[str] = DEFAULT_DIMENSIONS,
+    max_workers: int = 4,
+) -> List[Shard]:
+    """``total_count`` 를 보며 쿼리를 결과 ``max_results`` 이하의 샤드로 나눕니다.
+
+    같은 단계의 하위 쿼리는 최대 ``max_workers`` 개씩 동시에 조회합니다. 더 나눌 수 없는
+    쿼리는 결과가 많아도 그대로 샤드가 됩니다.
+
+    Args:
+        search: 검색 파라미터를 키워드 인자로 받아 한 페이지를 반환하는 함수
+            (예: ``api.auctions.get_items``)
+        query: 검색 파라미터. PageNo는 무시합니다.
+        max_results: 샤드 하나의 최대 결과 수
+        dimensions: 사용할 샤딩 기준
+        max_workers: 동시에 보낼 최대 요청 수
+
+    Returns:
+        List[Shard]: 결과가 있는 샤드 리스트
+
+    Raises:
+        ValueError: max_results나 max_workers가 1보다 작거나, 알 수 없는 기준이 있는 경우
+    """
+    _check(max_results, dimensions, max_workers)
+    shards: List[Shard] = []
+    frontier = [_start(query)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while frontier:
+            pages = list(executor.map(lambda q: search(**q, PageNo=1), frontier))
+            frontier = _plan_level(frontier, pages, max_results, dimensions, shards)
+    return shards
+
+
+def _overlap(previous: List[Any], items: List[Any]) -> int:
+    """앞 페이지의 끝과 이번 페이지의 앞이 같은 순서로 겹치는 항목 수를 반환합니다.
+
+    페이지를 넘기는 사이 앞쪽에 항목이 등록되면 앞 페이지의 마지막 항목들이 다음 페이지
+    앞에 다시 나옵니다. 경매장 아이템에는 고유 ID가 없으므로 가장 긴 겹침을 밀림으로 봅니다.
+    """
+    for size in range(min(len(previous), len(items)), 0, -1):
+        if previous[-size:] == items[:size]:
+            return size
+    return 0
+
+
+def iter_sharded_items(
+    search: Callable[..., Any],
+    query: Dict[str, Any],
+    max_results: int = DEFAULT_MAX_RESULTS,
+    dimensions: Sequence[str] = DEFAULT_DIMENSIONS,
+    max_workers: int = 4,
+    prefetch: int = 1,
+) -> Iterator[Any]:
+    """쿼리를 샤드로 나누어 동시에 조회하고, 항목을 하나의 스트림으로 반환합니다.
+
+    최대 ``max_workers`` 개의 샤드를 동시에 넘기며, 샤드들의 다음 페이지를 하나의 워커 풀로
+    돌아가며 요청해 최대 ``max_workers`` 개의 페이지 요청을 동시에 보냅니다 (샤드 하나는
+    ``prefetch`` 페이지까지). 다음 페이지를 요청해 둔 뒤 받은 페이지의 항목을 바로 반환하므로
+    샤드 전체를 메모리에 올리지 않고, 전체 결과의 정렬 순서는 보장하지 않습니다.
+
+    샤드끼리는 겹치지 않으므로 중복 제거는 같은 샤드의 이어지는 두 페이지 사이에서만
+    합니다. 페이지가 밀려 앞 페이지의 마지막 항목들이 다음 페이지 앞에 같은 순서로 다시
+    나오면 한 번만 반환합니다. 따라서 모든 필드가 같은 서로 다른 매물이 페이지 경계에 걸친
+    경우에만 함께 제거될 수 있습니다. 샤드 조회 중 오류가 발생하면 남은 조회를 취소하고
+    예외를 다시 발생시킵니다.
+
+    인자는 :func:`plan_shards` 와 같습니다.
+
+    Args:
+        prefetch: 샤드 하나에 동시에 미리 요청해 둘 최대 페이지 수
+
+    Returns:
+        Iterator: 항목 제너레이터
+
+    Raises:
+        ValueError: prefetch가 1보다 작거나 :func:`plan_shards` 의 인자가 잘못된 경우
+    """
+    _check(max_results, dimensions, max_workers, prefetch)
+    return _sharded_items(search, query, max_results, dimensions, max_workers, prefetch)
+
+
+class _ShardCursor:
+    """샤드 하나의 페이지 진행 상태. 동기/비동기 샤딩이 공유합니다."""
+
+    def __init__(self, shard: Shard):
+        self.shard = shard
+        self.last = _last_page(shard.first_page, 1, None, None)
+        self.next_page = 2
+        # 요청 순서대로 쌓인 다음 페이지 요청 (Future 또는 Task)
+        self.pending: "deque" = deque()
+        self.previous: List[Any] = []
+        self.finished = False
+
+    @property
+    def done(self) -> bool:
+        """더 받을 페이지가 없는지 여부."""
+        return not self.pending and (self.finished or self.next_page > self.last)
+
+    def take(self, page: Any) -> List[Any]:
+        """받은 페이지에서 앞 페이지와 겹치지 않는 항목을 반환합니다.
+
+        순회 도중 결과가 줄어 빈 페이지가 나오면 샤드를 끝냅니다.
+        """
+        items = page_fields(page)[2]
+        if not items:
+            self.finished = True
+        fresh = items[_overlap(self.previous, items) :]
+        self.previous = items
+        return fresh
+
+
+def _schedule(
+    active: List[_ShardCursor],
+    max_workers: int,
+    prefetch: int,
+    submit: Callable[[Shard, int], Any],
+) -> None:
+    """샤드들에 돌아가며 다음 페이지 요청을 최대 ``max_workers`` 개까지 제출합니다."""
+    inflight = sum(len(cursor.pending) for cursor in active)
+    progress = True
+    while progress and inflight < max_workers:
+        progress = False
+        for cursor in active:
+            if inflight >= max_workers:
+                break
+            if (
+                not cursor.finished
+                and cursor.next_page <= cursor.last
+                and len(cursor.pending) < prefetch
+            ):
+                cursor.pending.append(submit(cursor.shard, cursor.next_page))
+                cursor.next_page += 1
+                inflight += 1
+                progress = True
+
+
+def _activate(
+    shards: "deque", active: List[_ShardCursor], max_workers: int
+) -> List[List[Any]]:
+    """대기 중인 샤드를 ``max_workers`` 개까지 넘기기 시작하고 첫 페이지 항목을 반환합니다."""
+    ready = []
+    while shards and len(active) < max_workers:
+        cursor = _ShardCursor(shards.popleft())
+        ready.append(cursor.take(cursor.shard.first_page))
+        if not cursor.done:
+            active.append(cursor)
+    return ready
+
+
+def _discard(cursors: List[_ShardCursor]) -> None:
+    """샤드들의 남은 페이지 요청(Future 또는 Task)을 취소합니다."""
+    for cursor in cursors:
+        for future in cursor.pending:
+            if future.done() and not future.cancelled():
+                # 소비하지 않은 페이지의 예외로 경고가 나지 않게 합니다.
+                future.exception()
+            future.cancel()
+        cursor.pending.clear()
+
+
+def _retire(active: List[_ShardCursor]) -> List[_ShardCursor]:
+    """끝난 샤드를 빼고, 빈 페이지로 끝난 샤드의 남은 요청은 취소합니다."""
+    _discard([cursor for cursor in active if cursor.finished])
+    return [cursor for cursor in active if not cursor.done]
+
+
+def _sharded_items(search, query, max_results, dimensions, max_workers, prefetch):
+    shards = deque(plan_shards(search, query, max_results, dimensions, max_workers))
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit(shard, page_no):
+        return executor.submit(lambda: search(**shard.query, PageNo=page_no))
+
+    active: List[_ShardCursor] = []
+    try:
+        while shards or active:
+            ready = _activate(shards, active, max_workers)
+            _schedule(active, max_workers, prefetch, submit)
+            for items in ready:
+                yield from items
+            if not active:
+                continue
+            heads = {cursor.pending[0]: cursor for cursor in active if cursor.pending}
+            done, _ = wait(heads, return_when=FIRST_COMPLETED)
+            ready = []
+            for future in done:
+                cursor = heads[future]
+                cursor.pending.popleft()
+                ready.append(cursor.take(future.result()))
+            active = _retire(active)
+            # 받은 항목을 돌려주는 동안에도 요청이 진행되도록 먼저 제출합니다.
+            _schedule(active, max_workers, prefetch, submit)
+            for items in ready:
+                yield from items
+    finally:
+        _discard(active)
+        executor.shutdown(wait=True)
+
+
+async def aplan_shards(
+    search: Callable[..., Awaitable[Any]],
+    query: Dict[str, Any],
+    max_results: int = DEFAULT_MAX_RESULTS,
+    dimensions: Sequence[str] = DEFAULT_DIMENSIONS,
+    max_workers: int = 4,
+) -> List[Shard]:
+    """:func:`plan_shards` 의 asyncio 버전. ``search`` 는 코루틴 함수입니다."""
+    _check(max_results, dimensions, max_workers)
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def probe(q):
+        async with semaphore:
+            return await search(**q, PageNo=1)
+
+    shards: List[Shard] = []
+    frontier = [_start(query)]
+    while frontier:
+        pages = await asyncio.gather(*(probe(q) for q in frontier))
+        frontier = _plan_level(frontier, list(pages), max_results, dimensions, shards)
+    return shards
+
+
+def aiter_sharded_items(
+    search: Callable[..., Awaitable[Any]],
+    query: Dict[str, Any],
+    max_results: int = DEFAULT_MAX_RESULTS,
+    dimensions: Sequence[str] = DEFAULT_DIMENSIONS,
+    max_workers: int = 4,
+    prefetch: int = 1,
+) -> AsyncIterator[Any]:
+    """:func:`iter_sharded_items` 의 asyncio 버전."""
+    _check(max_results, dimensions, max_workers, prefetch)
+    return _asharded_items(
+        search, query, max_results, dimensions, max_workers, prefetch
+    )
+
+
+async def _asharded_items(
+    search, query, max_results, dimensions, max_workers, prefetch
+):
+    planned = await aplan_shards(search, query, max_results, dimensions, max_workers)
+    shards = deque(planned)
+
+    def submit(shard, page_no):
+        return asyncio.ensure_future(search(**shard.query, PageNo=page_no))
+
+    active: List[_ShardCursor] = []
+    try:
+        while shards or active:
+            ready = _activate(shards, active, max_workers)
+            _schedule(active, max_workers, prefetch, submit)
+            for items in ready:
+                for item in items:
+                    yield item
+            if not active:
+                continue
+            heads = {cursor.pending[0]: cursor for cursor in active if cursor.pending}
+            done, _ = await asyncio.wait(heads, return_when=asyncio.FIRST_COMPLETED)
+            ready = []
+            for task in done:
+                cursor = heads[task]
+                cursor.pending.popleft()
+                ready.append(cursor.take(task.result()))
+            active = _retire(active)
+            _schedule(active, max_workers, prefetch, submit)
+            for items in ready:
+                for item in items:
+                    yield item
+    finally:
+        _discard(active)
@@ -0,0 +1,128 @@
+"""동시에 들어온 동일 요청을 하나의 API 호출로 합치는 single-flight.
+
+같은 키로 진행 중인 호출이 있으면 새 호출자는 요청을 보내지 않고 그 결과를 기다렸다가
+함께 받습니다. 인기 캐릭터 조회처럼 같은 요청이 몰릴 때 지연 시간과 속도 제한 예산을
+모두 아낄 수 있습니다.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """진행 중인 호출 하나의 상태."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """스레드 간에 동일한 호출을 합치는 single-flight.
+
+    Attributes:
+        executions: 실제로 실행한 호출 수
+        coalesced: 진행 중인 호출에 합쳐진 호출 수
+    """
+
+    def __init__(self):
+        self.executions = 0
+        self.coalesced = 0
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """키에 대해 진행 중인 호출이 없으면 ``fn`` 을 실행하고, 있으면 그 결과를 기다립니다.
+
+        Args:
+            key: 호출을 식별하는 키
+            fn: 실행할 함수
+            *args: fn의 위치 인자
+            **kwargs: fn의 키워드 인자
+
+        Returns:
+            Any: fn의 반환값. 합쳐진 호출자들은 같은 객체를 받습니다.
+
+        Raises:
+            Exception: fn이 발생시킨 예외. 합쳐진 호출자에게도 같은 예외가 전달됩니다.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """하나의 이벤트 루프 안에서 동일한 코루틴 호출을 합치는 single-flight.
+
+    진행 중인 호출이 취소되면 기다리던 호출자 중 하나가 이어서 호출을 실행합니다.
+
+    Attributes:
+        executions: 실제로 실행한 호출 수
+        coalesced: 진행 중인 호출에 합쳐진 호출 수
+    """
+
+    def __init__(self):
+        self.executions = 0
+        self.coalesced = 0
+        self._calls: Dict[Hashable, "asyncio.Future"] = {}
+
+    async def do(
+        self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Any:
+        """:meth:`SingleFlight.do` 의 asyncio 버전. ``fn`` 은 코루틴 함수입니다."""
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 진행 중이던 호출이 취소된 경우에만 다시 시도합니다.
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.executions += 1
+        try:
+            result = await fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 기다리는 호출자가 없어도 "exception was never retrieved" 경고가 나지 않게 합니다.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
@@ -15,6 +15,15 @@ setup(
         "requests>=2.0.0",
     ],
     extras_require={
+        "async": [
+            "httpx>=0.23.0",
+        ],
+        "fast": [
+            "orjson>=3.0.0",
+        ],
+        "analytics": [
+            "numpy>=1.20.0",
+        ],
         "dev": [
             "pytest",
             "pytest-cov",
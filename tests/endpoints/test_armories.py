@@ -285,3 +285,277 @@ def test_get_total_info():
     )
     assert isinstance(total, ArmoryTotal)
     assert total.armory_profile.character_name == "Name"
+
+
+def test_get_total_info_many():
+    """get_total_info_many는 이름마다 get_total_info를 호출하고 오류를 결과에 담아야 합니다."""
+    from pyloa.exceptions import APIError
+
+    client = Mock(spec=LostArkAPI)
+    endpoint = ArmoriesEndpoint(client)
+
+    def fake_request(method, path, params=None):
+        if path == "/없음":
+            raise APIError("API error (404): not found")
+        return {"ArmoryProfile": {"CharacterName": path[1:]}}
+
+    endpoint._request = Mock(side_effect=fake_request)
+
+    results = endpoint.get_total_info_many(
+        ["a", "없음", "b"], filters=["profiles"], max_workers=2
+    )
+    by_name = {r.key: r for r in results}
+
+    assert by_name["a"].value.armory_profile.character_name == "a"
+    assert by_name["b"].ok
+    assert isinstance(by_name["없음"].error, APIError)
+    assert results.stats.succeeded == 2
+    assert results.stats.failed == 1
+    endpoint._request.assert_any_call("GET", "/a", params={"filters": "profiles"})
+
+
+def test_get_total_info_lazy():
+    """lazy=True면 섹션을 처음 접근할 때 변환하는 ArmoryTotal을 반환해야 합니다."""
+    client = Mock(spec=LostArkAPI)
+    endpoint = ArmoriesEndpoint(client)
+    endpoint._request = Mock(
+        return_value={"ArmoryProfile": {"CharacterName": "홍길동"}, "ArmoryGem": None}
+    )
+
+    total = endpoint.get_total_info("홍길동", lazy=True)
+
+    assert "armory_profile" in total._pending
+    assert total.armory_profile.character_name == "홍길동"
+    assert "armory_profile" not in total._pending
+
+
+def make_cached_endpoint(responses, cache=None):
+    """섹션 캐시를 가진 클라이언트와, 경로별 응답을 돌려주는 _request를 준비합니다."""
+    from pyloa.cache import ArmoryCache
+
+    client = Mock(spec=LostArkAPI)
+    client.armory_cache = ArmoryCache() if cache is None else cache
+    endpoint = ArmoriesEndpoint(client)
+    endpoint._request = Mock(side_effect=lambda method, path, **kw: responses[path])
+    return endpoint
+
+
+GEMS = {"Gems": [], "Effects": None}
+TOTAL = {
+    "ArmoryProfile": {"CharacterName": "홍길동"},
+    "ArmoryEquipment": [],
+    "ArmoryGem": GEMS,
+    "ArkGrid": None,
+}
+
+
+def test_section_getters_use_cached_total():
+    """종합 정보를 조회한 뒤의 섹션별 조회는 요청 없이 캐시에서 응답해야 합니다."""
+    endpoint = make_cached_endpoint({"/홍길동": TOTAL})
+
+    endpoint.get_total_info("홍길동")
+    gems = endpoint.get_gems("홍길동")
+    profile = endpoint.get_profile("홍길동")
+    grid = endpoint.get_ark_grid("홍길동")
+    total = endpoint.get_total_info("홍길동", filters=["gems", "profiles"])
+
+    endpoint._request.assert_called_once_with("GET", "/홍길동", params={})
+    assert gems.gems == []
+    assert profile.character_name == "홍길동"
+    assert grid is None
+    assert total.armory_gem.gems == []
+
+
+def test_total_info_fetches_only_missing_sections():
+    """필터를 준 종합 정보 조회는 캐시에 없거나 만료된 섹션만 요청해야 합니다."""
+    from unittest.mock import patch
+    from pyloa.cache import ArmoryCache
+
+    responses = {
+        "/홍길동/profiles": {"CharacterName": "홍길동"},
+        "/홍길동": {"ArmoryProfile": {"CharacterName": "새이름"}, "ArmoryGem": GEMS},
+    }
+    cache = ArmoryCache(ttl=60, ttls={"profiles": 10})
+    endpoint = make_cached_endpoint(responses, cache)
+
+    with patch("pyloa.cache.time.monotonic", return_value=100.0):
+        endpoint.get_profile("홍길동")
+        total = endpoint.get_total_info("홍길동", filters=["profiles", "gems"])
+    endpoint._request.assert_called_with("GET", "/홍길동", params={"filters": "gems"})
+    assert total.armory_profile.character_name == "홍길동"
+
+    with patch("pyloa.cache.time.monotonic", return_value=111.0):
+        total = endpoint.get_total_info("홍길동", filters=["profiles", "gems"])
+    endpoint._request.assert_called_with(
+        "GET", "/홍길동", params={"filters": "profiles"}
+    )
+    assert total.armory_profile.character_name == "새이름"
+
+    with patch("pyloa.cache.time.monotonic", return_value=112.0):
+        endpoint.get_total_info("홍길동")
+    endpoint._request.assert_called_with(
+        "GET",
+        "/홍길동",
+        params={
+            "filters": "equipment,avatars,combat-skills,engravings,cards,"
+            "colosseums,collectibles,arkpassive,arkgrid"
+        },
+    )
+
+
+def test_section_cache_skips_unknown_characters_and_filters():
+    """없는 캐릭터의 빈 응답은 저장하지 않고, 알 수 없는 필터는 캐시를 거치지 않아야 합니다."""
+    responses = {"/없음": None, "/없음/gems": None, "/홍길동": TOTAL}
+    endpoint = make_cached_endpoint(responses)
+
+    assert endpoint.get_total_info("없음") is None
+    assert endpoint.get_gems("없음") is None
+    assert endpoint.get_gems("없음") is None
+    assert endpoint._request.call_count == 3
+
+    endpoint.get_total_info("홍길동", filters=["profiles", "unknown"])
+    endpoint._request.assert_called_with(
+        "GET", "/홍길동", params={"filters": "profiles,unknown"}
+    )
+    assert len(endpoint.client.armory_cache) == 0
+
+
+def test_section_cache_is_bypassed_in_bytes_mode():
+    """응답 바이트를 반환하는 raw 모드에서는 섹션 캐시를 사용하지 않아야 합니다."""
+    endpoint = make_cached_endpoint({"/홍길동/gems": b"{}"})
+    endpoint.client.raw = "bytes"
+
+    assert endpoint.get_gems("홍길동") == b"{}"
+    assert endpoint.get_gems("홍길동") == b"{}"
+    assert endpoint._request.call_count == 2
+
+
+def test_fetch_issues_at_most_one_request():
+    """fetch는 섹션 수에 따라 섹션별 조회나 필터 조회를 한 번만 보내야 합니다."""
+    from pyloa.endpoints.armories import FetchStats
+
+    client = Mock(spec=LostArkAPI)
+    endpoint = ArmoriesEndpoint(client)
+    responses = {"/홍길동/gems": GEMS, "/홍길동": TOTAL}
+    endpoint._request = Mock(side_effect=lambda method, path, **kw: responses[path])
+    stats = FetchStats()
+
+    one = endpoint.fetch("홍길동", {"gems"}, stats=stats)
+    endpoint._request.assert_called_with("GET", "/홍길동/gems", params=None)
+    many = endpoint.fetch("홍길동", ["profiles", "gems", "profiles"], stats=stats)
+    endpoint._request.assert_called_with(
+        "GET", "/홍길동", params={"filters": "profiles,gems"}
+    )
+    endpoint.fetch("홍길동", stats=stats)
+    endpoint._request.assert_called_with("GET", "/홍길동", params={})
+
+    assert one.armory_gem.gems == [] and one.armory_profile is None
+    assert many.armory_profile.character_name == "홍길동"
+    assert (stats.sections, stats.requests, stats.saved) == (14, 3, 11)
+
+
+def test_fetch_uses_section_cache():
+    """캐시된 섹션은 요청하지 않고, 모두 캐시되어 있으면 요청하지 않아야 합니다."""
+    endpoint = make_cached_endpoint({"/홍길동/profiles": TOTAL["ArmoryProfile"]})
+
+    endpoint.client.armory_cache.set("홍길동", {"gems": GEMS, "cards": None})
+    total = endpoint.fetch("홍길동", {"gems", "cards", "profiles"})
+    again = endpoint.fetch("홍길동", {"gems", "profiles"}, lazy=True)
+
+    endpoint._request.assert_called_once_with("GET", "/홍길동/profiles", params=None)
+    assert total.armory_gem.gems == []
+    assert total.armory_profile.character_name == "홍길동"
+    assert again.armory_profile.character_name == "홍길동"
+    assert endpoint.get_profile("홍길동").character_name == "홍길동"
+    assert endpoint._request.call_count == 1
+
+
+def test_fetch_handles_missing_character_and_bytes_mode():
+    """없는 캐릭터는 None, bytes 모드는 필터 조회의 응답 바이트를 반환해야 합니다."""
+    endpoint = make_cached_endpoint({"/없음": None})
+    assert endpoint.fetch("없음", {"gems", "cards"}) is None
+    assert len(endpoint.client.armory_cache) == 0
+
+    endpoint = make_cached_endpoint({"/홍길동": b"{}"})
+    endpoint.client.raw = "bytes"
+    assert endpoint.fetch("홍길동", ["gems"]) == b"{}"
+    endpoint._request.assert_called_once_with(
+        "GET", "/홍길동", params={"filters": "gems"}
+    )
+
+
+@pytest.mark.parametrize("sections", [[], ["gems", "unknown"]])
+def test_fetch_rejects_invalid_sections(sections):
+    """알 수 없는 섹션이나 빈 섹션 목록은 ValueError를 발생시켜야 합니다."""
+    endpoint = ArmoriesEndpoint(Mock(spec=LostArkAPI))
+
+    with pytest.raises(ValueError):
+        endpoint.fetch("홍길동", sections)
+    with pytest.raises(ValueError):
+        endpoint.fetch_many(["홍길동"], sections)
+
+
+def test_fetch_many_reports_saved_requests():
+    """fetch_many의 통계는 섹션별 조회 대비 아낀 요청 수를 보고해야 합니다."""
+    endpoint = make_cached_endpoint({"/a": TOTAL, "/b": TOTAL, "/c": None})
+
+    results = endpoint.fetch_many(["a", "b", "c"], {"profiles", "gems", "equipment"})
+    values = {r.key: r.value for r in results}
+
+    assert values["a"].armory_profile.character_name == "홍길동"
+    assert values["c"] is None
+    assert results.stats.succeeded == 3
+    assert (results.stats.requests, results.stats.saved) == (3, 6)
+    assert "saved=6" in repr(results.stats)
+
+
+def test_unknown_character_is_negative_cached():
+    """null을 반환한 캐릭터는 없는 캐릭터 캐시에 기록되어 다시 요청하지 않아야 합니다."""
+    from pyloa.cache import NegativeCache
+
+    endpoint = make_cached_endpoint(
+        {"/없음": None, "/오타/profiles": None, "/홍길동/gems": None}
+    )
+    endpoint.client.negative_cache = NegativeCache()
+
+    assert endpoint.get_total_info("없음") is None
+    assert endpoint.get_total_info("없음") is None
+    assert endpoint.get_equipment("없음") == []
+    assert endpoint.fetch("없음", {"gems"}) is None
+    assert endpoint.get_profile("오타") is None
+    assert endpoint.fetch("오타", {"profiles", "gems"}) is None
+    assert endpoint.get_gems("홍길동") is None
+
+    assert endpoint._request.call_count == 3
+    assert "없음" in endpoint.client.negative_cache
+    assert "홍길동" not in endpoint.client.negative_cache
+
+
+def test_fetch_records_unknown_character():
+    """fetch의 null 응답도 없는 캐릭터로 기록하되, 빈 섹션 하나는 기록하지 않아야 합니다."""
+    from pyloa.endpoints.armories import FetchStats
+    from pyloa.cache import NegativeCache
+
+    endpoint = make_cached_endpoint({"/없음": None, "/홍길동/cards": None})
+    endpoint.client.negative_cache = NegativeCache()
+    stats = FetchStats()
+
+    endpoint.fetch("없음", ["gems", "cards"], stats=stats)
+    endpoint.fetch("없음", ["gems", "cards"], stats=stats)
+    endpoint.fetch("홍길동", ["cards"], stats=stats)
+
+    assert (stats.requests, stats.saved) == (2, 3)
+    assert "홍길동" not in endpoint.client.negative_cache
+
+
+def test_fetch_stats_record_plan():
+    """조회 계획을 누적해 아낀 요청 수를 계산해야 합니다."""
+    from pyloa.endpoints.armories import FetchStats
+
+    stats = FetchStats()
+
+    stats.record_plan(3, 1)
+    stats.record_plan(2, 0)
+
+    assert (stats.sections, stats.requests, stats.saved) == (5, 1, 4)
+    assert "saved=4" in repr(stats)
@@ -0,0 +1,477 @@
+"""비동기 엔드포인트 테스트."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+from pyloa.async_client import AsyncLostArkAPI
+from pyloa.endpoints.armories import FetchStats
+from pyloa.cache import ArmoryCache, NegativeCache, RosterIndex
+from pyloa.endpoints.news import AsyncNewsEndpoint
+from pyloa.endpoints.characters import AsyncCharactersEndpoint
+from pyloa.endpoints.game_contents import AsyncGameContentsEndpoint
+from pyloa.endpoints.markets import AsyncMarketsEndpoint
+from pyloa.endpoints.auctions import AsyncAuctionsEndpoint
+from pyloa.endpoints.armories import AsyncArmoriesEndpoint
+from pyloa.models.armory import ArmoryTotal, ArmoryProfile
+from pyloa.models.market import Market, TradeMarket, MarketItemStats
+from pyloa.models.auction import Auction
+
+
+def make_endpoint(cls, return_value):
+    endpoint = cls(Mock(spec=AsyncLostArkAPI))
+    endpoint._request = AsyncMock(return_value=return_value)
+    return endpoint
+
+
+def test_async_news_endpoint():
+    """AsyncNewsEndpoint는 동기 버전과 같은 경로와 모델을 사용해야 합니다."""
+    endpoint = make_endpoint(
+        AsyncNewsEndpoint,
+        [{"Title": "t", "Date": "d", "Link": "l", "Type": "공지"}],
+    )
+    assert endpoint.base_path == "/news"
+
+    notices = asyncio.run(endpoint.get_notices(searchText="점검", type="점검"))
+    endpoint._request.assert_awaited_once_with(
+        "GET", "/notices", params={"searchText": "점검", "type": "점검"}
+    )
+    assert notices[0].title == "t"
+
+    endpoint._request = AsyncMock(
+        return_value=[
+            {
+                "Title": "e",
+                "Thumbnail": "th",
+                "Link": "l",
+                "StartDate": "s",
+                "EndDate": "e",
+            }
+        ]
+    )
+    events = asyncio.run(endpoint.get_events())
+    endpoint._request.assert_awaited_once_with("GET", "/events")
+    assert events[0].thumbnail == "th"
+
+    endpoint._request = AsyncMock(return_value={"RequirePolling": True, "Alarms": []})
+    alarms = asyncio.run(endpoint.get_alarms())
+    endpoint._request.assert_awaited_once_with("GET", "/alarms")
+    assert alarms.require_polling is True
+
+
+def test_async_characters_endpoint():
+    """AsyncCharactersEndpoint.get_siblings는 CharacterInfo 리스트를 반환해야 합니다."""
+    endpoint = make_endpoint(
+        AsyncCharactersEndpoint,
+        [
+            {
+                "ServerName": "아만",
+                "CharacterName": "홍길동",
+                "CharacterLevel": 60,
+                "CharacterClassName": "버서커",
+                "ItemAvgLevel": "1620.00",
+            }
+        ],
+    )
+
+    siblings = asyncio.run(endpoint.get_siblings("홍길동"))
+
+    endpoint._request.assert_awaited_once_with("GET", "/홍길동/siblings")
+    assert endpoint.base_path == "/characters"
+    assert siblings[0].character_name == "홍길동"
+
+
+def test_async_game_contents_endpoint():
+    """AsyncGameContentsEndpoint.get_calendar는 캘린더 리스트를 반환해야 합니다."""
+    endpoint = make_endpoint(
+        AsyncGameContentsEndpoint,
+        [{"CategoryName": "c", "ContentsName": "n", "ContentsIcon": "i"}],
+    )
+
+    calendar = asyncio.run(endpoint.get_calendar())
+
+    endpoint._request.assert_awaited_once_with("GET", "/calendar")
+    assert endpoint.base_path == "/gamecontents"
+    assert calendar[0].contents_name == "n"
+
+
+def test_async_markets_endpoint():
+    """AsyncMarketsEndpoint는 모든 거래소 메서드를 제공해야 합니다."""
+    endpoint = make_endpoint(AsyncMarketsEndpoint, {"Categories": []})
+    assert endpoint.base_path == "/markets"
+
+    assert asyncio.run(endpoint.get_options()) == {"Categories": []}
+    endpoint._request.assert_awaited_once_with("GET", "/options")
+
+    endpoint._request = AsyncMock(return_value=[{"Name": "파괴강석", "Stats": []}])
+    items = asyncio.run(endpoint.get_item(123))
+    endpoint._request.assert_awaited_once_with("GET", "/items/123")
+    assert isinstance(items[0], MarketItemStats)
+
+    endpoint._request = AsyncMock(return_value=None)
+    assert asyncio.run(endpoint.get_item(123)) == []
+
+    history = Mock()
+    asyncio.run(endpoint.get_item(123, history=history))
+    history.record.assert_called_once_with(123, [])
+
+    endpoint._request = AsyncMock(return_value={"PageNo": 1, "Items": []})
+    market = asyncio.run(endpoint.search_items(ItemName="파괴강석"))
+    endpoint._request.assert_awaited_once_with(
+        "POST", "/items", json={"ItemName": "파괴강석"}
+    )
+    assert isinstance(market, Market)
+
+    endpoint._request = AsyncMock(return_value={"PageNo": 1, "Items": []})
+    trades = asyncio.run(endpoint.get_trades(ItemName="파괴강석"))
+    endpoint._request.assert_awaited_once_with(
+        "POST", "/trades", json={"ItemName": "파괴강석"}
+    )
+    assert isinstance(trades, TradeMarket)
+
+
+def test_async_auctions_endpoint():
+    """AsyncAuctionsEndpoint는 옵션 조회와 검색을 제공해야 합니다."""
+    endpoint = make_endpoint(AsyncAuctionsEndpoint, {"Categories": []})
+    assert endpoint.base_path == "/auctions"
+
+    assert asyncio.run(endpoint.get_options()) == {"Categories": []}
+
+    endpoint._request = AsyncMock(return_value={"PageNo": 1, "Items": []})
+    auction = asyncio.run(endpoint.get_items(ItemTier=3))
+    endpoint._request.assert_awaited_once_with("POST", "/items", json={"ItemTier": 3})
+    assert isinstance(auction, Auction)
+
+
+@pytest.mark.parametrize(
+    "method, path, payload, check",
+    [
+        ("get_profile", "/홍길동/profiles", {"CharacterName": "홍길동"},
+         lambda r: isinstance(r, ArmoryProfile)),
+        ("get_equipment", "/홍길동/equipment",
+         [{"Type": "무기", "Name": "n", "Icon": "i", "Grade": "g", "Tooltip": "{}"}],
+         lambda r: len(r) == 1),
+        ("get_avatars", "/홍길동/avatars", None, lambda r: r == []),
+        ("get_combat_skills", "/홍길동/combat-skills", [{"Name": "스킬"}],
+         lambda r: r[0].name == "스킬"),
+        ("get_engravings", "/홍길동/engravings", None, lambda r: r is None),
+        ("get_cards", "/홍길동/cards", {"Cards": []}, lambda r: r is not None),
+        ("get_gems", "/홍길동/gems", {"Gems": []}, lambda r: r is not None),
+        ("get_colosseums", "/홍길동/colosseums", {"Rank": 1},
+         lambda r: r.rank == 1),
+        ("get_collectibles", "/홍길동/collectibles", None, lambda r: r == []),
+        ("get_ark_passive", "/홍길동/arkpassive", {"IsArkPassive": True},
+         lambda r: r.is_ark_passive),
+        ("get_ark_grid", "/홍길동/arkgrid", {"Slots": []}, lambda r: r is not None),
+    ],
+)
+def test_async_armories_section_getters(method, path, payload, check):
+    """AsyncArmoriesEndpoint의 섹션별 메서드는 동기 버전과 같은 경로를 사용해야 합니다."""
+    endpoint = make_endpoint(AsyncArmoriesEndpoint, payload)
+
+    result = asyncio.run(getattr(endpoint, method)("홍길동"))
+
+    endpoint._request.assert_awaited_once_with("GET", path)
+    assert check(result)
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "get_avatars",
+        "get_combat_skills",
+        "get_engravings",
+        "get_cards",
+        "get_gems",
+        "get_colosseums",
+        "get_collectibles",
+        "get_ark_passive",
+        "get_ark_grid",
+    ],
+)
+def test_async_armories_empty_responses(method):
+    """비어 있는 응답은 None 또는 빈 리스트를 반환해야 합니다."""
+    endpoint = make_endpoint(AsyncArmoriesEndpoint, None)
+
+    assert not asyncio.run(getattr(endpoint, method)("홍길동"))
+
+
+def test_async_armories_total_info():
+    """get_total_info는 필터를 쉼표로 연결해 전달해야 합니다."""
+    endpoint = make_endpoint(
+        AsyncArmoriesEndpoint, {"ArmoryProfile": {"CharacterName": "홍길동"}}
+    )
+    assert endpoint.base_path == "/armories/characters"
+
+    total = asyncio.run(endpoint.get_total_info("홍길동", filters=["profiles", "gems"]))
+
+    endpoint._request.assert_awaited_once_with(
+        "GET", "/홍길동", params={"filters": "profiles,gems"}
+    )
+    assert isinstance(total, ArmoryTotal)
+    assert total.armory_profile.character_name == "홍길동"
+
+    endpoint._request = AsyncMock(return_value=None)
+    assert asyncio.run(endpoint.get_total_info("홍길동")) is None
+
+
+def test_async_armories_total_info_many():
+    """비동기 get_total_info_many는 async for로 결과를 돌려줘야 합니다."""
+    endpoint = make_endpoint(
+        AsyncArmoriesEndpoint, {"ArmoryProfile": {"CharacterName": "홍길동"}}
+    )
+
+    async def main():
+        results = endpoint.get_total_info_many(["a", "b"], max_workers=2)
+        return [r async for r in results]
+
+    results = asyncio.run(main())
+
+    assert sorted(r.key for r in results) == ["a", "b"]
+    assert all(isinstance(r.value, ArmoryTotal) for r in results)
+
+
+def test_async_armories_use_section_cache():
+    """비동기 섹션 조회도 캐시된 종합 정보로 응답하고, 없는 섹션만 요청해야 합니다."""
+    responses = {
+        "/홍길동/gems": {"Gems": []},
+        "/홍길동": {"ArmoryProfile": {"CharacterName": "홍길동"}},
+    }
+    endpoint = make_endpoint(AsyncArmoriesEndpoint, None)
+    endpoint.client.armory_cache = ArmoryCache()
+    endpoint.client.raw = False
+    endpoint._request = AsyncMock(
+        side_effect=lambda method, path, **kw: responses[path]
+    )
+
+    async def main():
+        await endpoint.get_gems("홍길동")
+        total = await endpoint.get_total_info("홍길동", filters=["gems", "profiles"])
+        profile = await endpoint.get_profile("홍길동")
+        return total, profile
+
+    total, profile = asyncio.run(main())
+
+    assert endpoint._request.await_count == 2
+    endpoint._request.assert_awaited_with(
+        "GET", "/홍길동", params={"filters": "profiles"}
+    )
+    assert total.armory_gem.gems == []
+    assert profile.character_name == "홍길동"
+
+
+def test_async_fetch_plans_minimal_requests():
+    """비동기 fetch도 캐시에 없는 섹션만 한 번의 요청으로 받고 절약량을 기록해야 합니다."""
+    responses = {
+        "/홍길동/profiles": {"CharacterName": "홍길동"},
+        "/홍길동": {"ArmoryGem": {"Gems": []}, "ArmoryCard": None},
+    }
+    endpoint = make_endpoint(AsyncArmoriesEndpoint, None)
+    endpoint.client.armory_cache = ArmoryCache()
+    endpoint.client.raw = False
+    endpoint._request = AsyncMock(
+        side_effect=lambda method, path, **kw: responses[path]
+    )
+
+    async def main():
+        first = await endpoint.fetch("홍길동", ["profiles"])
+        results = endpoint.fetch_many(["홍길동"], ["profiles", "gems", "cards"])
+        return first, [r async for r in results], results.stats
+
+    first, results, stats = asyncio.run(main())
+
+    assert first.armory_profile.character_name == "홍길동"
+    endpoint._request.assert_awaited_with(
+        "GET", "/홍길동", params={"filters": "gems,cards"}
+    )
+    assert results[0].value.armory_gem.gems == []
+    assert (stats.requests, stats.saved) == (1, 2)
+
+
+def test_async_endpoints_skip_unknown_characters():
+    """비동기 엔드포인트도 null을 반환한 이름을 다시 요청하지 않아야 합니다."""
+    armories = make_endpoint(AsyncArmoriesEndpoint, None)
+    characters = make_endpoint(AsyncCharactersEndpoint, None)
+    negative = NegativeCache()
+    for endpoint in (armories, characters):
+        endpoint.client.negative_cache = negative
+        endpoint.client.raw = False
+
+    async def main():
+        return (
+            await armories.get_total_info("없음"),
+            await armories.get_total_info("없음"),
+            await armories.get_profile("없음"),
+            await armories.fetch("없음", ["gems", "cards"], stats=FetchStats()),
+            await characters.get_siblings("없음"),
+            await armories.get_profile("오타"),
+            await armories.fetch("누구", ["profiles"]),
+        )
+
+    results = asyncio.run(main())
+
+    assert results[:6] == (None, None, None, None, [], None)
+    assert results[6].armory_profile is None
+    armories._request.assert_awaited_with("GET", "/누구/profiles", params=None)
+    assert armories._request.await_count == 3
+    characters._request.assert_not_awaited()
+    assert "오타" in negative and "누구" in negative
+
+
+def test_async_get_siblings_uses_roster_index():
+    """비동기 get_siblings도 원정대 캐시로 다른 캐릭터를 요청 없이 조회해야 합니다."""
+    endpoint = make_endpoint(
+        AsyncCharactersEndpoint,
+        [
+            {
+                "ServerName": "아만",
+                "CharacterName": name,
+                "CharacterLevel": 60,
+                "CharacterClassName": "버서커",
+                "ItemAvgLevel": "1620.00",
+            }
+            for name in ("홍길동", "김철수")
+        ],
+    )
+    endpoint.client.roster_index = RosterIndex()
+    endpoint.client.raw = False
+
+    async def main():
+        await endpoint.get_siblings("홍길동")
+        return await endpoint.get_siblings("김철수")
+
+    siblings = asyncio.run(main())
+
+    endpoint._request.assert_awaited_once_with("GET", "/홍길동/siblings")
+    assert [c.character_name for c in siblings] == ["홍길동", "김철수"]
+
+
+def test_async_characters_crawl():
+    """비동기 crawl은 원정대를 조회하고 주어진 fetch로 캐릭터를 조회해야 합니다."""
+    endpoint = make_endpoint(
+        AsyncCharactersEndpoint,
+        [
+            {
+                "ServerName": "아만",
+                "CharacterName": "홍길동",
+                "CharacterLevel": 60,
+                "CharacterClassName": "버서커",
+                "ItemAvgLevel": "1620.00",
+            }
+        ],
+    )
+
+    async def fetch(name):
+        return f"armory:{name}"
+
+    async def main():
+        return [(r.key, r.value) async for r in endpoint.crawl(["홍길동"], fetch=fetch)]
+
+    assert asyncio.run(main()) == [("홍길동", "armory:홍길동")]
+
+
+def test_async_markets_iter_items():
+    """AsyncMarketsEndpoint.iter_items는 모든 페이지의 아이템을 순서대로 반환해야 합니다."""
+
+    async def request(method, path, json):
+        return {
+            "PageNo": json["PageNo"],
+            "PageSize": 1,
+            "TotalCount": 2,
+            "Items": [
+                {"Id": json["PageNo"], "Name": "", "Grade": "", "Icon": "", "BundleCount": 1}
+            ],
+        }
+
+    endpoint = make_endpoint(AsyncMarketsEndpoint, None)
+    endpoint._request = AsyncMock(side_effect=request)
+
+    async def main():
+        return [item.id async for item in endpoint.iter_items(ItemName="a")]
+
+    assert asyncio.run(main()) == [1, 2]
+
+
+def test_async_markets_iter_items_in_bytes_mode():
+    """bytes 모드의 비동기 iter_items도 페이지를 디코딩해 JSON 항목을 반환해야 합니다."""
+    import json as jsonlib
+
+    async def request(method, path, json):
+        page = {"PageSize": 1, "TotalCount": 2, "Items": [{"Id": json["PageNo"]}]}
+        return jsonlib.dumps(page).encode()
+
+    endpoint = make_endpoint(AsyncMarketsEndpoint, None)
+    endpoint.client.raw = "bytes"
+    endpoint._request = AsyncMock(side_effect=request)
+
+    async def main():
+        return [item async for item in endpoint.iter_items()]
+
+    assert asyncio.run(main()) == [{"Id": 1}, {"Id": 2}]
+
+
+def test_async_auctions_iter_items():
+    """AsyncAuctionsEndpoint.iter_items는 max_items만큼 아이템을 반환해야 합니다."""
+
+    async def request(method, path, json):
+        return {
+            "PageNo": json["PageNo"],
+            "PageSize": 1,
+            "TotalCount": 5,
+            "Items": [{"Name": str(json["PageNo"]), "Grade": "", "Tier": 4, "Icon": ""}],
+        }
+
+    endpoint = make_endpoint(AsyncAuctionsEndpoint, None)
+    endpoint._request = AsyncMock(side_effect=request)
+
+    async def main():
+        return [i.name async for i in endpoint.iter_items(ItemTier=4, max_items=3)]
+
+    assert asyncio.run(main()) == ["1", "2", "3"]
+    assert endpoint._request.await_count == 3
+
+
+def test_async_auctions_iter_items_in_bytes_mode():
+    """bytes 모드의 비동기 경매장 순회도 페이지를 디코딩해 JSON 항목을 반환해야 합니다."""
+    import json as jsonlib
+
+    async def request(method, path, json):
+        tier = json.get("ItemTier")
+        page = {
+            "PageSize": 10,
+            "TotalCount": 1 if tier else 100,
+            "Items": [{"Name": str(tier), "Tier": tier or 0}],
+        }
+        return jsonlib.dumps(page).encode()
+
+    endpoint = make_endpoint(AsyncAuctionsEndpoint, None)
+    endpoint.client.raw = "bytes"
+    endpoint._request = AsyncMock(side_effect=request)
+
+    async def main():
+        pages = [i async for i in endpoint.iter_items(ItemTier=2)]
+        sharded = endpoint.iter_items_sharded(max_results=10, dimensions=["ItemTier"])
+        return pages, sorted([item["Name"] async for item in sharded])
+
+    assert asyncio.run(main()) == ([{"Name": "2", "Tier": 2}], ["1", "2", "3", "4"])
+
+
+def test_async_auctions_iter_items_sharded():
+    """AsyncAuctionsEndpoint.iter_items_sharded는 나눈 쿼리의 아이템을 모두 반환해야 합니다."""
+
+    async def request(method, path, json):
+        tier = json.get("ItemTier")
+        return {
+            "PageNo": json["PageNo"],
+            "PageSize": 10,
+            "TotalCount": 1 if tier else 100,
+            "Items": [{"Name": str(tier), "Grade": "", "Tier": tier or 0, "Icon": ""}],
+        }
+
+    endpoint = make_endpoint(AsyncAuctionsEndpoint, None)
+    endpoint._request = AsyncMock(side_effect=request)
+
+    async def main():
+        sharded = endpoint.iter_items_sharded(max_results=10, dimensions=["ItemTier"])
+        return sorted([item.name async for item in sharded])
+
+    assert asyncio.run(main()) == ["1", "2", "3", "4"]
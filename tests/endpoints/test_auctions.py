@@ -67,3 +67,95 @@ def test_get_items():
 
     assert len(result.items) == 1
     assert isinstance(result.items[0], AuctionItem)
+
+
+def auction_page(page_no, total_count=25, page_size=10):
+    start = (page_no - 1) * page_size
+    count = max(0, min(page_size, total_count - start))
+    return {
+        "PageNo": page_no,
+        "PageSize": page_size,
+        "TotalCount": total_count,
+        "Items": [
+            {"Name": f"아이템{start + i}", "Grade": "고대", "Tier": 4, "Icon": ""}
+            for i in range(count)
+        ],
+    }
+
+
+def test_iter_items_streams_all_pages():
+    """iter_items는 모든 페이지의 경매장 아이템을 순서대로 반환해야 합니다."""
+    endpoint = AuctionsEndpoint(Mock(spec=LostArkAPI))
+    endpoint._request = Mock(
+        side_effect=lambda method, path, json: auction_page(json["PageNo"])
+    )
+
+    names = [item.name for item in endpoint.iter_items(ItemTier=4, prefetch=2)]
+
+    assert names == [f"아이템{i}" for i in range(25)]
+    assert endpoint._request.call_count == 3
+
+
+def test_iter_items_caps_items_and_pages():
+    """max_items와 max_pages로 조회량을 제한할 수 있어야 합니다."""
+    endpoint = AuctionsEndpoint(Mock(spec=LostArkAPI))
+    endpoint._request = Mock(
+        side_effect=lambda method, path, json: auction_page(json["PageNo"], 1000)
+    )
+
+    items = list(endpoint.iter_items(ItemTier=4, max_items=12))
+    assert len(items) == 12
+    assert endpoint._request.call_count == 2
+
+    endpoint._request.reset_mock()
+    items = list(endpoint.iter_items(ItemTier=4, max_pages=3))
+    assert len(items) == 30
+    assert endpoint._request.call_count == 3
+
+
+def test_iter_items_sharded_splits_broad_query():
+    """iter_items_sharded는 결과가 많은 쿼리를 나누어 모든 아이템을 반환해야 합니다."""
+    endpoint = AuctionsEndpoint(Mock(spec=LostArkAPI))
+
+    def request(method, path, json):
+        # 티어를 지정하지 않으면 결과가 많고, 티어별로는 한 페이지에 들어갑니다.
+        if not json.get("ItemTier"):
+            return auction_page(json["PageNo"], total_count=40)
+        page = auction_page(json["PageNo"], total_count=5)
+        for item in page["Items"]:
+            item["Name"] += f"-{json['ItemTier']}"
+        return page
+
+    endpoint._request = Mock(side_effect=request)
+
+    items = list(endpoint.iter_items_sharded(max_results=10, CategoryCode=210000))
+
+    assert len(items) == 20
+    assert {item.name.split("-")[1] for item in items} == {"1", "2", "3", "4"}
+
+
+def test_iter_items_decode_pages_in_bytes_mode():
+    """bytes 모드에서도 일반/샤딩 순회가 페이지를 디코딩해 JSON 항목을 반환해야 합니다."""
+    import json as jsonlib
+
+    client = Mock(spec=LostArkAPI)
+    client.raw = "bytes"
+    client.json_decoder = jsonlib.loads
+    endpoint = AuctionsEndpoint(client)
+
+    def request(method, path, json):
+        tier = json.get("ItemTier")
+        page = auction_page(json["PageNo"], total_count=5 if tier else 40)
+        for item in page["Items"]:
+            item["Tier"] = tier or 4
+        return jsonlib.dumps(page).encode()
+
+    endpoint._request = Mock(side_effect=request)
+
+    items = list(endpoint.iter_items(max_items=12))
+    assert items[0] == {"Name": "아이템0", "Grade": "고대", "Tier": 4, "Icon": ""}
+    assert len(items) == 12
+
+    sharded = endpoint.iter_items_sharded(max_results=10, dimensions=["ItemTier"])
+    assert sorted(item["Tier"] for item in sharded) == sorted([1, 2, 3, 4] * 5)
+    assert isinstance(endpoint.get_items(ItemTier=1, PageNo=1), bytes)
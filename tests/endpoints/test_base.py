@@ -1,10 +1,13 @@
 """BaseEndpoint 테스트."""
 
+import asyncio
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 from requests import Response, HTTPError
 from pyloa.client import LostArkAPI
-from pyloa.endpoints.base import BaseEndpoint
+from pyloa.async_client import AsyncLostArkAPI
+from pyloa.endpoints.base import BaseEndpoint, AsyncBaseEndpoint
+from pyloa.rate_limiter import RateLimiter
 from pyloa.exceptions import APIError, RateLimitError, AuthenticationError
 
 
@@ -102,3 +105,592 @@ def test_request_raises_api_error_on_4xx_5xx():
 
     with pytest.raises(APIError):
         endpoint._request("GET", "/path")
+
+
+def test_request_uses_rate_limiter():
+    """_request는 요청 전 슬롯을 예약하고 응답 헤더로 제한기를 갱신해야 합니다."""
+    client = Mock(spec=LostArkAPI)
+    client.base_url = "https://test.com"
+    client.session = Mock()
+    client.rate_limiter = Mock()
+
+    mock_response = Mock(spec=Response)
+    mock_response.status_code = 200
+    mock_response.headers = {"X-RateLimit-Remaining": "99"}
+    mock_response.json.return_value = {}
+    client.session.request.return_value = mock_response
+
+    endpoint = ConcreteEndpoint(client)
+    endpoint._request("GET", "/path")
+
+    client.rate_limiter.acquire.assert_called_once_with()
+    client.rate_limiter.update.assert_called_once_with(
+        {"X-RateLimit-Remaining": "99"}, 200
+    )
+
+
+class ConcreteAsyncEndpoint(AsyncBaseEndpoint):
+    """테스트를 위한 구체적인 비동기 엔드포인트."""
+
+    def __init__(self, client):
+        super().__init__(client)
+        self.base_path = "/test"
+
+
+def make_async_client(status_code, json_data=None, text=""):
+    client = Mock(spec=AsyncLostArkAPI)
+    client.base_url = "https://test.com"
+    client.session = Mock()
+    client.rate_limiter = RateLimiter()
+
+    response = Mock()
+    response.status_code = status_code
+    response.headers = {"X-RateLimit-Remaining": "10"}
+    response.text = text
+    response.json.return_value = json_data
+    client.session.request = AsyncMock(return_value=response)
+    return client
+
+
+def test_async_request_makes_http_call():
+    """비동기 _request는 올바른 URL로 요청하고 JSON을 반환해야 합니다."""
+    client = make_async_client(200, {"data": "test"})
+    endpoint = ConcreteAsyncEndpoint(client)
+
+    result = asyncio.run(endpoint._request("GET", "/path", params={"q": "v"}))
+
+    client.session.request.assert_awaited_once_with(
+        "GET", "https://test.com/test/path", params={"q": "v"}
+    )
+    assert result == {"data": "test"}
+    assert client.rate_limiter.remaining == 10
+
+
+@pytest.mark.parametrize(
+    "status_code, exc",
+    [(401, AuthenticationError), (429, RateLimitError), (500, APIError)],
+)
+def test_async_request_raises_errors(status_code, exc):
+    """비동기 _request는 동기 버전과 같은 예외를 발생시켜야 합니다."""
+    client = make_async_client(status_code, text="error")
+    endpoint = ConcreteAsyncEndpoint(client)
+
+    with pytest.raises(exc):
+        asyncio.run(endpoint._request("GET", "/path"))
+
+
+def test_request_routes_through_key_pool():
+    """키 풀이 있으면 고른 키의 인증 헤더로 요청하고 해당 키를 갱신해야 합니다."""
+    from pyloa.rate_limiter import KeyPool
+
+    client = Mock(spec=LostArkAPI)
+    client.base_url = "https://test.com"
+    client.session = Mock()
+    client.rate_limiter = None
+    client.key_pool = KeyPool(["key1", "key2"])
+    client.key_pool.update("key1", {"X-RateLimit-Remaining": "3"})
+
+    mock_response = Mock(spec=Response)
+    mock_response.status_code = 200
+    mock_response.headers = {"X-RateLimit-Remaining": "1"}
+    mock_response.json.return_value = {}
+    client.session.request.return_value = mock_response
+
+    endpoint = ConcreteEndpoint(client)
+    endpoint._request("GET", "/path", headers={"x-test": "1"})
+
+    client.session.request.assert_called_once_with(
+        "GET",
+        "https://test.com/test/path",
+        headers={"x-test": "1", "authorization": "bearer key2"},
+    )
+    assert client.key_pool.limiter("key2").remaining == 1
+
+
+def test_async_request_routes_through_key_pool():
+    """비동기 _request도 키 풀을 사용해야 합니다."""
+    from pyloa.rate_limiter import KeyPool
+
+    client = make_async_client(200, {"ok": True})
+    client.rate_limiter = None
+    client.key_pool = KeyPool(["key1"])
+    endpoint = ConcreteAsyncEndpoint(client)
+
+    asyncio.run(endpoint._request("GET", "/path"))
+
+    client.session.request.assert_awaited_once_with(
+        "GET", "https://test.com/test/path", headers={"authorization": "bearer key1"}
+    )
+    assert client.key_pool.limiter("key1").remaining == 10
+
+
+def make_response(status_code, headers=None, json_data=None):
+    response = Mock(spec=Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.text = "body"
+    response.json.return_value = json_data
+    if status_code >= 400:
+        response.raise_for_status.side_effect = HTTPError()
+    return response
+
+
+def make_retry_client(*responses, policy=None):
+    from pyloa.retry import RetryPolicy
+
+    client = Mock(spec=LostArkAPI)
+    client.base_url = "https://test.com"
+    client.session = Mock()
+    client.retry_policy = policy or RetryPolicy(jitter=False, backoff_factor=0.1)
+    client.session.request.side_effect = list(responses)
+    return client
+
+
+def test_request_retries_transient_errors():
+    """_request는 5xx 응답을 재시도하고 성공 응답을 반환해야 합니다."""
+    client = make_retry_client(
+        make_response(503), make_response(200, json_data={"ok": True})
+    )
+    endpoint = ConcreteEndpoint(client)
+
+    with patch("pyloa.endpoints.base.time.sleep") as sleep:
+        result = endpoint._request("GET", "/path")
+
+    assert result == {"ok": True}
+    sleep.assert_called_once_with(0.1)
+    stats = client.retry_policy.stats
+    assert (stats.requests, stats.attempts, stats.retries) == (1, 2, 1)
+    assert stats.snapshot()[0].status_code == 503
+
+
+def test_request_honors_retry_after_on_429():
+    """_request는 429의 Retry-After만큼 기다린 뒤 재시도해야 합니다."""
+    client = make_retry_client(
+        make_response(429, headers={"Retry-After": "2"}),
+        make_response(200, json_data=[]),
+    )
+    endpoint = ConcreteEndpoint(client)
+
+    with patch("pyloa.endpoints.base.time.sleep") as sleep:
+        endpoint._request("GET", "/path")
+
+    sleep.assert_called_once_with(2.0)
+
+
+def test_request_raises_after_exhausting_attempts():
+    """모든 시도가 실패하면 마지막 오류를 예외로 발생시켜야 합니다."""
+    client = make_retry_client(make_response(500), make_response(500), make_response(500))
+    endpoint = ConcreteEndpoint(client)
+
+    with patch("pyloa.endpoints.base.time.sleep"):
+        with pytest.raises(APIError):
+            endpoint._request("GET", "/path")
+
+    assert client.session.request.call_count == 3
+    assert client.retry_policy.stats.giveups == 1
+
+
+def test_request_does_not_retry_non_idempotent_post():
+    """멱등으로 표시되지 않은 POST는 재시도하지 않아야 합니다."""
+    client = make_retry_client(make_response(503))
+    endpoint = ConcreteEndpoint(client)
+
+    with pytest.raises(APIError):
+        endpoint._request("POST", "/path", json={})
+
+    assert client.session.request.call_count == 1
+
+
+def test_request_retries_idempotent_post_paths():
+    """idempotent_paths에 속한 POST 검색 요청은 재시도해야 합니다."""
+    from pyloa.endpoints.markets import MarketsEndpoint
+
+    client = make_retry_client(
+        make_response(502), make_response(200, json_data={"Items": []})
+    )
+    endpoint = MarketsEndpoint(client)
+
+    with patch("pyloa.endpoints.base.time.sleep"):
+        result = endpoint._request("POST", "/items", json={"PageNo": 1})
+
+    assert result == {"Items": []}
+    assert client.session.request.call_count == 2
+
+
+def test_request_retries_connection_errors():
+    """연결 오류는 재시도하고, 재시도할 수 없으면 그대로 발생시켜야 합니다."""
+    from requests.exceptions import ConnectionError as RequestsConnectionError
+
+    client = make_retry_client(
+        RequestsConnectionError("reset"), make_response(200, json_data={})
+    )
+    endpoint = ConcreteEndpoint(client)
+
+    with patch("pyloa.endpoints.base.time.sleep"):
+        assert endpoint._request("GET", "/path") == {}
+    assert client.retry_policy.stats.snapshot()[0].error is not None
+
+    client = make_retry_client(RequestsConnectionError("reset"))
+    endpoint = ConcreteEndpoint(client)
+    with pytest.raises(RequestsConnectionError):
+        endpoint._request("POST", "/path")
+
+
+def test_async_request_retries_transient_errors():
+    """비동기 _request도 5xx 응답과 전송 오류를 재시도해야 합니다."""
+    import httpx
+    from pyloa.retry import RetryPolicy
+
+    client = make_async_client(200, {"ok": True})
+    ok_response = client.session.request.return_value
+    error_response = Mock()
+    error_response.status_code = 503
+    error_response.headers = {}
+    client.session.request = AsyncMock(
+        side_effect=[httpx.ConnectError("boom"), error_response, ok_response]
+    )
+    client.retry_policy = RetryPolicy(jitter=False, backoff_factor=0.1)
+    endpoint = ConcreteAsyncEndpoint(client)
+
+    with patch("pyloa.endpoints.base.asyncio.sleep", new=AsyncMock()) as sleep:
+        result = asyncio.run(endpoint._request("GET", "/path"))
+
+    assert result == {"ok": True}
+    assert sleep.await_count == 2
+    assert client.retry_policy.stats.retries == 2
+
+
+def test_async_request_raises_unretryable_transport_error():
+    """재시도할 수 없는 전송 오류는 그대로 발생시켜야 합니다."""
+    import httpx
+
+    client = make_async_client(200)
+    client.session.request = AsyncMock(side_effect=httpx.ConnectError("boom"))
+    endpoint = ConcreteAsyncEndpoint(client)
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(endpoint._request("GET", "/path"))
+
+
+def make_cached_client(*responses, cache=None):
+    from pyloa.cache import MemoryCache
+
+    client = Mock(spec=LostArkAPI)
+    client.base_url = "https://test.com"
+    client.session = Mock()
+    client.cache = cache if cache is not None else MemoryCache()
+    client.session.request.side_effect = list(responses)
+    return client
+
+
+def test_request_serves_repeated_calls_from_cache():
+    """같은 요청은 캐시에서 응답하고 HTTP 요청을 다시 보내지 않아야 합니다."""
+    client = make_cached_client(make_response(200, json_data={"v": 1}))
+    endpoint = ConcreteEndpoint(client)
+
+    assert endpoint._request("GET", "/path", params={"q": 1}) == {"v": 1}
+    assert endpoint._request("GET", "/path", params={"q": 1}) == {"v": 1}
+
+    assert client.session.request.call_count == 1
+    assert client.cache.stats.hits == 1
+
+
+def test_request_does_not_cache_non_idempotent_post():
+    """멱등이 아닌 POST는 캐시하지 않아야 합니다."""
+    client = make_cached_client(
+        make_response(200, json_data=1), make_response(200, json_data=2)
+    )
+    endpoint = ConcreteEndpoint(client)
+
+    assert endpoint._request("POST", "/path", json={}) == 1
+    assert endpoint._request("POST", "/path", json={}) == 2
+
+
+def test_request_caches_idempotent_post_by_body():
+    """검색 POST는 JSON 본문별로 캐시해야 합니다."""
+    from pyloa.endpoints.markets import MarketsEndpoint
+
+    client = make_cached_client(
+        make_response(200, json_data={"PageNo": 1}),
+        make_response(200, json_data={"PageNo": 2}),
+    )
+    endpoint = MarketsEndpoint(client)
+
+    assert endpoint._request("POST", "/items", json={"PageNo": 1}) == {"PageNo": 1}
+    assert endpoint._request("POST", "/items", json={"PageNo": 2}) == {"PageNo": 2}
+    assert endpoint._request("POST", "/items", json={"PageNo": 1}) == {"PageNo": 1}
+    assert client.session.request.call_count == 2
+
+
+def test_request_skips_cache_when_ttl_is_zero():
+    """TTL이 0인 경로는 캐시하지 않아야 합니다."""
+    from pyloa.cache import MemoryCache
+
+    client = make_cached_client(
+        make_response(200, json_data=1),
+        make_response(200, json_data=2),
+        cache=MemoryCache(default_ttl=0),
+    )
+    endpoint = ConcreteEndpoint(client)
+
+    assert endpoint._request("GET", "/path") == 1
+    assert endpoint._request("GET", "/path") == 2
+
+
+def test_async_request_uses_cache():
+    """비동기 _request도 캐시를 사용해야 합니다."""
+    from pyloa.cache import MemoryCache
+
+    client = make_async_client(200, {"v": 1})
+    client.cache = MemoryCache()
+    endpoint = ConcreteAsyncEndpoint(client)
+
+    asyncio.run(endpoint._request("GET", "/path"))
+    assert asyncio.run(endpoint._request("GET", "/path")) == {"v": 1}
+
+    client.session.request.assert_awaited_once()
+
+
+def test_request_coalesces_concurrent_identical_calls():
+    """동시에 들어온 같은 GET 요청은 HTTP 요청 하나로 합쳐져야 합니다."""
+    import threading
+    from pyloa.singleflight import SingleFlight
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_request(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return make_response(200, json_data={"v": 1})
+
+    client = Mock(spec=LostArkAPI)
+    client.base_url = "https://test.com"
+    client.session = Mock()
+    client.session.request.side_effect = slow_request
+    client.single_flight = SingleFlight()
+    endpoint = ConcreteEndpoint(client)
+
+    results = []
+
+    def call():
+        results.append(endpoint._request("GET", "/path", params={"q": 1}))
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    threads[0].start()
+    started.wait(5)
+    for t in threads[1:]:
+        t.start()
+    while client.single_flight.coalesced < 2:
+        pass
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert results == [{"v": 1}] * 3
+    assert client.session.request.call_count == 1
+
+
+def test_request_does_not_coalesce_non_idempotent_post():
+    """멱등이 아닌 POST는 single-flight를 거치지 않아야 합니다."""
+    from pyloa.singleflight import SingleFlight
+
+    client = make_cached_client(make_response(200, json_data=1))
+    client.cache = None
+    client.single_flight = SingleFlight()
+    endpoint = ConcreteEndpoint(client)
+
+    assert endpoint._request("POST", "/path", json={}) == 1
+    assert client.single_flight.executions == 0
+
+
+def test_async_request_coalesces_concurrent_identical_calls():
+    """비동기 _request도 동시에 들어온 같은 요청을 합쳐야 합니다."""
+    from pyloa.singleflight import AsyncSingleFlight
+
+    client = make_async_client(200, {"v": 1})
+    client.single_flight = AsyncSingleFlight()
+    response = client.session.request.return_value
+
+    async def slow_request(*args, **kwargs):
+        await asyncio.sleep(0)
+        return response
+
+    client.session.request.side_effect = slow_request
+    endpoint = ConcreteAsyncEndpoint(client)
+
+    async def main():
+        return await asyncio.gather(
+            *(endpoint._request("GET", "/path") for _ in range(3))
+        )
+
+    assert asyncio.run(main()) == [{"v": 1}] * 3
+    client.session.request.assert_awaited_once()
+
+
+def make_conditional_client(*responses):
+    from pyloa.conditional import ConditionalCache
+
+    client = Mock(spec=LostArkAPI)
+    client.base_url = "https://test.com"
+    client.session = Mock()
+    client.conditional = ConditionalCache()
+    client.session.request.side_effect = list(responses)
+    return client
+
+
+def test_request_sends_validators_and_reuses_304_body():
+    """저장된 ETag로 조건부 요청을 보내고 304에는 이전 JSON을 반환해야 합니다."""
+    client = make_conditional_client(
+        make_response(200, headers={"ETag": '"v1"'}, json_data={"v": 1}),
+        make_response(304, headers={"ETag": '"v1"'}),
+    )
+    endpoint = ConcreteEndpoint(client)
+
+    first = endpoint._request("GET", "/path", params={"q": 1})
+    second = endpoint._request("GET", "/path", params={"q": 1})
+
+    assert second is first
+    first_call, second_call = client.session.request.call_args_list
+    assert "headers" not in first_call[1]
+    assert second_call[1]["headers"] == {"If-None-Match": '"v1"'}
+    assert client.conditional.stats.not_modified == 1
+
+
+def test_request_raises_on_unexpected_304():
+    """저장된 응답이 없는데 304를 받으면 APIError를 발생시켜야 합니다."""
+    client = make_conditional_client(make_response(304))
+    endpoint = ConcreteEndpoint(client)
+
+    with pytest.raises(APIError):
+        endpoint._request("GET", "/path")
+
+
+def test_request_skips_validators_for_post():
+    """POST 요청에는 조건부 헤더를 붙이지 않아야 합니다."""
+    client = make_conditional_client(
+        make_response(200, headers={"ETag": '"v1"'}, json_data=1)
+    )
+    endpoint = ConcreteEndpoint(client)
+
+    endpoint._request("POST", "/path", json={})
+
+    assert len(client.conditional) == 0
+
+
+def test_model_helpers_reuse_models_on_304():
+    """304로 재사용한 JSON은 모델 변환도 건너뛰어야 합니다."""
+    from pyloa.endpoints.news import NewsEndpoint
+    from pyloa.models.news import Event
+
+    event = {
+        "Title": "이벤트",
+        "Link": "l",
+        "Thumbnail": "t",
+        "StartDate": "s",
+        "EndDate": "e",
+    }
+    client = make_conditional_client(
+        make_response(200, headers={"ETag": '"v1"'}, json_data=[event]),
+        make_response(304),
+    )
+    endpoint = NewsEndpoint(client)
+
+    with patch.object(Event, "from_dict", wraps=Event.from_dict) as from_dict:
+        first = endpoint.get_events()
+        second = endpoint.get_events()
+
+    assert from_dict.call_count == 1
+    assert second[0] is first[0]
+    assert second is not first
+    assert client.conditional.stats.model_reuses == 1
+
+
+def test_async_request_reuses_304_body():
+    """비동기 _request도 304에 이전 JSON을 반환해야 합니다."""
+    from pyloa.conditional import ConditionalCache
+
+    client = make_async_client(200, {"v": 1})
+    client.conditional = ConditionalCache()
+    ok = client.session.request.return_value
+    ok.headers = {"ETag": '"v1"'}
+    not_modified = Mock(status_code=304, headers={}, text="")
+    client.session.request = AsyncMock(side_effect=[ok, not_modified])
+    endpoint = ConcreteAsyncEndpoint(client)
+
+    first = asyncio.run(endpoint._request("GET", "/path"))
+    second = asyncio.run(endpoint._request("GET", "/path"))
+
+    assert second is first
+    assert client.conditional.stats.not_modified == 1
+
+
+def test_model_helper_reuses_single_model_on_304():
+    """단일 모델 변환도 304로 재사용한 JSON이면 이전 모델을 반환해야 합니다."""
+    from pyloa.endpoints.news import NewsEndpoint
+
+    client = make_conditional_client(
+        make_response(200, headers={"ETag": '"v1"'}, json_data={"Alarms": []}),
+        make_response(304),
+    )
+    endpoint = NewsEndpoint(client)
+
+    assert endpoint.get_alarms() is endpoint.get_alarms()
+
+
+def test_async_request_raises_on_unexpected_304():
+    """비동기 _request도 저장된 응답 없이 304를 받으면 APIError를 발생시켜야 합니다."""
+    from pyloa.conditional import ConditionalCache
+
+    client = make_async_client(304)
+    client.conditional = ConditionalCache()
+    endpoint = ConcreteAsyncEndpoint(client)
+
+    with pytest.raises(APIError):
+        asyncio.run(endpoint._request("GET", "/path"))
+
+
+def test_model_helpers_return_json_in_raw_mode():
+    """raw 모드에서는 모델로 변환하지 않고 JSON을 그대로 반환해야 합니다."""
+    from pyloa.endpoints.armories import ArmoriesEndpoint
+    from pyloa.endpoints.characters import CharactersEndpoint
+    from pyloa.models.character import CharacterInfo
+
+    siblings = [{"ServerName": "루페온", "CharacterName": "a"}]
+    client = make_cached_client(
+        make_response(200, json_data=siblings),
+        make_response(200, json_data=None),
+    )
+    client.raw = True
+
+    with patch.object(CharacterInfo, "from_dict") as from_dict:
+        assert CharactersEndpoint(client).get_siblings("a") is siblings
+    from_dict.assert_not_called()
+    # 빈 응답도 None으로 바꾸지 않고 그대로 반환합니다.
+    assert ArmoriesEndpoint(client).get_total_info("a") is None
+
+
+def test_request_returns_body_bytes_and_skips_cache():
+    """raw="bytes"이면 JSON을 해석하지 않고 본문 바이트를 반환하며 캐시하지 않아야 합니다."""
+    first = make_response(200)
+    first.content = b'{"v":1}'
+    second = make_response(200)
+    second.content = b'{"v":2}'
+    client = make_cached_client(first, second)
+    client.raw = "bytes"
+    endpoint = ConcreteEndpoint(client)
+
+    assert endpoint._request("GET", "/path") == b'{"v":1}'
+    assert endpoint._request("GET", "/path") == b'{"v":2}'
+    first.json.assert_not_called()
+    assert len(client.cache) == 0
+
+
+def test_async_request_returns_body_bytes():
+    """비동기 _request도 raw="bytes"이면 본문 바이트를 반환해야 합니다."""
+    client = make_async_client(200, {"v": 1})
+    client.raw = "bytes"
+    client.session.request.return_value.content = b'{"v":1}'
+    endpoint = ConcreteAsyncEndpoint(client)
+
+    assert asyncio.run(endpoint._request("GET", "/path")) == b'{"v":1}'
@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import Mock
+from pyloa.cache import NegativeCache, RosterIndex
 from pyloa.client import LostArkAPI
 from pyloa.endpoints.characters import CharactersEndpoint
 from pyloa.models.character import CharacterInfo
@@ -63,3 +64,59 @@ def test_get_siblings_url_encoding():
 
     # Path should include the name as-is (encoding handled by requests)
     endpoint._request.assert_called_once_with("GET", "/테스트 캐릭터/siblings")
+
+
+def test_get_siblings_skips_roster_index_in_bytes_mode():
+    """응답 바이트를 반환하는 raw 모드에서는 원정대 캐시를 사용하지 않아야 합니다."""
+    client = Mock(spec=LostArkAPI)
+    client.raw = "bytes"
+    client.roster_index = RosterIndex()
+    endpoint = CharactersEndpoint(client)
+    endpoint._request = Mock(return_value=b"[]")
+
+    assert endpoint.get_siblings("홍길동") == b"[]"
+    assert endpoint.get_siblings("홍길동") == b"[]"
+    assert endpoint._request.call_count == 2
+    assert len(client.roster_index) == 0
+
+
+def test_crawl_fetches_roster_armories():
+    """crawl은 원정대를 조회하고 기본으로 Armory 종합 정보를 조회해야 합니다."""
+    client = Mock(spec=LostArkAPI)
+    client.armories.get_total_info = Mock(side_effect=lambda name: f"armory:{name}")
+    endpoint = CharactersEndpoint(client)
+    endpoint._request = Mock(
+        return_value=[
+            {
+                "ServerName": "아만",
+                "CharacterName": name,
+                "CharacterLevel": 60,
+                "CharacterClassName": "버서커",
+                "ItemAvgLevel": "1620.00",
+            }
+            for name in ("홍길동", "김철수")
+        ]
+    )
+
+    crawler = endpoint.crawl(["홍길동", "김철수"], max_workers=1)
+    results = {r.key: r.value for r in crawler}
+
+    endpoint._request.assert_called_once_with("GET", "/홍길동/siblings")
+    assert results == {"홍길동": "armory:홍길동", "김철수": "armory:김철수"}
+    assert crawler.stats.rosters == 1
+
+
+def test_get_siblings_skips_unknown_characters():
+    """null을 반환한 이름은 없는 캐릭터 캐시로 다시 요청하지 않아야 합니다."""
+    client = Mock(spec=LostArkAPI)
+    client.negative_cache = NegativeCache()
+    endpoint = CharactersEndpoint(client)
+    endpoint._request = Mock(return_value=None)
+
+    assert endpoint.get_siblings("없음") == []
+    assert endpoint.get_siblings("없음") == []
+    endpoint._request.assert_called_once_with("GET", "/없음/siblings")
+
+    client.raw = "bytes"
+    endpoint._request = Mock(return_value=b"null")
+    assert endpoint.get_siblings("없음") == b"null"
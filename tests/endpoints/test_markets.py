@@ -117,3 +117,100 @@ def test_get_trades():
     assert result.total_count == 1
     assert isinstance(result.items[0], TradeMarketItem)
     assert result.items[0].recent_price == 100
+
+
+def test_iter_items_requests_every_page():
+    """iter_items는 PageNo를 바꿔 가며 모든 페이지의 아이템을 순서대로 반환해야 합니다."""
+    client = Mock(spec=LostArkAPI)
+    endpoint = MarketsEndpoint(client)
+
+    def request(method, path, json):
+        page_no = json["PageNo"]
+        return {
+            "PageNo": page_no,
+            "PageSize": 1,
+            "TotalCount": 3,
+            "Items": [
+                {"Id": page_no, "Name": "", "Grade": "", "Icon": "", "BundleCount": 1}
+            ],
+        }
+
+    endpoint._request = Mock(side_effect=request)
+
+    items = list(endpoint.iter_items(ItemName="테스트", PageNo=2))
+
+    assert [item.id for item in items] == [2, 3]
+    assert all(isinstance(item, MarketItem) for item in items)
+    first_call = endpoint._request.call_args_list[0]
+    assert first_call[1]["json"] == {"ItemName": "테스트", "PageNo": 2}
+
+
+def test_iter_items_decodes_pages_in_bytes_mode():
+    """bytes 모드에서도 페이지를 디코딩해 JSON 항목을 반환해야 합니다."""
+    import json as jsonlib
+
+    client = Mock(spec=LostArkAPI)
+    client.raw = "bytes"
+    client.json_decoder = jsonlib.loads
+    endpoint = MarketsEndpoint(client)
+
+    def request(method, path, json):
+        page = {
+            "PageNo": json["PageNo"],
+            "PageSize": 1,
+            "TotalCount": 2,
+            "Items": [{"Id": json["PageNo"]}],
+        }
+        return jsonlib.dumps(page).encode()
+
+    endpoint._request = Mock(side_effect=request)
+
+    assert list(endpoint.iter_items()) == [{"Id": 1}, {"Id": 2}]
+
+
+def test_get_item_records_history(tmp_path):
+    """get_item에 history를 주면 조회한 시세를 저장소에 누적해야 합니다."""
+    from pyloa.history import PriceHistoryStore
+
+    store = PriceHistoryStore(str(tmp_path))
+    endpoint = MarketsEndpoint(Mock(spec=LostArkAPI))
+    endpoint._request = Mock(
+        return_value=[
+            {
+                "Name": "파괴강석",
+                "BundleCount": 10,
+                "Stats": [{"Date": "2024-01-01", "AvgPrice": 12.5, "TradeCount": 3}],
+            }
+        ]
+    )
+
+    items = endpoint.get_item(66110221, history=store)
+
+    assert isinstance(items[0], MarketItemStats)
+    assert list(store.query(66110221).avg_prices) == [12.5]
+
+
+def test_get_item_records_history_in_bytes_mode(tmp_path):
+    """bytes 모드에서도 응답을 디코딩해 시세를 저장하고 bytes를 그대로 반환해야 합니다."""
+    import json as jsonlib
+
+    from pyloa.history import PriceHistoryStore
+
+    store = PriceHistoryStore(str(tmp_path))
+    client = Mock(spec=LostArkAPI)
+    client.raw = "bytes"
+    client.json_decoder = None
+    endpoint = MarketsEndpoint(client)
+    body = jsonlib.dumps(
+        [
+            {
+                "Name": "파괴강석",
+                "TradeRemainCount": 2,
+                "Stats": [{"Date": "2024-01-01", "AvgPrice": 12.5, "TradeCount": 3}],
+            }
+        ]
+    ).encode()
+    endpoint._request = Mock(return_value=body)
+
+    assert endpoint.get_item(66110221, history=store) == body
+    assert list(store.query(66110221, trade_remain_count=2).avg_prices) == [12.5]
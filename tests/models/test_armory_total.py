@@ -40,3 +40,54 @@ def test_armory_total_deserialization():
     assert len(total.armory_equipment) == 1
     assert isinstance(total.armory_equipment[0], ArmoryEquipment)
     assert total.armory_equipment[0].name == "Sword"
+
+
+def make_total_data():
+    return {
+        "ArmoryProfile": {"CharacterName": "TestChar", "ItemAvgLevel": "1,680.00"},
+        "ArmoryEquipment": [
+            {"Type": "무기", "Name": "Sword", "Icon": "", "Grade": "", "Tooltip": ""}
+        ],
+        "ArmoryGem": None,
+    }
+
+
+def test_armory_total_lazy_parses_sections_on_access():
+    """lazy 모드는 섹션을 처음 접근할 때만 변환하고 결과를 보관해야 합니다."""
+    from unittest.mock import patch
+
+    with patch.object(
+        ArmoryEquipment, "from_dict", wraps=ArmoryEquipment.from_dict
+    ) as equipment_from_dict:
+        total = ArmoryTotal.from_dict(make_total_data(), lazy=True)
+        assert total.armory_profile.item_avg_level == "1,680.00"
+        assert equipment_from_dict.call_count == 0
+
+        assert total.armory_equipment[0].name == "Sword"
+        assert total.armory_equipment is total.armory_equipment
+        assert equipment_from_dict.call_count == 1
+
+    assert total.armory_gem is None
+    assert total.armory_skills == []
+
+
+def test_armory_total_lazy_equals_eager():
+    """lazy 모드의 결과는 즉시 변환한 결과와 같아야 합니다."""
+    data = make_total_data()
+
+    lazy = ArmoryTotal.from_dict(data, lazy=True)
+
+    assert lazy == ArmoryTotal.from_dict(data)
+    assert lazy.to_dict() == ArmoryTotal.from_dict(data).to_dict()
+
+
+def test_armory_total_unknown_attribute_raises():
+    """정의되지 않은 속성은 lazy 여부와 관계없이 AttributeError여야 합니다."""
+    import pytest
+
+    for total in (
+        ArmoryTotal.from_dict(make_total_data()),
+        ArmoryTotal.from_dict(make_total_data(), lazy=True),
+    ):
+        with pytest.raises(AttributeError, match="unknown"):
+            total.unknown
@@ -125,3 +125,116 @@ def test_from_dict_empty_data():
     """BaseModel은 빈 딕셔너리에 대해 TypeError를 발생시켜야 합니다."""
     with pytest.raises(TypeError):
         SampleModel.from_dict({})
+
+
+def test_from_dict_caches_key_mapping_per_class():
+    """키 변환은 클래스마다 한 번만 수행해야 합니다."""
+    from unittest.mock import patch
+
+    @dataclass
+    class CachedModel(BaseModel):
+        server_name: str
+        item_level: int = 0
+
+    data = {"ServerName": "아만", "ItemLevel": 1, "Unknown": "x"}
+
+    with patch.object(
+        CachedModel, "_pascal_to_snake", wraps=CachedModel._pascal_to_snake
+    ) as convert:
+        CachedModel.from_dict(data)
+        model = CachedModel.from_dict(data)
+
+    assert convert.call_count == 3
+    assert model.server_name == "아만"
+    assert model.item_level == 1
+
+
+def test_from_dict_key_cache_is_bounded():
+    """예상하지 못한 키가 많아도 키 캐시는 상한을 넘지 않아야 합니다."""
+    from pyloa.models import base
+
+    @dataclass
+    class BoundedModel(BaseModel):
+        name: str
+
+    data = {f"Extra{i}": i for i in range(base._MAX_KEYS_PER_CLASS + 10)}
+    data["Name"] = "n"
+
+    assert BoundedModel.from_dict(data).name == "n"
+    assert len(base._KEY_MAPS[BoundedModel][1]) == base._MAX_KEYS_PER_CLASS
+
+
+def test_slotted_dataclass_has_no_instance_dict():
+    """pyloa dataclass는 __slots__를 가진 모델을 만들어야 합니다."""
+    from dataclasses import field
+    from pyloa.models.base import dataclass as slotted
+
+    @slotted
+    class SlottedModel(BaseModel):
+        name: str
+        tags: list = field(default_factory=list)
+        level: int = 1
+
+    model = SlottedModel.from_dict({"Name": "n"})
+
+    assert SlottedModel.__slots__ == ("name", "tags", "level")
+    assert not hasattr(model, "__dict__")
+    assert model.level == 1 and model.tags == []
+    assert model.to_dict() == {"name": "n", "tags": [], "level": 1}
+    with pytest.raises(AttributeError):
+        model.unknown = 1
+
+
+def test_slotted_dataclass_merges_existing_slots_and_options():
+    """기존 __slots__와 dataclass 옵션, 인자 없는 super()를 유지해야 합니다."""
+    from pyloa.models.base import dataclass as slotted
+
+    @slotted(eq=False)
+    class Parent(BaseModel):
+        __slots__ = ("_cache",)
+
+        name: str
+
+        def describe(self):
+            return f"parent:{self.name}"
+
+    @slotted
+    class Child(Parent):
+        level: int = 0
+
+        def describe(self):
+            return "child/" + super().describe()
+
+    child = Child(name="n", level=3)
+    child._cache = "x"
+
+    assert Parent.__slots__ == ("name", "_cache")
+    assert Child.__slots__ == ("level",)
+    assert Child.__qualname__.endswith("<locals>.Child")
+    assert child.describe() == "child/parent:n"
+    assert Parent(name="a") != Parent(name="a")
+
+
+def test_slotted_dataclass_adds_extra_slots():
+    """_extra_slots의 이름은 슬롯으로 추가하고, 일반 dataclass에서는 무시되어야 합니다."""
+    import dataclasses
+
+    from pyloa.models.base import dataclass as slotted
+
+    def define(decorator):
+        @decorator
+        class Lazy(BaseModel):
+            _extra_slots = ("_pending",)
+
+            name: str = ""
+
+        return Lazy
+
+    slotted_cls = define(slotted)
+    plain_cls = define(dataclasses.dataclass)
+    model = slotted_cls()
+    model._pending = {}
+
+    assert slotted_cls.__slots__ == ("name", "_pending")
+    assert not hasattr(model, "__dict__")
+    assert plain_cls(name="b").name == "b"
@@ -0,0 +1,119 @@
+"""툴팁 파싱 테스트."""
+
+import json
+
+from pyloa.models.armory import ArmoryEquipment, ArmorySkill, Gem
+from pyloa.models.tooltip import Tooltip, parse_tooltip, strip_tags
+
+EQUIPMENT_TOOLTIP = json.dumps(
+    {
+        "Element_000": {
+            "type": "NameTagBox",
+            "value": "<P ALIGN='CENTER'><FONT COLOR='#E3C7A1'>+25 운명의 업화 머리 장식</FONT></P>",
+        },
+        "Element_001": {
+            "type": "ItemTitle",
+            "value": {
+                "leftStr0": "<FONT SIZE='12'><FONT COLOR='#E3C7A1'>고대 머리 방어구</FONT></FONT>",
+                "leftStr2": "<FONT SIZE='14'>아이템 레벨 1,700 (티어 4)</FONT>",
+                "qualityValue": 98,
+            },
+        },
+        "Element_002": {"type": "SingleTextBox", "value": "<FONT>거래 불가</FONT>"},
+        "Element_003": {
+            "type": "ItemPartBox",
+            "value": {
+                "Element_000": "<FONT COLOR='#A9D0F5'>기본 효과</FONT>",
+                "Element_001": "물리 방어력 +5,000<BR>최대 생명력 +40,000",
+            },
+        },
+        "Element_004": {
+            "type": "IndentStringGroup",
+            "value": {
+                "Element_000": {
+                    "topStr": "<FONT>엘릭서 효과</FONT>",
+                    "contentStr": {
+                        "Element_000": {"contentStr": "[공용] 힘 Lv.5", "bPoint": True}
+                    },
+                }
+            },
+        },
+    },
+    ensure_ascii=False,
+)
+
+
+def test_strip_tags_removes_markup_and_keeps_line_breaks():
+    """태그를 제거하고 <BR>을 줄바꿈으로, HTML 엔티티를 문자로 바꿔야 합니다."""
+    assert strip_tags("<FONT COLOR='#FFF'>A &amp; B</FONT><BR>C") == "A & B\nC"
+    assert strip_tags(None) == ""
+
+
+def test_parse_equipment_tooltip():
+    """장비 툴팁에서 이름, 레벨, 품질, 재련 단계, 효과를 추출해야 합니다."""
+    tooltip = parse_tooltip(EQUIPMENT_TOOLTIP)
+
+    assert tooltip.name == "+25 운명의 업화 머리 장식"
+    assert tooltip.item_type == "고대 머리 방어구"
+    assert tooltip.item_level == 1700
+    assert tooltip.tier == 4
+    assert tooltip.quality == 98
+    assert tooltip.refinement == 25
+    assert tooltip.sections["기본 효과"] == ["물리 방어력 +5,000", "최대 생명력 +40,000"]
+    assert tooltip.sections["엘릭서 효과"] == ["[공용] 힘 Lv.5"]
+    assert tooltip.texts == ["거래 불가"]
+    assert [e.type for e in tooltip.elements][:2] == ["NameTagBox", "ItemTitle"]
+
+
+def test_parse_skill_tooltip():
+    """스킬 툴팁에서 스킬 이름과 레벨을 추출해야 합니다."""
+    raw = json.dumps(
+        {
+            "Element_000": {
+                "type": "CommonSkillTitle",
+                "value": {"name": "<FONT>소드 스톰</FONT>", "level": "스킬 레벨 10"},
+            }
+        }
+    )
+
+    tooltip = parse_tooltip(raw)
+
+    assert tooltip.name == "소드 스톰"
+    assert tooltip.skill_level == 10
+    assert tooltip.quality is None
+
+
+def test_parse_tooltip_handles_empty_and_plain_text():
+    """빈 툴팁은 기본값을, JSON이 아닌 툴팁은 텍스트 하나로 취급해야 합니다."""
+    assert parse_tooltip("") == Tooltip()
+    assert parse_tooltip(None) == Tooltip()
+    assert parse_tooltip("<FONT>설명</FONT>").texts == ["설명"]
+
+
+def test_parse_tooltip_ignores_negative_quality():
+    """품질이 없는 아이템(-1)은 quality가 None이어야 합니다."""
+    raw = json.dumps(
+        {"Element_000": {"type": "ItemTitle", "value": {"qualityValue": -1}}}
+    )
+
+    assert parse_tooltip(raw).quality is None
+
+
+def test_parsed_tooltip_is_memoized_across_models():
+    """같은 툴팁을 가진 모델들은 파싱 결과를 공유해야 합니다."""
+    first = ArmoryEquipment("투구", "a", "", "고대", EQUIPMENT_TOOLTIP)
+    second = ArmoryEquipment("투구", "b", "", "고대", EQUIPMENT_TOOLTIP)
+
+    assert first.parsed_tooltip is second.parsed_tooltip
+    assert parse_tooltip.cache_info().hits >= 1
+
+
+def test_tooltip_models_expose_parsed_tooltip():
+    """보석과 스킬 모델도 parsed_tooltip을 제공해야 합니다."""
+    gem = Gem.from_dict(
+        {"Slot": 0, "Name": "", "Icon": "", "Level": 10, "Grade": "", "Tooltip": ""}
+    )
+    skill = ArmorySkill.from_dict({"Name": "s", "Tooltip": EQUIPMENT_TOOLTIP})
+
+    assert gem.parsed_tooltip == Tooltip()
+    assert skill.parsed_tooltip.item_level == 1700
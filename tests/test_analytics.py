@@ -0,0 +1,172 @@
+"""거래소 시세 지표 계산 테스트."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyloa.analytics import (  # noqa: E402
+    MarketArrays,
+    moving_average,
+    to_arrays,
+    volatility,
+    vwap,
+    zscore,
+)
+from pyloa.models.market import MarketItemStats, MarketStatsInfo  # noqa: E402
+
+
+def item(name, *rows):
+    stats = [MarketStatsInfo(date=d, avg_price=p, trade_count=c) for d, p, c in rows]
+    return MarketItemStats(name=name, bundle_count=1, stats=stats)
+
+
+def days(prices, counts=None):
+    counts = counts or [1] * len(prices)
+    return [
+        (f"2024-01-{i + 1:02d}", p, c) for i, (p, c) in enumerate(zip(prices, counts))
+    ]
+
+
+def test_to_arrays_aligns_dates_and_fills_missing():
+    """아이템별 날짜를 합친 축에 맞추고, 없는 날은 NaN/0으로 채워야 합니다."""
+    arrays = to_arrays(
+        {
+            10: item("a", ("2024-01-03", 30, 3), ("2024-01-01", 10, 1)),
+            20: item("b", ("2024-01-02T00:00:00", 5, 2)),
+        }
+    )
+
+    assert arrays.keys == [10, 20]
+    assert [str(d) for d in arrays.dates] == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    np.testing.assert_array_equal(
+        arrays.prices, [[10, np.nan, 30], [np.nan, 5, np.nan]]
+    )
+    np.testing.assert_array_equal(arrays.counts, [[1, 0, 3], [0, 2, 0]])
+    assert arrays.prices.flags.c_contiguous
+    assert arrays.row(20) == 1
+    with pytest.raises(KeyError):
+        arrays.row(30)
+
+
+def test_to_arrays_accepts_lists_and_raw_dicts():
+    """목록이면 (이름, 거래 가능 횟수)를 키로 쓰고, raw 모드의 dict도 변환해야 합니다."""
+    raw = {"Name": "b", "Stats": [{"Date": "2024-01-01", "AvgPrice": 2, "TradeCount": 1}]}
+
+    arrays = to_arrays([item("a", ("2024-01-01", 1, 1)), raw])
+
+    assert arrays.keys == [("a", None), ("b", None)]
+    np.testing.assert_array_equal(arrays.prices, [[1], [2]])
+    assert to_arrays([]).prices.shape == (0, 0)
+
+
+def test_to_arrays_keeps_trade_remain_count_variants():
+    """거래 가능 횟수만 다른 같은 아이템은 서로 다른 행이어야 합니다."""
+    bound = item("a", ("2024-01-01", 1, 1))
+    bound.trade_remain_count = 0
+    tradable = item("a", ("2024-01-01", 5, 1))
+    tradable.trade_remain_count = 2
+
+    arrays = to_arrays([bound, tradable])
+
+    assert arrays.keys == [("a", 0), ("a", 2)]
+    assert arrays.prices[arrays.row(("a", 2)), 0] == 5
+
+
+def test_to_arrays_rejects_duplicate_list_keys():
+    """목록에 같은 키의 아이템이 두 번 있으면 ValueError를 발생시켜야 합니다."""
+    with pytest.raises(ValueError, match="Duplicate"):
+        to_arrays([item("a", ("2024-01-01", 1, 1)), item("a", ("2024-01-02", 2, 1))])
+
+
+def test_moving_average_and_vwap():
+    """이동 평균과 VWAP를 계산하고, 창에 빈 날이 있으면 NaN이어야 합니다."""
+    prices = np.array([[1.0, 2.0, 3.0, 4.0], [1.0, np.nan, 3.0, 5.0]])
+    counts = np.array([[1, 1, 2, 0], [1, 0, 1, 1]])
+
+    np.testing.assert_allclose(
+        moving_average(prices, 2), [[np.nan, 1.5, 2.5, 3.5], [np.nan] * 3 + [4.0]]
+    )
+    np.testing.assert_allclose(vwap(prices, counts), [9 / 4, 3.0])
+    np.testing.assert_allclose(
+        vwap(prices, counts, 2), [[np.nan, 1.5, 8 / 3, 3.0], [np.nan, 1.0, 3.0, 4.0]]
+    )
+    assert np.isnan(moving_average(prices, 5)).all()
+    assert np.isnan(vwap(prices, counts, 5)).all()
+    assert np.isnan(vwap(prices, np.zeros_like(counts))).all()
+
+
+def test_volatility_matches_log_return_std():
+    """변동성은 창 안 로그 수익률의 표본 표준편차여야 합니다."""
+    prices = np.array([[100.0, 110.0, 99.0, 120.0]])
+    returns = [math.log(110 / 100), math.log(99 / 110), math.log(120 / 99)]
+
+    result = volatility(prices, 2)
+
+    assert np.isnan(result[0, :2]).all()
+    assert result[0, 2] == pytest.approx(np.std(returns[:2], ddof=1))
+    assert result[0, 3] == pytest.approx(np.std(returns[1:], ddof=1))
+    assert np.isnan(volatility(prices, 5)).all()
+
+
+def test_zscore_uses_preceding_window():
+    """z-score는 당일을 제외한 직전 창으로 계산하고, 변동이 없으면 NaN이어야 합니다."""
+    prices = np.array([[10.0, 12.0, 11.0, 20.0], [5.0, 5.0, 5.0, 9.0]])
+
+    result = zscore(prices, 3)
+
+    assert np.isnan(result[:, :3]).all()
+    assert result[0, 3] == pytest.approx((20 - 11) / 1.0)
+    assert np.isnan(result[1, 3])
+    assert np.isnan(zscore(prices, 4)).all()
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda p: moving_average(p, 0),
+        lambda p: vwap(p, p, 0),
+        lambda p: volatility(p, 1),
+        lambda p: zscore(p, 1),
+    ],
+)
+def test_invalid_window_raises(call):
+    """창 크기가 너무 작으면 ValueError가 발생해야 합니다."""
+    with pytest.raises(ValueError):
+        call(np.ones((1, 3)))
+
+
+def test_alerts_report_outliers():
+    """z-score가 기준을 넘는 날을 경보로 반환해야 합니다."""
+    arrays = to_arrays(
+        {
+            "spike": item("s", *days([100, 102, 98, 101, 99, 100, 160])),
+            "drop": item("d", *days([100, 102, 98, 40, 99, 100, 101])),
+            "flat": item("f", *days([100] * 7)),
+        }
+    )
+
+    alerts = arrays.alerts(window=3, threshold=3.0)
+    latest = arrays.alerts(window=3, threshold=3.0, latest=True)
+
+    assert [(a.key, str(a.date)) for a in alerts] == [
+        ("spike", "2024-01-07"),
+        ("drop", "2024-01-04"),
+    ]
+    assert alerts[0].price == 160
+    assert alerts[1].zscore < -3
+    assert [a.key for a in latest] == ["spike"]
+
+
+def test_market_arrays_methods_match_functions():
+    """MarketArrays의 메서드는 모듈 함수와 같은 결과를 반환해야 합니다."""
+    arrays = to_arrays({1: item("a", *days([1, 2, 4, 8], [1, 2, 3, 4]))})
+
+    assert isinstance(arrays, MarketArrays)
+    np.testing.assert_array_equal(
+        arrays.moving_average(2), moving_average(arrays.prices, 2)
+    )
+    np.testing.assert_array_equal(arrays.vwap(), vwap(arrays.prices, arrays.counts))
+    np.testing.assert_array_equal(arrays.volatility(2), volatility(arrays.prices, 2))
+    np.testing.assert_array_equal(arrays.zscore(2), zscore(arrays.prices, 2))
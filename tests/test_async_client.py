@@ -0,0 +1,143 @@
+"""AsyncLostArkAPI 클라이언트 테스트."""
+
+import asyncio
+import builtins
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from pyloa.async_client import AsyncLostArkAPI
+from pyloa.rate_limiter import RateLimiter
+
+
+def test_async_client_initialization():
+    """비동기 클라이언트가 API 키와 httpx 세션으로 초기화되어야 합니다."""
+    import httpx
+
+    api = AsyncLostArkAPI(api_key="test_jwt_token")
+
+    assert api.api_key == "test_jwt_token"
+    assert api.base_url == "https://developer-lostark.game.onstove.com"
+    assert isinstance(api.session, httpx.AsyncClient)
+    assert api.session.headers["authorization"] == "bearer test_jwt_token"
+    assert isinstance(api.rate_limiter, RateLimiter)
+    asyncio.run(api.aclose())
+
+
+def test_async_client_uses_given_session():
+    """주어진 세션에 인증 헤더를 설정해야 합니다."""
+    session = Mock()
+    session.headers = {}
+
+    api = AsyncLostArkAPI(api_key="test_jwt_token", session=session)
+
+    assert api.session is session
+    assert session.headers["authorization"] == "bearer test_jwt_token"
+    assert session.headers["accept"] == "application/json"
+
+
+def test_async_client_requires_httpx():
+    """httpx가 없으면 ImportError를 발생시켜야 합니다."""
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name == "httpx":
+            raise ImportError("No module named 'httpx'")
+        return real_import(name, *args, **kwargs)
+
+    with patch("builtins.__import__", side_effect=fake_import):
+        with pytest.raises(ImportError, match="httpx"):
+            AsyncLostArkAPI(api_key="test_jwt_token")
+
+
+def test_async_client_context_manager_closes_session():
+    """async with 블록을 벗어나면 세션을 닫아야 합니다."""
+    session = Mock()
+    session.headers = {}
+    session.aclose = AsyncMock()
+
+    async def run():
+        async with AsyncLostArkAPI(api_key="k", session=session) as api:
+            assert isinstance(api, AsyncLostArkAPI)
+
+    asyncio.run(run())
+    session.aclose.assert_awaited_once()
+
+
+def test_async_client_api_key_immutable():
+    """API 키는 초기화 후 수정할 수 없어야 합니다."""
+    session = Mock()
+    session.headers = {}
+    api = AsyncLostArkAPI(api_key="k", session=session)
+
+    with pytest.raises(AttributeError):
+        api.api_key = "new_key"
+
+
+@pytest.mark.parametrize(
+    "attr, cls_name",
+    [
+        ("news", "AsyncNewsEndpoint"),
+        ("characters", "AsyncCharactersEndpoint"),
+        ("markets", "AsyncMarketsEndpoint"),
+        ("auctions", "AsyncAuctionsEndpoint"),
+        ("game_contents", "AsyncGameContentsEndpoint"),
+        ("armories", "AsyncArmoriesEndpoint"),
+    ],
+)
+def test_async_client_provides_endpoints(attr, cls_name):
+    """비동기 클라이언트는 모든 엔드포인트를 지연 생성해야 합니다."""
+    import pyloa.endpoints as endpoints
+
+    session = Mock()
+    session.headers = {}
+    api = AsyncLostArkAPI(api_key="k", session=session)
+
+    endpoint = getattr(api, attr)
+    assert isinstance(endpoint, getattr(endpoints, cls_name))
+    assert getattr(api, attr) is endpoint
+
+
+def test_async_client_with_multiple_keys_uses_key_pool():
+    """여러 키로 초기화하면 키 풀을 구성해야 합니다."""
+    from pyloa.rate_limiter import KeyPool
+
+    session = Mock()
+    session.headers = {}
+    api = AsyncLostArkAPI(api_key=["key1", "key2"], session=session)
+
+    assert isinstance(api.key_pool, KeyPool)
+    assert api.rate_limiter is None
+    assert api.api_keys == ["key1", "key2"]
+
+
+def test_async_client_single_key_and_empty_list():
+    """키가 하나면 키 풀이 없고, 빈 리스트는 ValueError를 발생시켜야 합니다."""
+    session = Mock()
+    session.headers = {}
+    api = AsyncLostArkAPI(api_key="key1", session=session)
+    assert api.api_keys == ["key1"]
+
+    with pytest.raises(ValueError):
+        AsyncLostArkAPI(api_key=[], session=session)
+
+
+def test_async_client_coalesces_by_default():
+    """비동기 클라이언트도 기본으로 single-flight를 사용하고 끌 수 있어야 합니다."""
+    from pyloa.singleflight import AsyncSingleFlight
+
+    session = Mock()
+    session.headers = {}
+    assert isinstance(
+        AsyncLostArkAPI(api_key="k", session=session).single_flight, AsyncSingleFlight
+    )
+    client = AsyncLostArkAPI(api_key="k", session=session, coalesce=False)
+    assert client.single_flight is None
+
+
+def test_async_client_accepts_raw_mode():
+    """비동기 클라이언트도 raw 모드를 받고 잘못된 값은 거부해야 합니다."""
+    session = Mock()
+    session.headers = {}
+    assert AsyncLostArkAPI(api_key="k", session=session, raw=True).raw is True
+
+    with pytest.raises(ValueError):
+        AsyncLostArkAPI(api_key="k", session=session, raw="text")
@@ -0,0 +1,141 @@
+"""대량 조회 도우미 테스트."""
+
+import asyncio
+import threading
+import pytest
+from pyloa.bulk import AsyncBulkIterator, BulkIterator, BulkResult, BulkStats
+from pyloa.exceptions import APIError
+
+
+def test_bulk_iterator_yields_all_results():
+    """모든 항목의 결과를 돌려주고 통계를 집계해야 합니다."""
+    results = BulkIterator(lambda x: x * 2, range(10), max_workers=3)
+
+    values = sorted(r.value for r in results)
+
+    assert values == [x * 2 for x in range(10)]
+    assert results.stats.submitted == 10
+    assert results.stats.succeeded == 10
+    assert results.stats.failed == 0
+    assert results.stats.finished_at is not None
+
+
+def test_bulk_iterator_reports_errors_per_item():
+    """항목별 오류는 배치를 중단하지 않고 결과에 담아야 합니다."""
+
+    def fetch(name):
+        if name == "없는캐릭터":
+            raise APIError("API error (404): not found")
+        return name
+
+    results = list(BulkIterator(fetch, ["a", "없는캐릭터", "b"]))
+
+    failed = [r for r in results if not r.ok]
+    assert len(results) == 3
+    assert [r.key for r in failed] == ["없는캐릭터"]
+    assert isinstance(failed[0].error, APIError)
+    assert failed[0].value is None
+
+
+def test_bulk_iterator_bounds_concurrency():
+    """동시에 실행하는 작업 수는 max_workers를 넘지 않아야 합니다."""
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def fetch(x):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        threading.Event().wait(0.005)
+        with lock:
+            running[0] -= 1
+        return x
+
+    list(BulkIterator(fetch, range(20), max_workers=4))
+
+    assert 1 <= peak[0] <= 4
+
+
+def test_bulk_iterator_consumes_input_lazily():
+    """입력을 한 번에 모두 읽지 않고 필요한 만큼만 제출해야 합니다."""
+    consumed = []
+
+    def names():
+        for i in range(1000):
+            consumed.append(i)
+            yield i
+
+    results = BulkIterator(lambda x: x, names(), max_workers=2)
+    next(results)
+    results.close()
+
+    assert len(consumed) < 10
+    assert results.stats.finished_at is not None
+
+
+def test_bulk_iterator_invalid_workers():
+    """max_workers가 1보다 작으면 ValueError를 발생시켜야 합니다."""
+    with pytest.raises(ValueError):
+        BulkIterator(lambda x: x, [], max_workers=0)
+    with pytest.raises(ValueError):
+        AsyncBulkIterator(lambda x: x, [], max_workers=0)
+
+
+def test_bulk_stats_throughput():
+    """throughput은 완료한 항목 수를 경과 시간으로 나눈 값이어야 합니다."""
+    stats = BulkStats()
+    assert stats.elapsed == 0.0
+    assert stats.throughput == 0.0
+
+    stats.started_at = 10.0
+    stats.finished_at = 14.0
+    stats._record(BulkResult("a", 1))
+    stats._record(BulkResult("b", error=ValueError()))
+
+    assert stats.completed == 2
+    assert stats.throughput == pytest.approx(0.5)
+    assert "failed=1" in repr(stats)
+
+
+def test_async_bulk_iterator():
+    """AsyncBulkIterator는 결과와 오류를 모두 돌려줘야 합니다."""
+
+    async def fetch(x):
+        await asyncio.sleep(0)
+        if x == 3:
+            raise APIError("boom")
+        return x
+
+    async def main():
+        results = AsyncBulkIterator(fetch, range(6), max_workers=2)
+        return [r async for r in results], results.stats
+
+    results, stats = asyncio.run(main())
+
+    assert sorted(r.key for r in results) == list(range(6))
+    assert stats.succeeded == 5
+    assert stats.failed == 1
+
+
+def test_async_bulk_iterator_aclose_cancels_pending():
+    """aclose는 진행 중인 작업을 취소해야 합니다."""
+    started = []
+
+    async def fetch(x):
+        started.append(x)
+        await asyncio.sleep(0 if x == 0 else 10)
+        return x
+
+    async def main():
+        results = AsyncBulkIterator(fetch, range(100), max_workers=3)
+        first = await results.__anext__()
+        await results.aclose()
+        return first, results.stats
+
+    first, stats = asyncio.run(main())
+
+    assert first.key == 0
+    assert len(started) == 3
+    assert stats.finished_at is not None
+
@@ -0,0 +1,414 @@
+"""응답 캐시 테스트."""
+
+import pytest
+from unittest.mock import patch
+from pyloa.cache import (
+    ArmoryCache,
+    CacheBackend,
+    MemoryCache,
+    NegativeCache,
+    RosterIndex,
+    SQLiteCache,
+    MISSING,
+    make_cache_key,
+)
+
+
+def test_make_cache_key_is_canonical():
+    """캐시 키는 파라미터/본문의 키 순서와 무관해야 합니다."""
+    key1 = make_cache_key("post", "/markets/items", None, {"A": 1, "B": [1, 2]})
+    key2 = make_cache_key("POST", "/markets/items", {}, {"B": [1, 2], "A": 1})
+
+    assert key1 == key2
+    assert key1.startswith("POST /markets/items")
+
+
+def test_make_cache_key_distinguishes_requests():
+    """메서드, 경로, 파라미터, 본문이 다르면 다른 키여야 합니다."""
+    base = make_cache_key("GET", "/news/notices", {"type": "공지"})
+
+    assert base != make_cache_key("GET", "/news/notices", {"type": "점검"})
+    assert base != make_cache_key("GET", "/news/events", {"type": "공지"})
+    assert base != make_cache_key("POST", "/news/notices", {"type": "공지"})
+    assert make_cache_key("POST", "/x", None, {"PageNo": 1}) != make_cache_key(
+        "POST", "/x", None, {"PageNo": 2}
+    )
+
+
+def test_ttl_for_uses_longest_prefix():
+    """ttl_for는 가장 긴 접두사의 TTL을, 없으면 default_ttl을 사용해야 합니다."""
+    cache = MemoryCache(default_ttl=10, ttls={"/markets": 5, "/markets/options": 50})
+
+    assert cache.ttl_for("/markets/options") == 50
+    assert cache.ttl_for("/markets/items") == 5
+    assert cache.ttl_for("/gamecontents/calendar") == 3600
+    assert cache.ttl_for("/armories/characters/x") == 10
+
+
+def test_memory_cache_hit_and_miss():
+    """캐시는 적중/미적중을 집계해야 합니다."""
+    cache = MemoryCache()
+
+    assert cache.get("k") is MISSING
+    cache.set("k", {"v": 1}, ttl=60)
+    assert cache.get("k") == {"v": 1}
+
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_rate == 0.5
+    assert "hits=1" in repr(cache.stats)
+
+
+def test_memory_cache_stores_none():
+    """JSON null(None)도 캐시할 수 있어야 합니다."""
+    cache = MemoryCache()
+    cache.set("k", None, ttl=60)
+
+    assert cache.get("k") is None
+
+
+def test_memory_cache_zero_ttl_is_not_stored():
+    """TTL이 0이면 저장하지 않아야 합니다."""
+    cache = MemoryCache()
+    cache.set("k", 1, ttl=0)
+
+    assert len(cache) == 0
+
+
+def test_memory_cache_expires_entries():
+    """TTL이 지나면 항목이 만료되어야 합니다."""
+    cache = MemoryCache()
+
+    with patch("pyloa.cache.time.monotonic", return_value=100.0):
+        cache.set("k", 1, ttl=10)
+    with patch("pyloa.cache.time.monotonic", return_value=105.0):
+        assert cache.get("k") == 1
+    with patch("pyloa.cache.time.monotonic", return_value=111.0):
+        assert cache.get("k") is MISSING
+    assert len(cache) == 0
+
+
+def test_memory_cache_lru_eviction():
+    """maxsize를 넘으면 가장 오래 사용하지 않은 항목을 제거해야 합니다."""
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_memory_cache_delete_and_clear():
+    """delete와 clear는 항목을 삭제해야 합니다."""
+    cache = MemoryCache()
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+
+    cache.delete("a")
+    assert cache.get("a") is MISSING
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_memory_cache_invalid_maxsize():
+    """maxsize가 1보다 작으면 ValueError를 발생시켜야 합니다."""
+    with pytest.raises(ValueError):
+        MemoryCache(maxsize=0)
+
+
+def test_cache_backend_is_abstract():
+    """CacheBackend는 저장 메서드를 구현하지 않아야 합니다."""
+    backend = CacheBackend()
+
+    with pytest.raises(NotImplementedError):
+        backend.get("k")
+    with pytest.raises(NotImplementedError):
+        backend.set("k", 1, ttl=1)
+    with pytest.raises(NotImplementedError):
+        backend.delete("k")
+    with pytest.raises(NotImplementedError):
+        backend.clear()
+
+
+def test_sqlite_cache_roundtrip(tmp_path):
+    """SQLiteCache는 JSON 값을 압축 저장하고 그대로 복원해야 합니다."""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+    value = {"Name": "파괴강석", "Stats": [{"AvgPrice": 4.5}], "Empty": None}
+
+    assert cache.get("k") is MISSING
+    cache.set("k", value, ttl=60)
+
+    assert cache.get("k") == value
+    assert len(cache) == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_sqlite_cache_uses_wal_mode(tmp_path):
+    """SQLiteCache는 WAL 모드로 열려야 합니다."""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+
+    mode = cache._connection().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_sqlite_cache_shared_between_instances(tmp_path):
+    """같은 파일을 여는 캐시(다른 워커)끼리 항목을 공유해야 합니다."""
+    path = str(tmp_path / "cache.sqlite3")
+    worker1 = SQLiteCache(path)
+    worker2 = SQLiteCache(path)
+
+    worker1.set("k", [1, 2, 3], ttl=60)
+
+    assert worker2.get("k") == [1, 2, 3]
+
+
+def test_sqlite_cache_survives_restart(tmp_path):
+    """연결을 닫고 다시 열어도 항목이 유지되어야 합니다."""
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SQLiteCache(path)
+    cache.set("k", {"v": 1}, ttl=60)
+    cache.close()
+    cache.close()
+
+    assert SQLiteCache(path).get("k") == {"v": 1}
+
+
+def test_sqlite_cache_expires_entries(tmp_path):
+    """TTL이 지난 항목은 MISSING이어야 하고 삭제되어야 합니다."""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+
+    with patch("pyloa.cache.time.time", return_value=1000.0):
+        cache.set("k", 1, ttl=10)
+    with patch("pyloa.cache.time.time", return_value=1011.0):
+        assert cache.get("k") is MISSING
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_evicts_overflow(tmp_path):
+    """항목 수가 maxsize를 넘으면 만료가 가장 이른 항목부터 제거해야 합니다."""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), maxsize=2)
+    cache.EVICT_INTERVAL = 1
+
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=30)
+    cache.set("c", 3, ttl=20)
+
+    assert len(cache) == 2
+    assert cache.get("a") is MISSING
+    assert cache.stats.evictions == 1
+
+
+def test_sqlite_cache_delete_and_clear(tmp_path):
+    """delete와 clear는 항목을 삭제해야 합니다."""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+
+    cache.delete("a")
+    assert cache.get("a") is MISSING
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_reconnects_after_fork(tmp_path):
+    """프로세스 ID가 바뀌면 새 연결을 열어야 합니다."""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+    conn = cache._connection()
+
+    with patch("pyloa.cache.os.getpid", return_value=-1):
+        assert cache._connection() is not conn
+
+
+def test_sqlite_cache_invalid_maxsize(tmp_path):
+    """maxsize가 1보다 작으면 ValueError를 발생시켜야 합니다."""
+    with pytest.raises(ValueError):
+        SQLiteCache(str(tmp_path / "cache.sqlite3"), maxsize=0)
+
+
+def test_sqlite_cache_with_client(tmp_path):
+    """LostArkAPI는 SQLiteCache를 캐시 백엔드로 사용할 수 있어야 합니다."""
+    from unittest.mock import Mock
+    from pyloa.client import LostArkAPI
+
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+    api = LostArkAPI(api_key="k", cache=cache)
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.content = b'[{"CategoryName": "c", "ContentsName": "n"}]'
+    api.session.request = Mock(return_value=response)
+
+    first = api.game_contents.get_calendar()
+    second = LostArkAPI(api_key="k", cache=cache).game_contents.get_calendar()
+
+    assert first == second
+    api.session.request.assert_called_once()
+
+
+def roster(*names):
+    return [{"ServerName": "아만", "CharacterName": name} for name in names]
+
+
+def test_roster_index_resolves_any_member():
+    """원정대 목록은 한 번 저장하고 어떤 캐릭터 이름으로도 찾을 수 있어야 합니다."""
+    index = RosterIndex()
+    data = roster("a", "b", "c")
+
+    index.set("a", data)
+
+    assert index.get("b") is data
+    assert index.get("c") is data
+    assert index.get("x") is MISSING
+    assert len(index) == 1
+    assert index.stats.hits == 2
+    assert index.stats.misses == 1
+
+
+def test_roster_index_replaces_changed_rosters():
+    """원정대가 바뀌면 이전 항목을 제거하고, 빈 목록은 저장하지 않아야 합니다."""
+    index = RosterIndex()
+    index.set("a", roster("a", "b"))
+    index.set("a", roster("a", "c"))
+    index.set("없음", [])
+    index.set("없음", None)
+
+    assert index.get("b") is MISSING
+    assert [m["CharacterName"] for m in index.get("c")] == ["a", "c"]
+    assert index.get("없음") is MISSING
+    assert len(index) == 1
+
+    index.delete("c")
+    assert index.get("a") is MISSING
+    index.set("a", roster("a"))
+    index.clear()
+    assert len(index) == 0
+
+
+def test_roster_index_expires_and_evicts():
+    """TTL이 지나면 만료되고, maxsize를 넘으면 오래된 원정대부터 제거해야 합니다."""
+    index = RosterIndex(maxsize=2, ttl=10)
+    with patch("pyloa.cache.time.monotonic", return_value=100.0):
+        index.set("a", roster("a"))
+        index.set("b", roster("b"))
+        index.get("a")
+        index.set("c", roster("c"))
+        assert index.get("b") is MISSING
+        assert index.stats.evictions == 1
+    with patch("pyloa.cache.time.monotonic", return_value=111.0):
+        assert index.get("a") is MISSING
+    assert len(index) == 1
+
+
+def test_roster_index_invalid_arguments():
+    """maxsize나 ttl이 올바르지 않으면 ValueError를 발생시켜야 합니다."""
+    with pytest.raises(ValueError):
+        RosterIndex(maxsize=0)
+    with pytest.raises(ValueError):
+        RosterIndex(ttl=0)
+
+
+def test_armory_cache_tracks_sections_per_character():
+    """섹션별로 저장하고, 유효한 섹션만 반환하며 통계를 집계해야 합니다."""
+    cache = ArmoryCache(maxsize=2, ttl=60, ttls={"profiles": 10, "cards": 0})
+    with patch("pyloa.cache.time.monotonic", return_value=100.0):
+        cache.set("a", {"profiles": {"CharacterName": "a"}, "gems": None, "cards": {}})
+        assert cache.get("a", ["profiles", "gems", "cards"]) == {
+            "profiles": {"CharacterName": "a"},
+            "gems": None,
+        }
+    with patch("pyloa.cache.time.monotonic", return_value=111.0):
+        assert cache.get("a", ["profiles", "gems"]) == {"gems": None}
+    assert cache.stats.hits == 3
+    assert cache.stats.misses == 2
+
+    cache.set("b", {"gems": None})
+    cache.get("a", ["gems"])
+    cache.set("c", {"gems": None})
+    assert cache.get("b", ["gems"]) == {}
+    assert cache.stats.evictions == 1
+    assert len(cache) == 2
+
+    cache.delete("a")
+    assert cache.get("a", ["gems"]) == {}
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_armory_cache_invalid_arguments():
+    """maxsize가 올바르지 않거나 알 수 없는 섹션 TTL이 있으면 ValueError여야 합니다."""
+    with pytest.raises(ValueError):
+        ArmoryCache(maxsize=0)
+    with pytest.raises(ValueError):
+        ArmoryCache(ttls={"ArmoryGem": 10})
+
+
+def test_negative_cache_remembers_names_until_ttl():
+    """기본 모드는 이름을 TTL 동안 기억하고, maxsize를 넘으면 오래된 이름부터 지워야 합니다."""
+    cache = NegativeCache(ttl=60, maxsize=2)
+    with patch("pyloa.cache.time.monotonic", return_value=100.0):
+        cache.add("a")
+        cache.add("b")
+        assert "a" in cache
+        assert "없음" not in cache
+    with patch("pyloa.cache.time.monotonic", return_value=160.0):
+        assert "a" not in cache
+        assert len(cache) == 1
+        cache.add("c")
+        cache.add("d")
+    assert cache.stats.evictions == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+    with patch("pyloa.cache.time.monotonic", return_value=161.0):
+        cache.delete("c")
+        assert "c" not in cache and "d" in cache
+        cache.clear()
+        assert len(cache) == 0
+
+
+def test_negative_cache_bloom_mode_rotates_generations():
+    """Bloom 모드는 두 세대를 번갈아 써서 이름을 최대 TTL 동안만 기억해야 합니다."""
+    with patch("pyloa.cache.time.monotonic", return_value=100.0):
+        cache = NegativeCache(ttl=60, maxsize=1000, bloom=True)
+        cache.add("a")
+    with patch("pyloa.cache.time.monotonic", return_value=135.0):
+        assert "a" in cache  # 이전 세대로 넘어갔지만 아직 유효합니다.
+        cache.add("b")
+    with patch("pyloa.cache.time.monotonic", return_value=170.0):
+        assert "a" not in cache
+        assert "b" in cache
+    with patch("pyloa.cache.time.monotonic", return_value=300.0):
+        assert "b" not in cache
+        assert len(cache) == 0
+
+        cache.add("c")
+        cache.delete("c")
+        assert "c" not in cache
+
+
+def test_negative_cache_bloom_mode_is_compact_and_accurate():
+    """Bloom 모드는 이름 길이와 무관한 메모리를 쓰고, 오탐률이 목표 근처여야 합니다."""
+    cache = NegativeCache(ttl=60, maxsize=5000, bloom=True, error_rate=0.01)
+    for i in range(5000):
+        cache.add(f"없는캐릭터{i}")
+    cache.add("넘침")  # 현재 세대가 가득 차면 새 세대를 시작합니다.
+
+    assert all(f"없는캐릭터{i}" in cache for i in range(0, 5000, 7))
+    assert "넘침" in cache
+    false_positives = sum(f"있는캐릭터{i}" in cache for i in range(10000))
+    assert false_positives < 300
+    assert len(cache._current._bits) < 8 * 1024
+
+
+def test_negative_cache_invalid_arguments():
+    """TTL, maxsize, error_rate가 올바르지 않으면 ValueError여야 합니다."""
+    with pytest.raises(ValueError):
+        NegativeCache(ttl=0)
+    with pytest.raises(ValueError):
+        NegativeCache(maxsize=0)
+    with pytest.raises(ValueError):
+        NegativeCache(bloom=True, error_rate=1.0)
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import Mock, patch
 from pyloa.client import LostArkAPI
+from pyloa.cache import RosterIndex
 
 
 def test_client_initialization():
@@ -13,6 +14,26 @@ def test_client_initialization():
     assert api.base_url == "https://developer-lostark.game.onstove.com"
 
 
+def test_client_uses_given_session():
+    """주어진 requests 세션에 인증 헤더를 설정해 사용해야 합니다."""
+    import requests
+
+    session = requests.Session()
+    api = LostArkAPI(api_key="test_jwt_token", session=session)
+
+    assert api.session is session
+    assert session.headers["authorization"] == "bearer test_jwt_token"
+
+
+def test_sync_and_async_clients_share_options():
+    """두 클라이언트의 생성자 옵션은 같아야 합니다."""
+    import inspect
+
+    from pyloa.async_client import AsyncLostArkAPI
+
+    assert inspect.signature(AsyncLostArkAPI) == inspect.signature(LostArkAPI)
+
+
 def test_client_creates_session_with_headers():
     """클라이언트가 적절한 헤더로 세션을 생성해야 합니다."""
     api = LostArkAPI(api_key="test_jwt_token")
@@ -102,3 +123,172 @@ def test_client_provides_armories_endpoint():
     assert isinstance(api.armories, ArmoriesEndpoint)
     # Should return same instance (lazy initialization)
     assert api.armories is api.armories
+
+
+def test_client_creates_default_rate_limiter():
+    """클라이언트는 대기하지 않는 fail_fast 모드의 기본 RateLimiter를 가져야 합니다."""
+    from pyloa.rate_limiter import RateLimiter
+
+    api = LostArkAPI(api_key="test_jwt_token")
+
+    assert isinstance(api.rate_limiter, RateLimiter)
+    assert api.rate_limiter.mode == "fail_fast"
+    assert LostArkAPI(api_key=["key1", "key2"]).key_pool.mode == "fail_fast"
+
+
+def test_default_client_does_not_sleep_when_budget_runs_out():
+    """기본 클라이언트는 한도를 다 쓰면 기다리지 않고 RateLimitError를 발생시켜야 합니다."""
+    from unittest.mock import patch
+
+    from pyloa.exceptions import RateLimitError
+
+    api = LostArkAPI(api_key="test_jwt_token")
+    api.rate_limiter.remaining = 0
+
+    with patch("time.sleep") as sleep, patch.object(api.session, "request") as send:
+        with pytest.raises(RateLimitError):
+            api.news.get_events()
+
+    sleep.assert_not_called()
+    send.assert_not_called()
+
+
+def test_client_accepts_custom_rate_limiter():
+    """클라이언트는 사용자 지정 RateLimiter를 사용해야 합니다."""
+    from pyloa.rate_limiter import RateLimiter
+
+    limiter = RateLimiter(mode="fail_fast")
+    api = LostArkAPI(api_key="test_jwt_token", rate_limiter=limiter)
+
+    assert api.rate_limiter is limiter
+
+
+def test_client_with_multiple_keys_uses_key_pool():
+    """여러 키로 초기화하면 키 풀을 구성해야 합니다."""
+    from pyloa.rate_limiter import KeyPool, RateLimiter
+
+    api = LostArkAPI(
+        api_key=["key1", "key2"], rate_limiter=RateLimiter(mode="wait", max_wait=5)
+    )
+
+    assert api.api_key == "key1"
+    assert api.api_keys == ["key1", "key2"]
+    assert isinstance(api.key_pool, KeyPool)
+    assert api.key_pool.mode == "wait"
+    assert api.key_pool.max_wait == 5
+    assert api.rate_limiter is None
+
+
+def test_client_with_single_key_has_no_pool():
+    """키가 하나면 키 풀 없이 단일 제한기를 사용해야 합니다."""
+    api = LostArkAPI(api_key="key1")
+
+    assert api.key_pool is None
+    assert api.api_keys == ["key1"]
+
+
+def test_client_rejects_empty_key_list():
+    """빈 키 리스트는 ValueError를 발생시켜야 합니다."""
+    with pytest.raises(ValueError):
+        LostArkAPI(api_key=[])
+
+
+def test_client_retries_only_when_opted_in():
+    """재시도는 선택 기능이어야 하고 사용자 정책을 받을 수 있어야 합니다."""
+    from pyloa.retry import RetryPolicy
+
+    assert LostArkAPI(api_key="k").retry_policy is None
+
+    policy = RetryPolicy(max_attempts=5)
+    assert LostArkAPI(api_key="k", retry_policy=policy).retry_policy is policy
+
+
+def test_client_accepts_cache():
+    """클라이언트는 캐시 백엔드를 받을 수 있어야 하고 기본값은 None입니다."""
+    from pyloa.cache import MemoryCache
+
+    assert LostArkAPI(api_key="k").cache is None
+
+    cache = MemoryCache()
+    assert LostArkAPI(api_key="k", cache=cache).cache is cache
+
+
+def test_client_coalesces_by_default():
+    """클라이언트는 기본으로 single-flight를 사용하고 끌 수 있어야 합니다."""
+    from pyloa.singleflight import SingleFlight
+
+    assert isinstance(LostArkAPI(api_key="k").single_flight, SingleFlight)
+    assert LostArkAPI(api_key="k", coalesce=False).single_flight is None
+
+
+def test_client_accepts_conditional_store():
+    """클라이언트는 조건부 GET 저장소를 받을 수 있어야 하고 기본값은 None입니다."""
+    from pyloa.conditional import ConditionalCache
+
+    assert LostArkAPI(api_key="k").conditional is None
+
+    store = ConditionalCache()
+    assert LostArkAPI(api_key="k", conditional=store).conditional is store
+
+
+def test_client_accepts_raw_mode():
+    """클라이언트는 raw 모드를 받을 수 있어야 하고 잘못된 값은 거부해야 합니다."""
+    assert LostArkAPI(api_key="k").raw is False
+    assert LostArkAPI(api_key="k", raw=True).raw is True
+    assert LostArkAPI(api_key="k", raw="bytes").raw == "bytes"
+
+    with pytest.raises(ValueError):
+        LostArkAPI(api_key="k", raw="json")
+
+
+def test_client_serves_alts_from_roster_index():
+    """원정대 캐시가 있으면 같은 원정대의 다른 캐릭터는 요청 없이 조회해야 합니다."""
+    body = (
+        '[{"ServerName": "아만", "CharacterName": "a", "CharacterLevel": 60,'
+        ' "CharacterClassName": "버서커", "ItemAvgLevel": "1600.00"},'
+        ' {"ServerName": "아만", "CharacterName": "b", "CharacterLevel": 60,'
+        ' "CharacterClassName": "바드", "ItemAvgLevel": "1580.00"}]'
+    ).encode("utf-8")
+    api = LostArkAPI(api_key="k", roster_index=RosterIndex())
+    response = Mock(status_code=200, headers={}, content=body)
+    api.session.request = Mock(return_value=response)
+
+    first = api.characters.get_siblings("a")
+    second = api.characters.get_siblings("b")
+
+    assert api.session.request.call_count == 1
+    assert [c.character_name for c in second] == ["a", "b"]
+    assert first == second
+
+
+def test_client_decodes_responses_with_configured_decoder():
+    """클라이언트는 json_decoder로 응답 본문을 디코딩해야 합니다."""
+    decoder = Mock(return_value=[])
+    api = LostArkAPI(api_key="k", json_decoder=decoder)
+    response = Mock(status_code=200, headers={}, content=b"[]")
+    api.session.request = Mock(return_value=response)
+
+    assert api.news.get_events() == []
+    decoder.assert_called_once_with(b"[]")
+    response.json.assert_not_called()
+
+
+def test_default_client_raises_429_immediately():
+    """기본 클라이언트는 429를 기다리거나 재시도하지 않고 바로 RateLimitError로 알려야 합니다."""
+    from requests import HTTPError, Response
+
+    from pyloa.exceptions import RateLimitError
+
+    api = LostArkAPI(api_key="k")
+    response = Mock(spec=Response)
+    response.status_code = 429
+    response.headers = {"Retry-After": "30"}
+    response.text = "Too Many Requests"
+    response.raise_for_status.side_effect = HTTPError()
+    api.session.request = Mock(return_value=response)
+
+    with patch("time.sleep") as sleep, pytest.raises(RateLimitError):
+        api.news.get_events()
+
+    api.session.request.assert_called_once()
+    sleep.assert_not_called()
@@ -0,0 +1,106 @@
+"""ConditionalCache 테스트."""
+
+import pytest
+from pyloa.cache import MISSING
+from pyloa.conditional import ConditionalCache
+
+
+def test_request_headers_empty_without_validators():
+    """저장된 검증자가 없으면 조건부 헤더를 보내지 않아야 합니다."""
+    store = ConditionalCache()
+
+    assert store.request_headers("k") == {}
+    assert store.stats.conditional_requests == 0
+
+
+def test_update_and_request_headers():
+    """ETag와 Last-Modified를 저장하고 조건부 헤더로 돌려줘야 합니다."""
+    store = ConditionalCache()
+    store.update(
+        "k",
+        {"etag": '"abc"', "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"},
+        {"v": 1},
+    )
+
+    assert store.request_headers("k") == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 21 Oct 2026 07:28:00 GMT",
+    }
+    assert store.stats.conditional_requests == 1
+    assert store.stats.updates == 1
+    assert "conditional_requests=1" in repr(store.stats)
+
+
+def test_update_without_validators_discards_entry():
+    """검증자가 없는 응답은 기존 항목을 지워야 합니다."""
+    store = ConditionalCache()
+    store.update("k", {"ETag": '"a"'}, [1])
+    store.update("k", {}, [2])
+
+    assert len(store) == 0
+    assert store.not_modified("k") is MISSING
+
+
+def test_not_modified_returns_stored_data():
+    """304 응답에는 저장된 JSON 객체를 그대로 반환해야 합니다."""
+    store = ConditionalCache()
+    data = [{"Title": "공지"}]
+    store.update("k", {"ETag": '"a"'}, data)
+
+    assert store.not_modified("k") is data
+    assert store.stats.not_modified == 1
+
+
+def test_model_is_reused_for_same_data():
+    """같은 JSON 객체에 대해서는 모델을 한 번만 만들어야 합니다."""
+    store = ConditionalCache()
+    data = {"v": 1}
+    store.update("k", {"ETag": '"a"'}, data)
+    builds = []
+
+    def build(d):
+        builds.append(d)
+        return object()
+
+    first = store.model(data, "M", build)
+    second = store.model(data, "M", build)
+
+    assert first is second
+    assert len(builds) == 1
+    assert store.stats.model_reuses == 1
+    assert store.model({"v": 1}, "M", build) is not first
+
+
+def test_model_not_reused_after_update():
+    """새 응답으로 바뀌면 이전 모델을 재사용하지 않아야 합니다."""
+    store = ConditionalCache()
+    old = {"v": 1}
+    store.update("k", {"ETag": '"a"'}, old)
+    store.model(old, "M", lambda d: "old-model")
+    store.update("k", {"ETag": '"b"'}, {"v": 2})
+
+    assert store.model(old, "M", lambda d: "rebuilt") == "rebuilt"
+
+
+def test_evicts_least_recently_used():
+    """maxsize를 넘으면 가장 오래 사용하지 않은 URL부터 제거해야 합니다."""
+    store = ConditionalCache(maxsize=2)
+    store.update("a", {"ETag": '"a"'}, 1)
+    store.update("b", {"ETag": '"b"'}, 2)
+    store.request_headers("a")
+    store.update("c", {"ETag": '"c"'}, 3)
+
+    assert store.request_headers("b") == {}
+    assert store.request_headers("a") == {"If-None-Match": '"a"'}
+    assert len(store) == 2
+
+
+def test_clear_and_invalid_maxsize():
+    """clear는 항목을 모두 지우고, maxsize가 1보다 작으면 ValueError여야 합니다."""
+    store = ConditionalCache()
+    store.update("k", {"ETag": '"a"'}, 1)
+    store.clear()
+
+    assert len(store) == 0
+    with pytest.raises(ValueError):
+        ConditionalCache(maxsize=0)
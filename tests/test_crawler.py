@@ -0,0 +1,292 @@
+"""원정대 크롤러 테스트."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from pyloa.crawler import AsyncRosterCrawler, CrawlStats, RosterCrawler
+from pyloa.exceptions import APIError
+from pyloa.models.character import CharacterInfo
+
+ROSTERS = {
+    "A": ["a1", "a2", "a3"],
+    "B": ["b1", "b2"],
+    "C": ["c1"],
+}
+ACCOUNT = {name: account for account, names in ROSTERS.items() for name in names}
+
+
+class FakeWorld:
+    """원정대 조회와 Armory 조회 호출을 기록하는 가짜 API."""
+
+    def __init__(self, broken=()):
+        self.broken = set(broken)
+        self.sibling_calls = []
+        self.fetch_calls = []
+        self.lock = threading.Lock()
+
+    def siblings(self, name):
+        with self.lock:
+            self.sibling_calls.append(name)
+        if name not in ACCOUNT:
+            raise APIError("API error (404): not found")
+        return [
+            CharacterInfo("아만", member, 60, "버서커", "1600.00")
+            for member in ROSTERS[ACCOUNT[name]]
+        ]
+
+    def fetch(self, name):
+        with self.lock:
+            self.fetch_calls.append(name)
+        if name in self.broken:
+            raise APIError("API error (500): broken")
+        return f"armory:{name}"
+
+    async def asiblings(self, name):
+        await asyncio.sleep(0)
+        return self.siblings(name)
+
+    async def afetch(self, name):
+        await asyncio.sleep(0)
+        return self.fetch(name)
+
+
+def expand_links(links):
+    return lambda name, value: links.get(name, [])
+
+
+def test_crawler_queries_each_roster_once():
+    """같은 원정대의 이름은 get_siblings를 다시 호출하지 않아야 합니다."""
+    world = FakeWorld()
+    crawler = RosterCrawler(
+        world.siblings, world.fetch, ["a1", "a2", "a1"], max_workers=1
+    )
+
+    results = list(crawler)
+
+    assert world.sibling_calls == ["a1"]
+    assert sorted(r.key for r in results) == ["a1", "a2", "a3"]
+    assert {r.value for r in results} == {"armory:a1", "armory:a2", "armory:a3"}
+    assert sorted(world.fetch_calls) == ["a1", "a2", "a3"]
+    assert crawler.stats.rosters == 1
+    assert crawler.stats.skipped == 2
+    assert crawler.stats.succeeded == 3
+    assert crawler.stats.requests == 4
+
+
+def test_crawler_expands_breadth_first_with_dedup():
+    """expand가 찾은 이름의 원정대를 이어서 탐색하되, 본 이름은 건너뛰어야 합니다."""
+    world = FakeWorld()
+    links = {"a1": ["b2", "a3"], "b1": ["c1", "a2"]}
+    crawler = RosterCrawler(
+        world.siblings, world.fetch, ["a1"], expand=expand_links(links)
+    )
+
+    keys = [r.key for r in crawler]
+
+    assert world.sibling_calls == ["a1", "b2", "c1"]
+    assert sorted(keys) == ["a1", "a2", "a3", "b1", "b2", "c1"]
+    assert len(world.fetch_calls) == 6
+
+
+def test_crawler_reports_roster_and_character_failures():
+    """원정대/캐릭터 조회 실패는 중단하지 않고 실패 결과로 돌려줘야 합니다."""
+    world = FakeWorld(broken={"b2"})
+    crawler = RosterCrawler(world.siblings, world.fetch, ["없는캐릭터", "b1"])
+
+    results = {r.key: r for r in crawler}
+
+    assert not results["없는캐릭터"].ok
+    assert not results["b2"].ok
+    assert results["b1"].value == "armory:b1"
+    assert sorted(crawler.failed) == ["b2", "없는캐릭터"]
+    assert crawler.stats.failed == 2
+
+
+def test_crawler_accepts_raw_rosters():
+    """raw 모드의 원정대 목록(dict)도 처리해야 합니다."""
+    crawler = RosterCrawler(
+        lambda name: [{"CharacterName": "a1"}, {"CharacterName": "a2"}], str, ["a1"]
+    )
+
+    assert sorted(r.key for r in crawler) == ["a1", "a2"]
+
+
+def test_crawler_bounds_concurrency():
+    """동시에 실행하는 요청 수는 max_workers를 넘지 않아야 합니다."""
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+    world = FakeWorld()
+
+    def fetch(name):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        threading.Event().wait(0.005)
+        with lock:
+            running[0] -= 1
+        return name
+
+    links = {"a1": ["b1", "c1"]}
+    crawler = RosterCrawler(
+        world.siblings, fetch, ["a1"], expand=expand_links(links), max_workers=2
+    )
+
+    assert len(list(crawler)) == 6
+    assert 1 <= peak[0] <= 2
+
+
+def test_crawler_resumes_from_checkpoint(tmp_path):
+    """중간에 멈춘 뒤 같은 체크포인트로 다시 만들면 남은 캐릭터만 조회해야 합니다."""
+    path = str(tmp_path / "crawl.json")
+    links = {"a1": ["b1"], "b1": ["c1"]}
+    world = FakeWorld()
+    first = RosterCrawler(
+        world.siblings,
+        world.fetch,
+        ["a1"],
+        checkpoint=path,
+        expand=expand_links(links),
+        max_workers=1,
+        checkpoint_every=1,
+    )
+    delivered = [next(first).key, next(first).key]
+    first.close()
+
+    with open(path, encoding="utf-8") as f:
+        saved = json.load(f)
+    assert set(saved["claimed"]) >= set(delivered)
+
+    world = FakeWorld()
+    second = RosterCrawler(
+        world.siblings,
+        world.fetch,
+        ["a1"],
+        checkpoint=path,
+        expand=expand_links(links),
+        max_workers=1,
+    )
+    rest = [r.key for r in second]
+
+    # 닫을 때 처리 중이던 마지막 결과는 다시 돌려줍니다.
+    assert rest[0] == delivered[-1]
+    assert sorted(delivered[:-1] + rest) == ["a1", "a2", "a3", "b1", "b2", "c1"]
+    assert "a1" not in world.sibling_calls
+    assert set(world.fetch_calls) & set(delivered) == {delivered[-1]}
+    assert list(RosterCrawler(world.siblings, world.fetch, checkpoint=path)) == []
+
+
+def test_crawler_redelivers_result_after_kill(tmp_path):
+    """결과를 돌려준 직후 종료되면 재개할 때 그 결과를 다시 돌려줘야 합니다."""
+    path = tmp_path / "crawl.json"
+    killed = tmp_path / "killed.json"
+    world = FakeWorld()
+    crawler = RosterCrawler(
+        world.siblings,
+        world.fetch,
+        ["a1"],
+        checkpoint=str(path),
+        max_workers=1,
+        checkpoint_every=1,
+    )
+    first = next(crawler).key
+    # 프로세스가 여기서 종료되었다면 남는 체크포인트
+    killed.write_text(path.read_text(encoding="utf-8"), encoding="utf-8")
+    crawler.close()
+
+    resumed = RosterCrawler(world.siblings, world.fetch, checkpoint=str(killed))
+
+    assert first in [r.key for r in resumed]
+
+
+def test_crawler_retries_failed_on_resume(tmp_path):
+    """retry_failed=True로 재개하면 실패했던 원정대와 캐릭터를 다시 조회해야 합니다."""
+    path = str(tmp_path / "crawl.json")
+    first = RosterCrawler(
+        FakeWorld().siblings,
+        FakeWorld(broken={"b2"}).fetch,
+        ["없는캐릭터", "b1"],
+        checkpoint=path,
+    )
+    list(first)
+    assert sorted(first.failed) == ["b2", "없는캐릭터"]
+
+    world = FakeWorld()
+    kept = RosterCrawler(world.siblings, world.fetch, checkpoint=path)
+    assert list(kept) == []
+    assert sorted(kept.failed) == ["b2", "없는캐릭터"]
+
+    retried = RosterCrawler(
+        world.siblings, world.fetch, checkpoint=path, retry_failed=True
+    )
+    results = list(retried)
+
+    assert world.sibling_calls == ["없는캐릭터"]
+    assert [r.key for r in results if r.ok] == ["b2"]
+    assert retried.failed == ["없는캐릭터"]
+
+
+def test_crawler_rejects_invalid_arguments(tmp_path):
+    """잘못된 인자나 체크포인트는 ValueError를 발생시켜야 합니다."""
+    world = FakeWorld()
+    with pytest.raises(ValueError):
+        RosterCrawler(world.siblings, world.fetch, max_workers=0)
+    with pytest.raises(ValueError):
+        RosterCrawler(world.siblings, world.fetch, checkpoint_every=0)
+    with pytest.raises(ValueError):
+        AsyncRosterCrawler(world.asiblings, world.afetch, max_workers=0)
+    with pytest.raises(ValueError):
+        AsyncRosterCrawler(world.asiblings, world.afetch, checkpoint_every=0)
+
+    path = tmp_path / "crawl.json"
+    path.write_text(json.dumps({"version": 99}))
+    with pytest.raises(ValueError):
+        RosterCrawler(world.siblings, world.fetch, checkpoint=str(path))
+
+
+def test_crawl_stats_repr():
+    """통계는 크롤링 속도를 함께 보여줘야 합니다."""
+    stats = CrawlStats()
+
+    assert stats.request_rate == 0.0
+    assert "request_rate" in repr(stats)
+
+
+def test_async_crawler_crawls_and_resumes(tmp_path):
+    """비동기 크롤러도 원정대를 한 번만 조회하고 체크포인트에서 이어가야 합니다."""
+    path = str(tmp_path / "crawl.json")
+    links = {"a1": ["b1", "a2"]}
+    world = FakeWorld(broken={"b2"})
+
+    async def main():
+        first = AsyncRosterCrawler(
+            world.asiblings,
+            world.afetch,
+            ["a1"],
+            checkpoint=path,
+            expand=expand_links(links),
+            max_workers=1,
+            checkpoint_every=1,
+        )
+        delivered = [(await first.__anext__()).key]
+        await first.aclose()
+        second = AsyncRosterCrawler(
+            world.asiblings,
+            world.afetch,
+            checkpoint=path,
+            expand=expand_links(links),
+            max_workers=2,
+        )
+        rest = [r async for r in second]
+        return delivered, rest, second
+
+    delivered, rest, second = asyncio.run(main())
+
+    keys = [r.key for r in rest]
+    assert delivered[0] in keys
+    assert sorted(keys) == ["a1", "a2", "a3", "b1", "b2"]
+    assert world.sibling_calls == ["a1", "b1"]
+    assert second.failed == ["b2"]
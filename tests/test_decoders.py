@@ -0,0 +1,61 @@
+"""JSON 디코더 선택 테스트."""
+
+import builtins
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pyloa.decoders import get_decoder
+
+
+def block_imports(*names):
+    """지정한 모듈의 import가 실패하도록 패치합니다."""
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name.split(".")[0] in names:
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    return patch.object(builtins, "__import__", fake_import)
+
+
+def test_get_decoder_prefers_orjson_when_installed():
+    """자동 선택은 설치된 orjson을 우선 사용해야 합니다."""
+    orjson = pytest.importorskip("orjson")
+
+    assert get_decoder() is orjson.loads
+
+
+def test_get_decoder_falls_back_to_stdlib():
+    """고속 라이브러리가 없으면 표준 json을 사용해야 합니다."""
+    with block_imports("orjson", "msgspec", "ujson"):
+        decoder = get_decoder()
+
+    assert decoder is json.loads
+    assert decoder('{"a": [1, "한글"]}'.encode("utf-8")) == {"a": [1, "한글"]}
+
+
+def test_get_decoder_accepts_name_and_callable():
+    """이름이나 함수를 직접 지정할 수 있어야 합니다."""
+    custom = Mock()
+
+    assert get_decoder("json") is json.loads
+    assert get_decoder(custom) is custom
+
+
+def test_get_decoder_rejects_unknown_or_missing_decoder():
+    """알 수 없는 이름은 ValueError, 설치되지 않은 라이브러리는 ImportError여야 합니다."""
+    with pytest.raises(ValueError):
+        get_decoder("simplejson")
+    with block_imports("ujson"), pytest.raises(ImportError):
+        get_decoder("ujson")
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec", "ujson"])
+def test_optional_decoders_decode_bytes(name):
+    """설치된 고속 디코더는 bytes 본문을 디코딩해야 합니다."""
+    pytest.importorskip(name)
+
+    assert get_decoder(name)(b'{"Name": "\xec\x95\x84"}') == {"Name": "아"}
@@ -0,0 +1,109 @@
+"""시세 이력 저장소 테스트."""
+
+import datetime
+
+import pytest
+
+from pyloa.history import PriceHistoryStore
+from pyloa.models.market import MarketItemStats, MarketStatsInfo
+
+
+def stats(*rows):
+    return [MarketStatsInfo(date=d, avg_price=p, trade_count=c) for d, p, c in rows]
+
+
+def test_append_deduplicates_by_date_and_keeps_latest(tmp_path):
+    """같은 날짜는 한 행만 유지하고 최신 값으로 갱신해야 합니다."""
+    store = PriceHistoryStore(str(tmp_path))
+
+    assert store.append(1, stats(("2024-01-02", 10, 5), ("2024-01-01", 9, 3))) == 2
+    assert store.append(1, stats(("2024-01-02", 11, 7), ("2024-01-03", 12, 1))) == 1
+    assert store.append(1, stats(("2024-01-03", 12, 1))) == 0
+    assert store.append(1, []) == 0
+
+    series = store.query(1)
+    assert series.dates == [
+        datetime.date(2024, 1, 1),
+        datetime.date(2024, 1, 2),
+        datetime.date(2024, 1, 3),
+    ]
+    assert list(series.avg_prices) == [9, 11, 12]
+    assert list(series.trade_counts) == [3, 7, 1]
+
+
+def test_append_backfills_older_dates_in_order(tmp_path):
+    """이전 날짜를 나중에 추가해도 날짜 순서를 유지해야 합니다."""
+    store = PriceHistoryStore(str(tmp_path))
+    store.append(1, stats(("2024-01-05", 5, 1)))
+    store.append(1, stats(("2024-01-01", 1, 1), ("2024-01-10", 10, 1)))
+
+    assert [r.date for r in store.query(1).rows()] == [
+        "2024-01-01",
+        "2024-01-05",
+        "2024-01-10",
+    ]
+
+
+def test_query_filters_by_date_range(tmp_path):
+    """기간 조회는 start와 end를 포함해야 합니다."""
+    store = PriceHistoryStore(str(tmp_path))
+    store.append(1, stats(*[(f"2024-01-{d:02d}", d, 1) for d in range(1, 31)]))
+
+    series = store.query(1, start="2024-01-10", end=datetime.date(2024, 1, 12))
+
+    assert list(series.avg_prices) == [10, 11, 12]
+    assert len(store.query(2)) == 0
+
+
+def test_resample_weights_by_trade_count(tmp_path):
+    """다운샘플링은 거래량 가중 평균가와 거래량 합계를 계산해야 합니다."""
+    store = PriceHistoryStore(str(tmp_path))
+    # 1970-01-01 기준 일 수가 7의 배수인 2024-01-04(19726)부터 한 주입니다.
+    store.append(
+        1,
+        stats(
+            ("2024-01-04", 100, 1),
+            ("2024-01-05", 200, 3),
+            ("2024-01-11", 50, 0),
+            ("2024-01-12", 70, 0),
+        ),
+    )
+
+    weekly = store.query(1).resample(7)
+
+    assert weekly.dates == [datetime.date(2024, 1, 4), datetime.date(2024, 1, 11)]
+    assert list(weekly.avg_prices) == [175, 60]
+    assert list(weekly.trade_counts) == [4, 0]
+    with pytest.raises(ValueError):
+        weekly.resample(0)
+
+
+def test_record_stores_get_item_results_per_variant(tmp_path):
+    """get_item 결과를 거래 가능 횟수별로 나누어 저장해야 합니다."""
+    store = PriceHistoryStore(str(tmp_path))
+    entries = [
+        MarketItemStats(name="a", bundle_count=1, stats=stats(("2024-01-01", 1, 1))),
+        {
+            "Name": "a",
+            "BundleCount": 1,
+            "TradeRemainCount": 2,
+            "Stats": [{"Date": "2024-01-01", "AvgPrice": 3.5, "TradeCount": 4}],
+        },
+    ]
+
+    assert store.record(7, entries) == 2
+    assert store.items() == [(7, None), (7, 2)]
+    assert list(store.query(7, trade_remain_count=2).avg_prices) == [3.5]
+
+
+def test_store_persists_and_rejects_foreign_files(tmp_path):
+    """다시 연 저장소에서도 이력을 읽고, 다른 형식의 파일은 거부해야 합니다."""
+    PriceHistoryStore(str(tmp_path)).append(1, stats(("2024-01-01", 1, 1)))
+
+    assert len(PriceHistoryStore(str(tmp_path)).query(1)) == 1
+
+    (tmp_path / "2.col").write_bytes(b"NOTPYLOA" + b"\0" * 4)
+    (tmp_path / "notes.txt").write_text("x")
+    assert PriceHistoryStore(str(tmp_path)).items() == [(1, None), (2, None)]
+    with pytest.raises(ValueError):
+        PriceHistoryStore(str(tmp_path)).query(2)
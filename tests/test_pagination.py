@@ -0,0 +1,205 @@
+"""페이지 자동 순회 테스트."""
+
+import asyncio
+import threading
+
+import pytest
+
+from pyloa.models.market import Market, MarketItem
+from pyloa.pagination import aiter_items, aiter_pages, iter_items, iter_pages
+
+
+def make_page(page_no, total_count=25, page_size=10):
+    start = (page_no - 1) * page_size
+    count = max(0, min(page_size, total_count - start))
+    items = [
+        MarketItem(id=start + i, name="", grade="", icon="", bundle_count=1)
+        for i in range(count)
+    ]
+    return Market(
+        page_no=page_no, page_size=page_size, total_count=total_count, items=items
+    )
+
+
+def test_iter_items_streams_all_pages_in_order():
+    """모든 페이지의 아이템을 페이지 순서대로 반환해야 합니다."""
+    requested = []
+
+    def fetch(page_no):
+        requested.append(page_no)
+        return make_page(page_no)
+
+    ids = [item.id for item in iter_items(fetch)]
+
+    assert ids == list(range(25))
+    assert sorted(requested) == [1, 2, 3]
+
+
+def test_iter_pages_fetches_remaining_pages_concurrently():
+    """첫 페이지 이후의 페이지는 prefetch 수만큼 동시에 요청해야 합니다."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fetch(page_no):
+        if page_no > 1:
+            # 페이지 2-4가 동시에 요청되지 않으면 BrokenBarrierError가 발생합니다.
+            barrier.wait()
+        return make_page(page_no, total_count=40)
+
+    pages = list(iter_pages(fetch, prefetch=3))
+
+    assert [p.page_no for p in pages] == [1, 2, 3, 4]
+
+
+def test_iter_items_stops_fetching_when_consumer_breaks():
+    """반복을 멈추면 시작하지 않은 페이지는 요청하지 않아야 합니다."""
+    requested = []
+
+    def fetch(page_no):
+        requested.append(page_no)
+        return make_page(page_no, total_count=1000)
+
+    items = iter_items(fetch, prefetch=2)
+    for item in items:
+        if item.id == 12:
+            break
+    items.close()
+
+    assert max(requested) <= 4
+
+
+def test_iter_pages_starts_from_given_page_and_handles_raw_dicts():
+    """시작 페이지를 지정할 수 있고 raw 모드의 dict 페이지도 처리해야 합니다."""
+
+    def fetch(page_no):
+        return {
+            "PageNo": page_no,
+            "PageSize": 10,
+            "TotalCount": 30,
+            "Items": [{"Id": page_no}],
+        }
+
+    assert [p["PageNo"] for p in iter_pages(fetch, start=2)] == [2, 3]
+
+
+def test_iter_pages_single_or_empty_result():
+    """결과가 한 페이지 이하이면 추가 요청을 보내지 않아야 합니다."""
+    requested = []
+
+    def fetch(page_no):
+        requested.append(page_no)
+        return make_page(page_no, total_count=total_count)
+
+    for total_count in (0, 5):
+        assert len(list(iter_pages(fetch))) == 1
+    assert requested == [1, 1]
+
+
+def test_iter_pages_stops_on_empty_page():
+    """순회 도중 빈 페이지를 받으면 멈춰야 합니다."""
+
+    def fetch(page_no):
+        return make_page(page_no, total_count=50 if page_no == 1 else 10)
+
+    assert [p.page_no for p in iter_pages(fetch, prefetch=1)] == [1, 2]
+
+
+def test_iter_pages_rejects_invalid_prefetch():
+    """prefetch가 1보다 작으면 ValueError를 발생시켜야 합니다."""
+    with pytest.raises(ValueError):
+        iter_pages(make_page, prefetch=0)
+    with pytest.raises(ValueError):
+        aiter_pages(make_page, prefetch=0)
+
+
+def test_aiter_items_streams_all_pages_in_order():
+    """비동기 버전도 모든 아이템을 페이지 순서대로 반환해야 합니다."""
+
+    async def fetch(page_no):
+        await asyncio.sleep(0.01 if page_no == 2 else 0)
+        return make_page(page_no)
+
+    async def main():
+        return [item.id async for item in aiter_items(fetch)]
+
+    assert asyncio.run(main()) == list(range(25))
+
+
+def test_aiter_items_cancels_pending_pages_on_close():
+    """비동기 버전은 aclose 시 미리 요청한 페이지를 취소해야 합니다."""
+    cancelled = []
+
+    async def fetch(page_no):
+        if page_no > 2:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(page_no)
+                raise
+        return make_page(page_no, total_count=100)
+
+    async def main():
+        items = aiter_items(fetch, prefetch=3)
+        async for item in items:
+            if item.id == 10:
+                break
+        await items.aclose()
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+
+    assert cancelled == [3, 4]
+
+
+def test_aiter_pages_stops_on_empty_page():
+    """비동기 버전도 빈 페이지를 받으면 멈춰야 합니다."""
+
+    async def fetch(page_no):
+        if page_no == 3:
+            raise RuntimeError("not consumed")
+        return make_page(page_no, total_count=50 if page_no == 1 else 10)
+
+    async def main():
+        return [p.page_no async for p in aiter_pages(fetch, prefetch=2)]
+
+    assert asyncio.run(main()) == [1, 2]
+
+
+def test_iter_items_respects_max_items_and_max_pages():
+    """max_items와 max_pages를 넘는 페이지는 요청하지 않아야 합니다."""
+    requested = []
+
+    def fetch(page_no):
+        requested.append(page_no)
+        return make_page(page_no, total_count=1000)
+
+    ids = [item.id for item in iter_items(fetch, max_items=15)]
+    assert ids == list(range(15))
+    assert sorted(requested) == [1, 2]
+
+    requested.clear()
+    pages = list(iter_pages(fetch, start=3, max_pages=2))
+    assert [p.page_no for p in pages] == [3, 4]
+    assert sorted(requested) == [3, 4]
+
+
+def test_iter_items_rejects_invalid_limits():
+    """max_pages와 max_items는 1 이상이어야 합니다."""
+    with pytest.raises(ValueError):
+        iter_items(make_page, max_pages=0)
+    with pytest.raises(ValueError):
+        aiter_items(make_page, max_items=0)
+
+
+def test_aiter_items_respects_max_items():
+    """비동기 버전도 max_items만큼만 반환해야 합니다."""
+    requested = []
+
+    async def fetch(page_no):
+        requested.append(page_no)
+        return make_page(page_no, total_count=1000)
+
+    async def main():
+        return [item.id async for item in aiter_items(fetch, max_items=10)]
+
+    assert asyncio.run(main()) == list(range(10))
+    assert requested == [1]
@@ -0,0 +1,306 @@
+"""RateLimiter 테스트."""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+from pyloa.rate_limiter import KeyPool, RateLimiter, get_header
+from pyloa.exceptions import RateLimitError
+
+
+def test_get_header_case_insensitive():
+    """get_header는 대소문자와 무관하게 헤더를 찾아야 합니다."""
+    headers = {"x-ratelimit-remaining": "10"}
+
+    assert get_header(headers, "X-RateLimit-Remaining") == "10"
+    assert get_header(headers, "X-RateLimit-Limit") is None
+    assert get_header(None, "X-RateLimit-Limit") is None
+
+
+def test_initial_state_does_not_wait():
+    """헤더를 받기 전에는 대기하지 않아야 합니다."""
+    limiter = RateLimiter()
+
+    assert limiter.limit == 100
+    assert limiter.remaining is None
+    assert limiter.reset_time is None
+    assert limiter.get_wait_duration() == 0.0
+    assert limiter.acquire() == 0.0
+
+
+def test_invalid_mode():
+    """알 수 없는 mode는 ValueError를 발생시켜야 합니다."""
+    with pytest.raises(ValueError):
+        RateLimiter(mode="unknown")
+
+
+def test_update_from_headers():
+    """update는 X-RateLimit-* 헤더를 반영해야 합니다."""
+    limiter = RateLimiter()
+    limiter.update(
+        {
+            "X-RateLimit-Limit": "100",
+            "X-RateLimit-Remaining": "42",
+            "X-RateLimit-Reset": "2000000000",
+        }
+    )
+
+    assert limiter.limit == 100
+    assert limiter.remaining == 42
+    assert int(limiter.reset_time.timestamp()) == 2000000000
+
+
+def test_update_ignores_invalid_values():
+    """update는 숫자가 아닌 헤더 값을 무시해야 합니다."""
+    limiter = RateLimiter()
+    limiter.update({"X-RateLimit-Remaining": "abc"})
+
+    assert limiter.remaining is None
+
+
+def test_acquire_decrements_remaining():
+    """acquire는 남은 요청 수를 미리 차감해야 합니다."""
+    limiter = RateLimiter()
+    limiter.update({"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": "2000000000"})
+
+    with patch("pyloa.rate_limiter.time.time", return_value=1000.0):
+        limiter.acquire()
+
+    assert limiter.remaining == 1
+
+
+def test_wait_duration_until_reset():
+    """남은 요청이 없으면 초기화 시각까지 기다려야 합니다."""
+    limiter = RateLimiter()
+    limiter.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"})
+
+    with patch("pyloa.rate_limiter.time.time", return_value=1000.0):
+        assert limiter.get_wait_duration() == pytest.approx(30.0)
+
+
+def test_window_elapsed_resets_state():
+    """초기화 시각이 지나면 새 윈도우의 한도(limit)부터 다시 세야 합니다."""
+    limiter = RateLimiter()
+    limiter.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1000"})
+
+    with patch("pyloa.rate_limiter.time.time", return_value=1001.0):
+        assert limiter.get_wait_duration() == 0.0
+
+    assert limiter.remaining == 100
+    assert limiter.reset_time is None
+
+
+def test_fresh_limiter_counts_before_first_response():
+    """헤더를 받기 전에도 limit을 넘는 예약은 기다려야 합니다."""
+    limiter = RateLimiter(limit=3, mode="fail_fast", window=60.0)
+
+    with patch("pyloa.rate_limiter.time.time", return_value=1000.0):
+        assert [limiter.try_acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.try_acquire() == pytest.approx(60.0)
+        with pytest.raises(RateLimitError):
+            limiter.acquire()
+
+
+def test_window_reset_counts_new_window():
+    """윈도우가 초기화된 직후에도 limit을 넘는 예약은 기다려야 합니다."""
+    limiter = RateLimiter(limit=2)
+    limiter.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1000"})
+
+    with patch("pyloa.rate_limiter.time.time", return_value=1001.0):
+        assert limiter.try_acquire() == 0.0
+        assert limiter.try_acquire() == 0.0
+        assert limiter.try_acquire() > 0
+
+
+def test_update_keeps_in_flight_reservations():
+    """같은 윈도우의 헤더는 로컬 값보다 작을 때만, 새 윈도우의 헤더는 그대로 반영해야 합니다."""
+    limiter = RateLimiter(limit=10)
+    with patch("pyloa.rate_limiter.time.time", return_value=1000.0):
+        for _ in range(5):
+            limiter.acquire()
+    # 첫 응답은 다른 4개의 요청이 처리되기 전의 값을 알려줍니다.
+    limiter.update({"X-RateLimit-Remaining": "9", "X-RateLimit-Reset": "1060"})
+    assert limiter.remaining == 5
+    limiter.update({"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "1060"})
+    assert limiter.remaining == 3
+
+    limiter.update({"X-RateLimit-Remaining": "8", "X-RateLimit-Reset": "1120"})
+    assert limiter.remaining == 8
+    # 지난 윈도우의 늦은 응답은 무시합니다.
+    limiter.update({"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "1060"})
+    assert limiter.remaining == 8
+    assert int(limiter.reset_time.timestamp()) == 1120
+
+
+def test_exhausted_without_reset_waits_one_window():
+    """초기화 시각을 모르면 한 윈도우를 기다려야 합니다."""
+    limiter = RateLimiter(window=60.0)
+    limiter.update({"X-RateLimit-Remaining": "0"})
+
+    with patch("pyloa.rate_limiter.time.time", return_value=1000.0):
+        assert limiter.get_wait_duration() == 60.0
+
+
+def test_block_mode_sleeps_until_reset():
+    """block 모드는 초기화 시각까지 대기한 뒤 슬롯을 예약해야 합니다."""
+    limiter = RateLimiter(mode="block")
+    limiter.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1010"})
+    clock = [1000.0]
+
+    def fake_sleep(seconds):
+        clock[0] += seconds
+
+    with patch("pyloa.rate_limiter.time.time", side_effect=lambda: clock[0]), patch(
+        "pyloa.rate_limiter.time.sleep", side_effect=fake_sleep
+    ) as sleep:
+        waited = limiter.acquire()
+
+    sleep.assert_called_once_with(pytest.approx(10.0))
+    assert waited == pytest.approx(10.0)
+
+
+def test_fail_fast_mode_raises():
+    """fail_fast 모드는 대기 없이 RateLimitError를 발생시켜야 합니다."""
+    limiter = RateLimiter(mode="fail_fast")
+    limiter.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1010"})
+
+    with patch("pyloa.rate_limiter.time.time", return_value=1000.0):
+        with pytest.raises(RateLimitError):
+            limiter.acquire()
+
+
+def test_wait_mode_respects_max_wait():
+    """wait 모드는 max_wait를 초과하는 대기에 대해 RateLimitError를 발생시켜야 합니다."""
+    limiter = RateLimiter(mode="wait", max_wait=5.0)
+    limiter.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1010"})
+
+    with patch("pyloa.rate_limiter.time.time", return_value=1000.0):
+        with pytest.raises(RateLimitError):
+            limiter.acquire()
+
+
+def test_status_429_exhausts_and_uses_retry_after():
+    """429 응답은 남은 요청을 0으로 만들고 Retry-After를 반영해야 합니다."""
+    limiter = RateLimiter()
+
+    with patch("pyloa.rate_limiter.time.time", return_value=1000.0):
+        limiter.update({"Retry-After": "15"}, status_code=429)
+        assert limiter.remaining == 0
+        assert limiter.get_wait_duration() == pytest.approx(15.0)
+
+
+def test_acquire_async_waits_without_blocking():
+    """acquire_async는 asyncio.sleep으로 대기해야 합니다."""
+    limiter = RateLimiter()
+    limiter.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1005"})
+    clock = [1000.0]
+
+    async def fake_sleep(seconds):
+        clock[0] += seconds
+
+    with patch("pyloa.rate_limiter.time.time", side_effect=lambda: clock[0]), patch(
+        "pyloa.rate_limiter.asyncio.sleep", side_effect=fake_sleep
+    ):
+        waited = asyncio.run(limiter.acquire_async())
+
+    assert waited == pytest.approx(5.0)
+
+
+def test_headroom():
+    """headroom은 남은 요청 수를, 모르면 limit을 반환해야 합니다."""
+    limiter = RateLimiter(limit=100)
+    assert limiter.headroom() == 100
+
+    limiter.update({"X-RateLimit-Remaining": "7", "X-RateLimit-Reset": "2000000000"})
+    with patch("pyloa.rate_limiter.time.time", return_value=1000.0):
+        assert limiter.headroom() == 7
+
+    limiter.update({"X-RateLimit-Remaining": "0"})
+    with patch("pyloa.rate_limiter.time.time", return_value=1000.0):
+        assert limiter.headroom() == 0
+
+
+def test_key_pool_requires_keys():
+    """KeyPool은 최소 하나의 키와 올바른 mode가 필요합니다."""
+    with pytest.raises(ValueError):
+        KeyPool([])
+    with pytest.raises(ValueError):
+        KeyPool(["a"], mode="unknown")
+
+
+def test_key_pool_deduplicates_keys():
+    """KeyPool은 중복 키를 제거하고 순서를 유지해야 합니다."""
+    pool = KeyPool(["a", "b", "a"])
+
+    assert pool.keys == ["a", "b"]
+    assert len(pool) == 2
+
+
+def test_key_pool_routes_to_most_headroom():
+    """KeyPool은 남은 요청 수가 가장 많은 키를 골라야 합니다."""
+    pool = KeyPool(["a", "b", "c"])
+    pool.update("a", {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "2000000000"})
+    pool.update("b", {"X-RateLimit-Remaining": "50", "X-RateLimit-Reset": "2000000000"})
+    pool.update("c", {"X-RateLimit-Remaining": "20", "X-RateLimit-Reset": "2000000000"})
+
+    with patch("pyloa.rate_limiter.time.time", return_value=1000.0):
+        assert pool.acquire() == "b"
+
+    assert pool.limiter("b").remaining == 49
+
+
+def test_key_pool_skips_exhausted_keys():
+    """KeyPool은 소진된 키를 건너뛰어야 합니다."""
+    pool = KeyPool(["a", "b"])
+    pool.update("a", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"})
+    pool.update("b", {"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "1030"})
+
+    with patch("pyloa.rate_limiter.time.time", return_value=1000.0):
+        assert pool.acquire() == "b"
+        key, wait = pool.try_acquire()
+
+    assert key is None
+    assert wait == pytest.approx(30.0)
+
+
+def test_key_pool_blocks_until_earliest_reset():
+    """모든 키가 소진되면 가장 먼저 초기화되는 키까지 대기해야 합니다."""
+    pool = KeyPool(["a", "b"])
+    pool.update("a", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"})
+    pool.update("b", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1010"})
+    clock = [1000.0]
+
+    def fake_sleep(seconds):
+        clock[0] += seconds
+
+    with patch("pyloa.rate_limiter.time.time", side_effect=lambda: clock[0]), patch(
+        "pyloa.rate_limiter.time.sleep", side_effect=fake_sleep
+    ):
+        assert pool.acquire() == "b"
+
+    assert clock[0] == pytest.approx(1010.0)
+
+
+def test_key_pool_fail_fast():
+    """fail_fast 모드의 KeyPool은 모든 키가 소진되면 즉시 실패해야 합니다."""
+    pool = KeyPool(["a", "b"], mode="fail_fast")
+    pool.update("a", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"})
+    pool.update("b", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"})
+
+    with patch("pyloa.rate_limiter.time.time", return_value=1000.0):
+        with pytest.raises(RateLimitError):
+            pool.acquire()
+
+
+def test_key_pool_acquire_async():
+    """acquire_async는 이벤트 루프를 막지 않고 대기해야 합니다."""
+    pool = KeyPool(["a"])
+    pool.update("a", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1005"})
+    clock = [1000.0]
+
+    async def fake_sleep(seconds):
+        clock[0] += seconds
+
+    with patch("pyloa.rate_limiter.time.time", side_effect=lambda: clock[0]), patch(
+        "pyloa.rate_limiter.asyncio.sleep", side_effect=fake_sleep
+    ):
+        assert asyncio.run(pool.acquire_async()) == "a"
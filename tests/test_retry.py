@@ -0,0 +1,118 @@
+"""RetryPolicy 테스트."""
+
+import pytest
+from unittest.mock import patch
+from pyloa.retry import RetryPolicy, RetryStats, RetryAttempt, _parse_retry_after
+
+
+def test_default_policy():
+    """기본 정책은 429/5xx를 최대 3회까지 시도해야 합니다."""
+    policy = RetryPolicy()
+
+    assert policy.max_attempts == 3
+    assert 429 in policy.retry_statuses
+    assert 503 in policy.retry_statuses
+    assert 404 not in policy.retry_statuses
+
+
+def test_invalid_max_attempts():
+    """max_attempts가 1보다 작으면 ValueError를 발생시켜야 합니다."""
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_is_idempotent():
+    """GET은 항상, POST는 idempotent_paths에 속할 때만 멱등이어야 합니다."""
+    policy = RetryPolicy()
+
+    assert policy.is_idempotent("get", "/anything")
+    assert not policy.is_idempotent("POST", "/items")
+    assert policy.is_idempotent("POST", "/items", frozenset({"/items"}))
+
+
+def test_backoff_without_jitter_is_exponential():
+    """jitter가 없으면 백오프는 지수적으로 증가하고 상한을 넘지 않아야 합니다."""
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0, jitter=False)
+
+    assert policy.backoff(1) == 1.0
+    assert policy.backoff(2) == 2.0
+    assert policy.backoff(3) == 4.0
+    assert policy.backoff(4) == 5.0
+
+
+def test_backoff_with_jitter_is_bounded():
+    """jitter가 있으면 백오프는 [0, 상한] 범위여야 합니다."""
+    policy = RetryPolicy(backoff_factor=1.0)
+
+    for attempt in range(1, 6):
+        assert 0 <= policy.backoff(attempt) <= 2 ** (attempt - 1)
+
+
+def test_next_delay_retryable_status():
+    """재시도 가능한 상태 코드는 백오프 시간을 반환해야 합니다."""
+    policy = RetryPolicy(jitter=False, backoff_factor=0.5)
+
+    assert policy.next_delay(1, True, 503) == 0.5
+    assert policy.next_delay(1, True, 404) is None
+    assert policy.next_delay(1, False, 503) is None
+
+
+def test_next_delay_gives_up_after_max_attempts():
+    """시도 횟수를 모두 쓰면 None을 반환하고 포기를 기록해야 합니다."""
+    policy = RetryPolicy(max_attempts=2)
+
+    assert policy.next_delay(2, True, 500) is None
+    assert policy.stats.giveups == 1
+
+
+def test_next_delay_honors_retry_after():
+    """Retry-After 헤더가 있으면 그 값을 대기 시간으로 사용해야 합니다."""
+    policy = RetryPolicy()
+
+    assert policy.next_delay(1, True, 429, {"Retry-After": "7"}) == 7.0
+
+
+def test_next_delay_gives_up_on_long_retry_after():
+    """max_retry_after보다 긴 Retry-After는 포기해야 합니다."""
+    policy = RetryPolicy(max_retry_after=10)
+
+    assert policy.next_delay(1, True, 429, {"Retry-After": "120"}) is None
+    assert policy.stats.giveups == 1
+
+
+def test_next_delay_ignores_retry_after_when_disabled():
+    """respect_retry_after가 False면 Retry-After를 무시해야 합니다."""
+    policy = RetryPolicy(respect_retry_after=False, jitter=False, backoff_factor=1)
+
+    assert policy.next_delay(1, True, 429, {"Retry-After": "120"}) == 1.0
+
+
+def test_next_delay_connection_error():
+    """연결 오류는 retry_on_connection_error 설정을 따라야 합니다."""
+    assert RetryPolicy(jitter=False).next_delay(1, True) == 0.5
+    assert RetryPolicy(retry_on_connection_error=False).next_delay(1, True) is None
+
+
+def test_parse_retry_after_formats():
+    """Retry-After는 초 단위와 HTTP 날짜 형식을 모두 해석해야 합니다."""
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after("3") == 3.0
+    assert _parse_retry_after("-3") == 0.0
+    assert _parse_retry_after("not a date") is None
+
+    with patch("pyloa.retry.time.time", return_value=1445412470.0):
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 10.0
+
+
+def test_retry_stats_records():
+    """RetryStats는 요청/시도/재시도 수와 기록을 집계해야 합니다."""
+    stats = RetryStats(history_size=2)
+    stats.record_request()
+    for attempt in range(1, 4):
+        stats.record_attempt()
+        stats.record_retry(RetryAttempt("GET", "/u", attempt, 503, 0.1))
+
+    assert stats.requests == 1
+    assert stats.attempts == 3
+    assert stats.retries == 3
+    assert [r.attempt for r in stats.snapshot()] == [2, 3]
@@ -0,0 +1,321 @@
+"""경매장 검색 샤딩 테스트."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pyloa.models.auction import Auction
+from pyloa.sharding import (
+    aiter_sharded_items,
+    aplan_shards,
+    iter_sharded_items,
+    plan_shards,
+    split_query,
+)
+
+PAGE_SIZE = 10
+
+
+def make_items():
+    items = []
+    for tier in (3, 4):
+        for grade in ("유물", "고대"):
+            for i in range(30):
+                items.append(
+                    {
+                        "Name": f"{tier}-{grade}-{i}",
+                        "Grade": grade,
+                        "Tier": tier,
+                        "Level": 1500 + i * 10,
+                        "Icon": "",
+                        "AuctionInfo": {
+                            "StartPrice": i,
+                            "EndDate": "2024-01-08",
+                            "BidCount": 0,
+                            "BidStartPrice": i,
+                            "IsCompetitive": False,
+                            "TradeAllowCount": 2,
+                            "BuyPrice": i,
+                        },
+                    }
+                )
+    return items
+
+
+class FakeAuctionHouse:
+    """검색 조건을 적용해 페이지를 반환하는 가짜 경매장."""
+
+    def __init__(self):
+        self.items = make_items()
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def matches(self, item, query):
+        if query.get("ItemTier") and item["Tier"] != query["ItemTier"]:
+            return False
+        if query.get("ItemGrade") and item["Grade"] != query["ItemGrade"]:
+            return False
+        if query.get("ItemLevelMin") and item["Level"] < query["ItemLevelMin"]:
+            return False
+        if query.get("ItemLevelMax") and item["Level"] > query["ItemLevelMax"]:
+            return False
+        return True
+
+    def search(self, **query):
+        with self.lock:
+            self.calls.append(query)
+        found = [item for item in self.items if self.matches(item, query)]
+        start = (query["PageNo"] - 1) * PAGE_SIZE
+        return Auction.from_dict(
+            {
+                "PageNo": query["PageNo"],
+                "PageSize": PAGE_SIZE,
+                "TotalCount": len(found),
+                "Items": found[start : start + PAGE_SIZE],
+            }
+        )
+
+
+def test_split_query_uses_first_unfixed_dimension():
+    """아직 고정되지 않은 첫 기준으로 나눠야 합니다."""
+    assert [q["ItemTier"] for q in split_query({})] == [1, 2, 3, 4]
+    assert len(split_query({"ItemTier": 4})) == 8
+    assert split_query({"ItemTier": 4, "ItemGrade": "고대", "ItemLevelMin": 1600}) == [
+        {"ItemTier": 4, "ItemGrade": "고대", "ItemLevelMin": 1600, "ItemLevelMax": 1800},
+        {"ItemTier": 4, "ItemGrade": "고대", "ItemLevelMin": 1801, "ItemLevelMax": 2000},
+    ]
+    assert split_query({"ItemLevelMin": 5, "ItemLevelMax": 5}, ["ItemLevel"]) is None
+    assert split_query({}, []) is None
+
+
+def test_plan_shards_splits_until_under_max_results():
+    """결과가 max_results를 넘는 쿼리는 겹치지 않는 샤드로 나눠야 합니다."""
+    house = FakeAuctionHouse()
+
+    shards = plan_shards(house.search, {"CategoryCode": 200000}, max_results=20)
+
+    assert all(shard.total_count <= 20 for shard in shards)
+    assert sum(shard.total_count for shard in shards) == len(house.items)
+    assert all(shard.query["CategoryCode"] == 200000 for shard in shards)
+
+
+def test_plan_shards_keeps_unsplittable_query():
+    """더 나눌 수 없는 쿼리는 결과가 많아도 샤드가 되어야 합니다."""
+    house = FakeAuctionHouse()
+
+    shards = plan_shards(house.search, {"PageNo": 3}, max_results=1, dimensions=[])
+
+    assert len(shards) == 1
+    assert shards[0].total_count == len(house.items)
+    assert shards[0].query == {}
+
+
+def test_iter_sharded_items_returns_every_item_once():
+    """모든 샤드의 항목을 한 번씩 반환하고 첫 페이지는 다시 요청하지 않아야 합니다."""
+    house = FakeAuctionHouse()
+
+    items = list(iter_sharded_items(house.search, {}, max_results=20))
+
+    assert sorted(item.name for item in items) == sorted(i["Name"] for i in house.items)
+    pages = [(tuple(sorted(q.items()))) for q in house.calls]
+    assert len(pages) == len(set(pages))
+
+
+def test_iter_sharded_items_removes_duplicates():
+    """페이지가 밀려 같은 항목이 다시 나오면 한 번만 반환해야 합니다."""
+    house = FakeAuctionHouse()
+    search = house.search
+
+    def shifting_search(**query):
+        page = search(**query)
+        if query["PageNo"] == 2:
+            page.items.insert(0, search(**dict(query, PageNo=1)).items[-1])
+        return page
+
+    items = list(
+        iter_sharded_items(shifting_search, {"ItemTier": 3, "ItemGrade": "고대"})
+    )
+
+    assert len(items) == 30
+
+
+def test_iter_sharded_items_keeps_identical_listings():
+    """모든 필드가 같은 서로 다른 매물도 페이지 경계에 걸치지 않으면 모두 반환해야 합니다."""
+    house = FakeAuctionHouse()
+    house.items[1] = dict(house.items[0])
+
+    items = list(iter_sharded_items(house.search, {}, max_results=20))
+
+    assert len(items) == len(house.items)
+
+
+def test_iter_sharded_items_streams_pages():
+    """샤드 전체를 받기 전에 받은 페이지의 항목부터 반환해야 합니다."""
+    house = FakeAuctionHouse()
+    query = {"ItemTier": 3, "ItemGrade": "고대"}
+
+    items = iter_sharded_items(house.search, query, max_workers=1, prefetch=1)
+    received = [next(items) for _ in range(PAGE_SIZE)]
+    requested = sorted(q["PageNo"] for q in house.calls)
+    items.close()
+
+    assert received[-1].name == "3-고대-9"
+    assert 3 not in requested
+
+
+def test_iter_sharded_items_passes_prefetch():
+    """샤드 하나에도 prefetch 만큼 페이지를 미리 요청해야 합니다."""
+    house = FakeAuctionHouse()
+    third_page = threading.Event()
+
+    def search(**query):
+        if query["PageNo"] == 3:
+            third_page.set()
+        return house.search(**query)
+
+    query = {"ItemTier": 3, "ItemGrade": "고대"}
+    items = iter_sharded_items(search, query, max_workers=2, prefetch=2)
+    next(items)
+
+    assert third_page.wait(timeout=5)
+    items.close()
+
+
+def test_iter_sharded_items_fetches_shards_concurrently():
+    """기본 설정에서도 여러 샤드의 페이지를 동시에 요청해야 합니다."""
+    house = FakeAuctionHouse()
+    lock = threading.Lock()
+    inflight = [0, 0]  # 현재, 최대
+
+    def search(**query):
+        if query["PageNo"] == 1:
+            return house.search(**query)
+        with lock:
+            inflight[0] += 1
+            inflight[1] = max(inflight)
+        time.sleep(0.02)
+        with lock:
+            inflight[0] -= 1
+        return house.search(**query)
+
+    items = list(iter_sharded_items(search, {}, max_results=20))
+
+    assert len(items) == len(house.items)
+    assert inflight[1] > 1
+
+
+def test_iter_sharded_items_stops_shard_on_empty_page():
+    """순회 도중 결과가 줄어 빈 페이지가 나오면 그 샤드의 남은 페이지를 버려야 합니다."""
+    house = FakeAuctionHouse()
+
+    def shrinking_search(**query):
+        page = house.search(**query)
+        if query["PageNo"] == 2:
+            page.items = []
+        return page
+
+    query = {"ItemTier": 3, "ItemGrade": "고대"}
+    items = list(iter_sharded_items(shrinking_search, query, prefetch=2))
+
+    assert len(items) == PAGE_SIZE
+
+
+def test_iter_sharded_items_raises_shard_errors():
+    """샤드 조회 중 오류가 발생하면 예외를 다시 발생시켜야 합니다."""
+    house = FakeAuctionHouse()
+
+    def failing_search(**query):
+        if query["PageNo"] > 1:
+            raise RuntimeError("boom")
+        return house.search(**query)
+
+    with pytest.raises(RuntimeError):
+        list(iter_sharded_items(failing_search, {}, max_results=20))
+
+
+def test_sharding_rejects_invalid_arguments():
+    """잘못된 인자는 ValueError를 발생시켜야 합니다."""
+    house = FakeAuctionHouse()
+    with pytest.raises(ValueError):
+        iter_sharded_items(house.search, {}, max_results=0)
+    with pytest.raises(ValueError):
+        plan_shards(house.search, {}, max_workers=0)
+    with pytest.raises(ValueError):
+        aiter_sharded_items(house.search, {}, dimensions=["ItemGradeQuality"])
+    with pytest.raises(ValueError):
+        iter_sharded_items(house.search, {}, prefetch=0)
+
+
+def test_async_sharding_returns_every_item_once():
+    """비동기 버전도 샤드를 나누고 모든 항목을 한 번씩 반환해야 합니다."""
+    house = FakeAuctionHouse()
+
+    async def search(**query):
+        await asyncio.sleep(0)
+        return house.search(**query)
+
+    async def main():
+        shards = await aplan_shards(search, {}, max_results=20)
+        items = [i async for i in aiter_sharded_items(search, {}, max_results=20)]
+        return shards, items
+
+    shards, items = asyncio.run(main())
+
+    assert all(shard.total_count <= 20 for shard in shards)
+    assert sorted(item.name for item in items) == sorted(i["Name"] for i in house.items)
+
+
+def test_async_sharding_raises_shard_errors():
+    """비동기 버전도 샤드 조회 오류를 다시 발생시켜야 합니다."""
+    house = FakeAuctionHouse()
+
+    async def search(**query):
+        if query["PageNo"] > 1:
+            raise RuntimeError("boom")
+        return house.search(**query)
+
+    async def main():
+        return [i async for i in aiter_sharded_items(search, {}, max_results=20)]
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(main())
+
+
+def test_async_sharding_removes_duplicates():
+    """비동기 버전도 페이지가 밀려 다시 나온 항목을 한 번만 반환해야 합니다."""
+    house = FakeAuctionHouse()
+    house.items[1] = dict(house.items[0])
+
+    async def search(**query):
+        page = house.search(**query)
+        if query["PageNo"] == 2:
+            page.items.insert(0, house.search(**dict(query, PageNo=1)).items[-1])
+        return page
+
+    async def main():
+        query = {"ItemTier": 3, "ItemGrade": "유물"}
+        return [i async for i in aiter_sharded_items(search, query, prefetch=2)]
+
+    assert len(asyncio.run(main())) == 30
+
+
+def test_async_sharding_fetches_shards_concurrently():
+    """비동기 버전도 여러 샤드의 페이지를 동시에 요청해야 합니다."""
+    house = FakeAuctionHouse()
+    inflight = [0, 0]
+
+    async def search(**query):
+        if query["PageNo"] > 1:
+            inflight[0] += 1
+            inflight[1] = max(inflight)
+            await asyncio.sleep(0.01)
+            inflight[0] -= 1
+        return house.search(**query)
+
+    async def main():
+        return [i async for i in aiter_sharded_items(search, {}, max_results=20)]
+
+    assert len(asyncio.run(main())) == len(house.items)
+    assert inflight[1] > 1
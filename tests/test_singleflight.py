@@ -0,0 +1,161 @@
+"""SingleFlight 테스트."""
+
+import asyncio
+import threading
+import pytest
+from pyloa.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_single_flight_runs_call():
+    """진행 중인 호출이 없으면 함수를 바로 실행해야 합니다."""
+    flight = SingleFlight()
+
+    assert flight.do("k", lambda x: x * 2, 21) == 42
+    assert flight.do("k", lambda: 1) == 1
+    assert flight.executions == 2
+    assert flight.coalesced == 0
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    """동시에 들어온 같은 키의 호출은 한 번만 실행하고 결과를 공유해야 합니다."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"v": 1}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+    leader.start()
+    started.wait(5)
+
+    followers = [
+        threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+        for _ in range(4)
+    ]
+    for t in followers:
+        t.start()
+    while flight.coalesced < 4:
+        pass
+    release.set()
+    for t in [leader] + followers:
+        t.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 5
+    assert all(r is results[0] for r in results)
+    assert flight.executions == 1
+    assert flight.coalesced == 4
+
+
+def test_single_flight_shares_errors():
+    """실행 중 발생한 예외는 기다리던 호출자에게도 전달되어야 합니다."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    def run():
+        try:
+            flight.do("k", failing)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=run)
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=run)
+    follower.start()
+    while flight.coalesced < 1:
+        pass
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert len(errors) == 2
+    assert errors[0] is errors[1]
+    assert flight.do("k", lambda: "next") == "next"
+
+
+def test_async_single_flight_coalesces():
+    """같은 키의 동시 코루틴 호출은 한 번만 실행해야 합니다."""
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return [1, 2]
+
+    async def main():
+        return await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert flight.executions == 1
+    assert flight.coalesced == 4
+
+
+def test_async_single_flight_shares_errors():
+    """코루틴이 발생시킨 예외는 모든 호출자에게 전달되어야 합니다."""
+    flight = AsyncSingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(
+            *(flight.do("k", failing) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flight.executions == 1
+
+
+def test_async_single_flight_error_without_waiters():
+    """기다리는 호출자가 없어도 예외는 호출자에게 그대로 전달되어야 합니다."""
+    flight = AsyncSingleFlight()
+
+    async def failing():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        asyncio.run(flight.do("k", failing))
+
+
+def test_async_single_flight_takes_over_cancelled_call():
+    """진행 중인 호출이 취소되면 기다리던 호출자가 이어서 실행해야 합니다."""
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    async def main():
+        leader = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower, leader.cancelled()
+
+    assert asyncio.run(main()) == ("ok", True)
+    assert len(calls) == 2
+    assert flight.executions == 2